@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Benchmark of GET /nodes serialization, compares model returned to FastAPI with JSON response and stdlib decoding
+of database responses to models rendered by orjson used by API. Database is replaced by transport returning
+prepared Neo4j response, so only work done by API is measured.
+
+Usage: python benchmark.py [number of nodes] [number of requests]
+"""
+import asyncio
+import json
+import sys
+import time
+import types
+import unittest.mock as mock
+
+import httpx
+import orjson
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+import database_backend
+import node.node_router
+from database_service import DatabaseService
+
+
+def prepare_database_response(nodes_number):
+    """
+    Prepare body of Neo4j response with given number of nodes
+    """
+    data = [{"row": [{"name": f"participant {index}", "age": index % 90, "sex": "female",
+                      "date_of_birth": "1990-01-01", "disorder": "none"}],
+             "meta": [{"id": index, "type": "node", "deleted": False}]} for index in range(nodes_number)]
+    return orjson.dumps({"results": [{"columns": ["n"], "data": data}], "errors": []})
+
+
+async def measure(app, body, requests_number):
+    """
+    Send GET /nodes requests to app and return mean time of request in milliseconds
+    """
+    database_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200,
+                                                                                                  content=body)))
+    DatabaseService.backend._client = database_client
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        await client.get("/nodes", params={"label": "Participant"})
+        start = time.perf_counter()
+        for _ in range(requests_number):
+            response = await client.get("/nodes", params={"label": "Participant"})
+            response.raise_for_status()
+        elapsed = time.perf_counter() - start
+    await database_client.aclose()
+    DatabaseService.backend._client = None
+    return elapsed / requests_number * 1000
+
+
+def prepare_app(response_class):
+    """
+    Create app with node endpoints and given default response class
+    """
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(node.node_router.router)
+    return app
+
+
+async def main(nodes_number, requests_number):
+    """
+    Run benchmark and print mean times of requests
+    """
+    body = prepare_database_response(nodes_number)
+
+    with mock.patch.object(database_backend, "orjson", types.SimpleNamespace(loads=json.loads)), \
+            mock.patch.object(node.node_router, "ModelResponse", lambda model, status_code: model):
+        baseline = await measure(prepare_app(JSONResponse), body, requests_number)
+    fast = await measure(prepare_app(ORJSONResponse), body, requests_number)
+
+    print(f"GET /nodes with {nodes_number} nodes, mean of {requests_number} requests")
+    print(f"json:   {baseline:.2f} ms")
+    print(f"orjson: {fast:.2f} ms ({baseline / fast:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+                     int(sys.argv[2]) if len(sys.argv) > 2 else 20))
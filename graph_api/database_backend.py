@@ -0,0 +1,410 @@
+import re
+import time
+import uuid
+import httpx
+import orjson
+from neo4j import AsyncGraphDatabase
+from neo4j.exceptions import DriverError, Neo4jError
+from neo4j.graph import Node, Relationship
+from database_config import database
+
+# error returned for transaction id which does not identify open transaction, as HTTP API returns it
+transaction_not_found = {"code": "Neo.ClientError.Transaction.TransactionNotFound",
+                         "message": "Unrecognized transaction id"}
+
+
+class HttpBackend:
+    """
+    Backend sending statements to Neo4j HTTP transactional endpoint
+
+    Attributes:
+        database_url (str): Database URL
+        transaction_url (str): URL of database endpoint for explicit transactions
+        database_auth (httpx.BasicAuth): Database connection credentials
+        database_limits (httpx.Limits): Size of the keep-alive connection pool
+        database_timeout (httpx.Timeout): Timeouts of requests sent to database
+        _client (httpx.AsyncClient): Pooled HTTP client shared by all requests
+    """
+    database_url = (database["address"] + database["commit_path"]) \
+        .replace("{database_name}", database["name"])
+    transaction_url = (database["address"] + database["transaction_path"]) \
+        .replace("{database_name}", database["name"])
+    database_auth = httpx.BasicAuth(database["user"], database["passwd"])
+    database_limits = httpx.Limits(max_connections=database["pool_size"],
+                                   max_keepalive_connections=database["pool_keepalive"])
+    database_timeout = httpx.Timeout(database["timeout"], connect=database["connect_timeout"])
+
+    def __init__(self):
+        self._client = None
+
+    def get_client(self):
+        """
+        Return pooled HTTP client, create it on first use
+
+        Returns:
+            Client used to send requests to database
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(auth=self.database_auth, limits=self.database_limits,
+                                             timeout=self.database_timeout)
+        return self._client
+
+    def is_transaction_id(self, transaction_id):
+        """
+        Check whether transaction id can be put into URL of transaction, HTTP API identifies transactions
+        by numbers
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            True if id consists of digits only, otherwise false
+        """
+        return re.fullmatch("[0-9]+", transaction_id) is not None
+
+    async def post(self, commit_body, transaction_id=None):
+        """
+        Send statements to database by its HTTP API
+
+        Args:
+            commit_body (dict): Body with statements to be sent
+            transaction_id (str): Id of open transaction to run statements in, if None statements are
+                committed at once
+
+        Returns:
+            Result of request
+        """
+        url = self.database_url if transaction_id is None else f"{self.transaction_url}/{transaction_id}"
+        response = await self.get_client().post(url=url, json=commit_body)
+        return orjson.loads(response.content)
+
+    async def begin(self):
+        """
+        Open transaction in database
+
+        Returns:
+            Id of opened transaction and errors of request
+        """
+        response = await self.get_client().post(url=self.transaction_url, json={"statements": []})
+        response = orjson.loads(response.content)
+        if len(response["errors"]) > 0:
+            return {"id": None, "errors": response["errors"]}
+        return {"id": response["commit"].split("/")[-2], "errors": []}
+
+    async def commit(self, transaction_id):
+        """
+        Commit open transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request
+        """
+        response = await self.get_client().post(url=f"{self.transaction_url}/{transaction_id}/commit",
+                                                json={"statements": []})
+        return orjson.loads(response.content)
+
+    async def rollback(self, transaction_id):
+        """
+        Roll back open transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request
+        """
+        response = await self.get_client().delete(url=f"{self.transaction_url}/{transaction_id}")
+        return orjson.loads(response.content)
+
+    async def close(self):
+        """
+        Close pooled HTTP client and its open connections
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class BoltBackend:
+    """
+    Backend sending statements to Neo4j with Bolt protocol
+
+    Results are converted to the shape returned by the HTTP API, so services
+    can use both backends interchangeably.
+
+    Open explicit transactions are kept in memory of the process, so API using
+    them must run in one worker. Like in HTTP API, transaction not used for
+    transaction_timeout seconds is rolled back.
+
+    Attributes:
+        database_uri (str): Bolt URI of database
+        database_auth (tuple): Database connection credentials
+        transaction_timeout (float): Time in seconds after which unused transaction expires
+        _driver (AsyncDriver): Driver holding pool of Bolt connections
+        _transactions (dict): Open transactions with their sessions and expiry times by transaction id
+    """
+    database_uri = database["bolt_address"]
+    database_auth = (database["user"], database["passwd"])
+    transaction_timeout = database["transaction_timeout"]
+
+    def __init__(self):
+        self._driver = None
+        self._transactions = {}
+
+    def get_driver(self):
+        """
+        Return pooled Bolt driver, create it on first use
+
+        Returns:
+            Driver used to send statements to database
+        """
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(self.database_uri, auth=self.database_auth,
+                                                     max_connection_pool_size=database["pool_size"],
+                                                     connection_timeout=database["connect_timeout"],
+                                                     connection_acquisition_timeout=database["timeout"])
+        return self._driver
+
+    async def post(self, commit_body, transaction_id=None):
+        """
+        Run statements in one transaction with Bolt protocol
+
+        Args:
+            commit_body (dict): Body with statements to be sent
+            transaction_id (str): Id of open transaction to run statements in, if None statements are
+                committed at once
+
+        Returns:
+            Result of request in the same form as returned by HTTP API
+        """
+        if transaction_id is not None:
+            return await self.post_in_transaction(commit_body, transaction_id)
+
+        results, errors = [], []
+        async with self.get_driver().session(database=database["name"]) as session:
+            transaction = await session.begin_transaction()
+            try:
+                for statement in commit_body["statements"]:
+                    result = await transaction.run(statement["statement"], statement.get("parameters") or {})
+                    results.append(await self.convert_result(result))
+                await transaction.commit()
+            except (Neo4jError, DriverError) as error:
+                # failed commit closes transaction, so only transaction of failed statement is rolled back
+                if not transaction.closed():
+                    await transaction.rollback()
+                errors.append(self.convert_error(error))
+        return {"results": results, "errors": errors}
+
+    def is_transaction_id(self, transaction_id):
+        """
+        Check whether transaction id identifies transaction opened by this process
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            True if transaction is open, otherwise false
+        """
+        return transaction_id in self._transactions
+
+    async def post_in_transaction(self, commit_body, transaction_id):
+        """
+        Run statements in open transaction, transaction is rolled back on error like in HTTP API
+
+        Args:
+            commit_body (dict): Body with statements to be sent
+            transaction_id (str): Id of open transaction
+
+        Returns:
+            Result of request in the same form as returned by HTTP API
+        """
+        await self.expire_transactions()
+        if transaction_id not in self._transactions:
+            return {"results": [], "errors": [transaction_not_found]}
+
+        results = []
+        session, transaction, _ = self._transactions[transaction_id]
+        self._transactions[transaction_id] = (session, transaction, time.monotonic() + self.transaction_timeout)
+        try:
+            for statement in commit_body["statements"]:
+                result = await transaction.run(statement["statement"], statement.get("parameters") or {})
+                results.append(await self.convert_result(result))
+        except (Neo4jError, DriverError) as error:
+            await self.rollback(transaction_id)
+            return {"results": results, "errors": [self.convert_error(error)]}
+        return {"results": results, "errors": []}
+
+    async def begin(self):
+        """
+        Open transaction in database
+
+        Returns:
+            Id of opened transaction and errors of request
+        """
+        await self.expire_transactions()
+        session = self.get_driver().session(database=database["name"])
+        try:
+            transaction = await session.begin_transaction()
+        except (Neo4jError, DriverError) as error:
+            await session.close()
+            return {"id": None, "errors": [self.convert_error(error)]}
+
+        transaction_id = uuid.uuid4().hex
+        self._transactions[transaction_id] = (session, transaction, time.monotonic() + self.transaction_timeout)
+        return {"id": transaction_id, "errors": []}
+
+    async def expire_transactions(self):
+        """
+        Roll back transactions which were not used for transaction_timeout seconds and close their sessions
+        """
+        now = time.monotonic()
+        for transaction_id in [transaction_id for transaction_id, (_, _, expires) in self._transactions.items()
+                               if expires < now]:
+            await self.rollback(transaction_id)
+
+    async def commit(self, transaction_id):
+        """
+        Commit open transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request
+        """
+        return await self.finish(transaction_id, commit=True)
+
+    async def rollback(self, transaction_id):
+        """
+        Roll back open transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request
+        """
+        return await self.finish(transaction_id, commit=False)
+
+    async def finish(self, transaction_id, commit):
+        """
+        Commit or roll back open transaction and close its session
+
+        Args:
+            transaction_id (str): Id of transaction
+            commit (bool): Whether transaction is committed, otherwise it is rolled back
+
+        Returns:
+            Result of request
+        """
+        if commit:
+            await self.expire_transactions()
+        if transaction_id not in self._transactions:
+            return {"results": [], "errors": [transaction_not_found]}
+
+        session, transaction, _ = self._transactions.pop(transaction_id)
+        errors = []
+        try:
+            if commit:
+                await transaction.commit()
+            elif not transaction.closed():
+                await transaction.rollback()
+        except (Neo4jError, DriverError) as error:
+            errors.append(self.convert_error(error))
+        finally:
+            await session.close()
+        return {"results": [], "errors": errors}
+
+    def convert_error(self, error):
+        """
+        Convert error raised by driver to the form returned by HTTP API
+
+        Args:
+            error (Neo4jError|DriverError): Error raised by database or by driver itself
+
+        Returns:
+            Dictionary with code and message of error
+        """
+        if isinstance(error, Neo4jError):
+            return {"code": error.code, "message": error.message}
+        return {"code": type(error).__name__, "message": str(error)}
+
+    async def convert_result(self, result):
+        """
+        Convert result of Bolt statement to the form returned by HTTP API
+
+        Args:
+            result (AsyncResult): Result of statement
+
+        Returns:
+            Dictionary with columns and data of statement
+        """
+        data = [{"row": [self.convert_value(value) for value in record.values()],
+                 "meta": [self.convert_meta(value) for value in record.values()]}
+                async for record in result]
+        return {"columns": list(result.keys()), "data": data}
+
+    def convert_value(self, value):
+        """
+        Convert value of record to its JSON representation
+
+        Args:
+            value (Any): Value returned in record
+
+        Returns:
+            Properties of nodes and relationships, otherwise value itself
+        """
+        if isinstance(value, (Node, Relationship)):
+            return dict(value.items())
+        if isinstance(value, list):
+            return [self.convert_value(item) for item in value]
+        return value
+
+    def convert_meta(self, value):
+        """
+        Prepare metadata of value of record
+
+        Args:
+            value (Any): Value returned in record
+
+        Returns:
+            Id and type of nodes and relationships, otherwise None
+        """
+        if isinstance(value, Node):
+            return {"id": value.id, "type": "node", "deleted": False}
+        if isinstance(value, Relationship):
+            return {"id": value.id, "type": "relationship", "deleted": False}
+        if isinstance(value, list) and any(isinstance(item, (Node, Relationship)) for item in value):
+            return [self.convert_meta(item) for item in value]
+        return None
+
+    async def close(self):
+        """
+        Close Bolt driver and its open connections, roll back transactions left open
+        """
+        for transaction_id in list(self._transactions):
+            await self.rollback(transaction_id)
+        if self._driver is not None:
+            await self._driver.close()
+            self._driver = None
+
+
+backends = {
+    "http": HttpBackend,
+    "bolt": BoltBackend,
+}
+
+
+def get_backend(name):
+    """
+    Create backend used to communicate with database
+
+    Args:
+        name (str): Name of backend, one of keys of backends
+
+    Returns:
+        Backend instance
+    """
+    return backends[name]()
@@ -3,11 +3,23 @@ import os
 
 db_host = os.environ.get('DB_HOST') or 'localhost'
 db_port = os.environ.get('DB_PORT') or '7474'
+db_bolt_port = os.environ.get('DB_BOLT_PORT') or '7687'
 
 database = {
+    "backend": os.environ.get('DB_BACKEND') or 'http',
     "address": "http://{}:{}".format(db_host, db_port),
+    "bolt_address": "bolt://{}:{}".format(db_host, db_bolt_port),
     "name": "neo4j",
     "commit_path": "/db/{database_name}/tx/commit",
+    "transaction_path": "/db/{database_name}/tx",
     "user": "neo4j",
     "passwd": "grisera",
+    "pool_size": int(os.environ.get('DB_POOL_SIZE') or '100'),
+    "pool_keepalive": int(os.environ.get('DB_POOL_KEEPALIVE') or '20'),
+    "connect_timeout": float(os.environ.get('DB_CONNECT_TIMEOUT') or '5'),
+    "timeout": float(os.environ.get('DB_TIMEOUT') or '30'),
+    "transaction_timeout": float(os.environ.get('DB_TRANSACTION_TIMEOUT') or '60'),
+    "stream_page_size": int(os.environ.get('DB_STREAM_PAGE_SIZE') or '1000'),
+    "schema_retry_delay": float(os.environ.get('DB_SCHEMA_RETRY_DELAY') or '1'),
+    "schema_retry_max_delay": float(os.environ.get('DB_SCHEMA_RETRY_MAX_DELAY') or '60'),
 }
@@ -0,0 +1,18 @@
+# declared schema of graph database, indexes on properties by which grisera_api looks up nodes
+# indexes are created at startup when they do not exist yet, so matching on these properties does not scan
+# all nodes with label
+from index.index_model import IndexIn
+
+schema = [
+    IndexIn(label="Activity", key="activity"),
+    IndexIn(label="Arrangement", key="arrangement_distance"),
+    IndexIn(label="Arrangement", key="arrangement_type"),
+    IndexIn(label="Channel", key="type"),
+    IndexIn(label="Experiment", key="experiment_name"),
+    IndexIn(label="Life Activity", key="life_activity"),
+    IndexIn(label="Measure Name", key="name"),
+    IndexIn(label="Modality", key="modality"),
+    IndexIn(label="Participant", key="name"),
+    IndexIn(label="Registered Data", key="source"),
+    IndexIn(label="Time Series", key="source"),
+]
@@ -1,6 +1,11 @@
-import requests
-from requests.auth import HTTPBasicAuth
+from contextvars import ContextVar
+from database_backend import get_backend, transaction_not_found
 from database_config import database
+from database_statements import statements
+from relationship.relationship_model import RelationshipDirection
+
+# id of explicit transaction in which statements of current request are run
+current_transaction = ContextVar("current_transaction", default=None)
 
 
 class DatabaseService:
@@ -8,13 +13,12 @@ class DatabaseService:
     Object that handles communication with Neo4j database
 
     Attributes:
-        database_url (str): Database URL 
-        database_auth (HTTPBasicAuth): Database connection credentials
+        backend (HttpBackend|BoltBackend): Backend used to send statements, selected in config
+        statements (dict): Templates of statements sent to database
         _instance (DatabaseService): Instance of the singleton object
     """
-    database_url = (database["address"] + database["commit_path"]) \
-        .replace("{database_name}", database["name"])
-    database_auth = HTTPBasicAuth(database["user"], database["passwd"])
+    backend = get_backend(database["backend"])
+    statements = statements
 
     _instance = None
 
@@ -26,39 +30,143 @@ class DatabaseService:
             cls._instance = super(DatabaseService, cls).__new__(cls)
         return cls._instance
 
-    def post_statement(self, statement):
+    async def close(self):
+        """
+        Close connections to database held by backend
+        """
+        await self.backend.close()
+
+    def batch(self):
+        """
+        Create builder of statements sent to database in one commit
+
+        Returns:
+            Empty batch of statements
+        """
+        return StatementBatch(self)
+
+    def prepare_statement(self, template, parameters=None, **identifiers):
+        """
+        Prepare statement from template with given name
+
+        Args:
+            template (str): Name of template in statements registry
+            parameters (dict): Values passed to database as statement parameters
+            identifiers (str): Labels or relationship types formatted into template
+
+        Returns:
+            Statement with its parameters
+        """
+        return {"statement": self.statements[template].format(**identifiers), "parameters": parameters or {}}
+
+    def prepare_properties(self, properties):
+        """
+        Prepare properties to be passed as statement parameter
+
+        Args:
+            properties (List[PropertyIn]): Properties to prepare
+
+        Returns:
+            Dictionary of property values by their keys
+        """
+        return {property.key: property.value for property in properties}
+
+    async def post_statement(self, statement, parameters=None):
         """
         Wrap statement with body and send it to database by its API
 
         Args:
             statement (string): Statement to be sent
+            parameters (dict): Parameters of statement
 
         Returns:
             Result of request      
         """
         commit_body = {
-            "statements": [{"statement": statement}]
+            "statements": [{"statement": statement, "parameters": parameters or {}}]
         }
-        response = self.post(commit_body)
+        response = await self.post(commit_body)
         return response
 
-    def post(self, commit_body):
+    async def post_template(self, template, parameters=None, **identifiers):
         """
-        Send request to database by its API
+        Send statement prepared from template to database
 
         Args:
-            statement (string): Statement to be sent
+            template (str): Name of template in statements registry
+            parameters (dict): Values passed to database as statement parameters
+            identifiers (str): Labels or relationship types formatted into template
+
+        Returns:
+            Result of request
+        """
+        commit_body = {
+            "statements": [self.prepare_statement(template, parameters, **identifiers)]
+        }
+        return await self.post(commit_body)
+
+    async def post(self, commit_body):
+        """
+        Send request to database by configured backend, in transaction of current request if it is set
+
+        Args:
+            commit_body (dict): Body with statements to be sent
 
         Returns:
             Result of request      
         """
+        return await self.backend.post(commit_body, current_transaction.get())
 
-        response = requests.post(url=self.database_url,
-                                 json=commit_body,
-                                 auth=self.database_auth).json()
-        return response
+    async def begin_transaction(self):
+        """
+        Send to the database request to open explicit transaction
+
+        Returns:
+            Id of opened transaction and errors of request
+        """
+        return await self.backend.begin()
+
+    def is_transaction_id(self, transaction_id):
+        """
+        Check whether transaction id is accepted by backend, so it can be sent to database
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            True if id may identify open transaction, otherwise false
+        """
+        return self.backend.is_transaction_id(transaction_id)
+
+    async def commit_transaction(self, transaction_id):
+        """
+        Send to the database request to commit explicit transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request
+        """
+        if not self.is_transaction_id(transaction_id):
+            return {"results": [], "errors": [transaction_not_found]}
+        return await self.backend.commit(transaction_id)
 
-    def node_exists(self, node_id):
+    async def rollback_transaction(self, transaction_id):
+        """
+        Send to the database request to roll back explicit transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request
+        """
+        if not self.is_transaction_id(transaction_id):
+            return {"results": [], "errors": [transaction_not_found]}
+        return await self.backend.rollback(transaction_id)
+
+    async def node_exists(self, node_id):
         """
         Check wheather node with given id exists
 
@@ -68,13 +176,10 @@ class DatabaseService:
         Returns:
             True if exists, otherwise false 
         """
-
-        check_node_statement = "MATCH (n) where id(n) ={node_id} return n".format(
-            node_id=node_id)
-        response = self.post_statement(check_node_statement)
+        response = await self.post_template("node_exists", {"node_id": node_id})
         return len(response['results']) != 0 and len(response['results'][0]['data']) == 1
 
-    def create_node(self, node):
+    async def create_node(self, node):
         """
         Send to the database request to create node
 
@@ -84,38 +189,154 @@ class DatabaseService:
         Returns:
             Result of request      
         """
-        create_statement = "CREATE (n:{labels}) RETURN n".format(
-            labels=":".join(list(node.labels)))
-        return self.post_statement(create_statement)
+        return await self.post_template("create_node", labels=":".join(list(node.labels)))
+
+    async def create_nodes(self, nodes):
+        """
+        Send to the database request to create many nodes with their properties
+
+        Labels cannot be passed as parameters, so nodes are grouped by their labels and each group is created
+        with one UNWIND statement. All statements are sent in one request.
+
+        Args:
+            nodes (List[NodeWithPropertiesIn]): Nodes to be created
+
+        Returns:
+            Result of request, rows of each statement hold index of node in given list and its id
+        """
+        groups = {}
+        for index, node in enumerate(nodes):
+            groups.setdefault(tuple(sorted(node.labels)), []).append(
+                {"index": index, "properties": self.prepare_properties(node.properties)})
+
+        batch = self.batch()
+        for labels, group in groups.items():
+            batch.add("create_nodes", {"nodes": group}, labels="".join(f":{label}" for label in labels))
+        return await batch.commit()
+
+    async def create_subgraph(self, subgraph):
+        """
+        Send to the database request to create node with its properties and outgoing relationships
+
+        Whole subgraph is created by one statement, relationships are grouped by their names and each group is
+        created by its own subquery. Relationships to not existing nodes or nodes without expected label are
+        skipped.
+
+        Args:
+            subgraph (SubgraphIn): Node with relationships to be created
+
+        Returns:
+            Result of request with id, labels and properties of node and its outgoing relationships
+        """
+        groups = {}
+        for relationship in subgraph.relationships:
+            groups.setdefault(relationship.name, []).append(
+                {"end_node": relationship.end_node, "end_node_label": relationship.end_node_label})
+
+        labels = "".join(f":{label}" for label in sorted(subgraph.labels))
+        statement = [self.statements["create_subgraph_node"].format(labels=labels)]
+        statement.extend(self.statements["create_subgraph_relationships"].format(index=index,
+                                                                                 name=self.quote_identifier(name))
+                         for index, name in enumerate(groups))
+        statement.append(self.statements["return_subgraph"])
+
+        parameters = {"properties": self.prepare_properties(subgraph.properties),
+                      "relationships": list(groups.values())}
+        return await self.post_statement(" ".join(statement), parameters)
+
+    async def create_chain(self, chain):
+        """
+        Send to the database request to create chain of nodes with their outgoing relationships, linked to root
+
+        Whole chain is created by one statement, so it is created in one transaction. Relationships going out of
+        nodes are grouped by their names and each group is created by its own subquery, relationships to not
+        existing nodes or nodes without expected label are skipped.
+
+        Args:
+            chain (ChainIn): Chain of nodes to be created
+
+        Returns:
+            Result of request with root and created nodes of chain with their relationships
+        """
+        groups = {}
+        for index, node in enumerate(chain.nodes):
+            for relationship in node.relationships:
+                groups.setdefault(relationship.name, []).append(
+                    {"index": index, "end_node": relationship.end_node,
+                     "end_node_label": relationship.end_node_label})
 
-    def get_node(self, node_id):
+        labels = "".join(f":{label}" for label in sorted(chain.labels))
+        statement = [self.statements["create_chain_nodes"].format(labels=labels, head=self.quote_identifier(chain.head),
+                                                                  next=self.quote_identifier(chain.next))]
+        statement.extend(self.statements["create_chain_relationships"].format(index=index,
+                                                                               name=self.quote_identifier(name))
+                         for index, name in enumerate(groups))
+        statement.append(self.statements["return_chain"])
+
+        parameters = {"root": chain.root, "nodes": [self.prepare_properties(node.properties) for node in chain.nodes],
+                      "relationships": list(groups.values())}
+        return await self.post_statement(" ".join(statement), parameters)
+
+    async def create_nodes_properties(self, nodes):
+        """
+        Send to the database request to set properties of many nodes with one UNWIND statement
+
+        Args:
+            nodes (List[NodePropertiesIn]): Nodes with properties to set
+
+        Returns:
+            Result of request, rows hold id, labels and properties of nodes which were found
+        """
+        parameters = {"nodes": [{"id": node.id, "properties": self.prepare_properties(node.properties)}
+                                for node in nodes]}
+        return await self.post_template("create_nodes_properties", parameters)
+
+    async def get_node(self, node_id, label=None, include_relationships=False):
         """
         Send to the database request to get node with given id
 
         Args:
             node_id (): id to search by
+            label (str): Label which node must have, node is not found otherwise
+            include_relationships (bool): Whether relationships of node are returned in the same statement
 
         Returns:
             Result of request
         """
-        get_statement = f"MATCH (n) WHERE id(n)={node_id} RETURN n, labels(n)"
-        return self.post_statement(get_statement)
+        if label is None and not include_relationships:
+            return await self.post_template("get_node", {"node_id": node_id})
+        parameters = {"node_id": node_id, "label": label, "include_relationships": include_relationships}
+        return await self.post_template("get_node_details", parameters)
 
-    def get_nodes(self, label):
+    async def get_nodes(self, label, limit=None, after=None, filters=None):
         """
         Send to the database request to get nodes with given label
 
+        When limit is given, nodes are returned in pages ordered by their ids, next page starts after the
+        greatest id of previous one, so database does not skip over already returned nodes. Filters are compiled
+        to predicates on node properties, values of filters are passed as parameters.
+
         Args:
             label (): label to search by
+            limit (int): Maximal number of returned nodes, all nodes are returned if not given
+            after (int): Id after which returned nodes start
+            filters (List[PropertyFilter]): Filters which returned nodes must match
 
         Returns:
             Result of request
         """
-        get_statement = "MATCH (n: {label}) RETURN n".format(
-            label=label)
-        return self.post_statement(get_statement)
+        filters = filters or []
+        conditions = " AND ".join(f"n.{self.quote_identifier(filter.key)} {filter.operator.value} $value_{index}"
+                                  for index, filter in enumerate(filters))
+        parameters = {f"value_{index}": filter.value for index, filter in enumerate(filters)}
+
+        template = "get_nodes_filtered" if filters else "get_nodes"
+        if limit is not None:
+            template += "_page"
+            parameters.update({"limit": limit, "after": after if after is not None else -1})
+        return await self.post_template(template, parameters, label=label, conditions=conditions)
 
-    def delete_node(self, node_id):
+    async def delete_node(self, node_id):
         """
         Send to the database request to delete node with given id
 
@@ -125,10 +346,9 @@ class DatabaseService:
         Returns:
             Result of request
         """
-        delete_statement = f"MATCH (n) WHERE id(n)={node_id} DETACH DELETE n return n"
-        return self.post_statement(delete_statement)
+        return await self.post_template("delete_node", {"node_id": node_id})
 
-    def relationship_exist(self, relationship_id):
+    async def relationship_exist(self, relationship_id):
         """
         Check if relationship exists in the database
         Args:
@@ -137,13 +357,10 @@ class DatabaseService:
             True - If there is a relationship in the database.
             False - If there is not a relationship in the database.
         """
-        check_relationship_statement = "MATCH ()-[r]->() where id(r) ={relationship_id} return r".format(
-            relationship_id=relationship_id)
-
-        response = self.post_statement(check_relationship_statement)
+        response = await self.post_template("relationship_exists", {"relationship_id": relationship_id})
         return len(response['results']) != 0 and len(response['results'][0]['data']) == 1
 
-    def get_relationship(self, relationship_id):
+    async def get_relationship(self, relationship_id):
         """
         Send to the database request to get relationship
 
@@ -153,11 +370,9 @@ class DatabaseService:
         Returns:
             Result of request
         """
-        get_statement = "MATCH ()-[r]->() where id(r)={} " \
-                        "return id(startNode(r)), id(endNode(r)), type(r), id(r)".format(relationship_id)
-        return self.post_statement(get_statement)
+        return await self.post_template("get_relationship", {"relationship_id": relationship_id})
 
-    def delete_relationship(self, relationship_id):
+    async def delete_relationship(self, relationship_id):
         """
         Send to the database request to delete relationship with given id
 
@@ -167,62 +382,123 @@ class DatabaseService:
         Returns:
             Result of request
         """
-        delete_statement = f"MATCH ()-[r]->() WHERE id(r)={relationship_id} DETACH DELETE r return r"
-        return self.post_statement(delete_statement)
+        return await self.post_template("delete_relationship", {"relationship_id": relationship_id})
 
-    def get_relationships(self, node_id):
+    async def get_relationships(self, node_id, types=None, direction=None):
         """
         Send to the database request to get relationships of node
 
+        Relationships are expanded from node found by its id, types and direction are part of the pattern, so
+        only matching relationships are traversed.
+
         Args:
             node_id (): node to search by
+            types (List[str]): Names of relationships to get, all relationships are returned if not given
+            direction (RelationshipDirection): Direction of relationships to get, both directions if not given
 
         Returns:
             Result of request
         """
-        get_statement = "MATCH (n)-[r]->(m) where id(n)={} or id(m)={} " \
-                        "return id(startNode(r)), id(endNode(r)), type(r), id(r)".format(
-                         node_id, node_id)
-        return self.post_statement(get_statement)
+        relationship = "[r:" + "|".join(map(self.quote_identifier, types)) + "]" if types else "[r]"
+        if direction == RelationshipDirection.outgoing:
+            pattern = f"-{relationship}->"
+        elif direction == RelationshipDirection.incoming:
+            pattern = f"<-{relationship}-"
+        else:
+            pattern = f"-{relationship}-"
+        return await self.post_template("get_relationships", {"node_id": node_id}, pattern=pattern)
 
-    def create_relationship(self, relationship):
+    async def nodes_exist(self, nodes):
         """
-        Send to the database request to create relationship
+        Send to the database request to check whether nodes with given ids and labels exist, all nodes are
+        checked in one statement without reading their properties
 
         Args:
-            relationship (): relationship to be created
+            nodes (List[NodeExistsIn]): Nodes to check
 
         Returns:
-            Result of request      
+            Result of request, rows hold id, label and existence of nodes in the same order as given
+        """
+        return await self.post_template("nodes_exist", {"nodes": [node.dict() for node in nodes]})
+
+    async def get_neighbourhood(self, node_id, depth, types=None):
+        """
+        Send to the database request to get subgraph of nodes reachable from node in at most given number of hops
+
+        Subgraph is expanded by one variable-length pattern and nodes and relationships reached by many paths
+        are returned only once.
+
+        Args:
+            node_id (int): Id of node from which subgraph is expanded
+            depth (int): Maximal number of relationships between node and nodes of subgraph
+            types (List[str]): Names of relationships to traverse, all relationships are traversed if not given
+
+        Returns:
+            Result of request
         """
-        create_statement = ("MATCH (n) where id(n) ={start_node} MATCH (m) where " +
-                            "id(m) = {end_node} MERGE (n) - [r:{name}] -> (m) " +
-                            "RETURN r").format(start_node=relationship.start_node,
-                                               end_node=relationship.end_node,
-                                               name=relationship.name)
-        return self.post_statement(create_statement)
+        pattern = "[" + (":" + "|".join(map(self.quote_identifier, types)) if types else "") + f"*1..{int(depth)}]"
+        return await self.post_template("get_neighbourhood", {"node_id": node_id}, pattern=pattern)
 
-    def create_properties(self, id, properties, object_part, return_part):
+    async def get_chain(self, node_id, head, next, include_relationships=False):
+        """
+        Send to the database request to get chains of nodes linked by relationships with next name, which start
+        at root node by relationship with head name
+
+        Node may be root of chains or any node of chain, in the latter case only its chain is returned. Each chain
+        is acquired by one variable-length pattern from its first node to the node without next relationship.
+
+        Args:
+            node_id (int): Id of root or node of chain
+            head (str): Name of relationship from root to first node of chain
+            next (str): Name of relationship from node of chain to the following one
+            include_relationships (bool): Whether relationships of nodes of chain are acquired together with them
+
+        Returns:
+            Result of request, one row with root and nodes of chain in order for each chain
+        """
+        parameters = {"node_id": node_id, "include_relationships": include_relationships}
+        return await self.post_template("get_chain", parameters, head=self.quote_identifier(head),
+                                        next=self.quote_identifier(next))
+
+    async def create_relationships(self, relationships):
+        """
+        Send to the database request to create many relationships
+
+        Relationship types cannot be passed as parameters, so relationships are grouped by their names and each
+        group is created with one UNWIND statement. All statements are sent in one request.
+
+        Args:
+            relationships (List[RelationshipIn]): Relationships to be created
+
+        Returns:
+            Result of request, rows of each statement hold index of relationship in given list and its id,
+            relationships with not existing nodes have no row
+        """
+        groups = {}
+        for index, relationship in enumerate(relationships):
+            groups.setdefault(relationship.name, []).append(
+                {"index": index, "start_node": relationship.start_node, "end_node": relationship.end_node})
+
+        batch = self.batch()
+        for name, group in groups.items():
+            batch.add("create_relationships", {"relationships": group}, name=self.quote_identifier(name))
+        return await batch.commit()
+
+    async def create_properties(self, id, properties, template):
         """
         Send to the database request to add properties
 
         Args:
             id (int): Id of node or relationship
             properties (List[PropertyIn]): Properties to add
-            object_part (str): Part of statement used to identify object type
-            return_part (str): Part of statement used to return proper information
+            template (str): Name of template used to identify object type and return proper information
         Returns:
             Result of request      
         """
-        set_part = ''.join(map(lambda property: 'x.{}="{}", '.format(property.key, property.value), properties))
-        create_statement = "MATCH {} where id(x)={} SET {} return {}, x".format(
-            object_part, id, set_part[:-2], return_part)
-        commit_body = {
-            "statements": [{"statement": create_statement}]
-        }
-        return self.post(commit_body)
+        parameters = {"id": id, "properties": self.prepare_properties(properties)}
+        return await self.post_template(template, parameters)
 
-    def create_relationship_properties(self, id, properties):
+    async def create_relationship_properties(self, id, properties):
         """
         Create properties in database for relationship
 
@@ -233,11 +509,9 @@ class DatabaseService:
         Returns:
             Result of request
         """
-        relation_part = "(n)-[x]->(m)"
-        return_part = "id(n), type(x), id(m)"
-        return self.create_properties(id, properties, relation_part, return_part)
+        return await self.create_properties(id, properties, "create_relationship_properties")
 
-    def create_node_properties(self, id, properties):
+    async def create_node_properties(self, id, properties):
         """
         Create properties in database for node
 
@@ -248,11 +522,9 @@ class DatabaseService:
         Returns:
             Result of request
         """
-        node_part = "(x)"
-        return_part = "labels(x)"
-        return self.create_properties(id, properties, node_part, return_part)
+        return await self.create_properties(id, properties, "create_node_properties")
 
-    def delete_node_properties(self, id):
+    async def delete_node_properties(self, id):
         """
         Send to the database request to delete properties from node
 
@@ -261,8 +533,95 @@ class DatabaseService:
         Returns:
             Result of request
         """
-        delete_statement = "MATCH (x) where id(x)="+str(id)+" SET x ={} return x"
+        return await self.post_template("delete_node_properties", {"id": id})
+
+    def quote_identifier(self, identifier):
+        """
+        Quote name of label, property, relationship or index, so it can be formatted into statement
+
+        Args:
+            identifier (str): Name to quote
+
+        Returns:
+            Name enclosed in backticks with backticks inside it escaped
+        """
+        return "`" + identifier.replace("`", "``") + "`"
+
+    async def get_indexes(self):
+        """
+        Send to the database request to get indexes on single property of nodes
+
+        Returns:
+            Result of request
+        """
+        return await self.post_template("get_indexes")
+
+    async def create_index(self, name, index):
+        """
+        Send to the database request to create index, which is left untouched when it already exists
+
+        Args:
+            name (str): Name of index
+            index (IndexIn): Label and property key of indexed nodes
+
+        Returns:
+            Result of request
+        """
+        template = "create_unique_index" if index.unique else "create_index"
+        return await self.post_template(template, name=self.quote_identifier(name),
+                                        label=self.quote_identifier(index.label), key=self.quote_identifier(index.key))
+
+    async def drop_index(self, name, unique=False):
+        """
+        Send to the database request to drop index
+
+        Args:
+            name (str): Name of index
+            unique (bool): Whether index is backed by uniqueness constraint, which is dropped together with it
+
+        Returns:
+            Result of request
+        """
+        template = "drop_unique_index" if unique else "drop_index"
+        return await self.post_template(template, name=self.quote_identifier(name))
+
+
+class StatementBatch:
+    """
+    Builder of statements sent to database in one transactional commit
+
+    Attributes:
+        database_service (DatabaseService): Service used to prepare and send statements
+        statements (list): Statements accumulated in batch
+    """
+
+    def __init__(self, database_service):
+        self.database_service = database_service
+        self.statements = []
+
+    def add(self, template, parameters=None, **identifiers):
+        """
+        Add statement prepared from template to batch
+
+        Args:
+            template (str): Name of template in statements registry
+            parameters (dict): Values passed to database as statement parameters
+            identifiers (str): Labels or relationship types formatted into template
+
+        Returns:
+            Batch itself, so calls can be chained
+        """
+        self.statements.append(self.database_service.prepare_statement(template, parameters, **identifiers))
+        return self
+
+    async def commit(self):
+        """
+        Send all statements of batch to database in one request
+
+        Returns:
+            Result of request with one result for each statement, in order of adding
+        """
         commit_body = {
-            "statements": [{"statement": delete_statement}]
+            "statements": self.statements
         }
-        return self.post(commit_body)
+        return await self.database_service.post(commit_body)
@@ -0,0 +1,82 @@
+# templates of cypher statements sent to graph database
+# values are always passed as statement parameters, so each template has a fixed text and its query plan
+# is cached by database, only labels and relationship types which cannot be parameterized are formatted in
+statements = {
+    "node_exists": "MATCH (n) WHERE id(n) = $node_id RETURN n",
+    "create_node": "CREATE (n:{labels}) RETURN n",
+    "get_node": "MATCH (n) WHERE id(n) = $node_id RETURN n, labels(n)",
+    "get_node_details": "MATCH (n) WHERE id(n) = $node_id AND ($label IS NULL OR $label IN labels(n)) "
+                        "RETURN n, labels(n), CASE WHEN $include_relationships "
+                        "THEN [(n)-[r]-() | [id(startNode(r)), id(endNode(r)), type(r), id(r)]] END",
+    "get_nodes": "MATCH (n: {label}) RETURN n",
+    "get_nodes_page": "MATCH (n: {label}) WHERE id(n) > $after RETURN n ORDER BY id(n) LIMIT $limit",
+    "get_nodes_filtered": "MATCH (n: {label}) WHERE {conditions} RETURN n",
+    "get_nodes_filtered_page": "MATCH (n: {label}) WHERE {conditions} AND id(n) > $after "
+                               "RETURN n ORDER BY id(n) LIMIT $limit",
+    "create_nodes": "UNWIND $nodes AS node CREATE (n{labels}) SET n += node.properties RETURN node.index, id(n)",
+    "delete_node": "MATCH (n) WHERE id(n) = $node_id DETACH DELETE n RETURN n",
+    "relationship_exists": "MATCH ()-[r]->() WHERE id(r) = $relationship_id RETURN r",
+    "get_relationship": "MATCH ()-[r]->() WHERE id(r) = $relationship_id "
+                        "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+    "delete_relationship": "MATCH ()-[r]->() WHERE id(r) = $relationship_id DETACH DELETE r RETURN r",
+    "get_relationships": "MATCH (n) WHERE id(n) = $node_id MATCH (n){pattern}() "
+                         "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+    "nodes_exist": "UNWIND $nodes AS node OPTIONAL MATCH (n) WHERE id(n) = node.id "
+                   "AND (node.label IS NULL OR node.label IN labels(n)) "
+                   "RETURN node.id, node.label, n IS NOT NULL",
+    "get_neighbourhood": "MATCH (n) WHERE id(n) = $node_id OPTIONAL MATCH path = (n)-{pattern}-() "
+                         "UNWIND coalesce(relationships(path), [null]) AS r "
+                         "WITH n, collect(DISTINCT endNode(r)) + collect(DISTINCT startNode(r)) AS reached, "
+                         "collect(DISTINCT r) AS relationships "
+                         "UNWIND [n] + reached AS m WITH relationships, collect(DISTINCT m) AS nodes "
+                         "RETURN [m IN nodes | [id(m), labels(m), properties(m)]], "
+                         "[r IN relationships | [id(startNode(r)), id(endNode(r)), type(r), id(r)]]",
+    "get_chain": "MATCH (n) WHERE id(n) = $node_id "
+                 "OPTIONAL MATCH (head)-[:{head}]->(first)-[:{next}*0..]->(n) "
+                 "WITH coalesce(head, n) AS root, first "
+                 "OPTIONAL MATCH (root)-[:{head}]->(start) WHERE first IS NULL OR start = first "
+                 "OPTIONAL MATCH path = (start)-[:{next}*0..]->(last) WHERE NOT (last)-[:{next}]->() "
+                 "RETURN id(root), labels(root), [m IN nodes(path) | [id(m), labels(m), properties(m), "
+                 "CASE WHEN $include_relationships "
+                 "THEN [(m)-[r]-() | [id(startNode(r)), id(endNode(r)), type(r), id(r)]] END]] "
+                 "ORDER BY id(start)",
+    "create_relationship": "MATCH (n) WHERE id(n) = $start_node MATCH (m) WHERE id(m) = $end_node "
+                           "MERGE (n)-[r:{name}]->(m) RETURN r",
+    "create_relationships": "UNWIND $relationships AS relationship "
+                            "MATCH (n) WHERE id(n) = relationship.start_node "
+                            "MATCH (m) WHERE id(m) = relationship.end_node "
+                            "MERGE (n)-[r:{name}]->(m) RETURN relationship.index, id(r)",
+    "create_subgraph_node": "CREATE (n{labels}) SET n += $properties",
+    "create_subgraph_relationships": "WITH n CALL {{ WITH n UNWIND $relationships[{index}] AS relationship "
+                                     "MATCH (m) WHERE id(m) = relationship.end_node AND "
+                                     "(relationship.end_node_label IS NULL OR relationship.end_node_label IN labels(m)) "
+                                     "MERGE (n)-[:{name}]->(m) RETURN count(m) AS created_{index} }}",
+    "return_subgraph": "RETURN id(n), labels(n), n, [(n)-[r]->(m) | [id(m), type(r), id(r)]]",
+    "create_chain_nodes": "MATCH (root) WHERE id(root) = $root UNWIND $nodes AS node CREATE (n{labels}) "
+                          "SET n += node WITH root, collect(n) AS chain "
+                          "CALL {{ WITH root, chain WITH root, chain[0] AS first CREATE (root)-[:{head}]->(first) "
+                          "RETURN count(first) AS head }} "
+                          "CALL {{ WITH chain UNWIND range(0, size(chain) - 2) AS index "
+                          "WITH chain[index] AS n, chain[index + 1] AS m CREATE (n)-[:{next}]->(m) "
+                          "RETURN count(m) AS linked }}",
+    "create_chain_relationships": "CALL {{ WITH chain UNWIND $relationships[{index}] AS relationship "
+                                  "WITH chain[relationship.index] AS n, relationship "
+                                  "MATCH (m) WHERE id(m) = relationship.end_node AND "
+                                  "(relationship.end_node_label IS NULL OR relationship.end_node_label IN labels(m)) "
+                                  "CREATE (n)-[:{name}]->(m) RETURN count(m) AS created_{index} }}",
+    "return_chain": "RETURN id(root), labels(root), [n IN chain | [id(n), labels(n), properties(n), "
+                    "[(n)-[r]-() | [id(startNode(r)), id(endNode(r)), type(r), id(r)]]]]",
+    "create_node_properties": "MATCH (x) WHERE id(x) = $id SET x += $properties RETURN labels(x), x",
+    "create_nodes_properties": "UNWIND $nodes AS node MATCH (x) WHERE id(x) = node.id SET x += node.properties "
+                               "RETURN id(x), labels(x), x",
+    "create_relationship_properties": "MATCH (n)-[x]->(m) WHERE id(x) = $id SET x += $properties "
+                                      "RETURN id(n), type(x), id(m), x",
+    "delete_node_properties": "MATCH (x) WHERE id(x) = $id SET x = {{}} RETURN x",
+    "get_indexes": "SHOW RANGE INDEXES YIELD name, entityType, labelsOrTypes, properties, owningConstraint "
+                   "WHERE entityType = 'NODE' AND size(properties) = 1 "
+                   "RETURN name, labelsOrTypes[0], properties[0], owningConstraint IS NOT NULL ORDER BY name",
+    "create_index": "CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.{key})",
+    "create_unique_index": "CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{key} IS UNIQUE",
+    "drop_index": "DROP INDEX {name} IF EXISTS",
+    "drop_unique_index": "DROP CONSTRAINT {name} IF EXISTS",
+}
@@ -1,3 +1,30 @@
+from contextvars import ContextVar
+from urllib.parse import urlencode
+
+# header in which client can opt out of links, the same as links query parameter
+links_header = "X-Links"
+
+# whether links are added to responses of current request, clients which do not follow links can opt out
+links_enabled = ContextVar("links_enabled", default=True)
+
+# links of routers by their ids, routers live as long as application
+link_tables = {}
+
+
+def links_requested(request):
+    """
+    Check whether client of request wants links in responses, links=false query parameter or X-Links: false
+    header opts out of them
+
+    Args:
+        request (Request): Request of client
+
+    Returns:
+        False when client opted out of links, True otherwise
+    """
+    value = request.query_params.get("links", request.headers.get(links_header, "true"))
+    return value.lower() not in ["false", "0", "no"]
+
 
 def prepare_links(route):
     """
@@ -12,6 +39,22 @@ def prepare_links(route):
     return list(map(lambda method: {'rel': route.name, '$ref': route.path, 'action': method}, route.methods))
 
 
+def get_link_table(router):
+    """
+    Prepare links of all routes of given router, computed once per router as routes do not change after
+    application is created
+
+    Args:
+        router (Router): Router to get links from
+
+    Returns:
+        Tuple of links shared by all responses
+    """
+    if id(router) not in link_tables:
+        link_tables[id(router)] = tuple(link for route in router.routes for link in prepare_links(route))
+    return link_tables[id(router)]
+
+
 def get_links(router):
     """
     Return list of links from given router
@@ -20,6 +63,22 @@ def get_links(router):
         router (Router): Router to get links from
 
     Returns:
-        List of links
+        List of links, None when client of current request opted out of them
+    """
+    if not links_enabled.get():
+        return None
+    return list(get_link_table(router))
+
+
+def get_next_link(path, params):
+    """
+    Return link to next page of listing
+
+    Args:
+        path (str): Path of listing
+        params (dict): Query parameters of next page, list values are repeated
+
+    Returns:
+        Link to next page
     """
-    return sum(list(map(prepare_links, router.routes)), [])
+    return {'rel': 'next', '$ref': path + "?" + urlencode(params, doseq=True), 'action': 'GET'}
@@ -0,0 +1,47 @@
+from typing import Optional, Any, List
+from pydantic import BaseModel, constr
+
+
+class IndexIn(BaseModel):
+    """
+    Model of index on property of nodes to acquire from client
+
+    Attributes:
+        label (str): Label of indexed nodes
+        key (str): Key of indexed property, only word characters are allowed as it is a part of statement
+        unique (bool): Whether index is backed by uniqueness constraint, so property value is unique among nodes
+            with label
+    """
+    label: constr(min_length=1)
+    key: constr(regex=r"^\w+$")
+    unique: bool = False
+
+
+class IndexOut(IndexIn):
+    """
+    Model of index to send to client as a result of request
+
+    Attributes:
+        name (Optional[str]): Name of index in database
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list): Hateoas implementation
+    """
+    label: Optional[str] = None
+    key: Optional[str] = None
+    name: Optional[str] = None
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class IndexesOut(BaseModel):
+    """
+    Model of indexes to send to client as a result of request
+
+    Attributes:
+        indexes (List[IndexOut]): Indexes on properties of nodes
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list): Hateoas implementation
+    """
+    indexes: List[IndexOut] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
@@ -0,0 +1,76 @@
+from fastapi import Response
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+from index.index_model import IndexIn, IndexOut, IndexesOut
+from index.index_service import IndexService
+from database_schema import schema
+from hateoas import get_links
+
+router = InferringRouter()
+
+
+@cbv(router)
+class IndexRouter:
+    """
+    Class for routing indexes based requests
+
+    Attributes:
+        index_service (IndexService): Service instance for indexes
+    """
+    index_service = IndexService()
+
+    @router.get("/indexes", tags=["indexes"], response_model=IndexesOut)
+    async def get_indexes(self, response: Response):
+        """
+        Get indexes on single property of nodes
+        """
+        get_response = await self.index_service.get_indexes()
+        if get_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return get_response
+
+    @router.post("/indexes", tags=["indexes"], response_model=IndexOut)
+    async def create_index(self, index: IndexIn, response: Response):
+        """
+        Create index on property of nodes with given label, optionally backed by uniqueness constraint
+        """
+        create_response = await self.index_service.save_index(index)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/indexes/schema", tags=["indexes"], response_model=IndexesOut)
+    async def apply_schema(self, response: Response):
+        """
+        Create indexes of declared database schema which do not exist yet
+        """
+        create_response = await self.index_service.save_indexes(schema)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.delete("/indexes/{name}", tags=["indexes"], response_model=IndexOut)
+    async def delete_index(self, name: str, response: Response):
+        """
+        Drop index with given name, together with its uniqueness constraint
+        """
+        delete_response = await self.index_service.delete_index(name)
+        if delete_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        delete_response.links = get_links(router)
+
+        return delete_response
@@ -0,0 +1,103 @@
+import re
+from database_service import DatabaseService
+from index.index_model import IndexIn, IndexOut, IndexesOut
+from typing import List
+
+
+class IndexService:
+    """
+    Object to handle logic of indexes requests
+
+    Attributes:
+        db (DatabaseService): Handles communication with Neo4j database
+    """
+    db: DatabaseService = DatabaseService()
+
+    def prepare_name(self, index: IndexIn):
+        """
+        Create name of index from its label and property key, so the same index always gets the same name
+
+        Args:
+            index (IndexIn): Index to name
+
+        Returns:
+            Name of index
+        """
+        prefix = "unique" if index.unique else "index"
+        return re.sub(r"\W+", "_", f"{prefix}_{index.label}_{index.key}")
+
+    async def get_indexes(self):
+        """
+        Send request to database by its API to acquire indexes on properties of nodes
+
+        Returns:
+            List of acquired indexes in IndexesOut model
+        """
+        response = await self.db.get_indexes()
+
+        if len(response["errors"]) > 0:
+            return IndexesOut(errors=response["errors"])
+
+        return IndexesOut(indexes=[IndexOut(name=row["row"][0], label=row["row"][1], key=row["row"][2],
+                                            unique=row["row"][3]) for row in response["results"][0]["data"]])
+
+    async def save_index(self, index: IndexIn):
+        """
+        Send request to database by its API to create index, nothing is changed when it already exists
+
+        Args:
+            index (IndexIn): Index to be added to database
+
+        Returns:
+            Result of request as index object
+        """
+        name = self.prepare_name(index)
+        response = await self.db.create_index(name, index)
+
+        if len(response["errors"]) > 0:
+            return IndexOut(errors=response["errors"])
+
+        return IndexOut(name=name, **index.dict())
+
+    async def save_indexes(self, indexes: List[IndexIn]):
+        """
+        Create all given indexes which do not exist yet, used to apply declared schema of database
+
+        Args:
+            indexes (List[IndexIn]): Indexes to be added to database
+
+        Returns:
+            Result of request as list of indexes, creating stops at first failed index
+        """
+        result = IndexesOut()
+        for index in indexes:
+            index_out = await self.save_index(index)
+            if index_out.errors is not None:
+                return IndexesOut(indexes=result.indexes, errors=index_out.errors)
+            result.indexes.append(index_out)
+
+        return result
+
+    async def delete_index(self, name: str):
+        """
+        Send request to database by its API to drop index with given name, together with its constraint
+
+        Args:
+            name (str): Name of index
+
+        Returns:
+            Dropped index
+        """
+        indexes = await self.get_indexes()
+        if indexes.errors is not None:
+            return IndexOut(errors=indexes.errors)
+
+        index = next((index for index in indexes.indexes if index.name == name), None)
+        if index is None:
+            return IndexOut(name=name, errors="Index not found")
+
+        response = await self.db.drop_index(name, index.unique)
+        if len(response["errors"]) > 0:
+            return IndexOut(name=name, errors=response["errors"])
+
+        return index
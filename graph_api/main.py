@@ -1,15 +1,102 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from index.index_router import router as index_router
+from index.index_service import IndexService
 from node.node_router import router as node_router
 from relationship.relationship_router import router as relationship_router
-from hateoas import get_links
+from transaction.transaction_router import router as transaction_router, transaction_header
+from hateoas import get_links, links_enabled, links_requested
+from database_backend import transaction_not_found
+from database_config import database
+from database_service import DatabaseService, current_transaction
+from database_schema import schema
 
 app = FastAPI(title="GRISERA GraphDB API",
               description="GraphDB API provides an access to graph database for the GRISERA framework.",
               version="0.1",
+              default_response_class=ORJSONResponse,
               )
 
 app.include_router(node_router)
 app.include_router(relationship_router)
+app.include_router(transaction_router)
+app.include_router(index_router)
+
+
+@app.middleware("http")
+async def transaction_middleware(request: Request, call_next):
+    """
+    Run statements of request in explicit transaction given in X-Transaction-Id header, request with id not
+    accepted by database backend is rejected, so it cannot be used to build other URL of database
+    """
+    transaction_id = request.headers.get(transaction_header)
+    if transaction_id is not None and not DatabaseService().is_transaction_id(transaction_id):
+        return ORJSONResponse({"errors": [transaction_not_found]}, status_code=404)
+
+    token = current_transaction.set(transaction_id)
+    try:
+        return await call_next(request)
+    finally:
+        current_transaction.reset(token)
+
+
+@app.middleware("http")
+async def links_middleware(request: Request, call_next):
+    """
+    Omit links from responses when client opts out of them with links=false query parameter or X-Links header
+    """
+    token = links_enabled.set(links_requested(request))
+    try:
+        return await call_next(request)
+    finally:
+        links_enabled.reset(token)
+
+
+# task applying database schema in background, cancelled on shutdown when database was never available
+schema_task = None
+
+
+async def apply_schema(delay=database["schema_retry_delay"], max_delay=database["schema_retry_max_delay"]):
+    """
+    Create missing indexes of declared schema, retrying with doubled delay until database accepts them
+
+    Args:
+        delay (float): Time in seconds before first retry
+        max_delay (float): Maximal time in seconds between retries
+    """
+    while True:
+        try:
+            errors = (await IndexService().save_indexes(schema)).errors
+        except Exception as error:
+            errors = error
+        if errors is None:
+            return
+
+        logging.getLogger(__name__).warning("Database schema was not applied, retrying in %s s: %s", delay, errors)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+@app.on_event("startup")
+async def startup_event():
+    """
+    Start applying schema in background, so API starts before database accepts connections and indexes are
+    created as soon as it does
+    """
+    global schema_task
+    schema_task = asyncio.create_task(apply_schema())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Stop applying schema and close pooled connections to database
+    """
+    if schema_task is not None:
+        schema_task.cancel()
+    await DatabaseService().close()
 
 
 @app.get("/", tags=["root"])
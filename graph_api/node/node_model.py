@@ -1,6 +1,18 @@
+from enum import Enum
 from typing import Set, Optional, Any, List
-from pydantic import BaseModel
+from pydantic import BaseModel, conlist
 from property.property_model import PropertyIn
+from relationship.relationship_model import BasicRelationshipOut
+
+
+class NodeInclude(str, Enum):
+    """
+    Parts of node which can be included in response together with it
+
+    Attributes:
+        relationships (str): Relationships of node
+    """
+    relationships = "relationships"
 
 
 class NodeIn(BaseModel):
@@ -13,6 +25,94 @@ class NodeIn(BaseModel):
     labels: Optional[Set[str]] = []
 
 
+class NodeWithPropertiesIn(NodeIn):
+    """
+    Model of node with its properties to acquire from client in bulk requests
+
+    Attributes:
+        properties (Optional[List[PropertyIn]]): Properties added to node in graph DB
+    """
+    properties: Optional[List[PropertyIn]] = []
+
+
+class SubgraphRelationshipIn(BaseModel):
+    """
+    Model of relationship going out of node created in subgraph
+
+    Attributes:
+        end_node (int): Id of node which ends connection
+        name (str): Name of the relationship
+        end_node_label (Optional[str]): Label which end node must have, relationship is not created otherwise
+    """
+    end_node: int
+    name: str
+    end_node_label: Optional[str] = None
+
+
+class SubgraphIn(NodeWithPropertiesIn):
+    """
+    Model of node with its properties and outgoing relationships to acquire from client
+
+    Attributes:
+        relationships (Optional[List[SubgraphRelationshipIn]]): Relationships going out of node
+    """
+    relationships: Optional[List[SubgraphRelationshipIn]] = []
+
+
+class ChainNodeIn(BaseModel):
+    """
+    Model of node of chain to acquire from client
+
+    Attributes:
+        properties (Optional[List[PropertyIn]]): Properties added to node in graph DB
+        relationships (Optional[List[SubgraphRelationshipIn]]): Relationships going out of node to existing nodes
+    """
+    properties: Optional[List[PropertyIn]] = []
+    relationships: Optional[List[SubgraphRelationshipIn]] = []
+
+
+class ChainIn(BaseModel):
+    """
+    Model of chain of nodes created at once, linked to existing root node
+
+    Attributes:
+        root (int): Id of existing node from which chain starts
+        head (str): Name of relationship from root to first node of chain
+        next (str): Name of relationship from node of chain to the following one
+        labels (Set[str]): Labels added to every node of chain
+        nodes (List[ChainNodeIn]): Nodes of chain in their order
+    """
+    root: int
+    head: str
+    next: str
+    labels: Set[str]
+    nodes: conlist(ChainNodeIn, min_items=1)
+
+
+class NodeExistsIn(BaseModel):
+    """
+    Model of node whose existence is checked
+
+    Attributes:
+        id (int): Id of node
+        label (Optional[str]): Label which node must have, node with any labels is accepted if not given
+    """
+    id: int
+    label: Optional[str] = None
+
+
+class NodePropertiesIn(BaseModel):
+    """
+    Model of properties set on node, its other properties are kept
+
+    Attributes:
+        id (int): Id of node
+        properties (List[PropertyIn]): Properties set on node
+    """
+    id: int
+    properties: List[PropertyIn]
+
+
 class BasicNodeOut(NodeIn):
     """
     Model of node in database
@@ -30,9 +130,43 @@ class NodeOut(BasicNodeOut):
     Model of node to send to client as a result of request
 
     Attributes:
+        relationships (Optional[List[BasicRelationshipOut]]): Relationships of node, when requested
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list): Hateoas implementation
+    """
+    relationships: Optional[List[BasicRelationshipOut]] = None
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class NeighbourhoodOut(BaseModel):
+    """
+    Model of subgraph around node to send to client as a result of request
+
+    Attributes:
+        nodes (List[BasicNodeOut]): Node from which subgraph is expanded followed by nodes reached from it
+        relationships (List[BasicRelationshipOut]): Relationships between nodes of subgraph
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list): Hateoas implementation
+    """
+    nodes: List[BasicNodeOut] = []
+    relationships: List[BasicRelationshipOut] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
+
+
+class ChainOut(BaseModel):
+    """
+    Model of chains of nodes to send to client as a result of request
+
+    Attributes:
+        root (Optional[BasicNodeOut]): Node from which chains start, with its id and labels
+        nodes (List[NodeOut]): Nodes of chains in their order, chains starting at root follow one another
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list): Hateoas implementation
     """
+    root: Optional[BasicNodeOut] = None
+    nodes: List[NodeOut] = []
     errors: Optional[Any] = None
     links: Optional[list] = None
 
@@ -43,9 +177,35 @@ class NodesOut(BaseModel):
 
     Attributes:
         nodes (Optional[List[BasicNodeOut]]): List of nodes to send
+        next_after (Optional[int]): Id after which next page of nodes starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list): Hateoas implementation
     """
     nodes: Optional[List[BasicNodeOut]] = None
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[List] = None
+
+
+class NodeExistsOut(NodeExistsIn):
+    """
+    Model of result of existence check of node
+
+    Attributes:
+        exists (bool): Whether node with given id and label exists
+    """
+    exists: bool = False
+
+
+class NodesExistOut(BaseModel):
+    """
+    Model of results of existence checks of many nodes
+
+    Attributes:
+        nodes (List[NodeExistsOut]): Results of checks in the same order as given nodes
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list): Hateoas implementation
+    """
+    nodes: List[NodeExistsOut] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
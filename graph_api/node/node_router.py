@@ -1,12 +1,18 @@
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from node.node_model import NodeIn, NodeOut, NodesOut
+from pydantic import conint
+from node.node_model import NodeIn, NodeInclude, NodeOut, NodesOut, NodeWithPropertiesIn, SubgraphIn, \
+    NeighbourhoodOut, ChainIn, ChainOut, NodeExistsIn, NodesExistOut, NodePropertiesIn
 from node.node_service import NodeService
-from hateoas import get_links
-from typing import List
+from database_config import database
+from hateoas import get_links, get_next_link
+from streaming import ResponseFormat, ndjson_lines
+from responses import ModelResponse
+from typing import List, Optional
 from property.property_model import PropertyIn
-from relationship.relationship_model import RelationshipsOut
+from relationship.relationship_model import RelationshipsOut, RelationshipDirection
 router = InferringRouter()
 
 
@@ -25,7 +31,7 @@ class NodeRouter:
         """
         Create node with optional labels
         """
-        create_response = self.node_service.save_node(node)
+        create_response = await self.node_service.save_node(node)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -34,12 +40,85 @@ class NodeRouter:
 
         return create_response
 
+    @router.post("/nodes/bulk", tags=["nodes"], response_model=NodesOut)
+    async def create_nodes(self, nodes: List[NodeWithPropertiesIn], response: Response):
+        """
+        Create many nodes with their labels and properties in one request
+        """
+        create_response = await self.node_service.save_nodes(nodes)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/nodes/properties", tags=["nodes"], response_model=NodesOut)
+    async def create_nodes_properties(self, nodes: List[NodePropertiesIn], response: Response):
+        """
+        Set properties of many nodes in one request, other properties of nodes are kept
+        """
+        create_response = await self.node_service.save_nodes_properties(nodes)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/nodes/subgraph", tags=["nodes"], response_model=NodeOut)
+    async def create_subgraph(self, subgraph: SubgraphIn, response: Response):
+        """
+        Create node with its labels, properties and outgoing relationships in one request
+        """
+        create_response = await self.node_service.save_subgraph(subgraph)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/nodes/chain", tags=["nodes"], response_model=ChainOut)
+    async def create_chain(self, chain: ChainIn, response: Response):
+        """
+        Create chain of nodes with their properties and outgoing relationships in one transaction, first node is
+        linked to root by head relationship and each next node to previous one by next relationship
+        """
+        create_response = await self.node_service.save_chain(chain)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/nodes/exists", tags=["nodes"], response_model=NodesExistOut)
+    async def nodes_exist(self, nodes: List[NodeExistsIn], response: Response):
+        """
+        Check whether nodes with given ids exist, each optionally with given label, without reading their
+        properties and relationships
+        """
+        exist_response = await self.node_service.nodes_exist(nodes)
+        if exist_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        exist_response.links = get_links(router)
+
+        return exist_response
+
     @router.get("/nodes/{id}", tags=["nodes"], response_model=NodeOut)
-    async def get_node(self, id: int, response: Response):
+    async def get_node(self, id: int, response: Response, label: Optional[str] = None,
+                       include: Optional[NodeInclude] = None):
         """
-        Get node with same id as given
+        Get node with same id as given, optionally only when it has given label and together with its relationships
         """
-        node = self.node_service.get_node(id)
+        node = await self.node_service.get_node(id, label, include == NodeInclude.relationships)
         if node.errors is not None:
             response.status_code = 404
 
@@ -48,24 +127,38 @@ class NodeRouter:
         return node
 
     @router.get("/nodes", tags=["nodes"], response_model=NodesOut)
-    async def get_nodes(self, label: str, response: Response):
+    async def get_nodes(self, label: str, response: Response, limit: Optional[conint(gt=0)] = None,
+                        after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                        where: Optional[List[str]] = Query(None)):
         """
-        Get nodes with same label as given
+        Get nodes with same label as given, optionally in pages of given size starting after given id
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all nodes starting after given id are streamed, one node per line.
         """
-        nodes = self.node_service.get_nodes(label)
+        if format == ResponseFormat.ndjson:
+            nodes = self.node_service.stream_nodes(label, database["stream_page_size"], after, where)
+            return StreamingResponse(ndjson_lines(nodes), media_type="application/x-ndjson")
+
+        nodes = await self.node_service.get_nodes(label, limit, after, where)
         if nodes.errors is not None:
             response.status_code = 422
 
         nodes.links = get_links(router)
+        if nodes.next_after is not None and nodes.links is not None:
+            nodes.links.append(get_next_link("/nodes", {"label": label, "limit": limit, "after": nodes.next_after,
+                                                         "where": where or []}))
 
-        return nodes
+        return ModelResponse(nodes, response.status_code)
 
     @router.delete("/nodes/{id}", tags=["nodes"], response_model=NodeOut)
     async def delete_node(self, id: int, response: Response):
         """
         Delete node by id
         """
-        delete_response = self.node_service.delete_node(id)
+        delete_response = await self.node_service.delete_node(id)
         if delete_response.errors is not None:
             response.status_code = 404
 
@@ -75,11 +168,12 @@ class NodeRouter:
         return delete_response
 
     @router.get("/nodes/{id}/relationships", tags=["nodes"], response_model=RelationshipsOut)
-    async def get_node_relationships(self, id: int, response: Response):
+    async def get_node_relationships(self, id: int, response: Response, type: Optional[List[str]] = Query(None),
+                                     direction: Optional[RelationshipDirection] = None):
         """
-        Get relationships for node with given id
+        Get relationships for node with given id, optionally only with given names and in given direction
         """
-        get_response = self.node_service.get_relationships(id)
+        get_response = await self.node_service.get_relationships(id, type, direction)
         if get_response.errors is not None:
             response.status_code = 422
 
@@ -88,12 +182,45 @@ class NodeRouter:
 
         return get_response
 
+    @router.get("/nodes/{id}/neighbourhood", tags=["nodes"], response_model=NeighbourhoodOut)
+    async def get_node_neighbourhood(self, id: int, response: Response, depth: conint(gt=0, le=5) = 1,
+                                     types: Optional[List[str]] = Query(None)):
+        """
+        Get nodes reachable from node with given id in at most depth hops together with relationships between
+        them, optionally traversing only relationships with given names
+        """
+        get_response = await self.node_service.get_neighbourhood(id, depth, types)
+        if get_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return ModelResponse(get_response, response.status_code)
+
+    @router.get("/nodes/{id}/chain", tags=["nodes"], response_model=ChainOut)
+    async def get_node_chain(self, id: int, response: Response, head: str, next_: str = Query(..., alias="next"),
+                             include: Optional[NodeInclude] = None):
+        """
+        Get chains of nodes linked by next relationships, which start at root by head relationship, in their order.
+        Id may be id of root, then all its chains are returned, or id of node of chain, then only its chain is
+        returned. Nodes are returned together with their relationships when requested.
+        """
+        get_response = await self.node_service.get_chain(id, head, next_, include == NodeInclude.relationships)
+        if get_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        get_response.links = get_links(router)
+
+        return ModelResponse(get_response, response.status_code)
+
     @router.post("/nodes/{id}/properties", tags=["nodes"], response_model=NodeOut)
     async def create_node_properties(self, id: int, properties: List[PropertyIn], response: Response):
         """
         Create properties for node with given id
         """
-        create_response = self.node_service.save_properties(id, properties)
+        create_response = await self.node_service.save_properties(id, properties)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -107,7 +234,7 @@ class NodeRouter:
         """
         Delete node properties by id
         """
-        delete_response = self.node_service.delete_node_properties(id)
+        delete_response = await self.node_service.delete_node_properties(id)
         if delete_response.errors is not None:
             response.status_code = 404
 
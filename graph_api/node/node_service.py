@@ -1,8 +1,10 @@
+import json
 from database_service import DatabaseService
-from node.node_model import NodeIn, NodeOut, BasicNodeOut, NodesOut
-from property.property_model import PropertyIn
+from node.node_model import NodeIn, NodeOut, BasicNodeOut, NodesOut, NodeWithPropertiesIn, SubgraphIn, \
+    NeighbourhoodOut, ChainIn, ChainOut, NodeExistsIn, NodeExistsOut, NodesExistOut, NodePropertiesIn
+from property.property_model import PropertyIn, PropertyFilter, PropertyOperator
 from typing import List
-from relationship.relationship_model import RelationshipsOut, BasicRelationshipOut
+from relationship.relationship_model import RelationshipsOut, BasicRelationshipOut, RelationshipDirection
 
 
 class NodeService:
@@ -15,7 +17,7 @@ class NodeService:
 
     db : DatabaseService = DatabaseService()
 
-    def save_node(self, node: NodeIn):
+    async def save_node(self, node: NodeIn):
         """
         Send request to database by its API to create new node
 
@@ -25,7 +27,7 @@ class NodeService:
         Returns:
             Result of request as node object
         """
-        response = self.db.create_node(node)
+        response = await self.db.create_node(node)
 
         if len(response["errors"]) > 0:
             result = NodeOut(errors=response["errors"])
@@ -35,38 +37,134 @@ class NodeService:
 
         return result
 
-    def get_node(self, node_id: int):
+    async def save_nodes(self, nodes: List[NodeWithPropertiesIn]):
+        """
+        Send request to database by its API to create many nodes at once
+
+        Args:
+            nodes (List[NodeWithPropertiesIn]): Nodes to be added to database
+
+        Returns:
+            Result of request as list of nodes in the same order as given
+        """
+        response = await self.db.create_nodes(nodes)
+
+        if len(response["errors"]) > 0:
+            return NodesOut(errors=response["errors"])
+
+        ids = [None] * len(nodes)
+        for result in response["results"]:
+            for row in result["data"]:
+                ids[row["row"][0]] = row["row"][1]
+
+        return NodesOut(nodes=[BasicNodeOut(id=node_id, labels=node.labels, properties=node.properties)
+                               for node_id, node in zip(ids, nodes)])
+
+    async def save_subgraph(self, subgraph: SubgraphIn):
+        """
+        Send request to database by its API to create node with its properties and outgoing relationships
+
+        Args:
+            subgraph (SubgraphIn): Node with relationships to be added to database
+
+        Returns:
+            Result of request as created node with its relationships
+        """
+        response = await self.db.create_subgraph(subgraph)
+
+        if len(response["errors"]) > 0:
+            return NodeOut(errors=response["errors"])
+
+        row = response["results"][0]["data"][0]["row"]
+        properties = [PropertyIn(key=property[0], value=property[1]) for property in row[2].items()]
+        relationships = [BasicRelationshipOut(start_node=row[0], end_node=relationship[0], name=relationship[1],
+                                              id=relationship[2]) for relationship in row[3]]
+
+        return NodeOut(id=row[0], labels=set(row[1]), properties=properties, relationships=relationships)
+
+    async def save_chain(self, chain: ChainIn):
+        """
+        Send request to database by its API to create chain of nodes linked to existing root node
+
+        Args:
+            chain (ChainIn): Chain of nodes to be added to database
+
+        Returns:
+            Result of request as root and created nodes of chain with their relationships
+        """
+        response = await self.db.create_chain(chain)
+
+        if len(response["errors"]) > 0:
+            return ChainOut(errors=response["errors"])
+
+        data = response["results"][0]["data"]
+        if len(data) == 0:
+            return ChainOut(errors="Root node not found")
+
+        return self.prepare_chain(data)
+
+    async def get_node(self, node_id: int, label: str = None, include_relationships: bool = False):
         """
         Send request to database by its API to acquire node with given id
 
         Args:
             node_id (int): Id by which it is searched for in the database
+            label (str): Label which node must have, node is not found otherwise
+            include_relationships (bool): Whether relationships of node are acquired together with it
 
         Returns:
             Acquired node in NodeOut model
         """
-        response = self.db.get_node(node_id)
+        response = await self.db.get_node(node_id, label, include_relationships)
+
+        if len(response["errors"]) > 0:
+            return NodeOut(errors=response["errors"])
+
+        return self.prepare_node(node_id, response['results'][0]["data"])
+
+    def prepare_node(self, node_id: int, data: list):
+        """
+        Create node model from data returned by get_node statement
+
+        Args:
+            node_id (int): Id of node
+            data (list): Data of get_node statement result
 
-        if len(response['results'][0]["data"]) == 0:
+        Returns:
+            Acquired node in NodeOut model
+        """
+        if len(data) == 0:
             return NodeOut(errors="Node not found")
 
-        node = response['results'][0]["data"][0]
+        node = data[0]
         properties = [PropertyIn(key=property[0], value=property[1]) for property in node["row"][0].items()]
         result = NodeOut(id=node_id, properties=properties, labels={node["row"][1][0]})
+        if len(node["row"]) > 2 and node["row"][2] is not None:
+            result.relationships = [BasicRelationshipOut(start_node=relation[0], end_node=relation[1],
+                                                         name=relation[2], id=relation[3])
+                                    for relation in node["row"][2]]
 
         return result
 
-    def get_nodes(self, label: str):
+    async def get_nodes(self, label: str, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to database by its API to acquire all nodes with given label
 
         Args:
             label (str): Label by which it is searched for in the database
+            limit (int): Maximal number of acquired nodes, all nodes are acquired if not given
+            after (int): Id after which acquired nodes start
+            where (List[str]): Filters on properties of acquired nodes in form described in prepare_filters
 
         Returns:
             List of acquired nodes in NodesOut model
         """
-        response = self.db.get_nodes(label)
+        try:
+            filters = self.prepare_filters(where or [])
+        except ValueError as error:
+            return NodesOut(errors=str(error))
+
+        response = await self.db.get_nodes(label, limit, after, filters)
 
         if len(response["errors"]) > 0:
             return NodesOut(errors=response["errors"])
@@ -76,9 +174,75 @@ class NodeService:
             properties = [PropertyIn(key=property[0], value=property[1]) for property in node["row"][0].items()]
             result.nodes.append(BasicNodeOut(labels={label}, id=node["meta"][0]["id"], properties=properties))
 
+        if limit is not None and len(result.nodes) == limit:
+            result.next_after = result.nodes[-1].id
+
         return result
 
-    def delete_node(self, node_id: int):
+    def prepare_filters(self, where: List[str]):
+        """
+        Create property filters from their text form. Filter key:value requires property equal to value,
+        filters key:<value, key:<=value, key:>value and key:>=value compare property with value. Value is read
+        as JSON when possible, so key:5 matches number and key:"5" matches string, otherwise it is string.
+
+        Args:
+            where (List[str]): Filters in text form
+
+        Returns:
+            List of filters in PropertyFilter model
+
+        Raises:
+            ValueError: If any filter is malformed
+        """
+        filters = []
+        for text in where:
+            key, separator, condition = text.partition(":")
+            if not separator:
+                raise ValueError(f"Filter '{text}' has no value")
+
+            operator = PropertyOperator.eq
+            for candidate in [PropertyOperator.lte, PropertyOperator.gte, PropertyOperator.lt, PropertyOperator.gt]:
+                if condition.startswith(candidate.value):
+                    operator = candidate
+                    condition = condition[len(candidate.value):]
+                    break
+
+            try:
+                value = json.loads(condition)
+            except ValueError:
+                value = condition
+            filters.append(PropertyFilter(key=key, operator=operator, value=value))
+
+        return filters
+
+    async def stream_nodes(self, label: str, page_size: int, after: int = None, where: List[str] = None):
+        """
+        Acquire all nodes with given label page by page, so only one page of nodes is held in memory at once
+
+        Args:
+            label (str): Label by which it is searched for in the database
+            page_size (int): Number of nodes acquired in one request to database
+            after (int): Id after which acquired nodes start
+            where (List[str]): Filters on properties of acquired nodes in form described in prepare_filters
+
+        Returns:
+            Asynchronous generator of acquired nodes in BasicNodeOut model, if request fails generator ends with
+            NodeOut model with errors
+        """
+        while True:
+            page = await self.get_nodes(label, page_size, after, where)
+            if page.errors is not None:
+                yield NodeOut(errors=page.errors)
+                return
+
+            for node in page.nodes:
+                yield node
+
+            if page.next_after is None:
+                return
+            after = page.next_after
+
+    async def delete_node(self, node_id: int):
         """
         Send request to database by its API to delete node with given id
 
@@ -87,24 +251,30 @@ class NodeService:
         Returns:
             Deleted node
         """
-        node = self.get_node(node_id)
-        response = self.db.delete_node(node_id)
-        result = NodeOut(errors=response["errors"]) if len(response["errors"]) > 0 else \
-            NodeOut(id=node_id, labels=node.labels, properties=node.properties)
+        response = await self.db.batch() \
+            .add("get_node", {"node_id": node_id}) \
+            .add("delete_node", {"node_id": node_id}) \
+            .commit()
 
-        return result
+        if len(response["errors"]) > 0:
+            return NodeOut(errors=response["errors"])
+
+        node = self.prepare_node(node_id, response["results"][0]["data"])
+        return NodeOut(id=node_id, labels=node.labels, properties=node.properties)
 
-    def get_relationships(self, id: int):
+    async def get_relationships(self, id: int, types: List[str] = None, direction: RelationshipDirection = None):
         """
         Send request to database by its API to get node's relationships
 
         Args:
             id (int): Id of the node
+            types (List[str]): Names of relationships to get, all relationships are returned if not given
+            direction (RelationshipDirection): Direction of relationships to get, both directions if not given
 
         Returns:
             Result of request as list of relationships
         """
-        response = self.db.get_relationships(id)
+        response = await self.db.get_relationships(id, types, direction)
 
         if len(response["errors"]) > 0:
             result = RelationshipsOut(errors=response["errors"])
@@ -116,7 +286,102 @@ class NodeService:
 
         return result
 
-    def save_properties(self, id: int, properties: List[PropertyIn]):
+    async def nodes_exist(self, nodes: List[NodeExistsIn]):
+        """
+        Send request to database by its API to check whether nodes with given ids and labels exist
+
+        Args:
+            nodes (List[NodeExistsIn]): Nodes to check
+
+        Returns:
+            Results of checks in NodesExistOut model, in the same order as given nodes
+        """
+        response = await self.db.nodes_exist(nodes)
+
+        if len(response["errors"]) > 0:
+            return NodesExistOut(errors=response["errors"])
+
+        return NodesExistOut(nodes=[NodeExistsOut(id=row["row"][0], label=row["row"][1], exists=row["row"][2])
+                                    for row in response["results"][0]["data"]])
+
+    async def get_neighbourhood(self, id: int, depth: int, types: List[str] = None):
+        """
+        Send request to database by its API to get subgraph of nodes reachable from node in given number of hops
+
+        Args:
+            id (int): Id of the node
+            depth (int): Maximal number of relationships between node and nodes of subgraph
+            types (List[str]): Names of relationships to traverse, all relationships are traversed if not given
+
+        Returns:
+            Result of request as nodes and relationships of subgraph
+        """
+        response = await self.db.get_neighbourhood(id, depth, types)
+
+        if len(response["errors"]) > 0:
+            return NeighbourhoodOut(errors=response["errors"])
+
+        data = response["results"][0]["data"]
+        if len(data) == 0:
+            return NeighbourhoodOut(errors="Node not found")
+
+        nodes, relationships = data[0]["row"]
+        return NeighbourhoodOut(
+            nodes=[BasicNodeOut(id=node[0], labels=set(node[1]),
+                                properties=[PropertyIn(key=key, value=value) for key, value in node[2].items()])
+                   for node in nodes],
+            relationships=[BasicRelationshipOut(start_node=relation[0], end_node=relation[1], name=relation[2],
+                                                id=relation[3]) for relation in relationships])
+
+    async def get_chain(self, id: int, head: str, next: str, include_relationships: bool = False):
+        """
+        Send request to database by its API to get chains of nodes which start at root by head relationship and
+        continue by next relationships
+
+        Args:
+            id (int): Id of root or of node of chain
+            head (str): Name of relationship from root to first node of chain
+            next (str): Name of relationship from node of chain to the following one
+            include_relationships (bool): Whether relationships of nodes are acquired together with them
+
+        Returns:
+            Result of request as root and nodes of chains in order
+        """
+        response = await self.db.get_chain(id, head, next, include_relationships)
+
+        if len(response["errors"]) > 0:
+            return ChainOut(errors=response["errors"])
+
+        data = response["results"][0]["data"]
+        if len(data) == 0:
+            return ChainOut(errors="Node not found")
+
+        return self.prepare_chain(data)
+
+    def prepare_chain(self, data: list):
+        """
+        Create chain model from data returned by get_chain or create_chain statements
+
+        Args:
+            data (list): Data of statement result, one row with root and nodes of chain for each chain
+
+        Returns:
+            Root and nodes of chains in ChainOut model
+        """
+        result = ChainOut(root=BasicNodeOut(id=data[0]["row"][0], labels=set(data[0]["row"][1])))
+        for row in data:
+            for node in row["row"][2] or []:
+                node_out = NodeOut(id=node[0], labels=set(node[1]),
+                                   properties=[PropertyIn(key=key, value=value) for key, value in node[2].items()])
+                if node[3] is not None:
+                    node_out.relationships = [BasicRelationshipOut(start_node=relation[0], end_node=relation[1],
+                                                                   name=relation[2], id=relation[3])
+                                              for relation in node[3]]
+                result.nodes.append(node_out)
+
+        return result
+
+    async def save_properties(self, id: int, properties: List[PropertyIn]):
         """
         Send request to database by its API to create new properties
 
@@ -127,21 +392,47 @@ class NodeService:
         Returns:
             Result of request as node object
         """
-        if self.db.node_exists(id):
-            response = self.db.create_node_properties(id, properties)
-            if len(response["errors"]) > 0:
-                result = NodeOut(errors=response["errors"])
-            else:
-                response_data = response["results"][0]["data"][0]["row"]
-                response_properties = list((map(
-                    lambda property: PropertyIn(key=property[0], value=property[1]), response_data[1].items())))
-                result = NodeOut(labels=set(response_data[0]), id=id, properties=response_properties)
-        else:
+        response = await self.db.batch() \
+            .add("node_exists", {"node_id": id}) \
+            .add("create_node_properties", {"id": id, "properties": self.db.prepare_properties(properties)}) \
+            .commit()
+
+        if len(response["errors"]) > 0:
+            result = NodeOut(errors=response["errors"])
+        elif len(response["results"][0]["data"]) == 0:
             result = NodeOut(id=id, errors={"errors": "not matching id"})
+        else:
+            response_data = response["results"][1]["data"][0]["row"]
+            response_properties = list((map(
+                lambda property: PropertyIn(key=property[0], value=property[1]), response_data[1].items())))
+            result = NodeOut(labels=set(response_data[0]), id=id, properties=response_properties)
 
         return result
 
-    def delete_node_properties(self, node_id: int):
+    async def save_nodes_properties(self, nodes: List[NodePropertiesIn]):
+        """
+        Send request to database by its API to set properties of many nodes at once
+
+        Args:
+            nodes (List[NodePropertiesIn]): Nodes with properties to set
+
+        Returns:
+            Result of request as list of changed nodes, errors when some nodes were not found
+        """
+        response = await self.db.create_nodes_properties(nodes)
+
+        if len(response["errors"]) > 0:
+            return NodesOut(errors=response["errors"])
+
+        rows = [row["row"] for row in response["results"][0]["data"]]
+        result = NodesOut(nodes=[BasicNodeOut(id=row[0], labels=set(row[1]), properties=[
+            PropertyIn(key=key, value=value) for key, value in row[2].items()]) for row in rows])
+        if len(rows) != len({node.id for node in nodes}):
+            result.errors = {"errors": "not matching id"}
+
+        return result
+
+    async def delete_node_properties(self, node_id: int):
         """
         Send request to database by its API to delete properties from node with given id
 
@@ -150,9 +441,13 @@ class NodeService:
         Returns:
             Deleted node
         """
-        node = self.get_node(node_id)
-        response = self.db.delete_node_properties(node_id)
-        result = NodeOut(errors=response["errors"]) if len(response["errors"]) > 0 else \
-            NodeOut(id=node_id, labels=node.labels, properties=node.properties)
+        response = await self.db.batch() \
+            .add("get_node", {"node_id": node_id}) \
+            .add("delete_node_properties", {"id": node_id}) \
+            .commit()
 
-        return result
+        if len(response["errors"]) > 0:
+            return NodeOut(errors=response["errors"])
+
+        node = self.prepare_node(node_id, response["results"][0]["data"])
+        return NodeOut(id=node_id, labels=node.labels, properties=node.properties)
@@ -1,5 +1,6 @@
+from enum import Enum
 from typing import Union
-from pydantic import BaseModel
+from pydantic import BaseModel, StrictBool, StrictInt, StrictFloat, StrictStr, constr
 
 
 class PropertyIn(BaseModel):
@@ -9,7 +10,42 @@ class PropertyIn(BaseModel):
     Attributes:
         key (str): Key of property added to node or relationship
 
-        value (Union[str, int]): Value of property added to node or relationship
+        value (Union[bool, int, float, str]): Value of property added to node or relationship, its type is
+            kept when stored in database
     """
     key: str
-    value: Union[str, int]
+    value: Union[StrictBool, StrictInt, StrictFloat, StrictStr]
+
+
+class PropertyOperator(str, Enum):
+    """
+    Operators comparing property of node with value of filter
+
+    Attributes:
+        eq (str): Property equal to value
+        lt (str): Property less than value
+        lte (str): Property less than or equal to value
+        gt (str): Property greater than value
+        gte (str): Property greater than or equal to value
+    """
+    eq = "="
+    lt = "<"
+    lte = "<="
+    gt = ">"
+    gte = ">="
+
+
+class PropertyFilter(BaseModel):
+    """
+    Model of filter on property of node
+
+    Attributes:
+        key (str): Key of filtered property, only word characters are allowed as it is a part of statement
+
+        operator (PropertyOperator): Operator comparing property with value
+
+        value (Union[bool, int, float, str]): Value compared with property, passed to database as parameter
+    """
+    key: constr(regex=r"^\w+$")
+    operator: PropertyOperator = PropertyOperator.eq
+    value: Union[StrictBool, StrictInt, StrictFloat, StrictStr]
@@ -1,8 +1,21 @@
+from enum import Enum
 from typing import Optional, Any, List
 from pydantic import BaseModel
 from property.property_model import PropertyIn
 
 
+class RelationshipDirection(str, Enum):
+    """
+    Directions of relationships from the point of view of node
+
+    Attributes:
+        outgoing (str): Relationships which start in node
+        incoming (str): Relationships which end in node
+    """
+    outgoing = "outgoing"
+    incoming = "incoming"
+
+
 class RelationshipIn(BaseModel):
     """
         Model of relationship to acquire from client
@@ -57,3 +70,18 @@ class RelationshipsOut(BaseModel):
     relationships: List[BasicRelationshipOut] = []
     errors: Optional[Any] = None
     links: Optional[list] = None
+
+
+class RelationshipsBulkOut(BaseModel):
+    """
+        List of relationships created in one request, each with its own errors
+
+        Attributes:
+            relationships (List[RelationshipOut]): Created relationships in order of request
+            errors (Optional[Any]): Optional errors appeared during query executions
+            links (Optional[list): Hateoas implementation
+    """
+
+    relationships: List[RelationshipOut] = []
+    errors: Optional[Any] = None
+    links: Optional[list] = None
@@ -1,7 +1,7 @@
 from fastapi import Response
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from relationship.relationship_model import RelationshipIn, RelationshipOut
+from relationship.relationship_model import RelationshipIn, RelationshipOut, RelationshipsBulkOut
 from relationship.relationship_service import RelationshipService
 from hateoas import get_links
 from typing import List
@@ -26,7 +26,21 @@ class RelationshipRouter:
         """
         Create directed and named relationship
         """
-        create_response = self.relationship_service.save_relationship(relationship)
+        create_response = await self.relationship_service.save_relationship(relationship)
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/relationships/bulk", tags=["relationships"], response_model=RelationshipsBulkOut)
+    async def create_relationships(self, relationships: List[RelationshipIn], response: Response):
+        """
+        Create many directed and named relationships in one request
+        """
+        create_response = await self.relationship_service.save_relationships(relationships)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -40,7 +54,7 @@ class RelationshipRouter:
         """
         Create properties for relationship with given id
         """
-        create_response = self.relationship_service.save_properties(id, properties)
+        create_response = await self.relationship_service.save_properties(id, properties)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -54,7 +68,7 @@ class RelationshipRouter:
         """
         Delete relationship by id
         """
-        delete_response = self.relationship_service.delete_relationship(id)
+        delete_response = await self.relationship_service.delete_relationship(id)
         if delete_response.errors is not None:
             response.status_code = 404
 
@@ -1,6 +1,6 @@
 from database_service import DatabaseService
 from database_config import database
-from relationship.relationship_model import RelationshipOut, RelationshipIn
+from relationship.relationship_model import RelationshipOut, RelationshipIn, RelationshipsBulkOut
 from property.property_model import PropertyIn
 from typing import List
 
@@ -14,7 +14,7 @@ class RelationshipService:
     """
     db: DatabaseService = DatabaseService()
 
-    def save_relationship(self, relationship: RelationshipIn):
+    async def save_relationship(self, relationship: RelationshipIn):
         """
         Send request to database by its API to create new relationship
 
@@ -24,23 +24,61 @@ class RelationshipService:
         Returns:
             Result of request as relationship object
         """
-        if self.db.node_exists(relationship.start_node) and self.db.node_exists(relationship.end_node):
-            response = self.db.create_relationship(relationship)
+        response = await self.db.batch() \
+            .add("node_exists", {"node_id": relationship.start_node}) \
+            .add("node_exists", {"node_id": relationship.end_node}) \
+            .add("create_relationship", {"start_node": relationship.start_node, "end_node": relationship.end_node},
+                 name=self.db.quote_identifier(relationship.name)) \
+            .commit()
 
-            if len(response["errors"]) > 0:
-                result = RelationshipOut(start_node=relationship.start_node, end_node=relationship.end_node,
-                                         name=relationship.name, errors=response["errors"])
-            else:
-                relationship_id = response["results"][0]["data"][0]["meta"][0]["id"]
-                result = RelationshipOut(start_node=relationship.start_node, end_node=relationship.end_node,
-                                         name=relationship.name, id=relationship_id)
+        if len(response["errors"]) > 0:
+            result = RelationshipOut(start_node=relationship.start_node, end_node=relationship.end_node,
+                                     name=relationship.name, errors=response["errors"])
+        elif len(response["results"][0]["data"]) != 0 and len(response["results"][1]["data"]) != 0:
+            relationship_id = response["results"][2]["data"][0]["meta"][0]["id"]
+            result = RelationshipOut(start_node=relationship.start_node, end_node=relationship.end_node,
+                                     name=relationship.name, id=relationship_id)
         else:
             result = RelationshipOut(start_node=relationship.start_node, end_node=relationship.end_node,
                                      name=relationship.name, errors={"errors": "not matching node id"})
 
         return result
 
-    def get_relationship(self, relationship_id: int):
+    async def save_relationships(self, relationships: List[RelationshipIn]):
+        """
+        Send request to database by its API to create many relationships at once
+
+        Args:
+            relationships (List[RelationshipIn]): Relationships to be added to database
+
+        Returns:
+            Result of request as list of relationships in the same order as given, relationships between not
+            existing nodes have errors
+        """
+        response = await self.db.create_relationships(relationships)
+
+        if len(response["errors"]) > 0:
+            return RelationshipsBulkOut(errors=response["errors"])
+
+        ids = {}
+        for result in response["results"]:
+            for row in result["data"]:
+                ids[row["row"][0]] = row["row"][1]
+
+        result = RelationshipsBulkOut()
+        for index, relationship in enumerate(relationships):
+            if index in ids:
+                result.relationships.append(RelationshipOut(start_node=relationship.start_node,
+                                                            end_node=relationship.end_node,
+                                                            name=relationship.name, id=ids[index]))
+            else:
+                result.relationships.append(RelationshipOut(start_node=relationship.start_node,
+                                                            end_node=relationship.end_node, name=relationship.name,
+                                                            errors={"errors": "not matching node id"}))
+
+        return result
+
+    async def get_relationship(self, relationship_id: int):
         """
         Send request to database by its API to acquire relationship with given id
 
@@ -50,18 +88,30 @@ class RelationshipService:
         Returns:
             Acquired relationship in RelationshipOut model
         """
-        response = self.db.get_relationship(relationship_id)
+        response = await self.db.get_relationship(relationship_id)
+
+        return self.prepare_relationship(response['results'][0]["data"])
+
+    def prepare_relationship(self, data: list):
+        """
+        Create relationship model from data returned by get_relationship statement
 
-        if len(response['results'][0]["data"]) == 0:
+        Args:
+            data (list): Data of get_relationship statement result
+
+        Returns:
+            Acquired relationship in RelationshipOut model
+        """
+        if len(data) == 0:
             return RelationshipOut(errors="Relationship not found")
 
-        relationship = response['results'][0]["data"][0]
+        relationship = data[0]
         result = RelationshipOut(start_node=relationship["row"][0], end_node=relationship["row"][1],
                                  id=relationship["row"][3], name=relationship["row"][2])
 
         return result
 
-    def delete_relationship(self, relationship_id: int):
+    async def delete_relationship(self, relationship_id: int):
         """
         Send request to database by its API to delete relationship with given id
 
@@ -70,19 +120,22 @@ class RelationshipService:
         Returns:
             Deleted relationship
         """
-        relationship = self.get_relationship(relationship_id)
-        response = self.db.delete_relationship(relationship_id)
+        response = await self.db.batch() \
+            .add("get_relationship", {"relationship_id": relationship_id}) \
+            .add("delete_relationship", {"relationship_id": relationship_id}) \
+            .commit()
 
         if len(response["errors"]) > 0:
             result = RelationshipOut(errors=response["errors"])
         else:
+            relationship = self.prepare_relationship(response["results"][0]["data"])
             result = RelationshipOut(id=relationship_id, start_node=relationship.start_node,
                                      end_node=relationship.end_node, name=relationship.name,
                                      properties=relationship.properties)
 
         return result
 
-    def save_properties(self, id: int, properties: List[PropertyIn]):
+    async def save_properties(self, id: int, properties: List[PropertyIn]):
         """
         Send request to database by its API to create new properties
 
@@ -94,17 +147,20 @@ class RelationshipService:
         Returns:
             Result of request as relationship object
         """
-        if self.db.relationship_exist(id):
-            response = self.db.create_relationship_properties(id, properties)
-            if len(response["errors"]) > 0:
-                result = RelationshipOut(errors=response["errors"])
-            else:
-                response_data = response["results"][0]["data"][0]["row"]
-                response_properties = list((map(
-                    lambda property: PropertyIn(key=property[0], value=property[1]), response_data[3].items())))
-                result = RelationshipOut(start_node=response_data[0], end_node=response_data[2], name=response_data[1],
-                                         id=id, properties=response_properties)
-        else:
+        response = await self.db.batch() \
+            .add("relationship_exists", {"relationship_id": id}) \
+            .add("create_relationship_properties", {"id": id, "properties": self.db.prepare_properties(properties)}) \
+            .commit()
+
+        if len(response["errors"]) > 0:
+            result = RelationshipOut(errors=response["errors"])
+        elif len(response["results"][0]["data"]) == 0:
             result = RelationshipOut(id=id, errors={"errors": "not matching id"})
+        else:
+            response_data = response["results"][1]["data"][0]["row"]
+            response_properties = list((map(
+                lambda property: PropertyIn(key=property[0], value=property[1]), response_data[3].items())))
+            result = RelationshipOut(start_node=response_data[0], end_node=response_data[2], name=response_data[1],
+                                     id=id, properties=response_properties)
 
         return result
@@ -0,0 +1,35 @@
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def encode_value(value):
+    """
+    Encode values which are not supported by orjson
+
+    Args:
+        value (Any): Value to encode
+
+    Returns:
+        Value which orjson can serialize
+    """
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ModelResponse(ORJSONResponse):
+    """
+    Response rendering model with orjson directly. Model returned by endpoint is otherwise validated again and
+    encoded value by value by FastAPI, which takes most of the time of large responses.
+
+    Attributes:
+        model (BaseModel): Rendered model
+    """
+
+    def __init__(self, model: BaseModel, status_code: int = None, **kwargs):
+        self.model = model
+        super().__init__(model, status_code=status_code or 200, **kwargs)
+
+    def render(self, content: BaseModel):
+        return orjson.dumps(content.dict(), default=encode_value)
@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class ResponseFormat(str, Enum):
+    """
+    Formats in which listings can be returned
+
+    Attributes:
+        json (str): Whole listing in one JSON document
+        ndjson (str): Streamed listing with one JSON document per line
+    """
+    json = "json"
+    ndjson = "ndjson"
+
+
+async def ndjson_lines(models):
+    """
+    Serialize models produced by asynchronous generator to lines of NDJSON
+
+    Args:
+        models (AsyncIterator[BaseModel]): Models to serialize
+
+    Returns:
+        Asynchronous generator of lines
+    """
+    async for model in models:
+        yield model.json() + "\n"
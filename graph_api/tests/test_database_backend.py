@@ -0,0 +1,282 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from database_backend import HttpBackend, BoltBackend, get_backend
+from httpx import Response
+from neo4j.exceptions import Neo4jError, TransactionError
+from neo4j.graph import Node, Relationship
+
+
+def prepare_node(node_id, properties):
+    node = mock.MagicMock(spec=Node)
+    node.id = node_id
+    node.items.return_value = properties.items()
+    return node
+
+
+def prepare_relationship(relationship_id, properties):
+    relationship = mock.MagicMock(spec=Relationship)
+    relationship.id = relationship_id
+    relationship.items.return_value = properties.items()
+    return relationship
+
+
+class HttpBackendTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = HttpBackend()
+        self.commit_body = {"statements": [{"statement": "Create (n: Test)"}]}
+        self.response_content = {'results': [{'data': [{'meta': [{}]}]}], 'errors': []}
+        self.response = Response(200, json=self.response_content)
+
+    @mock.patch.object(HttpBackend, 'get_client')
+    def test_post(self, get_client_mock):
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=self.response)
+
+        result = asyncio.run(self.backend.post(self.commit_body))
+
+        self.assertEqual(result, self.response_content)
+        get_client_mock.return_value.post.assert_called_with(url=self.backend.database_url,
+                                                             json=self.commit_body)
+
+    @mock.patch.object(HttpBackend, 'get_client')
+    def test_post_in_transaction(self, get_client_mock):
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=self.response)
+
+        result = asyncio.run(self.backend.post(self.commit_body, "12"))
+
+        self.assertEqual(result, self.response_content)
+        get_client_mock.return_value.post.assert_called_with(url=self.backend.transaction_url + "/12",
+                                                             json=self.commit_body)
+
+    @mock.patch.object(HttpBackend, 'get_client')
+    def test_begin(self, get_client_mock):
+        response = Response(201, json={"commit": "http://localhost:7474/db/neo4j/tx/12/commit", "results": [],
+                                       "errors": []})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
+
+        result = asyncio.run(self.backend.begin())
+
+        self.assertEqual(result, {"id": "12", "errors": []})
+        get_client_mock.return_value.post.assert_called_with(url=self.backend.transaction_url,
+                                                             json={"statements": []})
+
+    @mock.patch.object(HttpBackend, 'get_client')
+    def test_begin_with_error(self, get_client_mock):
+        response = Response(200, json={"results": [], "errors": ["error"]})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
+
+        result = asyncio.run(self.backend.begin())
+
+        self.assertEqual(result, {"id": None, "errors": ["error"]})
+
+    @mock.patch.object(HttpBackend, 'get_client')
+    def test_commit(self, get_client_mock):
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=self.response)
+
+        result = asyncio.run(self.backend.commit("12"))
+
+        self.assertEqual(result, self.response_content)
+        get_client_mock.return_value.post.assert_called_with(url=self.backend.transaction_url + "/12/commit",
+                                                             json={"statements": []})
+
+    @mock.patch.object(HttpBackend, 'get_client')
+    def test_rollback(self, get_client_mock):
+        get_client_mock.return_value.delete = mock.AsyncMock(return_value=self.response)
+
+        result = asyncio.run(self.backend.rollback("12"))
+
+        self.assertEqual(result, self.response_content)
+        get_client_mock.return_value.delete.assert_called_with(url=self.backend.transaction_url + "/12")
+
+    @mock.patch('database_backend.httpx')
+    def test_get_client_is_reused(self, httpx_mock):
+        first = self.backend.get_client()
+        second = self.backend.get_client()
+
+        self.assertIs(first, second)
+        httpx_mock.AsyncClient.assert_called_once_with(auth=self.backend.database_auth,
+                                                       limits=self.backend.database_limits,
+                                                       timeout=self.backend.database_timeout)
+
+    def test_is_transaction_id(self):
+        self.assertTrue(self.backend.is_transaction_id("12"))
+        self.assertFalse(self.backend.is_transaction_id("../../system/tx/commit"))
+        self.assertFalse(self.backend.is_transaction_id(""))
+
+    def test_close(self):
+        client_mock = mock.MagicMock()
+        client_mock.aclose = mock.AsyncMock()
+        self.backend._client = client_mock
+
+        asyncio.run(self.backend.close())
+
+        client_mock.aclose.assert_awaited_once()
+        self.assertIsNone(self.backend._client)
+
+
+class BoltBackendTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = BoltBackend()
+        self.commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n)=$id RETURN n, labels(n)",
+                                            "parameters": {"id": 5}}]}
+
+    def prepare_transaction(self, get_driver_mock, records):
+        result = mock.MagicMock()
+        result.keys.return_value = ["n", "labels(n)"]
+        result.__aiter__.return_value = records
+        transaction = mock.MagicMock()
+        transaction.run = mock.AsyncMock(return_value=result)
+        transaction.commit = mock.AsyncMock()
+        transaction.rollback = mock.AsyncMock()
+        transaction.closed.return_value = False
+        session = get_driver_mock.return_value.session.return_value.__aenter__.return_value
+        session.begin_transaction = mock.AsyncMock(return_value=transaction)
+        return transaction
+
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_post(self, get_driver_mock):
+        record = mock.MagicMock()
+        record.values.return_value = [prepare_node(5, {"key": "value"}), ["Test"]]
+        transaction = self.prepare_transaction(get_driver_mock, [record])
+
+        result = asyncio.run(self.backend.post(self.commit_body))
+
+        self.assertEqual(result, {"results": [{"columns": ["n", "labels(n)"],
+                                               "data": [{"row": [{"key": "value"}, ["Test"]],
+                                                         "meta": [{"id": 5, "type": "node", "deleted": False},
+                                                                  None]}]}],
+                                  "errors": []})
+        transaction.run.assert_called_once_with("MATCH (n) WHERE id(n)=$id RETURN n, labels(n)", {"id": 5})
+        transaction.commit.assert_awaited_once()
+
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_post_with_error(self, get_driver_mock):
+        transaction = self.prepare_transaction(get_driver_mock, [])
+        transaction.run.side_effect = Neo4jError._hydrate_neo4j(code="Neo.ClientError.Statement.SyntaxError",
+                                                                message="error")
+
+        result = asyncio.run(self.backend.post(self.commit_body))
+
+        self.assertEqual(result, {"results": [], "errors": [{"code": "Neo.ClientError.Statement.SyntaxError",
+                                                             "message": "error"}]})
+        transaction.rollback.assert_awaited_once()
+
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_post_with_failed_commit(self, get_driver_mock):
+        transaction = self.prepare_transaction(get_driver_mock, [])
+        transaction.commit.side_effect = Neo4jError._hydrate_neo4j(
+            code="Neo.TransientError.Transaction.DeadlockDetected", message="deadlock")
+        transaction.closed.return_value = True
+
+        result = asyncio.run(self.backend.post(self.commit_body))
+
+        self.assertEqual(result, {"results": [{"columns": ["n", "labels(n)"], "data": []}],
+                                  "errors": [{"code": "Neo.TransientError.Transaction.DeadlockDetected",
+                                              "message": "deadlock"}]})
+        transaction.rollback.assert_not_awaited()
+
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_commit_with_driver_error(self, get_driver_mock):
+        session = get_driver_mock.return_value.session.return_value
+        transaction = mock.MagicMock()
+        transaction.commit = mock.AsyncMock(side_effect=TransactionError(transaction, "Transaction closed"))
+        session.begin_transaction = mock.AsyncMock(return_value=transaction)
+        session.close = mock.AsyncMock()
+        transaction_id = asyncio.run(self.backend.begin())["id"]
+
+        result = asyncio.run(self.backend.commit(transaction_id))
+
+        self.assertEqual(result, {"results": [], "errors": [{"code": "TransactionError",
+                                                             "message": "Transaction closed"}]})
+        session.close.assert_awaited_once()
+        self.assertEqual(self.backend._transactions, {})
+
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_begin_and_commit(self, get_driver_mock):
+        session = get_driver_mock.return_value.session.return_value
+        transaction = mock.MagicMock()
+        transaction.commit = mock.AsyncMock()
+        session.begin_transaction = mock.AsyncMock(return_value=transaction)
+        session.close = mock.AsyncMock()
+
+        begin_result = asyncio.run(self.backend.begin())
+        commit_result = asyncio.run(self.backend.commit(begin_result["id"]))
+
+        self.assertEqual(begin_result["errors"], [])
+        self.assertEqual(commit_result, {"results": [], "errors": []})
+        transaction.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+        self.assertEqual(self.backend._transactions, {})
+
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_post_in_transaction_with_error(self, get_driver_mock):
+        session = get_driver_mock.return_value.session.return_value
+        transaction = mock.MagicMock()
+        transaction.run = mock.AsyncMock(side_effect=Neo4jError._hydrate_neo4j(
+            code="Neo.ClientError.Statement.SyntaxError", message="error"))
+        transaction.rollback = mock.AsyncMock()
+        transaction.closed.return_value = False
+        session.begin_transaction = mock.AsyncMock(return_value=transaction)
+        session.close = mock.AsyncMock()
+        transaction_id = asyncio.run(self.backend.begin())["id"]
+
+        result = asyncio.run(self.backend.post(self.commit_body, transaction_id))
+
+        self.assertEqual(result, {"results": [], "errors": [{"code": "Neo.ClientError.Statement.SyntaxError",
+                                                             "message": "error"}]})
+        transaction.rollback.assert_awaited_once()
+        self.assertEqual(self.backend._transactions, {})
+
+    def test_is_transaction_id(self):
+        self.backend._transactions["abc"] = (mock.MagicMock(), mock.MagicMock(), 0)
+
+        self.assertTrue(self.backend.is_transaction_id("abc"))
+        self.assertFalse(self.backend.is_transaction_id("unknown"))
+
+    def test_commit_unknown_transaction(self):
+        result = asyncio.run(self.backend.commit("unknown"))
+
+        self.assertEqual(len(result["errors"]), 1)
+
+    @mock.patch('database_backend.time.monotonic')
+    @mock.patch.object(BoltBackend, 'get_driver')
+    def test_post_in_expired_transaction(self, get_driver_mock, monotonic_mock):
+        session = get_driver_mock.return_value.session.return_value
+        transaction = mock.MagicMock()
+        transaction.rollback = mock.AsyncMock()
+        transaction.closed.return_value = False
+        session.begin_transaction = mock.AsyncMock(return_value=transaction)
+        session.close = mock.AsyncMock()
+        monotonic_mock.return_value = 100
+        transaction_id = asyncio.run(self.backend.begin())["id"]
+        monotonic_mock.return_value = 100 + self.backend.transaction_timeout + 1
+
+        result = asyncio.run(self.backend.post(self.commit_body, transaction_id))
+
+        self.assertEqual(result["errors"][0]["message"], "Unrecognized transaction id")
+        transaction.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
+        self.assertEqual(self.backend._transactions, {})
+
+    def test_convert_relationship(self):
+        relationship = prepare_relationship(3, {"key": 1})
+
+        self.assertEqual(self.backend.convert_value(relationship), {"key": 1})
+        self.assertEqual(self.backend.convert_meta(relationship), {"id": 3, "type": "relationship", "deleted": False})
+
+    def test_convert_list(self):
+        nodes = [prepare_node(1, {}), prepare_node(2, {"key": "value"})]
+
+        self.assertEqual(self.backend.convert_value(nodes), [{}, {"key": "value"}])
+        self.assertEqual(self.backend.convert_meta(nodes), [{"id": 1, "type": "node", "deleted": False},
+                                                            {"id": 2, "type": "node", "deleted": False}])
+
+
+class GetBackendTestCase(unittest.TestCase):
+
+    def test_get_backend(self):
+        self.assertIsInstance(get_backend("http"), HttpBackend)
+        self.assertIsInstance(get_backend("bolt"), BoltBackend)
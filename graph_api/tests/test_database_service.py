@@ -1,12 +1,13 @@
-import json
+import asyncio
 import unittest
 import unittest.mock as mock
 
-from database_service import DatabaseService
-from node.node_model import NodeIn
-from property.property_model import PropertyIn
-from relationship.relationship_model import RelationshipIn
-from requests import Response
+from database_service import DatabaseService, current_transaction
+from index.index_model import IndexIn
+from node.node_model import NodeIn, NodeWithPropertiesIn, SubgraphIn, SubgraphRelationshipIn, ChainIn, ChainNodeIn, \
+    NodeExistsIn, NodePropertiesIn
+from property.property_model import PropertyIn, PropertyFilter, PropertyOperator
+from relationship.relationship_model import RelationshipIn, RelationshipDirection
 
 
 class DatabaseServiceTestCase(unittest.TestCase):
@@ -14,241 +15,554 @@ class DatabaseServiceTestCase(unittest.TestCase):
     def setUp(self):
         self.database_service = DatabaseService()
         self.statement = "Create (n: Test)"
-        self.commit_body = {"statements": [{"statement": self.statement}]}
+        self.commit_body = {"statements": [{"statement": self.statement, "parameters": {}}]}
         self.response_content = {'results': [{'data': [{'meta': [{}]}]}], 'errors': []}
-        self.response = Response()
-        self.response._content = json.dumps(self.response_content).encode('utf-8')
 
-    @mock.patch('database_service.requests')
-    def test_post(self, requests_mock):
-        requests_mock.post.return_value = self.response
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_post(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
 
-        result = self.database_service.post(self.commit_body)
+        result = asyncio.run(self.database_service.post(self.commit_body))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=self.commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(self.commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_post_statement(self, requests_mock):
-        requests_mock.post.return_value = self.response
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_post_in_current_transaction(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        token = current_transaction.set("12")
 
-        result = self.database_service.post_statement(self.statement)
+        result = asyncio.run(self.database_service.post(self.commit_body))
 
+        current_transaction.reset(token)
         self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(self.commit_body, "12")
 
-    @mock.patch('database_service.requests')
-    def test_node_exists_with_node(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH (n) where id(n) =1 return n"}]}
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_begin_transaction(self, backend_mock):
+        backend_mock.begin = mock.AsyncMock(return_value={"id": "12", "errors": []})
+
+        result = asyncio.run(self.database_service.begin_transaction())
+
+        self.assertEqual(result, {"id": "12", "errors": []})
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_commit_transaction(self, backend_mock):
+        backend_mock.commit = mock.AsyncMock(return_value=self.response_content)
+
+        result = asyncio.run(self.database_service.commit_transaction("12"))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.commit.assert_called_once_with("12")
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_rollback_transaction(self, backend_mock):
+        backend_mock.rollback = mock.AsyncMock(return_value=self.response_content)
+
+        result = asyncio.run(self.database_service.rollback_transaction("12"))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.rollback.assert_called_once_with("12")
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_commit_transaction_with_invalid_id(self, backend_mock):
+        backend_mock.is_transaction_id.return_value = False
+        backend_mock.commit = mock.AsyncMock()
+
+        result = asyncio.run(self.database_service.commit_transaction("../../system/tx"))
+
+        self.assertEqual(len(result["errors"]), 1)
+        backend_mock.commit.assert_not_called()
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_post_statement(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+
+        result = asyncio.run(self.database_service.post_statement(self.statement))
+
+        self.assertEqual(result, self.response_content)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_node_exists_with_node(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id RETURN n",
+                                       "parameters": {"node_id": 1}}]}
         node_id = 1
 
-        result = self.database_service.node_exists(node_id)
+        result = asyncio.run(self.database_service.node_exists(node_id))
 
         self.assertTrue(result)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json = commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_node_exists_without_node(self, requests_mock):
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_node_exists_without_node(self, backend_mock):
         response_content = {"results": [{"data": []}], "errors": []}
-        response = Response()
-        response._content = json.dumps(response_content).encode("utf-8")
-        requests_mock.post.return_value = response
+        backend_mock.post = mock.AsyncMock(return_value=response_content)
         node_id = 2
 
-        result = self.database_service.node_exists(node_id)
+        result = asyncio.run(self.database_service.node_exists(node_id))
 
         self.assertFalse(result)
 
-    @mock.patch('database_service.requests')
-    def test_create_node_with_one_label(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "CREATE (n:Test) RETURN n"}]}
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_node_with_one_label(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "CREATE (n:Test) RETURN n", "parameters": {}}]}
         node = NodeIn(labels=["Test"])
 
-        result = self.database_service.create_node(node)
+        result = asyncio.run(self.database_service.create_node(node))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_create_node_without_labels(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "CREATE (n:) RETURN n"}]}
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_node_without_labels(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "CREATE (n:) RETURN n", "parameters": {}}]}
         node = NodeIn()
 
-        result = self.database_service.create_node(node)
+        result = asyncio.run(self.database_service.create_node(node))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_nodes(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        statement = "UNWIND $nodes AS node CREATE (n{labels}) SET n += node.properties RETURN node.index, id(n)"
+        commit_body = {"statements": [
+            {"statement": statement.format(labels=":A:B"),
+             "parameters": {"nodes": [{"index": 0, "properties": {"key": "value"}},
+                                      {"index": 2, "properties": {}}]}},
+            {"statement": statement.format(labels=""),
+             "parameters": {"nodes": [{"index": 1, "properties": {}}]}}]}
+        nodes = [NodeWithPropertiesIn(labels={"B", "A"}, properties=[PropertyIn(key="key", value="value")]),
+                 NodeWithPropertiesIn(), NodeWithPropertiesIn(labels={"A", "B"})]
+
+        result = asyncio.run(self.database_service.create_nodes(nodes))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_nodes_properties(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "UNWIND $nodes AS node MATCH (x) WHERE id(x) = node.id "
+                                                    "SET x += node.properties RETURN id(x), labels(x), x",
+                                       "parameters": {"nodes": [{"id": 5, "properties": {"key": 1.0}},
+                                                                {"id": 6, "properties": {}}]}}]}
+        nodes = [NodePropertiesIn(id=5, properties=[PropertyIn(key="key", value=1.0)]),
+                 NodePropertiesIn(id=6, properties=[])]
+
+        result = asyncio.run(self.database_service.create_nodes_properties(nodes))
 
-    @mock.patch('database_service.requests')
-    def test_get_node(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n)=5 RETURN n, labels(n)"}]}
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_subgraph(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        relationships = "WITH n CALL {{ WITH n UNWIND $relationships[{index}] AS relationship " \
+                        "MATCH (m) WHERE id(m) = relationship.end_node AND " \
+                        "(relationship.end_node_label IS NULL OR relationship.end_node_label IN labels(m)) " \
+                        "MERGE (n)-[:{name}]->(m) RETURN count(m) AS created_{index} }}"
+        statement = " ".join(["CREATE (n:Test) SET n += $properties",
+                              relationships.format(index=0, name="`hasA`"), relationships.format(index=1, name="`hasB`"),
+                              "RETURN id(n), labels(n), n, [(n)-[r]->(m) | [id(m), type(r), id(r)]]"])
+        commit_body = {"statements": [{"statement": statement, "parameters": {
+            "properties": {"key": "value"},
+            "relationships": [[{"end_node": 2, "end_node_label": "A"}, {"end_node": 4, "end_node_label": None}],
+                              [{"end_node": 3, "end_node_label": "B"}]]}}]}
+        subgraph = SubgraphIn(labels={"Test"}, properties=[PropertyIn(key="key", value="value")],
+                              relationships=[SubgraphRelationshipIn(end_node=2, name="hasA", end_node_label="A"),
+                                             SubgraphRelationshipIn(end_node=3, name="hasB", end_node_label="B"),
+                                             SubgraphRelationshipIn(end_node=4, name="hasA")])
+
+        result = asyncio.run(self.database_service.create_subgraph(subgraph))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_node(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id RETURN n, labels(n)",
+                                       "parameters": {"node_id": 5}}]}
         node_id = 5
 
-        result = self.database_service.get_node(node_id)
+        result = asyncio.run(self.database_service.get_node(node_id))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_node_with_label_and_relationships(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id AND "
+                                                    "($label IS NULL OR $label IN labels(n)) "
+                                                    "RETURN n, labels(n), CASE WHEN $include_relationships "
+                                                    "THEN [(n)-[r]-() | [id(startNode(r)), id(endNode(r)), "
+                                                    "type(r), id(r)]] END",
+                                       "parameters": {"node_id": 5, "label": "Test",
+                                                      "include_relationships": True}}]}
+        node_id = 5
+
+        result = asyncio.run(self.database_service.get_node(node_id, "Test", True))
 
-    @mock.patch('database_service.requests')
-    def test_get_nodes(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH (n: Test) RETURN n"}]}
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_nodes(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n: Test) RETURN n", "parameters": {}}]}
         label = "Test"
 
-        result = self.database_service.get_nodes(label)
+        result = asyncio.run(self.database_service.get_nodes(label))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_nodes_page(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n: Test) WHERE id(n) > $after RETURN n ORDER BY id(n) "
+                                                    "LIMIT $limit",
+                                       "parameters": {"limit": 10, "after": 5}}]}
+        label = "Test"
+
+        result = asyncio.run(self.database_service.get_nodes(label, 10, 5))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_nodes_filtered_page(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n: Test) WHERE n.`name` = $value_0 AND n.`age` >= $value_1 "
+                                                    "AND id(n) > $after RETURN n ORDER BY id(n) LIMIT $limit",
+                                       "parameters": {"value_0": "Test", "value_1": 18, "limit": 10, "after": -1}}]}
+        filters = [PropertyFilter(key="name", value="Test"),
+                   PropertyFilter(key="age", operator=PropertyOperator.gte, value=18)]
+
+        result = asyncio.run(self.database_service.get_nodes("Test", 10, None, filters))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_nodes_exist(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+
+        result = asyncio.run(self.database_service.nodes_exist([NodeExistsIn(id=1, label="Modality"),
+                                                                NodeExistsIn(id=2)]))
+
+        self.assertEqual(result, self.response_content)
+        statement = backend_mock.post.call_args.args[0]["statements"][0]
+        self.assertIn("UNWIND $nodes AS node OPTIONAL MATCH (n) WHERE id(n) = node.id", statement["statement"])
+        self.assertEqual(statement["parameters"], {"nodes": [{"id": 1, "label": "Modality"},
+                                                             {"id": 2, "label": None}]})
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_neighbourhood(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+
+        result = asyncio.run(self.database_service.get_neighbourhood(5, 3, ["hasA", "hasB"]))
+
+        self.assertEqual(result, self.response_content)
+        statement = backend_mock.post.call_args.args[0]["statements"][0]
+        self.assertIn("OPTIONAL MATCH path = (n)-[:`hasA`|`hasB`*1..3]-()", statement["statement"])
+        self.assertEqual(statement["parameters"], {"node_id": 5})
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_neighbourhood_all_types(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+
+        asyncio.run(self.database_service.get_neighbourhood(5, 1))
+
+        statement = backend_mock.post.call_args.args[0]["statements"][0]
+        self.assertIn("OPTIONAL MATCH path = (n)-[*1..1]-()", statement["statement"])
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_chain(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        chain = ChainIn(root=1, head="hasScenario", next="nextActivityExecution", labels={"`Activity Execution`"},
+                        nodes=[ChainNodeIn(properties=[PropertyIn(key="position", value=1.0)],
+                                           relationships=[SubgraphRelationshipIn(end_node=7, name="hasActivity",
+                                                                                 end_node_label="Activity")]),
+                               ChainNodeIn(properties=[PropertyIn(key="position", value=2.0)],
+                                           relationships=[SubgraphRelationshipIn(end_node=7, name="hasActivity")])])
+
+        result = asyncio.run(self.database_service.create_chain(chain))
+
+        self.assertEqual(result, self.response_content)
+        statement = backend_mock.post.call_args.args[0]["statements"][0]
+        self.assertIn("CREATE (n:`Activity Execution`) SET n += node", statement["statement"])
+        self.assertIn("CREATE (root)-[:`hasScenario`]->(first)", statement["statement"])
+        self.assertIn("CREATE (n)-[:`nextActivityExecution`]->(m)", statement["statement"])
+        self.assertIn("CREATE (n)-[:`hasActivity`]->(m) RETURN count(m) AS created_0", statement["statement"])
+        self.assertEqual(statement["parameters"], {
+            "root": 1, "nodes": [{"position": 1.0}, {"position": 2.0}],
+            "relationships": [[{"index": 0, "end_node": 7, "end_node_label": "Activity"},
+                               {"index": 1, "end_node": 7, "end_node_label": None}]]})
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_chain(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+
+        result = asyncio.run(self.database_service.get_chain(5, "hasScenario", "nextActivityExecution", True))
+
+        self.assertEqual(result, self.response_content)
+        statement = backend_mock.post.call_args.args[0]["statements"][0]
+        self.assertIn("OPTIONAL MATCH (head)-[:`hasScenario`]->(first)-[:`nextActivityExecution`*0..]->(n)",
+                      statement["statement"])
+        self.assertEqual(statement["parameters"], {"node_id": 5, "include_relationships": True})
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_index(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "CREATE INDEX `index_Time_Series_source` IF NOT EXISTS "
+                                                    "FOR (n:`Time Series`) ON (n.`source`)", "parameters": {}}]}
+
+        result = asyncio.run(self.database_service.create_index("index_Time_Series_source",
+                                                                IndexIn(label="Time Series", key="source")))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_unique_index(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "CREATE CONSTRAINT `unique_Test_name` IF NOT EXISTS "
+                                                    "FOR (n:`Te``st`) REQUIRE n.`name` IS UNIQUE", "parameters": {}}]}
+
+        result = asyncio.run(self.database_service.create_index("unique_Test_name",
+                                                                IndexIn(label="Te`st", key="name", unique=True)))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_drop_index(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "DROP CONSTRAINT `unique_Test_name` IF EXISTS",
+                                       "parameters": {}}]}
+
+        result = asyncio.run(self.database_service.drop_index("unique_Test_name", True))
 
-    @mock.patch('database_service.requests')
-    def test_delete_node(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n)=5 DETACH DELETE n return n"}]}
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_delete_node(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id DETACH DELETE n RETURN n",
+                                       "parameters": {"node_id": 5}}]}
         node_id = 5
 
-        result = self.database_service.delete_node(node_id)
+        result = asyncio.run(self.database_service.delete_node(node_id))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_relationship_exist_with_relationship(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH ()-[r]->() where id(r) =1 return r"}]}
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_relationship_exist_with_relationship(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH ()-[r]->() WHERE id(r) = $relationship_id RETURN r",
+                                       "parameters": {"relationship_id": 1}}]}
         relation_id = 1
 
-        result = self.database_service.relationship_exist(relation_id)
+        result = asyncio.run(self.database_service.relationship_exist(relation_id))
 
         self.assertTrue(result)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_relationship_exist_without_relationship(self, requests_mock):
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_relationship_exist_without_relationship(self, backend_mock):
         response_content = {'results': [{'data': []}], 'errors': []}
-        response = Response()
-        response._content = json.dumps(response_content).encode('utf-8')
-        requests_mock.post.return_value = response
+        backend_mock.post = mock.AsyncMock(return_value=response_content)
         node_id = 2
 
-        result = self.database_service.relationship_exist(node_id)
+        result = asyncio.run(self.database_service.relationship_exist(node_id))
 
         self.assertFalse(result)
 
-    @mock.patch('database_service.requests')
-    def test_get_relationship(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH ()-[r]->() where id(r)=5 "
-                                                    "return id(startNode(r)), id(endNode(r)), type(r), id(r)"}]}
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_relationship(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH ()-[r]->() WHERE id(r) = $relationship_id "
+                                                    "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+                                       "parameters": {"relationship_id": 5}}]}
         relationship_id = 5
 
-        result = self.database_service.get_relationship(relationship_id)
+        result = asyncio.run(self.database_service.get_relationship(relationship_id))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
-
-    @mock.patch('database_service.requests')
-    def test_delete_relationship(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH ()-[r]->() WHERE id(r)=5 "
-                                                    "DETACH DELETE r return r"}]}
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_delete_relationship(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH ()-[r]->() WHERE id(r) = $relationship_id "
+                                                    "DETACH DELETE r RETURN r",
+                                       "parameters": {"relationship_id": 5}}]}
         relationship_id = 5
 
-        result = self.database_service.delete_relationship(relationship_id)
+        result = asyncio.run(self.database_service.delete_relationship(relationship_id))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_relationships(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id MATCH (n)-[r]-() "
+                                                    "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+                                       "parameters": {"node_id": 5}}]}
+        node_id = 5
+
+        result = asyncio.run(self.database_service.get_relationships(node_id))
 
-    @mock.patch('database_service.requests')
-    def test_get_relationships(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH (n)-[r]->(m) where id(n)=5 or id(m)=5 "
-                                                    "return id(startNode(r)), id(endNode(r)), type(r), id(r)"}]}
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_relationships_with_types_and_direction(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id "
+                                                    "MATCH (n)<-[r:`hasScenario`|`nextActivityExecution`]-() "
+                                                    "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+                                       "parameters": {"node_id": 5}}]}
         node_id = 5
 
-        result = self.database_service.get_relationships(node_id)
+        result = asyncio.run(self.database_service.get_relationships(node_id, ["hasScenario", "nextActivityExecution"],
+                                                                     RelationshipDirection.incoming))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_create_relationship(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": "MATCH (n) where id(n) =2 MATCH (m) where " +
-                                                    "id(m) = 3 MERGE (n) - [r:Test] -> (m) " +
-                                                    "RETURN r"}]}
-        relation = RelationshipIn(start_node=2, end_node=3, name="Test")
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_relationships_with_quoted_types(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id "
+                                                    "MATCH (n)-[r:`a``]-() DETACH DELETE n //`]-() "
+                                                    "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+                                       "parameters": {"node_id": 5}}]}
 
-        result = self.database_service.create_relationship(relation)
+        result = asyncio.run(self.database_service.get_relationships(5, ["a`]-() DETACH DELETE n //"]))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_get_relationships_outgoing(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id MATCH (n)-[r]->() "
+                                                    "RETURN id(startNode(r)), id(endNode(r)), type(r), id(r)",
+                                       "parameters": {"node_id": 5}}]}
+        node_id = 5
 
-    @mock.patch('database_service.requests')
-    def test_create_properties(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": 'MATCH (x) where id(x)=2 SET x.key="value", ' +
-                                                    'x.test="Test" return id(x), x'}]}
-        properties = [PropertyIn(key="key", value="value"), PropertyIn(key="test", value="Test")]
-        object_id = 2
+        result = asyncio.run(self.database_service.get_relationships(node_id, direction=RelationshipDirection.outgoing))
 
-        result = self.database_service.create_properties(object_id, properties, "(x)", "id(x)")
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_relationships(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        statement = "UNWIND $relationships AS relationship MATCH (n) WHERE id(n) = relationship.start_node " \
+                    "MATCH (m) WHERE id(m) = relationship.end_node MERGE (n)-[r:{name}]->(m) " \
+                    "RETURN relationship.index, id(r)"
+        commit_body = {"statements": [
+            {"statement": statement.format(name="`Test`"),
+             "parameters": {"relationships": [{"index": 0, "start_node": 2, "end_node": 3},
+                                              {"index": 2, "start_node": 3, "end_node": 4}]}},
+            {"statement": statement.format(name="`Other`"),
+             "parameters": {"relationships": [{"index": 1, "start_node": 2, "end_node": 4}]}}]}
+        relationships = [RelationshipIn(start_node=2, end_node=3, name="Test"),
+                         RelationshipIn(start_node=2, end_node=4, name="Other"),
+                         RelationshipIn(start_node=3, end_node=4, name="Test")]
+
+        result = asyncio.run(self.database_service.create_relationships(relationships))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_properties(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (x) WHERE id(x) = $id SET x += $properties "
+                                                    "RETURN labels(x), x",
+                                       "parameters": {"id": 2, "properties": {"key": "value", "test": 5}}}]}
+        properties = [PropertyIn(key="key", value="value"), PropertyIn(key="test", value=5)]
+        object_id = 2
 
-    @mock.patch('database_service.requests')
-    def test_create_relationship_properties(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": 'MATCH (n)-[x]->(m) where id(x)=2 SET x.key="value", ' +
-                                                    'x.test="Test" return id(n), type(x), id(m), x'}]}
+        result = asyncio.run(self.database_service.create_properties(object_id, properties,
+                                                                     "create_node_properties"))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_relationship_properties(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n)-[x]->(m) WHERE id(x) = $id SET x += $properties "
+                                                    "RETURN id(n), type(x), id(m), x",
+                                       "parameters": {"id": 2, "properties": {"key": "value", "test": "Test"}}}]}
         properties = [PropertyIn(key="key", value="value"), PropertyIn(key="test", value="Test")]
         object_id = 2
 
-        result = self.database_service.create_relationship_properties(object_id, properties)
+        result = asyncio.run(self.database_service.create_relationship_properties(object_id, properties))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
-
-    @mock.patch('database_service.requests')
-    def test_create_node_properties(self, requests_mock):
-        requests_mock.post.return_value = self.response
-        commit_body = {"statements": [{"statement": 'MATCH (x) where id(x)=2 SET x.key="value", ' +
-                                                    'x.test="Test" return labels(x), x'}]}
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_create_node_properties(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (x) WHERE id(x) = $id SET x += $properties "
+                                                    "RETURN labels(x), x",
+                                       "parameters": {"id": 2, "properties": {"key": "value", "test": "Test"}}}]}
         properties = [PropertyIn(key="key", value="value"), PropertyIn(key="test", value="Test")]
         object_id = 2
 
-        result = self.database_service.create_node_properties(object_id, properties)
+        result = asyncio.run(self.database_service.create_node_properties(object_id, properties))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_with(commit_body, None)
 
-    @mock.patch('database_service.requests')
-    def test_delete_node_properties(self, requests_mock):
-        requests_mock.post.return_value = self.response
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_delete_node_properties(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
         object_id = 2
-        commit_body = {
-            "statements": [{"statement": "MATCH (x) where id(x)="+str(object_id)+" SET x ={} return x"}]
-        }
-        result = self.database_service.delete_node_properties(object_id)
+        commit_body = {"statements": [{"statement": "MATCH (x) WHERE id(x) = $id SET x = {} RETURN x",
+                                       "parameters": {"id": 2}}]}
+        result = asyncio.run(self.database_service.delete_node_properties(object_id))
+
+        self.assertEqual(result, self.response_content)
+        backend_mock.post.assert_called_with(commit_body, None)
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_close(self, backend_mock):
+        backend_mock.close = mock.AsyncMock()
+
+        asyncio.run(self.database_service.close())
+
+        backend_mock.close.assert_awaited_once()
+
+    @mock.patch.object(DatabaseService, 'backend')
+    def test_batch_commit(self, backend_mock):
+        backend_mock.post = mock.AsyncMock(return_value=self.response_content)
+        commit_body = {"statements": [{"statement": "MATCH (n) WHERE id(n) = $node_id RETURN n",
+                                       "parameters": {"node_id": 1}},
+                                      {"statement": "MATCH (n) WHERE id(n) = $start_node MATCH (m) WHERE "
+                                                    "id(m) = $end_node MERGE (n)-[r:`Test`]->(m) RETURN r",
+                                       "parameters": {"start_node": 1, "end_node": 2}}]}
+
+        result = asyncio.run(self.database_service.batch()
+                             .add("node_exists", {"node_id": 1})
+                             .add("create_relationship", {"start_node": 1, "end_node": 2}, name="`Test`")
+                             .commit())
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.database_service.database_url, json=commit_body,
-                                              auth=self.database_service.database_auth)
+        backend_mock.post.assert_called_once_with(commit_body, None)
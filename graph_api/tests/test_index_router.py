@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from index.index_router import *
+
+
+class IndexRouterTestCase(unittest.TestCase):
+
+    @mock.patch.object(IndexService, 'get_indexes')
+    def test_get_indexes_without_error(self, get_indexes_mock):
+        get_indexes_mock.return_value = IndexesOut(indexes=[IndexOut(name="index_Test_name", label="Test",
+                                                                     key="name")])
+        response = Response()
+        index_router = IndexRouter()
+
+        result = asyncio.run(index_router.get_indexes(response))
+
+        self.assertEqual(result, IndexesOut(indexes=[IndexOut(name="index_Test_name", label="Test", key="name")],
+                                            links=get_links(router)))
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(IndexService, 'save_index')
+    def test_create_index_with_error(self, save_index_mock):
+        save_index_mock.return_value = IndexOut(errors=["error"])
+        index = IndexIn(label="Test", key="name")
+        response = Response()
+        index_router = IndexRouter()
+
+        result = asyncio.run(index_router.create_index(index, response))
+
+        self.assertEqual(result, IndexOut(errors=["error"], links=get_links(router)))
+        save_index_mock.assert_called_once_with(index)
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(IndexService, 'save_indexes')
+    def test_apply_schema(self, save_indexes_mock):
+        save_indexes_mock.return_value = IndexesOut()
+        response = Response()
+        index_router = IndexRouter()
+
+        result = asyncio.run(index_router.apply_schema(response))
+
+        self.assertEqual(result, IndexesOut(links=get_links(router)))
+        save_indexes_mock.assert_called_once_with(schema)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(IndexService, 'delete_index')
+    def test_delete_index_not_found(self, delete_index_mock):
+        delete_index_mock.return_value = IndexOut(name="index_Test_name", errors="Index not found")
+        response = Response()
+        index_router = IndexRouter()
+
+        result = asyncio.run(index_router.delete_index("index_Test_name", response))
+
+        self.assertEqual(result, IndexOut(name="index_Test_name", errors="Index not found", links=get_links(router)))
+        delete_index_mock.assert_called_once_with("index_Test_name")
+        self.assertEqual(response.status_code, 404)
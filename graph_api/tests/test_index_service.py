@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from database_service import DatabaseService
+from index.index_model import IndexIn, IndexOut, IndexesOut
+from index.index_service import IndexService
+
+
+class IndexServiceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.indexes_response = {"results": [{"data": [{"row": ["index_Time_Series_source", "Time Series",
+                                                                "source", False]},
+                                                       {"row": ["unique_Test_name", "Test", "name", True]}]}],
+                                 "errors": []}
+
+    def test_prepare_name(self):
+        index_service = IndexService()
+
+        self.assertEqual(index_service.prepare_name(IndexIn(label="Time Series", key="source")),
+                         "index_Time_Series_source")
+        self.assertEqual(index_service.prepare_name(IndexIn(label="Test", key="name", unique=True)),
+                         "unique_Test_name")
+
+    @mock.patch.object(DatabaseService, 'get_indexes')
+    def test_get_indexes_without_error(self, get_indexes_mock):
+        get_indexes_mock.return_value = self.indexes_response
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.get_indexes())
+
+        self.assertEqual(result, IndexesOut(indexes=[
+            IndexOut(name="index_Time_Series_source", label="Time Series", key="source", unique=False),
+            IndexOut(name="unique_Test_name", label="Test", key="name", unique=True)]))
+
+    @mock.patch.object(DatabaseService, 'get_indexes')
+    def test_get_indexes_with_error(self, get_indexes_mock):
+        get_indexes_mock.return_value = {"results": [], "errors": ["error"]}
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.get_indexes())
+
+        self.assertEqual(result, IndexesOut(errors=["error"]))
+
+    @mock.patch.object(DatabaseService, 'create_index')
+    def test_save_index_without_error(self, create_index_mock):
+        create_index_mock.return_value = {"results": [{"data": []}], "errors": []}
+        index = IndexIn(label="Test", key="name", unique=True)
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.save_index(index))
+
+        self.assertEqual(result, IndexOut(name="unique_Test_name", label="Test", key="name", unique=True))
+        create_index_mock.assert_called_once_with("unique_Test_name", index)
+
+    @mock.patch.object(DatabaseService, 'create_index')
+    def test_save_index_with_error(self, create_index_mock):
+        create_index_mock.return_value = {"results": [], "errors": ["error"]}
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.save_index(IndexIn(label="Test", key="name")))
+
+        self.assertEqual(result, IndexOut(errors=["error"]))
+
+    @mock.patch.object(DatabaseService, 'create_index')
+    def test_save_indexes_stops_at_error(self, create_index_mock):
+        create_index_mock.side_effect = [{"results": [{"data": []}], "errors": []},
+                                         {"results": [], "errors": ["error"]}]
+        indexes = [IndexIn(label="Test", key="name"), IndexIn(label="Test", key="age"),
+                   IndexIn(label="Test", key="sex")]
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.save_indexes(indexes))
+
+        self.assertEqual(result, IndexesOut(indexes=[IndexOut(name="index_Test_name", label="Test", key="name")],
+                                            errors=["error"]))
+        self.assertEqual(create_index_mock.call_count, 2)
+
+    @mock.patch.object(DatabaseService, 'drop_index')
+    @mock.patch.object(DatabaseService, 'get_indexes')
+    def test_delete_index_without_error(self, get_indexes_mock, drop_index_mock):
+        get_indexes_mock.return_value = self.indexes_response
+        drop_index_mock.return_value = {"results": [{"data": []}], "errors": []}
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.delete_index("unique_Test_name"))
+
+        self.assertEqual(result, IndexOut(name="unique_Test_name", label="Test", key="name", unique=True))
+        drop_index_mock.assert_called_once_with("unique_Test_name", True)
+
+    @mock.patch.object(DatabaseService, 'drop_index')
+    @mock.patch.object(DatabaseService, 'get_indexes')
+    def test_delete_index_not_found(self, get_indexes_mock, drop_index_mock):
+        get_indexes_mock.return_value = self.indexes_response
+        index_service = IndexService()
+
+        result = asyncio.run(index_service.delete_index("index_Test_age"))
+
+        self.assertEqual(result, IndexOut(name="index_Test_age", errors="Index not found"))
+        drop_index_mock.assert_not_called()
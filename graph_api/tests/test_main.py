@@ -1,6 +1,8 @@
 import asyncio
 import unittest
+import unittest.mock as mock
 
+import hateoas
 import main
 
 
@@ -13,3 +15,103 @@ class MainTestCase(unittest.TestCase):
         result = asyncio.run(main.root())
         
         self.assertEqual(result, expect)
+
+    def test_transaction_middleware(self):
+        request = mock.MagicMock()
+        request.headers = {"X-Transaction-Id": "12"}
+
+        async def call_next(request):
+            return main.current_transaction.get()
+
+        result = asyncio.run(main.transaction_middleware(request, call_next))
+
+        self.assertEqual(result, "12")
+        self.assertIsNone(main.current_transaction.get())
+
+    @mock.patch.object(main.DatabaseService, 'backend')
+    def test_transaction_middleware_with_invalid_id(self, backend_mock):
+        backend_mock.is_transaction_id.return_value = False
+        request = mock.MagicMock()
+        request.headers = {"X-Transaction-Id": "../../system/tx/commit"}
+        call_next = mock.AsyncMock()
+
+        result = asyncio.run(main.transaction_middleware(request, call_next))
+
+        self.assertEqual(result.status_code, 404)
+        backend_mock.is_transaction_id.assert_called_once_with("../../system/tx/commit")
+        call_next.assert_not_called()
+
+    @mock.patch.object(main.IndexService, 'save_indexes')
+    def test_apply_schema(self, save_indexes_mock):
+        save_indexes_mock.return_value = mock.MagicMock(errors=None)
+
+        asyncio.run(main.apply_schema())
+
+        save_indexes_mock.assert_called_once_with(main.schema)
+
+    @mock.patch('main.asyncio.sleep')
+    @mock.patch.object(main.IndexService, 'save_indexes')
+    def test_apply_schema_retries(self, save_indexes_mock, sleep_mock):
+        save_indexes_mock.side_effect = [ConnectionError("database unavailable"), mock.MagicMock(errors=["error"]),
+                                         mock.MagicMock(errors=["error"]), mock.MagicMock(errors=None)]
+
+        with self.assertLogs("main", level="WARNING") as logs:
+            asyncio.run(main.apply_schema(1, 3))
+
+        self.assertEqual(len(logs.output), 3)
+        self.assertEqual(save_indexes_mock.call_count, 4)
+        sleep_mock.assert_has_awaits([mock.call(1), mock.call(2), mock.call(3)])
+
+    @mock.patch.object(main, 'apply_schema')
+    def test_startup_applies_schema_in_background(self, apply_schema_mock):
+        async def startup():
+            await main.startup_event()
+            await main.schema_task
+
+        asyncio.run(startup())
+
+        apply_schema_mock.assert_awaited_once_with()
+
+    def test_links_middleware_opt_out_with_query(self):
+        request = mock.MagicMock()
+        request.query_params = {"links": "false"}
+        request.headers = {}
+
+        async def call_next(request):
+            return main.get_links(main.app)
+
+        result = asyncio.run(main.links_middleware(request, call_next))
+
+        self.assertIsNone(result)
+        self.assertTrue(main.links_enabled.get())
+
+    def test_links_middleware_opt_out_with_header(self):
+        request = mock.MagicMock()
+        request.query_params = {}
+        request.headers = {"X-Links": "0"}
+
+        async def call_next(request):
+            return main.links_enabled.get()
+
+        result = asyncio.run(main.links_middleware(request, call_next))
+
+        self.assertFalse(result)
+
+    def test_links_middleware_default(self):
+        request = mock.MagicMock()
+        request.query_params = {}
+        request.headers = {}
+
+        async def call_next(request):
+            return main.get_links(main.app)
+
+        result = asyncio.run(main.links_middleware(request, call_next))
+
+        self.assertEqual(result, main.get_links(main.app))
+
+    def test_links_computed_once(self):
+        links = main.get_links(main.app)
+        links.append({"rel": "next"})
+
+        self.assertNotEqual(main.get_links(main.app), links)
+        self.assertIs(hateoas.get_link_table(main.app), hateoas.get_link_table(main.app))
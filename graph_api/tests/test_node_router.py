@@ -55,6 +55,80 @@ class NodeRouterTestCase(unittest.TestCase):
         save_node_mock.assert_called_with(node)
         self.assertEqual(response.status_code, 422)
 
+    @mock.patch.object(NodeService, 'save_nodes')
+    def test_create_nodes_without_error(self, save_nodes_mock):
+        save_nodes_mock.return_value = NodesOut(nodes=[BasicNodeOut(id=5, labels={"test"})])
+        response = Response()
+        nodes = [NodeWithPropertiesIn(labels={"test"})]
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_nodes(nodes, response))
+
+        self.assertEqual(result, NodesOut(nodes=[BasicNodeOut(id=5, labels={"test"})], links=get_links(router)))
+        save_nodes_mock.assert_called_with(nodes)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(NodeService, 'save_nodes')
+    def test_create_nodes_with_error(self, save_nodes_mock):
+        save_nodes_mock.return_value = NodesOut(errors={'errors': ['test']})
+        response = Response()
+        nodes = [NodeWithPropertiesIn()]
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_nodes(nodes, response))
+
+        self.assertEqual(result, NodesOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(NodeService, 'save_nodes_properties')
+    def test_create_nodes_properties_without_error(self, save_nodes_properties_mock):
+        save_nodes_properties_mock.return_value = NodesOut(nodes=[BasicNodeOut(id=5, labels={"test"})])
+        response = Response()
+        nodes = [NodePropertiesIn(id=5, properties=[PropertyIn(key="key", value=1.0)])]
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_nodes_properties(nodes, response))
+
+        self.assertEqual(result, NodesOut(nodes=[BasicNodeOut(id=5, labels={"test"})], links=get_links(router)))
+        save_nodes_properties_mock.assert_called_with(nodes)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(NodeService, 'save_nodes_properties')
+    def test_create_nodes_properties_with_error(self, save_nodes_properties_mock):
+        save_nodes_properties_mock.return_value = NodesOut(errors={'errors': "not matching id"})
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_nodes_properties([NodePropertiesIn(id=5, properties=[])], response))
+
+        self.assertEqual(result, NodesOut(errors={'errors': "not matching id"}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(NodeService, 'save_subgraph')
+    def test_create_subgraph_without_error(self, save_subgraph_mock):
+        save_subgraph_mock.return_value = NodeOut(id=5, labels={"test"}, relationships=[])
+        response = Response()
+        subgraph = SubgraphIn(labels={"test"})
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_subgraph(subgraph, response))
+
+        self.assertEqual(result, NodeOut(id=5, labels={"test"}, relationships=[], links=get_links(router)))
+        save_subgraph_mock.assert_called_with(subgraph)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(NodeService, 'save_subgraph')
+    def test_create_subgraph_with_error(self, save_subgraph_mock):
+        save_subgraph_mock.return_value = NodeOut(errors={'errors': ['test']})
+        response = Response()
+        subgraph = SubgraphIn()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_subgraph(subgraph, response))
+
+        self.assertEqual(result, NodeOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
     @mock.patch.object(NodeService, 'get_node')
     def test_get_node_without_error(self, get_node_mock):
         get_node_mock.side_effect = return_node
@@ -65,7 +139,19 @@ class NodeRouterTestCase(unittest.TestCase):
         result = asyncio.run(node_router.get_node(5, response))
 
         self.assertEqual(result, NodeOut(id=5, labels={label}, links=get_links(router)))
-        get_node_mock.assert_called_with(5)
+        get_node_mock.assert_called_with(5, None, False)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(NodeService, 'get_node')
+    def test_get_node_with_label_and_relationships(self, get_node_mock):
+        get_node_mock.side_effect = return_node
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_node(5, response, "Test", NodeInclude.relationships))
+
+        self.assertEqual(result, NodeOut(id=5, labels={"Test"}, links=get_links(router)))
+        get_node_mock.assert_called_with(5, "Test", True)
         self.assertEqual(response.status_code, 200)
 
     @mock.patch.object(NodeService, 'get_node')
@@ -78,7 +164,7 @@ class NodeRouterTestCase(unittest.TestCase):
         result = asyncio.run(node_router.get_node(5, response))
 
         self.assertEqual(result, NodeOut(errors='error', links=get_links(router)))
-        get_node_mock.assert_called_with(5)
+        get_node_mock.assert_called_with(5, None, False)
         self.assertEqual(response.status_code, 404)
 
     @mock.patch.object(NodeService, 'delete_node')
@@ -113,11 +199,47 @@ class NodeRouterTestCase(unittest.TestCase):
         label = "Test"
         node_router = NodeRouter()
 
-        result = asyncio.run(node_router.get_nodes(label, response))
+        result = asyncio.run(node_router.get_nodes(label, response, where=None))
 
-        self.assertEqual(result, NodesOut(nodes=[BasicNodeOut(id=5, labels={label})], links=get_links(router)))
-        get_nodes_mock.assert_called_with(label)
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(result.model, NodesOut(nodes=[BasicNodeOut(id=5, labels={label})], links=get_links(router)))
+        get_nodes_mock.assert_called_with(label, None, None, None)
+        self.assertEqual(result.status_code, 200)
+
+    @mock.patch.object(NodeService, 'get_nodes')
+    def test_get_nodes_with_next_page(self, get_nodes_mock):
+        get_nodes_mock.return_value = NodesOut(nodes=[BasicNodeOut(id=5, labels={"Test"})], next_after=5)
+        response = Response()
+        label = "Test"
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_nodes(label, response, 1, 3, where=["key:value"]))
+
+        self.assertEqual(result.model, NodesOut(nodes=[BasicNodeOut(id=5, labels={"Test"})], next_after=5,
+                                          links=get_links(router) + [{'rel': 'next', 'action': 'GET',
+                                                                      '$ref': '/nodes?label=Test&limit=1&after=5&where=key%3Avalue'}]))
+        get_nodes_mock.assert_called_with(label, 1, 3, ["key:value"])
+        self.assertEqual(result.status_code, 200)
+
+    @mock.patch.object(NodeService, 'stream_nodes')
+    def test_get_nodes_as_ndjson(self, stream_nodes_mock):
+        async def stream_nodes(*args, **kwargs):
+            yield BasicNodeOut(id=5, labels={"Test"})
+            yield BasicNodeOut(id=6, labels={"Test"})
+        stream_nodes_mock.side_effect = stream_nodes
+        response = Response()
+        label = "Test"
+        node_router = NodeRouter()
+
+        async def collect():
+            result = await node_router.get_nodes(label, response, None, 3, ResponseFormat.ndjson, None)
+            return result, [line async for line in result.body_iterator]
+
+        result, lines = asyncio.run(collect())
+
+        self.assertEqual(result.media_type, "application/x-ndjson")
+        self.assertEqual(lines, [BasicNodeOut(id=5, labels={"Test"}).json() + "\n",
+                                 BasicNodeOut(id=6, labels={"Test"}).json() + "\n"])
+        stream_nodes_mock.assert_called_with(label, database["stream_page_size"], 3, None)
 
     @mock.patch.object(NodeService, 'get_nodes')
     def test_get_nodes_with_error(self, get_nodes_mock):
@@ -126,11 +248,11 @@ class NodeRouterTestCase(unittest.TestCase):
         label = "Test"
         node_router = NodeRouter()
 
-        result = asyncio.run(node_router.get_nodes(label, response))
+        result = asyncio.run(node_router.get_nodes(label, response, where=None))
 
-        self.assertEqual(result, NodesOut(errors='error', links=get_links(router)))
-        get_nodes_mock.assert_called_with(label)
-        self.assertEqual(response.status_code, 422)
+        self.assertEqual(result.model, NodesOut(errors='error', links=get_links(router)))
+        get_nodes_mock.assert_called_with(label, None, None, None)
+        self.assertEqual(result.status_code, 422)
 
     @mock.patch.object(NodeService, 'save_properties')
     def test_create_node_properties_without_error(self, save_properties_mock):
@@ -160,6 +282,97 @@ class NodeRouterTestCase(unittest.TestCase):
         save_properties_mock.assert_called_with(id, properties)
         self.assertEqual(response.status_code, 422)
 
+    @mock.patch.object(NodeService, 'save_chain')
+    def test_create_chain_with_error(self, save_chain_mock):
+        save_chain_mock.return_value = ChainOut(errors="Root node not found")
+        chain = ChainIn(root=1, head="hasScenario", next="nextActivityExecution", labels={"Test"},
+                        nodes=[ChainNodeIn()])
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.create_chain(chain, response))
+
+        self.assertEqual(result, ChainOut(errors="Root node not found", links=get_links(router)))
+        save_chain_mock.assert_called_once_with(chain)
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(NodeService, 'get_chain')
+    def test_get_node_chain_without_error(self, get_chain_mock):
+        get_chain_mock.return_value = ChainOut(root=BasicNodeOut(id=1), nodes=[NodeOut(id=2), NodeOut(id=3)])
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_node_chain(2, response, "hasScenario", "nextActivityExecution",
+                                                        NodeInclude.relationships))
+
+        self.assertEqual(result.model, ChainOut(root=BasicNodeOut(id=1), nodes=[NodeOut(id=2), NodeOut(id=3)],
+                                          links=get_links(router)))
+        get_chain_mock.assert_called_once_with(2, "hasScenario", "nextActivityExecution", True)
+        self.assertEqual(result.status_code, 200)
+
+    @mock.patch.object(NodeService, 'get_chain')
+    def test_get_node_chain_not_found(self, get_chain_mock):
+        get_chain_mock.return_value = ChainOut(errors="Node not found")
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_node_chain(2, response, "hasScenario", "nextActivityExecution"))
+
+        self.assertEqual(result.model, ChainOut(errors="Node not found", links=get_links(router)))
+        get_chain_mock.assert_called_once_with(2, "hasScenario", "nextActivityExecution", False)
+        self.assertEqual(result.status_code, 404)
+
+    @mock.patch.object(NodeService, 'nodes_exist')
+    def test_nodes_exist_without_error(self, nodes_exist_mock):
+        nodes = [NodeExistsIn(id=1, label="Modality"), NodeExistsIn(id=2)]
+        nodes_exist_mock.return_value = NodesExistOut(nodes=[NodeExistsOut(id=1, label="Modality", exists=True),
+                                                             NodeExistsOut(id=2)])
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.nodes_exist(nodes, response))
+
+        self.assertEqual(result, NodesExistOut(nodes=[NodeExistsOut(id=1, label="Modality", exists=True),
+                                                      NodeExistsOut(id=2)], links=get_links(router)))
+        nodes_exist_mock.assert_called_once_with(nodes)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(NodeService, 'nodes_exist')
+    def test_nodes_exist_with_error(self, nodes_exist_mock):
+        nodes_exist_mock.return_value = NodesExistOut(errors=["error"])
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.nodes_exist([NodeExistsIn(id=1)], response))
+
+        self.assertEqual(result, NodesExistOut(errors=["error"], links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(NodeService, 'get_neighbourhood')
+    def test_get_node_neighbourhood_without_error(self, get_neighbourhood_mock):
+        get_neighbourhood_mock.return_value = NeighbourhoodOut(nodes=[BasicNodeOut(id=5), BasicNodeOut(id=6)],
+                                                               relationships=[BasicRelationshipOut(id=1)])
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_node_neighbourhood(5, response, 2, ["hasParticipant"]))
+
+        self.assertEqual(result.model, NeighbourhoodOut(nodes=[BasicNodeOut(id=5), BasicNodeOut(id=6)],
+                                                  relationships=[BasicRelationshipOut(id=1)], links=get_links(router)))
+        get_neighbourhood_mock.assert_called_once_with(5, 2, ["hasParticipant"])
+        self.assertEqual(result.status_code, 200)
+
+    @mock.patch.object(NodeService, 'get_neighbourhood')
+    def test_get_node_neighbourhood_not_found(self, get_neighbourhood_mock):
+        get_neighbourhood_mock.return_value = NeighbourhoodOut(errors="Node not found")
+        response = Response()
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_node_neighbourhood(5, response, 1, None))
+
+        self.assertEqual(result.model, NeighbourhoodOut(errors="Node not found", links=get_links(router)))
+        self.assertEqual(result.status_code, 404)
+
     @mock.patch.object(NodeService, 'get_relationships')
     def test_get_node_relationships_without_error(self, get_relationships_mock):
         get_relationships_mock.side_effect = return_relationships
@@ -167,11 +380,26 @@ class NodeRouterTestCase(unittest.TestCase):
         id = 5
         node_router = NodeRouter()
 
-        result = asyncio.run(node_router.get_node_relationships(id, response))
+        result = asyncio.run(node_router.get_node_relationships(id, response, None, None))
+
+        self.assertEqual(result, RelationshipsOut(relationships=[BasicRelationshipOut(id=5),
+                                                                 BasicRelationshipOut(id=6)], links=get_links(router)))
+        get_relationships_mock.assert_called_with(id, None, None)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(NodeService, 'get_relationships')
+    def test_get_node_relationships_with_types_and_direction(self, get_relationships_mock):
+        get_relationships_mock.side_effect = return_relationships
+        response = Response()
+        id = 5
+        node_router = NodeRouter()
+
+        result = asyncio.run(node_router.get_node_relationships(id, response, ["Test"],
+                                                                RelationshipDirection.outgoing))
 
         self.assertEqual(result, RelationshipsOut(relationships=[BasicRelationshipOut(id=5),
                                                                  BasicRelationshipOut(id=6)], links=get_links(router)))
-        get_relationships_mock.assert_called_with(id)
+        get_relationships_mock.assert_called_with(id, ["Test"], RelationshipDirection.outgoing)
         self.assertEqual(response.status_code, 200)
 
     @mock.patch.object(NodeService, 'get_relationships')
@@ -181,10 +409,10 @@ class NodeRouterTestCase(unittest.TestCase):
         id = 5
         node_router = NodeRouter()
 
-        result = asyncio.run(node_router.get_node_relationships(id, response))
+        result = asyncio.run(node_router.get_node_relationships(id, response, None, None))
 
         self.assertEqual(result, RelationshipsOut(errors={'errors': ['test']}, links=get_links(router)))
-        get_relationships_mock.assert_called_with(id)
+        get_relationships_mock.assert_called_with(id, None, None)
         self.assertEqual(response.status_code, 422)
 
     @mock.patch.object(NodeService, 'delete_node_properties')
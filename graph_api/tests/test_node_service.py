@@ -1,9 +1,11 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
 from database_service import DatabaseService
 from node.node_model import *
 from node.node_service import NodeService
+from property.property_model import PropertyFilter, PropertyOperator
 from relationship.relationship_model import *
 
 
@@ -16,7 +18,7 @@ class NodeServiceTestCase(unittest.TestCase):
         node = NodeIn(labels={"test"})
         node_service = NodeService()
 
-        result = node_service.save_node(node)
+        result = asyncio.run(node_service.save_node(node))
 
         self.assertEqual(result, NodeOut(id=5, labels={"test"}))
         create_node_mock.assert_called_once_with(node)
@@ -28,21 +30,108 @@ class NodeServiceTestCase(unittest.TestCase):
         node = NodeIn(labels={"test"})
         node_service = NodeService()
 
-        result = node_service.save_node(node)
+        result = asyncio.run(node_service.save_node(node))
 
         self.assertEqual(result, NodeOut(errors=['error']))
         create_node_mock.assert_called_once_with(node)
 
+    @mock.patch.object(DatabaseService, 'create_nodes')
+    def test_save_nodes_without_error(self, create_nodes_mock):
+        create_nodes_mock.return_value = {'results': [{'data': [{'row': [0, 5]}, {'row': [2, 7]}]},
+                                                      {'data': [{'row': [1, 6]}]}], 'errors': []}
+        nodes = [NodeWithPropertiesIn(labels={"test"}, properties=[PropertyIn(key='key', value='value')]),
+                 NodeWithPropertiesIn(), NodeWithPropertiesIn(labels={"test"})]
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_nodes(nodes))
+
+        self.assertEqual(result, NodesOut(nodes=[
+            BasicNodeOut(id=5, labels={"test"}, properties=[PropertyIn(key='key', value='value')]),
+            BasicNodeOut(id=6, labels=set(), properties=[]), BasicNodeOut(id=7, labels={"test"}, properties=[])]))
+        create_nodes_mock.assert_called_once_with(nodes)
+
+    @mock.patch.object(DatabaseService, 'create_nodes')
+    def test_save_nodes_with_error(self, create_nodes_mock):
+        create_nodes_mock.return_value = {'results': [], 'errors': ['error']}
+        nodes = [NodeWithPropertiesIn(labels={"test"})]
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_nodes(nodes))
+
+        self.assertEqual(result, NodesOut(errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'create_nodes_properties')
+    def test_save_nodes_properties_without_error(self, create_nodes_properties_mock):
+        create_nodes_properties_mock.return_value = {'results': [{'data': [{'row': [5, ['test'], {'key': 1.0}]},
+                                                                           {'row': [6, [], {'key': 2.0}]}]}],
+                                                     'errors': []}
+        nodes = [NodePropertiesIn(id=5, properties=[PropertyIn(key='key', value=1.0)]),
+                 NodePropertiesIn(id=6, properties=[PropertyIn(key='key', value=2.0)])]
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_nodes_properties(nodes))
+
+        self.assertEqual(result, NodesOut(nodes=[
+            BasicNodeOut(id=5, labels={"test"}, properties=[PropertyIn(key='key', value=1.0)]),
+            BasicNodeOut(id=6, labels=set(), properties=[PropertyIn(key='key', value=2.0)])]))
+        create_nodes_properties_mock.assert_called_once_with(nodes)
+
+    @mock.patch.object(DatabaseService, 'create_nodes_properties')
+    def test_save_nodes_properties_without_nodes(self, create_nodes_properties_mock):
+        create_nodes_properties_mock.return_value = {'results': [{'data': [{'row': [5, ['test'], {'key': 1.0}]}]}],
+                                                     'errors': []}
+        nodes = [NodePropertiesIn(id=5, properties=[PropertyIn(key='key', value=1.0)]),
+                 NodePropertiesIn(id=6, properties=[PropertyIn(key='key', value=2.0)])]
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_nodes_properties(nodes))
+
+        self.assertEqual(result.errors, {"errors": "not matching id"})
+
+    @mock.patch.object(DatabaseService, 'create_nodes_properties')
+    def test_save_nodes_properties_with_error(self, create_nodes_properties_mock):
+        create_nodes_properties_mock.return_value = {'results': [], 'errors': ['error']}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_nodes_properties([NodePropertiesIn(id=5, properties=[])]))
+
+        self.assertEqual(result, NodesOut(errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'create_subgraph')
+    def test_save_subgraph_without_error(self, create_subgraph_mock):
+        create_subgraph_mock.return_value = {'results': [{'data': [{'row': [5, ["Test"], {'key': 'value'},
+                                                                            [[2, "hasA", 7]]]}]}], 'errors': []}
+        subgraph = SubgraphIn(labels={"Test"}, properties=[PropertyIn(key='key', value='value')],
+                              relationships=[SubgraphRelationshipIn(end_node=2, name="hasA")])
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_subgraph(subgraph))
+
+        self.assertEqual(result, NodeOut(id=5, labels={"Test"}, properties=[PropertyIn(key='key', value='value')],
+                                             relationships=[BasicRelationshipOut(start_node=5, end_node=2,
+                                                                                 name="hasA", id=7)]))
+        create_subgraph_mock.assert_called_once_with(subgraph)
+
+    @mock.patch.object(DatabaseService, 'create_subgraph')
+    def test_save_subgraph_with_error(self, create_subgraph_mock):
+        create_subgraph_mock.return_value = {'results': [], 'errors': ['error']}
+        subgraph = SubgraphIn(labels={"Test"})
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_subgraph(subgraph))
+
+        self.assertEqual(result, NodeOut(errors=['error']))
+
     @mock.patch.object(DatabaseService, 'get_node')
     def test_get_node_with_existing_node(self, get_node_mock):
         get_node_mock.return_value = {'results': [{'data': [{'row': [{'key': 'value'}, ["Test"]]}]}], 'errors': []}
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.get_node(node_id)
+        result = asyncio.run(node_service.get_node(node_id))
 
         self.assertEqual(result, NodeOut(id=1, properties=[PropertyIn(key='key', value='value')], labels={"Test"}))
-        get_node_mock.assert_called_once_with(node_id)
+        get_node_mock.assert_called_once_with(node_id, None, False)
 
     @mock.patch.object(DatabaseService, 'get_node')
     def test_get_node_without_existing_node(self, get_node_mock):
@@ -50,10 +139,38 @@ class NodeServiceTestCase(unittest.TestCase):
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.get_node(node_id)
+        result = asyncio.run(node_service.get_node(node_id))
 
         self.assertEqual(result, NodeOut(errors='Node not found'))
-        get_node_mock.assert_called_once_with(node_id)
+        get_node_mock.assert_called_once_with(node_id, None, False)
+
+    @mock.patch.object(DatabaseService, 'get_node')
+    def test_get_node_with_label_and_relationships(self, get_node_mock):
+        get_node_mock.return_value = {'results': [{'data': [{'row': [{'key': 'value'}, ["Test"],
+                                                                     [[1, 2, "hasTest", 3], [4, 1, "hasNode", 5]]]}]}],
+                                      'errors': []}
+        node_id = 1
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_node(node_id, "Test", True))
+
+        self.assertEqual(result, NodeOut(id=1, properties=[PropertyIn(key='key', value='value')], labels={"Test"},
+                                         relationships=[BasicRelationshipOut(start_node=1, end_node=2,
+                                                                             name="hasTest", id=3),
+                                                        BasicRelationshipOut(start_node=4, end_node=1,
+                                                                             name="hasNode", id=5)]))
+        get_node_mock.assert_called_once_with(node_id, "Test", True)
+
+    @mock.patch.object(DatabaseService, 'get_node')
+    def test_get_node_with_error(self, get_node_mock):
+        get_node_mock.return_value = {'results': [], 'errors': ['error']}
+        node_id = 1
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_node(node_id))
+
+        self.assertEqual(result, NodeOut(errors=['error']))
+        get_node_mock.assert_called_once_with(node_id, None, False)
 
     @mock.patch.object(DatabaseService, 'get_nodes')
     def test_get_nodes_without_error(self, get_nodes_mock):
@@ -62,10 +179,24 @@ class NodeServiceTestCase(unittest.TestCase):
         label = "Test"
         node_service = NodeService()
 
-        result = node_service.get_nodes(label)
+        result = asyncio.run(node_service.get_nodes(label))
 
         self.assertEqual(result, NodesOut(nodes=[BasicNodeOut(id=5, labels={"Test"}, properties=[])]))
-        get_nodes_mock.assert_called_once_with(label)
+        get_nodes_mock.assert_called_once_with(label, None, None, [])
+
+    @mock.patch.object(DatabaseService, 'get_nodes')
+    def test_get_nodes_with_limit(self, get_nodes_mock):
+        get_nodes_mock.return_value = {'results': [{'data': [{'row': [{}], 'meta': [{'id': 5}]},
+                                                             {'row': [{}], 'meta': [{'id': 7}]}]}],
+                                       'errors': []}
+        label = "Test"
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_nodes(label, 2, 3))
+
+        self.assertEqual(result, NodesOut(nodes=[BasicNodeOut(id=5, labels={"Test"}, properties=[]),
+                                                 BasicNodeOut(id=7, labels={"Test"}, properties=[])], next_after=7))
+        get_nodes_mock.assert_called_once_with(label, 2, 3, [])
 
     @mock.patch.object(DatabaseService, 'get_nodes')
     def test_get_nodes_with_error(self, get_nodes_mock):
@@ -73,37 +204,195 @@ class NodeServiceTestCase(unittest.TestCase):
         label = "Test"
         node_service = NodeService()
 
-        result = node_service.get_nodes(label)
+        result = asyncio.run(node_service.get_nodes(label))
 
         self.assertEqual(result, NodesOut(errors=['error']))
-        get_nodes_mock.assert_called_once_with(label)
+        get_nodes_mock.assert_called_once_with(label, None, None, [])
+
+    @mock.patch.object(DatabaseService, 'get_nodes')
+    def test_get_nodes_with_filters(self, get_nodes_mock):
+        get_nodes_mock.return_value = {'results': [{'data': [{'row': [{'name': 'Test'}], 'meta': [{'id': 5}]}]}],
+                                       'errors': []}
+        label = "Test"
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_nodes(label, where=["name:Test", "age:>=18", "code:\"5\""]))
 
-    @mock.patch.object(NodeService, 'get_node')
-    @mock.patch.object(DatabaseService, 'delete_node')
-    def test_delete_node_without_error(self, delete_node_mock, get_node_mock):
-        delete_node_mock.return_value = {'results': [{'data': [{'row': [{'key': 'value'}, ["Test"]]}]}], 'errors': []}
-        get_node_mock.return_value = NodeOut(id=1, properties=[PropertyIn(key='key', value='value')], labels={"Test"})
+        self.assertEqual(result, NodesOut(nodes=[BasicNodeOut(id=5, labels={"Test"},
+                                                              properties=[PropertyIn(key='name', value='Test')])]))
+        get_nodes_mock.assert_called_once_with(label, None, None, [
+            PropertyFilter(key="name", value="Test"),
+            PropertyFilter(key="age", operator=PropertyOperator.gte, value=18),
+            PropertyFilter(key="code", value="5")])
+
+    @mock.patch.object(DatabaseService, 'get_nodes')
+    def test_get_nodes_with_malformed_filter(self, get_nodes_mock):
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_nodes("Test", where=["name) DETACH DELETE n //:Test"]))
+
+        self.assertIsNotNone(result.errors)
+        get_nodes_mock.assert_not_called()
+
+    @mock.patch.object(NodeService, 'get_nodes')
+    def test_stream_nodes(self, get_nodes_mock):
+        get_nodes_mock.side_effect = [NodesOut(nodes=[BasicNodeOut(id=1), BasicNodeOut(id=2)], next_after=2),
+                                      NodesOut(nodes=[BasicNodeOut(id=3)])]
+        node_service = NodeService()
+
+        async def collect():
+            return [node async for node in node_service.stream_nodes("Test", 2)]
+
+        result = asyncio.run(collect())
+
+        self.assertEqual(result, [BasicNodeOut(id=1), BasicNodeOut(id=2), BasicNodeOut(id=3)])
+        get_nodes_mock.assert_has_calls([mock.call("Test", 2, None, None), mock.call("Test", 2, 2, None)])
+
+    @mock.patch.object(NodeService, 'get_nodes')
+    def test_stream_nodes_with_error(self, get_nodes_mock):
+        get_nodes_mock.side_effect = [NodesOut(nodes=[BasicNodeOut(id=1)], next_after=1), NodesOut(errors=['error'])]
+        node_service = NodeService()
+
+        async def collect():
+            return [node async for node in node_service.stream_nodes("Test", 1)]
+
+        result = asyncio.run(collect())
+
+        self.assertEqual(result, [BasicNodeOut(id=1), NodeOut(errors=['error'])])
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_delete_node_without_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{'key': 'value'}, ["Test"]]}]},
+                                              {'data': [{'row': [{}]}]}],
+                                  'errors': []}
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.delete_node(node_id)
+        result = asyncio.run(node_service.delete_node(node_id))
 
         self.assertEqual(result, NodeOut(id=1, properties=[PropertyIn(key='key', value='value')], labels={"Test"}))
-        delete_node_mock.assert_called_once_with(node_id)
-        get_node_mock.assert_called_once_with(node_id)
+        post_mock.assert_called_once()
+        self.assertEqual(len(post_mock.call_args[0][0]["statements"]), 2)
 
-    @mock.patch.object(DatabaseService, 'get_node')
-    @mock.patch.object(DatabaseService, 'delete_node')
-    def test_delete_node_with_error(self, delete_node_mock, get_node_mock):
-        delete_node_mock.return_value = {'results': [{'data': []}], 'errors': ['error']}
+    @mock.patch.object(DatabaseService, 'post')
+    def test_delete_node_with_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': []}], 'errors': ['error']}
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.delete_node(node_id)
+        result = asyncio.run(node_service.delete_node(node_id))
 
         self.assertEqual(result, NodeOut(errors=['error']))
-        delete_node_mock.assert_called_once_with(node_id)
-        get_node_mock.assert_called_once_with(node_id)
+        post_mock.assert_called_once()
+
+    @mock.patch.object(DatabaseService, 'create_chain')
+    def test_save_chain_without_error(self, create_chain_mock):
+        create_chain_mock.return_value = {'results': [{'data': [
+            {'row': [1, ['Experiment'], [[2, ['Activity Execution'], {}, [[1, 2, 'hasScenario', 7]]]]]}]}],
+            'errors': []}
+        chain = ChainIn(root=1, head='hasScenario', next='nextActivityExecution', labels={'`Activity Execution`'},
+                        nodes=[ChainNodeIn()])
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_chain(chain))
+
+        self.assertEqual(result, ChainOut(root=BasicNodeOut(id=1, labels={'Experiment'}), nodes=[
+            NodeOut(id=2, labels={'Activity Execution'}, properties=[],
+                    relationships=[BasicRelationshipOut(start_node=1, end_node=2, name='hasScenario', id=7)])]))
+        create_chain_mock.assert_called_once_with(chain)
+
+    @mock.patch.object(DatabaseService, 'create_chain')
+    def test_save_chain_without_root(self, create_chain_mock):
+        create_chain_mock.return_value = {'results': [{'data': []}], 'errors': []}
+        chain = ChainIn(root=1, head='hasScenario', next='nextActivityExecution', labels={'Test'},
+                        nodes=[ChainNodeIn()])
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.save_chain(chain))
+
+        self.assertEqual(result, ChainOut(errors="Root node not found"))
+
+    @mock.patch.object(DatabaseService, 'get_chain')
+    def test_get_chain_without_error(self, get_chain_mock):
+        get_chain_mock.return_value = {'results': [{'data': [
+            {'row': [1, ['Experiment'], [[2, ['Activity Execution'], {'activity': 'Test'}, [[1, 2, 'hasScenario', 7]]],
+                                         [3, ['Activity Execution'], {}, [[2, 3, 'nextActivityExecution', 8]]]]]},
+            {'row': [1, ['Experiment'], [[4, ['Activity Execution'], {}, []]]]}]}], 'errors': []}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_chain(1, 'hasScenario', 'nextActivityExecution', True))
+
+        self.assertEqual(result, ChainOut(root=BasicNodeOut(id=1, labels={'Experiment'}), nodes=[
+            NodeOut(id=2, labels={'Activity Execution'}, properties=[PropertyIn(key='activity', value='Test')],
+                    relationships=[BasicRelationshipOut(start_node=1, end_node=2, name='hasScenario', id=7)]),
+            NodeOut(id=3, labels={'Activity Execution'}, properties=[],
+                    relationships=[BasicRelationshipOut(start_node=2, end_node=3, name='nextActivityExecution', id=8)]),
+            NodeOut(id=4, labels={'Activity Execution'}, properties=[], relationships=[])]))
+        get_chain_mock.assert_called_once_with(1, 'hasScenario', 'nextActivityExecution', True)
+
+    @mock.patch.object(DatabaseService, 'get_chain')
+    def test_get_chain_of_root_without_chains(self, get_chain_mock):
+        get_chain_mock.return_value = {'results': [{'data': [{'row': [1, ['Experiment'], None]}]}], 'errors': []}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_chain(1, 'hasScenario', 'nextActivityExecution'))
+
+        self.assertEqual(result, ChainOut(root=BasicNodeOut(id=1, labels={'Experiment'})))
+
+    @mock.patch.object(DatabaseService, 'get_chain')
+    def test_get_chain_not_found(self, get_chain_mock):
+        get_chain_mock.return_value = {'results': [{'data': []}], 'errors': []}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_chain(1, 'hasScenario', 'nextActivityExecution'))
+
+        self.assertEqual(result, ChainOut(errors="Node not found"))
+
+    @mock.patch.object(DatabaseService, 'nodes_exist')
+    def test_nodes_exist_without_error(self, nodes_exist_mock):
+        nodes_exist_mock.return_value = {'results': [{'data': [{'row': [1, 'Modality', True]},
+                                                               {'row': [2, None, False]}]}], 'errors': []}
+        nodes = [NodeExistsIn(id=1, label='Modality'), NodeExistsIn(id=2)]
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.nodes_exist(nodes))
+
+        self.assertEqual(result, NodesExistOut(nodes=[NodeExistsOut(id=1, label='Modality', exists=True),
+                                                      NodeExistsOut(id=2, exists=False)]))
+        nodes_exist_mock.assert_called_once_with(nodes)
+
+    @mock.patch.object(DatabaseService, 'nodes_exist')
+    def test_nodes_exist_with_error(self, nodes_exist_mock):
+        nodes_exist_mock.return_value = {'results': [{'data': []}], 'errors': ['error']}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.nodes_exist([NodeExistsIn(id=1)]))
+
+        self.assertEqual(result, NodesExistOut(errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'get_neighbourhood')
+    def test_get_neighbourhood_without_error(self, get_neighbourhood_mock):
+        get_neighbourhood_mock.return_value = {'results': [{'data': [{'row': [
+            [[1, ['Participant'], {'name': 'Test'}], [2, ['Participant State'], {}]],
+            [[2, 1, 'hasParticipant', 0]]]}]}], 'errors': []}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_neighbourhood(1, 2, ['hasParticipant']))
+
+        self.assertEqual(result, NeighbourhoodOut(
+            nodes=[BasicNodeOut(id=1, labels={'Participant'}, properties=[PropertyIn(key='name', value='Test')]),
+                   BasicNodeOut(id=2, labels={'Participant State'}, properties=[])],
+            relationships=[BasicRelationshipOut(start_node=2, end_node=1, name='hasParticipant', id=0)]))
+        get_neighbourhood_mock.assert_called_once_with(1, 2, ['hasParticipant'])
+
+    @mock.patch.object(DatabaseService, 'get_neighbourhood')
+    def test_get_neighbourhood_not_found(self, get_neighbourhood_mock):
+        get_neighbourhood_mock.return_value = {'results': [{'data': []}], 'errors': []}
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_neighbourhood(1, 1))
+
+        self.assertEqual(result, NeighbourhoodOut(errors="Node not found"))
 
     @mock.patch.object(DatabaseService, 'get_relationships')
     def test_get_relationships_without_error(self, get_relationships_mock):
@@ -111,11 +400,23 @@ class NodeServiceTestCase(unittest.TestCase):
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.get_relationships(node_id)
+        result = asyncio.run(node_service.get_relationships(node_id))
 
         self.assertEqual(result, RelationshipsOut(relationships=[BasicRelationshipOut(start_node=1, end_node=2,
                                                   id=0, name="Test")]))
-        get_relationships_mock.assert_called_once_with(node_id)
+        get_relationships_mock.assert_called_once_with(node_id, None, None)
+
+    @mock.patch.object(DatabaseService, 'get_relationships')
+    def test_get_relationships_with_types_and_direction(self, get_relationships_mock):
+        get_relationships_mock.return_value = {'results': [{'data': [{'row': ['2', '1', 'Test', '0']}]}], 'errors': []}
+        node_id = 1
+        node_service = NodeService()
+
+        result = asyncio.run(node_service.get_relationships(node_id, ["Test"], RelationshipDirection.incoming))
+
+        self.assertEqual(result, RelationshipsOut(relationships=[BasicRelationshipOut(start_node=2, end_node=1,
+                                                  id=0, name="Test")]))
+        get_relationships_mock.assert_called_once_with(node_id, ["Test"], RelationshipDirection.incoming)
 
     @mock.patch.object(DatabaseService, 'get_relationships')
     def test_get_relationships_with_error(self, get_relationships_mock):
@@ -123,79 +424,71 @@ class NodeServiceTestCase(unittest.TestCase):
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.get_relationships(node_id)
+        result = asyncio.run(node_service.get_relationships(node_id))
 
         self.assertEqual(result, RelationshipsOut(errors=["error"]))
-        get_relationships_mock.assert_called_once_with(node_id)
-
-    @mock.patch.object(DatabaseService, 'create_node_properties')
-    @mock.patch.object(DatabaseService, 'node_exists')
-    def test_save_properties_without_error(self, node_exists_mock, create_properties_mock):
-        create_properties_mock.return_value = {'results': [{'data': [{'row': [['test'], {'testkey': 'testvalue'}],
-                                                                      'meta': [{}]}]}],
-                                               'errors': []}
-        node_exists_mock.return_value = True
+        get_relationships_mock.assert_called_once_with(node_id, None, None)
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_properties_without_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{}]}]},
+                                              {'data': [{'row': [['test'], {'testkey': 'testvalue'}],
+                                                         'meta': [{}]}]}],
+                                  'errors': []}
         node_service = NodeService()
         properties = [PropertyIn(key="testkey", value="testvalue")]
         node_id = 5
 
-        result = node_service.save_properties(id=node_id, properties=properties)
+        result = asyncio.run(node_service.save_properties(id=node_id, properties=properties))
 
         self.assertEqual(result, NodeOut(labels={"test"}, id=node_id, properties=properties))
-        create_properties_mock.assert_called_once_with(node_id, properties)
+        post_mock.assert_called_once()
+        self.assertEqual(post_mock.call_args[0][0]["statements"][1]["parameters"],
+                         {"id": node_id, "properties": {"testkey": "testvalue"}})
 
-    @mock.patch.object(DatabaseService, 'create_node_properties')
-    @mock.patch.object(DatabaseService, 'node_exists')
-    def test_save_properties_with_error(self, node_exists_mock, create_properties_mock):
-        create_properties_mock.return_value = {'results': [{'data': [{'meta': [{}]}]}],
-                                               'errors': ['error']}
-        node_exists_mock.return_value = True
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_properties_with_error(self, post_mock):
+        post_mock.return_value = {'results': [], 'errors': ['error']}
         node_service = NodeService()
         properties = [PropertyIn(key="testkey", value="testvalue")]
         node_id = 5
 
-        result = node_service.save_properties(id=node_id, properties=properties)
+        result = asyncio.run(node_service.save_properties(id=node_id, properties=properties))
 
         self.assertEqual(result, NodeOut(errors=['error']))
 
-    @mock.patch.object(DatabaseService, 'create_node_properties')
-    @mock.patch.object(DatabaseService, 'node_exists')
-    def test_save_properties_without_node(self, node_exists_mock, create_properties_mock):
-        create_properties_mock.return_value = {'results': [{'data': [{'meta': [{}]}]}],
-                                               'errors': []}
-        node_exists_mock.return_value = False
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_properties_without_node(self, post_mock):
+        post_mock.return_value = {'results': [{'data': []}, {'data': []}], 'errors': []}
         node_service = NodeService()
         properties = [PropertyIn(key="testkey", value="testvalue")]
         node_id = 5
 
-        result = node_service.save_properties(id=node_id, properties=properties)
+        result = asyncio.run(node_service.save_properties(id=node_id, properties=properties))
 
         self.assertEqual(result, NodeOut(id=node_id, errors={"errors": "not matching id"}))
 
-    @mock.patch.object(NodeService, 'get_node')
-    @mock.patch.object(DatabaseService, 'delete_node_properties')
-    def test_delete_node_properties_without_error(self, delete_node_properties_mock, get_node_mock):
-        delete_node_properties_mock.return_value = {'results': [{'data': [{'row': [{'key': 'value'}, ["Test"]]}]}],
-                                                    'errors': []}
-        get_node_mock.return_value = NodeOut(id=1, properties=[PropertyIn(key='key', value='value')], labels={"Test"})
+    @mock.patch.object(DatabaseService, 'post')
+    def test_delete_node_properties_without_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{'key': 'value'}, ["Test"]]}]},
+                                              {'data': [{'row': [{}]}]}],
+                                  'errors': []}
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.delete_node_properties(node_id)
+        result = asyncio.run(node_service.delete_node_properties(node_id))
 
         self.assertEqual(result, NodeOut(id=1, properties=[PropertyIn(key='key', value='value')], labels={"Test"}))
-        delete_node_properties_mock.assert_called_once_with(node_id)
-        get_node_mock.assert_called_once_with(node_id)
+        post_mock.assert_called_once()
+        self.assertEqual(len(post_mock.call_args[0][0]["statements"]), 2)
 
-    @mock.patch.object(DatabaseService, 'get_node')
-    @mock.patch.object(DatabaseService, 'delete_node_properties')
-    def test_delete_node_properties_with_error(self, delete_node_properties_mock, get_node_mock):
-        delete_node_properties_mock.return_value = {'results': [{'data': []}], 'errors': ['error']}
+    @mock.patch.object(DatabaseService, 'post')
+    def test_delete_node_properties_with_error(self, post_mock):
+        post_mock.return_value = {'results': [], 'errors': ['error']}
         node_id = 1
         node_service = NodeService()
 
-        result = node_service.delete_node_properties(node_id)
+        result = asyncio.run(node_service.delete_node_properties(node_id))
 
         self.assertEqual(result, NodeOut(errors=['error']))
-        delete_node_properties_mock.assert_called_once_with(node_id)
-        get_node_mock.assert_called_once_with(node_id)
+        post_mock.assert_called_once()
@@ -49,6 +49,33 @@ class TestRelationshipRouter(unittest.TestCase):
         save_relationship_mock.assert_called_with(relationship)
         self.assertEqual(response.status_code, 422)
 
+    @mock.patch.object(RelationshipService, 'save_relationships')
+    def test_create_relationships_without_error(self, save_relationships_mock):
+        save_relationships_mock.return_value = RelationshipsBulkOut(relationships=[
+            RelationshipOut(start_node=1, end_node=2, name="test", id=5)])
+        response = Response()
+        relationships = [RelationshipIn(start_node=1, end_node=2, name="test")]
+        relationship_router = RelationshipRouter()
+
+        result = asyncio.run(relationship_router.create_relationships(relationships, response))
+
+        self.assertEqual(result, RelationshipsBulkOut(relationships=[
+            RelationshipOut(start_node=1, end_node=2, name="test", id=5)], links=get_links(router)))
+        save_relationships_mock.assert_called_with(relationships)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(RelationshipService, 'save_relationships')
+    def test_create_relationships_with_error(self, save_relationships_mock):
+        save_relationships_mock.return_value = RelationshipsBulkOut(errors={'errors': ['test']})
+        response = Response()
+        relationships = [RelationshipIn(start_node=1, end_node=2, name="test")]
+        relationship_router = RelationshipRouter()
+
+        result = asyncio.run(relationship_router.create_relationships(relationships, response))
+
+        self.assertEqual(result, RelationshipsBulkOut(errors={'errors': ['test']}, links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
     @mock.patch.object(RelationshipService, 'save_properties')
     def test_create_relationship_properties_without_error(self, save_properties_mock):
         save_properties_mock.side_effect = return_relationship_with_properties
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -8,48 +9,83 @@ from relationship.relationship_service import RelationshipService
 
 class TestRelationshipService(unittest.TestCase):
 
-    @mock.patch.object(DatabaseService, 'create_relationship')
-    @mock.patch.object(DatabaseService, 'node_exists')
-    def test_save_relationship_without_error(self, node_exists_mock, create_relationship_mock):
-        create_relationship_mock.return_value = {'results': [{'data': [{'meta': [{'id': '5'}]}]}],
-                                                 'errors': []}
-        node_exists_mock.return_value = True
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_relationship_without_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{}]}]}, {'data': [{'row': [{}]}]},
+                                              {'data': [{'meta': [{'id': '5'}]}]}],
+                                  'errors': []}
         relationship = RelationshipIn(start_node=1, end_node=2, name="test")
         relationship_service = RelationshipService()
 
-        result = relationship_service.save_relationship(relationship)
+        result = asyncio.run(relationship_service.save_relationship(relationship))
 
         self.assertEqual(result, RelationshipOut(start_node=1, end_node=2, name="test", id=5, errors=None))
-        create_relationship_mock.assert_called_once_with(relationship)
-
-    @mock.patch.object(DatabaseService, 'create_relationship')
-    @mock.patch.object(DatabaseService, 'node_exists')
-    def test_save_relationship_with_error(self, node_exists_mock, create_relationship_mock):
-        create_relationship_mock.return_value = {'results': [{'data': [{'meta': [{}]}]}],
-                                                 'errors': ['error']}
-        node_exists_mock.return_value = True
+        post_mock.assert_called_once()
+        self.assertEqual(len(post_mock.call_args[0][0]["statements"]), 3)
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_relationship_with_quoted_name(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{}]}]}, {'data': [{'row': [{}]}]},
+                                              {'data': [{'meta': [{'id': '5'}]}]}],
+                                  'errors': []}
+        relationship = RelationshipIn(start_node=1, end_node=2, name="a]->(m) DETACH DELETE m //")
+        relationship_service = RelationshipService()
+
+        asyncio.run(relationship_service.save_relationship(relationship))
+
+        self.assertEqual(post_mock.call_args[0][0]["statements"][2]["statement"],
+                         "MATCH (n) WHERE id(n) = $start_node MATCH (m) WHERE id(m) = $end_node "
+                         "MERGE (n)-[r:`a]->(m) DETACH DELETE m //`]->(m) RETURN r")
+
+    @mock.patch.object(DatabaseService, 'create_relationships')
+    def test_save_relationships_without_error(self, create_relationships_mock):
+        create_relationships_mock.return_value = {'results': [{'data': [{'row': [0, 5]}]},
+                                                              {'data': [{'row': [2, 6]}]}], 'errors': []}
+        relationships = [RelationshipIn(start_node=1, end_node=2, name="test"),
+                         RelationshipIn(start_node=1, end_node=3, name="test"),
+                         RelationshipIn(start_node=2, end_node=3, name="other")]
+        relationship_service = RelationshipService()
+
+        result = asyncio.run(relationship_service.save_relationships(relationships))
+
+        self.assertEqual(result, RelationshipsBulkOut(relationships=[
+            RelationshipOut(start_node=1, end_node=2, name="test", id=5),
+            RelationshipOut(start_node=1, end_node=3, name="test", errors={"errors": "not matching node id"}),
+            RelationshipOut(start_node=2, end_node=3, name="other", id=6)]))
+        create_relationships_mock.assert_called_once_with(relationships)
+
+    @mock.patch.object(DatabaseService, 'create_relationships')
+    def test_save_relationships_with_error(self, create_relationships_mock):
+        create_relationships_mock.return_value = {'results': [], 'errors': ['error']}
+        relationships = [RelationshipIn(start_node=1, end_node=2, name="test")]
+        relationship_service = RelationshipService()
+
+        result = asyncio.run(relationship_service.save_relationships(relationships))
+
+        self.assertEqual(result, RelationshipsBulkOut(errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_relationship_with_error(self, post_mock):
+        post_mock.return_value = {'results': [], 'errors': ['error']}
         relationship = RelationshipIn(start_node=1, end_node=2, name="test")
         relationship_service = RelationshipService()
 
-        result = relationship_service.save_relationship(relationship)
+        result = asyncio.run(relationship_service.save_relationship(relationship))
 
         self.assertEqual(result, RelationshipOut(start_node=1, end_node=2, name="test", errors=['error']))
-        create_relationship_mock.assert_called_once_with(relationship)
-
-    @mock.patch.object(DatabaseService, 'create_relationship')
-    @mock.patch.object(DatabaseService, 'node_exists')
-    def test_save_relationship_without_nodes(self, node_exists_mock, create_relationship_mock):
-        create_relationship_mock.return_value = {'results': [{'data': [{'meta': [{'id': '5'}]}]}],
-                                                 'errors': []}
-        node_exists_mock.return_value = False
+        post_mock.assert_called_once()
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_relationship_without_nodes(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{}]}]}, {'data': []}, {'data': []}],
+                                  'errors': []}
         relationship = RelationshipIn(start_node=1, end_node=2, name="test")
         relationship_service = RelationshipService()
 
-        result = relationship_service.save_relationship(relationship)
+        result = asyncio.run(relationship_service.save_relationship(relationship))
 
         self.assertEqual(result, RelationshipOut(start_node=1, end_node=2, name="test",
                                                  errors={"errors": "not matching node id"}))
-        create_relationship_mock.assert_not_called()
 
     @mock.patch.object(DatabaseService, 'get_relationship')
     def test_get_relationship_without_error(self, get_relationship_mock):
@@ -57,7 +93,7 @@ class TestRelationshipService(unittest.TestCase):
             'results': [{'data': [{'row': [0, 1, "test", 5]}]}], 'errors': []}
         relationship_service = RelationshipService()
 
-        result = relationship_service.get_relationship(5)
+        result = asyncio.run(relationship_service.get_relationship(5))
 
         self.assertEqual(result, RelationshipOut(start_node=0, end_node=1, name="test", id=5))
         get_relationship_mock.assert_called_once_with(5)
@@ -68,79 +104,69 @@ class TestRelationshipService(unittest.TestCase):
                                                'errors': ['error']}
         relationship_service = RelationshipService()
 
-        result = relationship_service.get_relationship(5)
+        result = asyncio.run(relationship_service.get_relationship(5))
 
         self.assertEqual(result, RelationshipOut(errors="Relationship not found"))
         get_relationship_mock.assert_called_once_with(5)
 
-    @mock.patch.object(RelationshipService, 'get_relationship')
-    @mock.patch.object(DatabaseService, 'delete_relationship')
-    def test_delete_relationship_without_error(self, delete_relationship_mock, get_relationship_mock):
-        delete_relationship_mock.return_value = {'results': [{'data': [{'meta': [{'id': '5'}]}]}],
-                                                 'errors': []}
-        get_relationship_mock.return_value = RelationshipOut(start_node=1, end_node=2, name="test", id=5, errors=None)
+    @mock.patch.object(DatabaseService, 'post')
+    def test_delete_relationship_without_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [1, 2, "test", 5]}]},
+                                              {'data': [{'meta': [{'id': '5'}]}]}],
+                                  'errors': []}
         relationship_id = 5
         relationship_service = RelationshipService()
 
-        result = relationship_service.delete_relationship(relationship_id)
+        result = asyncio.run(relationship_service.delete_relationship(relationship_id))
 
         self.assertEqual(result, RelationshipOut(start_node=1, end_node=2, name="test", id=5, errors=None))
-        delete_relationship_mock.assert_called_once_with(relationship_id)
-        get_relationship_mock.assert_called_once_with(relationship_id)
-
-    @mock.patch.object(RelationshipService, 'get_relationship')
-    @mock.patch.object(DatabaseService, 'delete_relationship')
-    def test_delete_relationship_with_error(self, delete_relationship_mock, get_relationship_mock):
-        delete_relationship_mock.return_value = {'results': [{'data': [{'meta': [{}]}]}],
-                                                 'errors': ['error']}
-        get_relationship_mock.return_value = None
+        post_mock.assert_called_once()
+        self.assertEqual(len(post_mock.call_args[0][0]["statements"]), 2)
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_delete_relationship_with_error(self, post_mock):
+        post_mock.return_value = {'results': [], 'errors': ['error']}
         relationship_id = 5
         relationship_service = RelationshipService()
 
-        result = relationship_service.delete_relationship(relationship_id)
+        result = asyncio.run(relationship_service.delete_relationship(relationship_id))
 
         self.assertEqual(result, RelationshipOut(errors=['error']))
-        delete_relationship_mock.assert_called_once_with(relationship_id)
-        get_relationship_mock.assert_called_once_with(relationship_id)
-
-    @mock.patch.object(DatabaseService, 'create_relationship_properties')
-    @mock.patch.object(DatabaseService, 'relationship_exist')
-    def test_save_properties_without_error(self, relationship_exist_mock, create_properties_mock):
-        create_properties_mock.return_value = {'results': [{'data': [{'row': [0, "test", 1, {"testkey": "testvalue"}]}]}],
-                                               'errors': []}
-        relationship_exist_mock.return_value = True
+        post_mock.assert_called_once()
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_properties_without_error(self, post_mock):
+        post_mock.return_value = {'results': [{'data': [{'row': [{}]}]},
+                                              {'data': [{'row': [0, "test", 1, {"testkey": "testvalue"}]}]}],
+                                  'errors': []}
         relationship_service = RelationshipService()
         properties = [PropertyIn(key="testkey", value="testvalue")]
 
-        result = relationship_service.save_properties(id=5, properties=properties)
+        result = asyncio.run(relationship_service.save_properties(id=5, properties=properties))
 
         self.assertEqual(result, RelationshipOut(start_node=0, end_node=1, name="test",
                                                  id=5, properties=properties))
-        create_properties_mock.assert_called_once_with(5, properties)
+        post_mock.assert_called_once()
+        self.assertEqual(post_mock.call_args[0][0]["statements"][1]["parameters"],
+                         {"id": 5, "properties": {"testkey": "testvalue"}})
 
-    @mock.patch.object(DatabaseService, 'create_relationship_properties')
-    @mock.patch.object(DatabaseService, 'relationship_exist')
-    def test_save_properties_with_error(self, relationship_exist_mock, create_properties_mock):
-        create_properties_mock.return_value = {'results': [{'data': [{'row': []}]}],
-                                               'errors': ['error']}
-        relationship_exist_mock.return_value = True
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_properties_with_error(self, post_mock):
+        post_mock.return_value = {'results': [], 'errors': ['error']}
         relationship_service = RelationshipService()
         properties = [PropertyIn(key="testkey", value="testvalue")]
 
-        result = relationship_service.save_properties(id=5, properties=properties)
+        result = asyncio.run(relationship_service.save_properties(id=5, properties=properties))
 
         self.assertEqual(result, RelationshipOut(errors=['error']))
-        create_properties_mock.assert_called_once_with(5, properties)
-
-    @mock.patch.object(DatabaseService, 'create_relationship_properties')
-    @mock.patch.object(DatabaseService, 'relationship_exist')
-    def test_save_properties_without_nodes(self, relationship_exist_mock, create_properties_mock):
-        create_properties_mock.return_value = {'results': [{'data': [{'row': [0, "test", 1, {"testkey": "testvalue"}]}]}],
-                                               'errors': []}
-        relationship_exist_mock.return_value = False
+        post_mock.assert_called_once()
+
+    @mock.patch.object(DatabaseService, 'post')
+    def test_save_properties_without_nodes(self, post_mock):
+        post_mock.return_value = {'results': [{'data': []}, {'data': []}], 'errors': []}
         relationship_service = RelationshipService()
         properties = [PropertyIn(key="testkey", value="testvalue")]
 
-        result = relationship_service.save_properties(id=5, properties=properties)
+        result = asyncio.run(relationship_service.save_properties(id=5, properties=properties))
 
         self.assertEqual(result, RelationshipOut(id=5, errors={"errors": "not matching id"}))
@@ -0,0 +1,28 @@
+import unittest
+
+import orjson
+
+from node.node_model import BasicNodeOut, NodesOut
+from property.property_model import PropertyIn
+from responses import ModelResponse
+
+
+class ModelResponseTestCase(unittest.TestCase):
+
+    def test_render(self):
+        model = NodesOut(nodes=[BasicNodeOut(id=5, labels={"Test"}, properties=[PropertyIn(key="age", value=5)])],
+                         next_after=5, links=[{"rel": "next"}])
+
+        result = ModelResponse(model)
+
+        self.assertEqual(orjson.loads(result.body), {"nodes": [{"id": 5, "labels": ["Test"],
+                                                                "properties": [{"key": "age", "value": 5}]}],
+                                                     "next_after": 5, "errors": None, "links": [{"rel": "next"}]})
+        self.assertEqual(result.media_type, "application/json")
+        self.assertEqual(result.status_code, 200)
+
+    def test_status_code(self):
+        result = ModelResponse(NodesOut(errors="error"), 422)
+
+        self.assertEqual(result.status_code, 422)
+        self.assertEqual(orjson.loads(result.body)["errors"], "error")
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from transaction.transaction_router import *
+
+
+class TransactionRouterTestCase(unittest.TestCase):
+
+    @mock.patch.object(TransactionService, 'begin_transaction')
+    def test_begin_transaction_without_error(self, begin_transaction_mock):
+        begin_transaction_mock.return_value = TransactionOut(id="5")
+        response = Response()
+        transaction_router = TransactionRouter()
+
+        result = asyncio.run(transaction_router.begin_transaction(response))
+
+        self.assertEqual(result, TransactionOut(id="5", links=get_links(router)))
+        begin_transaction_mock.assert_called_once_with()
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TransactionService, 'begin_transaction')
+    def test_begin_transaction_with_error(self, begin_transaction_mock):
+        begin_transaction_mock.return_value = TransactionOut(errors=['error'])
+        response = Response()
+        transaction_router = TransactionRouter()
+
+        result = asyncio.run(transaction_router.begin_transaction(response))
+
+        self.assertEqual(result, TransactionOut(errors=['error'], links=get_links(router)))
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.object(TransactionService, 'commit_transaction')
+    def test_commit_transaction_without_error(self, commit_transaction_mock):
+        commit_transaction_mock.return_value = TransactionOut(id="5")
+        response = Response()
+        transaction_router = TransactionRouter()
+
+        result = asyncio.run(transaction_router.commit_transaction("5", response))
+
+        self.assertEqual(result, TransactionOut(id="5", links=get_links(router)))
+        commit_transaction_mock.assert_called_once_with("5")
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TransactionService, 'commit_transaction')
+    def test_commit_transaction_with_error(self, commit_transaction_mock):
+        commit_transaction_mock.return_value = TransactionOut(id="5", errors=['error'])
+        response = Response()
+        transaction_router = TransactionRouter()
+
+        result = asyncio.run(transaction_router.commit_transaction("5", response))
+
+        self.assertEqual(result, TransactionOut(id="5", errors=['error'], links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
+
+    @mock.patch.object(TransactionService, 'rollback_transaction')
+    def test_rollback_transaction_without_error(self, rollback_transaction_mock):
+        rollback_transaction_mock.return_value = TransactionOut(id="5")
+        response = Response()
+        transaction_router = TransactionRouter()
+
+        result = asyncio.run(transaction_router.rollback_transaction("5", response))
+
+        self.assertEqual(result, TransactionOut(id="5", links=get_links(router)))
+        rollback_transaction_mock.assert_called_once_with("5")
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(TransactionService, 'rollback_transaction')
+    def test_rollback_transaction_with_error(self, rollback_transaction_mock):
+        rollback_transaction_mock.return_value = TransactionOut(id="5", errors=['error'])
+        response = Response()
+        transaction_router = TransactionRouter()
+
+        result = asyncio.run(transaction_router.rollback_transaction("5", response))
+
+        self.assertEqual(result, TransactionOut(id="5", errors=['error'], links=get_links(router)))
+        self.assertEqual(response.status_code, 404)
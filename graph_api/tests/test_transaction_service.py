@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from database_service import DatabaseService
+from transaction.transaction_model import TransactionOut
+from transaction.transaction_service import TransactionService
+
+
+class TransactionServiceTestCase(unittest.TestCase):
+
+    @mock.patch.object(DatabaseService, 'begin_transaction')
+    def test_begin_transaction_without_error(self, begin_transaction_mock):
+        begin_transaction_mock.return_value = {'id': '5', 'errors': []}
+        transaction_service = TransactionService()
+
+        result = asyncio.run(transaction_service.begin_transaction())
+
+        self.assertEqual(result, TransactionOut(id='5'))
+        begin_transaction_mock.assert_called_once_with()
+
+    @mock.patch.object(DatabaseService, 'begin_transaction')
+    def test_begin_transaction_with_error(self, begin_transaction_mock):
+        begin_transaction_mock.return_value = {'id': None, 'errors': ['error']}
+        transaction_service = TransactionService()
+
+        result = asyncio.run(transaction_service.begin_transaction())
+
+        self.assertEqual(result, TransactionOut(errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'commit_transaction')
+    def test_commit_transaction_without_error(self, commit_transaction_mock):
+        commit_transaction_mock.return_value = {'results': [], 'errors': []}
+        transaction_service = TransactionService()
+
+        result = asyncio.run(transaction_service.commit_transaction('5'))
+
+        self.assertEqual(result, TransactionOut(id='5'))
+        commit_transaction_mock.assert_called_once_with('5')
+
+    @mock.patch.object(DatabaseService, 'commit_transaction')
+    def test_commit_transaction_with_error(self, commit_transaction_mock):
+        commit_transaction_mock.return_value = {'results': [], 'errors': ['error']}
+        transaction_service = TransactionService()
+
+        result = asyncio.run(transaction_service.commit_transaction('5'))
+
+        self.assertEqual(result, TransactionOut(id='5', errors=['error']))
+
+    @mock.patch.object(DatabaseService, 'rollback_transaction')
+    def test_rollback_transaction_without_error(self, rollback_transaction_mock):
+        rollback_transaction_mock.return_value = {'results': [], 'errors': []}
+        transaction_service = TransactionService()
+
+        result = asyncio.run(transaction_service.rollback_transaction('5'))
+
+        self.assertEqual(result, TransactionOut(id='5'))
+        rollback_transaction_mock.assert_called_once_with('5')
+
+    @mock.patch.object(DatabaseService, 'rollback_transaction')
+    def test_rollback_transaction_with_error(self, rollback_transaction_mock):
+        rollback_transaction_mock.return_value = {'results': [], 'errors': ['error']}
+        transaction_service = TransactionService()
+
+        result = asyncio.run(transaction_service.rollback_transaction('5'))
+
+        self.assertEqual(result, TransactionOut(id='5', errors=['error']))
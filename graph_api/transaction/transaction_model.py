@@ -0,0 +1,16 @@
+from typing import Optional, Any
+from pydantic import BaseModel
+
+
+class TransactionOut(BaseModel):
+    """
+    Model of explicit transaction to send to client as a result of request
+
+    Attributes:
+        id (Optional[str]): Id of transaction, sent in X-Transaction-Id header to run request in transaction
+        errors (Optional[Any]): Optional errors appeared during query executions
+        links (Optional[list): Hateoas implementation
+    """
+    id: Optional[str] = None
+    errors: Optional[Any] = None
+    links: Optional[list] = None
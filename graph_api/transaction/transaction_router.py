@@ -0,0 +1,67 @@
+from fastapi import Response
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+from transaction.transaction_model import TransactionOut
+from transaction.transaction_service import TransactionService
+from hateoas import get_links
+
+router = InferringRouter()
+
+# header in which client sends id of transaction to run its request in
+transaction_header = "X-Transaction-Id"
+
+
+@cbv(router)
+class TransactionRouter:
+    """
+    Class for routing explicit transactions based requests
+
+    Attributes:
+        transaction_service (TransactionService): Service instance for transactions
+    """
+    transaction_service = TransactionService()
+
+    @router.post("/transactions", tags=["transactions"], response_model=TransactionOut)
+    async def begin_transaction(self, response: Response):
+        """
+        Open transaction, requests with its id in X-Transaction-Id header are run in it
+
+        Transaction not used for DB_TRANSACTION_TIMEOUT seconds is rolled back. With bolt backend open
+        transactions are kept by API process, so API must run in one worker to use them.
+        """
+        create_response = await self.transaction_service.begin_transaction()
+        if create_response.errors is not None:
+            response.status_code = 422
+
+        # add links from hateoas
+        create_response.links = get_links(router)
+
+        return create_response
+
+    @router.post("/transactions/{id}/commit", tags=["transactions"], response_model=TransactionOut)
+    async def commit_transaction(self, id: str, response: Response):
+        """
+        Commit transaction with given id
+        """
+        commit_response = await self.transaction_service.commit_transaction(id)
+        if commit_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        commit_response.links = get_links(router)
+
+        return commit_response
+
+    @router.delete("/transactions/{id}", tags=["transactions"], response_model=TransactionOut)
+    async def rollback_transaction(self, id: str, response: Response):
+        """
+        Roll back transaction with given id
+        """
+        rollback_response = await self.transaction_service.rollback_transaction(id)
+        if rollback_response.errors is not None:
+            response.status_code = 404
+
+        # add links from hateoas
+        rollback_response.links = get_links(router)
+
+        return rollback_response
@@ -0,0 +1,60 @@
+from database_service import DatabaseService
+from transaction.transaction_model import TransactionOut
+
+
+class TransactionService:
+    """
+    Object to handle logic of explicit transactions requests
+
+    Attributes:
+        db (DatabaseService): Handles communication with Neo4j database
+    """
+    db: DatabaseService = DatabaseService()
+
+    async def begin_transaction(self):
+        """
+        Send request to database by its API to open new transaction
+
+        Returns:
+            Result of request as transaction object
+        """
+        response = await self.db.begin_transaction()
+
+        if len(response["errors"]) > 0:
+            return TransactionOut(errors=response["errors"])
+
+        return TransactionOut(id=response["id"])
+
+    async def commit_transaction(self, transaction_id: str):
+        """
+        Send request to database by its API to commit transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request as transaction object
+        """
+        response = await self.db.commit_transaction(transaction_id)
+
+        if len(response["errors"]) > 0:
+            return TransactionOut(id=transaction_id, errors=response["errors"])
+
+        return TransactionOut(id=transaction_id)
+
+    async def rollback_transaction(self, transaction_id: str):
+        """
+        Send request to database by its API to roll back transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+
+        Returns:
+            Result of request as transaction object
+        """
+        response = await self.db.rollback_transaction(transaction_id)
+
+        if len(response["errors"]) > 0:
+            return TransactionOut(id=transaction_id, errors=response["errors"])
+
+        return TransactionOut(id=transaction_id)
@@ -63,9 +63,11 @@ class ActivitiesOut(BaseModel):
 
     Attributes:
     activity_types (List[BasicActivityOut]): Activity types from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     activities: List[BasicActivityOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from activity.activity_model import ActivityIn, ActivityOut, ActivitiesOut, BasicActivityOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class ActivityService:
     """
     graph_api_service = GraphApiService()
 
-    def save_activity(self, activity: ActivityIn):
+    async def save_activity(self, activity: ActivityIn):
         """
         Send request to graph api to create new activity
 
@@ -23,36 +24,35 @@ class ActivityService:
         Returns:
             Result of request as activity object
         """
-
-        node_response = self.graph_api_service.create_node("Activity")
+        node_response = await self.graph_api_service.create_subgraph("Activity", activity)
 
         if node_response["errors"] is not None:
             return ActivityOut(activity=activity.activity, errors=node_response["errors"])
 
-        activity_id = node_response["id"]
-
-        properties_response = self.graph_api_service.create_properties(activity_id, activity)
-        if properties_response["errors"] is not None:
-            return ActivityOut(activity=activity.activity, errors=properties_response["errors"])
-
-        return ActivityOut(activity=activity.activity, id=activity_id)
+        self.graph_api_service.invalidate_reference_nodes("Activity")
+        return ActivityOut(activity=activity.activity, id=node_response["id"])
 
-    def get_activities(self):
+    async def get_activities(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get all activities
 
+        Args:
+            limit (int): Maximal number of activities, all are returned if not given
+            after (int): Id after which returned activities start
+            where (List[str]): Filters on properties of activities
+
         Returns:
             Result of request as list of activity objects
         """
-        get_response = self.graph_api_service.get_nodes("Activity")
+        get_response = await self.graph_api_service.get_nodes("Activity", limit, after, where)
         if get_response["errors"] is not None:
             return ActivitiesOut(errors=get_response["errors"])
         activities = [BasicActivityOut(id=activity["id"], activity=activity["properties"][0]["value"])
                       for activity in get_response["nodes"]]
 
-        return ActivitiesOut(activities=activities)
+        return ActivitiesOut(activities=activities, next_after=get_response.get("next_after"))
 
-    def get_activity(self, activity_id: int):
+    async def get_activity(self, activity_id: int):
         """
         Send request to graph api to get given activity
         Args:
@@ -60,20 +60,16 @@ class ActivityService:
         Returns:
             Result of request as activity object
         """
-        get_response = self.graph_api_service.get_node(activity_id)
+        get_response = await self.graph_api_service.get_node(activity_id, "Activity", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=activity_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Activity":
-            return NotFoundByIdModel(id=activity_id, errors="Node not found.")
 
         activity = {'id': get_response['id'], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
             activity[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(activity_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == activity_id:
                 activity['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                  name=relation["name"], relation_id=relation["id"]))
@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from models.not_found_model import NotFoundByIdModel
 from activity_execution.activity_execution_model import ActivityExecutionIn, ActivityExecutionOut, \
     ActivityExecutionsOut, ActivityExecutionPropertyIn, ActivityExecutionRelationIn
@@ -27,7 +31,7 @@ class ActivityExecutionRouter:
         """
         Create activity execution in database
         """
-        create_response = self.activity_execution_service.save_activity_execution(activity_execution)
+        create_response = await self.activity_execution_service.save_activity_execution(activity_execution)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -37,15 +41,32 @@ class ActivityExecutionRouter:
         return create_response
 
     @router.get("/activity_executions", tags=["activity executions"], response_model=ActivityExecutionsOut)
-    async def get_activity_executions(self, response: Response):
+    async def get_activity_executions(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                      after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                      where: Optional[List[str]] = Query(None)):
         """
         Get activity executions from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all activity executions starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.activity_execution_service.get_activity_executions, where=where)
+            activity_executions = stream_ndjson(get_page, "activity_executions", after)
+            return StreamingResponse(activity_executions, media_type="application/x-ndjson")
 
-        get_response = self.activity_execution_service.get_activity_executions()
+        get_response = await self.activity_execution_service.get_activity_executions(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/activity_executions", {"limit": limit,
+                                                                             "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
 
@@ -56,7 +77,7 @@ class ActivityExecutionRouter:
         Get activity executions from database
         """
 
-        get_response = self.activity_execution_service.get_activity_execution(activity_execution_id)
+        get_response = await self.activity_execution_service.get_activity_execution(activity_execution_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -71,7 +92,7 @@ class ActivityExecutionRouter:
         """
         Delete activity executions from database
         """
-        get_response = self.activity_execution_service.delete_activity_execution(activity_execution_id)
+        get_response = await self.activity_execution_service.delete_activity_execution(activity_execution_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -88,8 +109,8 @@ class ActivityExecutionRouter:
         """
         Update activity execution model in database
         """
-        update_response = self.activity_execution_service.update_activity_execution(activity_execution_id,
-                                                                                    activity_execution)
+        update_response = await self.activity_execution_service.update_activity_execution(activity_execution_id,
+                                                                                          activity_execution)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -106,8 +127,8 @@ class ActivityExecutionRouter:
         """
         Update activity executions relations in database
         """
-        update_response = self.activity_execution_service.update_activity_execution_relationships(activity_execution_id,
-                                                                                                  activity_execution)
+        update_response = await self.activity_execution_service.update_activity_execution_relationships(
+            activity_execution_id, activity_execution)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -1,6 +1,5 @@
+from typing import List
 from graph_api_service import GraphApiService
-from activity.activity_service import ActivityService
-from arrangement.arrangement_service import ArrangementService
 from activity_execution.activity_execution_model import ActivityExecutionPropertyIn, ActivityExecutionRelationIn, \
     ActivityExecutionIn, ActivityExecutionOut, ActivityExecutionsOut, BasicActivityExecutionOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,14 +12,10 @@ class ActivityExecutionService:
 
     Attributes:
     graph_api_service (GraphApiService): Service used to communicate with Graph API
-    activity_service (ActivityService): Service used to communicate with Activity
-    arrangement_service (ArrangementService): Service used to communicate with Arrangement
     """
     graph_api_service = GraphApiService()
-    activity_service = ActivityService()
-    arrangement_service = ArrangementService()
 
-    def save_activity_execution(self, activity_execution: ActivityExecutionIn):
+    async def save_activity_execution(self, activity_execution: ActivityExecutionIn):
         """
         Send request to graph api to create new activity execution
 
@@ -30,40 +25,49 @@ class ActivityExecutionService:
         Returns:
             Result of request as activity execution object
         """
-        node_response = self.graph_api_service.create_node("`Activity Execution`")
+        properties, relationships = self.prepare_subgraph(activity_execution)
+        node_response = await self.graph_api_service.create_subgraph("`Activity Execution`", properties, relationships)
 
         if node_response["errors"] is not None:
             return ActivityExecutionOut(**activity_execution.dict(), errors=node_response["errors"])
 
-        activity_execution_id = node_response["id"]
+        return self.prepare_activity_execution(node_response, node_response["relationships"])
 
-        if activity_execution.activity_id is not None and \
-                type(self.activity_service.get_activity(activity_execution.activity_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=activity_execution_id,
-                                                        end_node=activity_execution.activity_id,
-                                                        name="hasActivity")
-
-        if activity_execution.arrangement_id is not None and \
-                type(self.arrangement_service.get_arrangement(activity_execution.arrangement_id)) \
-                is not NotFoundByIdModel:
+    def prepare_subgraph(self, activity_execution: ActivityExecutionIn):
+        """
+        Split activity execution into properties of its node and relationships going out of it
 
-            self.graph_api_service.create_relationships(start_node=activity_execution_id,
-                                                        end_node=activity_execution.arrangement_id,
-                                                        name="hasArrangement")
+        Args:
+            activity_execution (ActivityExecutionIn): Activity execution to be added
 
-        activity_execution.activity_id = activity_execution.arrangement_id = None
-        self.graph_api_service.create_properties(activity_execution_id, activity_execution)
+        Returns:
+            Model with properties of node and relationships as tuples of end node id, name of the relationship
+            and label of end node
+        """
+        relationships = []
+        if activity_execution.activity_id is not None:
+            relationships.append((activity_execution.activity_id, "hasActivity", "Activity"))
+        if activity_execution.arrangement_id is not None:
+            relationships.append((activity_execution.arrangement_id, "hasArrangement", "Arrangement"))
 
-        return self.get_activity_execution(activity_execution_id)
+        properties = activity_execution.copy(update={"activity_id": None, "arrangement_id": None})
+        return properties, relationships
 
-    def get_activity_executions(self):
+    async def get_activity_executions(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get activity executions
 
+        Args:
+            limit (int): Maximal number of activity executions, all are returned if not given
+            after (int): Id after which returned activity executions start
+            where (List[str]): Filters on properties of activity executions
+
         Returns:
             Result of request as list of activity executions objects
         """
-        get_response = self.graph_api_service.get_nodes("`Activity Execution`")
+        get_response = await self.graph_api_service.get_nodes("`Activity Execution`", limit, after, where)
+        if get_response["errors"] is not None:
+            return ActivityExecutionsOut(errors=get_response["errors"])
 
         activity_executions = []
         for activity_execution_node in get_response["nodes"]:
@@ -73,9 +77,9 @@ class ActivityExecutionService:
             activity_execution = BasicActivityExecutionOut(**properties)
             activity_executions.append(activity_execution)
 
-        return ActivityExecutionsOut(activity_executions=activity_executions)
+        return ActivityExecutionsOut(activity_executions=activity_executions, next_after=get_response.get("next_after"))
 
-    def get_activity_execution(self, activity_execution_id: int):
+    async def get_activity_execution(self, activity_execution_id: int):
         """
         Send request to graph api to get given activity execution
 
@@ -85,21 +89,32 @@ class ActivityExecutionService:
         Returns:
             Result of request as activity execution object
         """
-        get_response = self.graph_api_service.get_node(activity_execution_id)
+        get_response = await self.graph_api_service.get_node(activity_execution_id, "Activity Execution",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=activity_execution_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Activity Execution":
-            return NotFoundByIdModel(id=activity_execution_id, errors="Node not found.")
 
-        activity_execution = {'id': get_response['id'], 'additional_properties': [], 'relations': [],
+        return self.prepare_activity_execution(get_response, get_response["relationships"])
+
+    def prepare_activity_execution(self, node: dict, relationships: list):
+        """
+        Create activity execution model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of activity execution with its properties
+            relationships (list): Relationships of node
+
+        Returns:
+            Result as activity execution object
+        """
+        activity_execution_id = node["id"]
+        activity_execution = {'id': activity_execution_id, 'additional_properties': [], 'relations': [],
                               'reversed_relations': []}
-        for property in get_response["properties"]:
+        for property in node["properties"]:
             activity_execution['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(activity_execution_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == activity_execution_id:
                 activity_execution['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                            name=relation["name"],
@@ -112,7 +127,7 @@ class ActivityExecutionService:
 
         return ActivityExecutionOut(**activity_execution)
 
-    def delete_activity_execution(self, activity_execution_id: int):
+    async def delete_activity_execution(self, activity_execution_id: int):
         """
         Send request to graph api to delete given activity execution
         Args:
@@ -120,15 +135,16 @@ class ActivityExecutionService:
         Returns:
             Result of request as activity execution object
         """
-        get_response = self.get_activity_execution(activity_execution_id)
+        get_response = await self.get_activity_execution(activity_execution_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(activity_execution_id)
+        await self.graph_api_service.delete_node(activity_execution_id)
         return get_response
 
-    def update_activity_execution(self, activity_execution_id: int, activity_execution: ActivityExecutionPropertyIn):
+    async def update_activity_execution(self, activity_execution_id: int,
+                                        activity_execution: ActivityExecutionPropertyIn):
         """
         Send request to graph api to update given participant state
         Args:
@@ -137,13 +153,13 @@ class ActivityExecutionService:
         Returns:
             Result of request as participant state object
         """
-        get_response = self.get_activity_execution(activity_execution_id)
+        get_response = await self.get_activity_execution(activity_execution_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(activity_execution_id)
-        self.graph_api_service.create_properties(activity_execution_id, activity_execution)
+        await self.graph_api_service.delete_node_properties(activity_execution_id)
+        await self.graph_api_service.create_properties(activity_execution_id, activity_execution)
 
         activity_execution_result = {"id": activity_execution_id, "relations": get_response.relations,
                                      "reversed_relations": get_response.reversed_relations}
@@ -151,8 +167,8 @@ class ActivityExecutionService:
 
         return ActivityExecutionOut(**activity_execution_result)
 
-    def update_activity_execution_relationships(self, activity_execution_id: int,
-                                                activity_execution: ActivityExecutionRelationIn):
+    async def update_activity_execution_relationships(self, activity_execution_id: int,
+                                                      activity_execution: ActivityExecutionRelationIn):
         """
         Send request to graph api to update given activity execution relationships
         Args:
@@ -161,21 +177,21 @@ class ActivityExecutionService:
         Returns:
             Result of request as activity execution object
         """
-        get_response = self.get_activity_execution(activity_execution_id)
+        lookups = [(activity_execution.activity_id, "hasActivity", "Activity"),
+                   (activity_execution.arrangement_id, "hasArrangement", "Arrangement")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_activity_execution(activity_execution_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=activity_execution_id, end_node=end_node, name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if activity_execution.activity_id is not None and \
-                type(self.activity_service.get_activity(activity_execution.activity_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=activity_execution_id,
-                                                        end_node=activity_execution.activity_id,
-                                                        name="hasActivity")
-        if activity_execution.arrangement_id is not None and \
-                type(self.arrangement_service.get_arrangement(activity_execution.arrangement_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=activity_execution_id,
-                                                        end_node=activity_execution.arrangement_id,
-                                                        name="hasArrangement")
-
-        return self.get_activity_execution(activity_execution_id)
+        return await self.get_activity_execution(activity_execution_id)
@@ -82,10 +82,12 @@ class AppearancesOut(BaseModel):
 
     Attributes:
         appearances (List[Union[BasicAppearanceSomatotypeOut, BasicAppearanceOcclusionOut]]): Appearances from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     appearances: List[Union[BasicAppearanceSomatotypeOut, BasicAppearanceOcclusionOut]] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
 
@@ -1,8 +1,12 @@
-from fastapi import Response
+from functools import partial
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from typing import Union
-from hateoas import get_links
+from typing import List, Optional, Union
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from appearance.appearance_model import AppearanceOcclusionIn, AppearanceOcclusionOut, BasicAppearanceOcclusionOut, \
      AppearanceSomatotypeIn, AppearanceSomatotypeOut, BasicAppearanceSomatotypeOut, AppearancesOut
 from appearance.appearance_service import AppearanceService
@@ -27,7 +31,7 @@ class AppearanceRouter:
         Create appearance occlusion model in database
         """
 
-        create_response = self.appearance_service.save_appearance_occlusion(appearance)
+        create_response = await self.appearance_service.save_appearance_occlusion(appearance)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -42,7 +46,7 @@ class AppearanceRouter:
         Create appearance somatotype model in database
         """
 
-        create_response = self.appearance_service.save_appearance_somatotype(appearance)
+        create_response = await self.appearance_service.save_appearance_somatotype(appearance)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -52,15 +56,30 @@ class AppearanceRouter:
         return create_response
 
     @router.get("/appearance", tags=["appearance"], response_model=AppearancesOut)
-    async def get_appearances(self, response: Response):
+    async def get_appearances(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                              after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                              where: Optional[List[str]] = Query(None)):
         """
         Get appearances from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all appearances starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.appearance_service.get_appearances, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "appearances", after), media_type="application/x-ndjson")
 
-        get_response = self.appearance_service.get_appearances()
+        get_response = await self.appearance_service.get_appearances(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/appearance", {"limit": limit, "after": get_response.next_after,
+                                                                    "where": where or []}))
 
         return get_response
 
@@ -71,7 +90,7 @@ class AppearanceRouter:
         Get appearance from database
         """
 
-        get_response = self.appearance_service.get_appearance(appearance_id)
+        get_response = await self.appearance_service.get_appearance(appearance_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -86,7 +105,7 @@ class AppearanceRouter:
         """
         Delete appearance from database
         """
-        get_response = self.appearance_service.delete_appearance(appearance_id)
+        get_response = await self.appearance_service.delete_appearance(appearance_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -102,7 +121,7 @@ class AppearanceRouter:
         """
         Update appearance occlusion model in database
         """
-        update_response = self.appearance_service.update_appearance_occlusion(appearance_id, appearance)
+        update_response = await self.appearance_service.update_appearance_occlusion(appearance_id, appearance)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -118,7 +137,7 @@ class AppearanceRouter:
         """
         Update appearance somatotype model in database
         """
-        update_response = self.appearance_service.update_appearance_somatotype(appearance_id, appearance)
+        update_response = await self.appearance_service.update_appearance_somatotype(appearance_id, appearance)
         if update_response.errors is not None:
             response.status_code = 404 if type(update_response) == NotFoundByIdModel else 422
 
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from appearance.appearance_model import AppearanceOcclusionIn, AppearanceOcclusionOut, BasicAppearanceOcclusionOut, \
      AppearanceSomatotypeIn, AppearanceSomatotypeOut, BasicAppearanceSomatotypeOut, AppearancesOut
@@ -14,7 +15,7 @@ class AppearanceService:
     """
     graph_api_service = GraphApiService()
 
-    def save_appearance_occlusion(self, appearance: AppearanceOcclusionIn):
+    async def save_appearance_occlusion(self, appearance: AppearanceOcclusionIn):
         """
         Send request to graph api to create new appearance occlusion model
 
@@ -24,23 +25,16 @@ class AppearanceService:
         Returns:
             Result of request as appearance state object
         """
-        node_response = self.graph_api_service.create_node("Appearance")
+        node_response = await self.graph_api_service.create_subgraph("Appearance", appearance)
 
         if node_response["errors"] is not None:
             return AppearanceOcclusionOut(glasses=appearance.glasses, beard=appearance.beard,
                                           moustache=appearance.moustache, errors=node_response["errors"])
 
-        appearance_id = node_response["id"]
-
-        properties_response = self.graph_api_service.create_properties(appearance_id, appearance)
-        if properties_response["errors"] is not None:
-            return AppearanceOcclusionOut(glasses=appearance.glasses, beard=appearance.beard,
-                                          moustache=appearance.moustache, errors=properties_response["errors"])
-
         return AppearanceOcclusionOut(glasses=appearance.glasses, beard=appearance.beard,
-                                      moustache=appearance.moustache, id=appearance_id)
+                                      moustache=appearance.moustache, id=node_response["id"])
 
-    def save_appearance_somatotype(self, appearance: AppearanceSomatotypeIn):
+    async def save_appearance_somatotype(self, appearance: AppearanceSomatotypeIn):
         """
         Send request to graph api to create new appearance somatotype model
 
@@ -50,29 +44,21 @@ class AppearanceService:
         Returns:
             Result of request as appearance state object
         """
-
         if not 1 <= appearance.ectomorph <= 7 or not 1 <= appearance.endomorph <= 7 \
                 or not 1 <= appearance.mesomorph <= 7:
             return AppearanceSomatotypeOut(ectomorph=appearance.ectomorph, endomorph=appearance.endomorph,
                                            mesomorph=appearance.mesomorph, errors="Scale range not between 1 and 7")
 
-        node_response = self.graph_api_service.create_node("Appearance")
+        node_response = await self.graph_api_service.create_subgraph("Appearance", appearance)
 
         if node_response["errors"] is not None:
             return AppearanceSomatotypeOut(ectomorph=appearance.ectomorph, endomorph=appearance.endomorph,
                                            mesomorph=appearance.mesomorph, errors=node_response["errors"])
 
-        appearance_id = node_response["id"]
-
-        properties_response = self.graph_api_service.create_properties(appearance_id, appearance)
-        if properties_response["errors"] is not None:
-            return AppearanceSomatotypeOut(ectomorph=appearance.ectomorph, endomorph=appearance.endomorph,
-                                           mesomorph=appearance.mesomorph,  errors=properties_response["errors"])
-
         return AppearanceSomatotypeOut(ectomorph=appearance.ectomorph, endomorph=appearance.endomorph,
-                                       mesomorph=appearance.mesomorph, id=appearance_id)
+                                       mesomorph=appearance.mesomorph, id=node_response["id"])
 
-    def get_appearance(self, appearance_id: int):
+    async def get_appearance(self, appearance_id: int):
         """
         Send request to graph api to get given appearance
 
@@ -82,19 +68,15 @@ class AppearanceService:
         Returns:
             Result of request as appearance object
         """
-        get_response = self.graph_api_service.get_node(appearance_id)
+        get_response = await self.graph_api_service.get_node(appearance_id, "Appearance", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=appearance_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Appearance":
-            return NotFoundByIdModel(id=appearance_id, errors="Node not found.")
 
         appearance = {'id': appearance_id, 'relations': [], 'reversed_relations': []}
         appearance.update({property["key"]: property["value"] for property in get_response["properties"]})
 
-        relations_response = self.graph_api_service.get_node_relationships(appearance_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == appearance_id:
                 appearance["relations"].append(RelationInformation(second_node_id=relation["end_node"],
                                                                    name=relation["name"], relation_id=relation["id"]))
@@ -106,14 +88,21 @@ class AppearanceService:
         return AppearanceOcclusionOut(**appearance) if "glasses" in appearance.keys() \
             else AppearanceSomatotypeOut(**appearance)
 
-    def get_appearances(self):
+    async def get_appearances(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get appearances
 
+        Args:
+            limit (int): Maximal number of appearances, all are returned if not given
+            after (int): Id after which returned appearances start
+            where (List[str]): Filters on properties of appearances
+
         Returns:
             Result of request as list of appearances objects
         """
-        get_response = self.graph_api_service.get_nodes("Appearance")
+        get_response = await self.graph_api_service.get_nodes("Appearance", limit, after, where)
+        if get_response["errors"] is not None:
+            return AppearancesOut(errors=get_response["errors"])
 
         appearances = []
 
@@ -124,9 +113,9 @@ class AppearanceService:
                 else BasicAppearanceSomatotypeOut(**properties)
             appearances.append(appearance)
 
-        return AppearancesOut(appearances=appearances)
+        return AppearancesOut(appearances=appearances, next_after=get_response.get("next_after"))
 
-    def delete_appearance(self, appearance_id: int):
+    async def delete_appearance(self, appearance_id: int):
         """
         Send request to graph api to delete given appearance
 
@@ -136,14 +125,14 @@ class AppearanceService:
         Returns:
             Result of request as appearance object
         """
-        get_response = self.get_appearance(appearance_id)
+        get_response = await self.get_appearance(appearance_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
-        self.graph_api_service.delete_node(appearance_id)
+        await self.graph_api_service.delete_node(appearance_id)
         return get_response
 
-    def update_appearance_occlusion(self, appearance_id: int, appearance: AppearanceOcclusionIn):
+    async def update_appearance_occlusion(self, appearance_id: int, appearance: AppearanceOcclusionIn):
         """
         Send request to graph api to update given appearance occlusion model
 
@@ -154,20 +143,20 @@ class AppearanceService:
         Returns:
             Result of request as appearance object
         """
-        get_response = self.get_appearance(appearance_id)
+        get_response = await self.get_appearance(appearance_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
         if type(get_response) is AppearanceSomatotypeOut:
             return NotFoundByIdModel(id=appearance_id, errors="Node not found.")
 
-        self.graph_api_service.create_properties(appearance_id, appearance)
+        await self.graph_api_service.create_properties(appearance_id, appearance)
 
         appearance_response = get_response.dict()
         appearance_response.update(appearance)
         return AppearanceOcclusionOut(**appearance_response)
 
-    def update_appearance_somatotype(self, appearance_id: int, appearance: AppearanceSomatotypeIn):
+    async def update_appearance_somatotype(self, appearance_id: int, appearance: AppearanceSomatotypeIn):
         """
         Send request to graph api to update given appearance somatotype model
 
@@ -183,13 +172,13 @@ class AppearanceService:
 
             return AppearanceSomatotypeOut(**appearance.dict(), errors="Scale range not between 1 and 7")
 
-        get_response = self.get_appearance(appearance_id)
+        get_response = await self.get_appearance(appearance_id)
         if type(get_response) is NotFoundByIdModel:
             return get_response
         if type(get_response) is AppearanceOcclusionOut:
             return NotFoundByIdModel(id=appearance_id, errors="Node not found.")
 
-        self.graph_api_service.create_properties(appearance_id, appearance)
+        await self.graph_api_service.create_properties(appearance_id, appearance)
 
         appearance_response = get_response.dict()
         appearance_response.update(appearance)
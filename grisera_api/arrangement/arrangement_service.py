@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from arrangement.arrangement_model import ArrangementIn, ArrangementOut, ArrangementsOut, BasicArrangementOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class ArrangementService:
     """
     graph_api_service = GraphApiService()
 
-    def save_arrangement(self, arrangement: ArrangementIn):
+    async def save_arrangement(self, arrangement: ArrangementIn):
         """
         Send request to graph api to create new arrangement
 
@@ -23,32 +24,29 @@ class ArrangementService:
         Returns:
             Result of request as arrangement object
         """
-
-        node_response = self.graph_api_service.create_node("Arrangement")
+        node_response = await self.graph_api_service.create_subgraph("Arrangement", arrangement)
 
         if node_response["errors"] is not None:
             return ArrangementOut(arrangement_type=arrangement.arrangement_type,
                                   arrangement_distance=arrangement.arrangement_distance, errors=node_response["errors"])
 
-        arrangement_id = node_response["id"]
-
-        properties_response = self.graph_api_service.create_properties(arrangement_id, arrangement)
-        if properties_response["errors"] is not None:
-            return ArrangementOut(arrangement_type=arrangement.arrangement_type,
-                                  arrangement_distance=arrangement.arrangement_distance,
-                                  errors=properties_response["errors"])
-
+        self.graph_api_service.invalidate_reference_nodes("Arrangement")
         return ArrangementOut(arrangement_type=arrangement.arrangement_type,
-                              arrangement_distance=arrangement.arrangement_distance, id=arrangement_id)
+                              arrangement_distance=arrangement.arrangement_distance, id=node_response["id"])
 
-    def get_arrangements(self):
+    async def get_arrangements(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get all arrangements
 
+        Args:
+            limit (int): Maximal number of arrangements, all are returned if not given
+            after (int): Id after which returned arrangements start
+            where (List[str]): Filters on properties of arrangements
+
         Returns:
             Result of request as list of arrangement objects
         """
-        get_response = self.graph_api_service.get_nodes("Arrangement")
+        get_response = await self.graph_api_service.get_nodes("Arrangement", limit, after, where)
         if get_response["errors"] is not None:
             return ArrangementsOut(errors=get_response["errors"])
 
@@ -63,9 +61,9 @@ class ArrangementService:
                                                         arrangement_type=arrangement["properties"][0]["value"],
                                                         arrangement_distance=None))
 
-        return ArrangementsOut(arrangements=arrangements)
+        return ArrangementsOut(arrangements=arrangements, next_after=get_response.get("next_after"))
 
-    def get_arrangement(self, arrangement_id: int):
+    async def get_arrangement(self, arrangement_id: int):
         """
         Send request to graph api to get given arrangement
 
@@ -75,20 +73,16 @@ class ArrangementService:
         Returns:
             Result of request as arrangement object
         """
-        get_response = self.graph_api_service.get_node(arrangement_id)
+        get_response = await self.graph_api_service.get_node(arrangement_id, "Arrangement", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=arrangement_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Arrangement":
-            return NotFoundByIdModel(id=arrangement_id, errors="Node not found.")
 
         arrangement = {'id': get_response['id'], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
             arrangement[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(arrangement_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == arrangement_id:
                 arrangement['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                     name=relation["name"], relation_id=relation["id"]))
@@ -74,9 +74,11 @@ class ChannelsOut(BaseModel):
 
     Attributes:
     channels (List[BasicChannelOut]): Channels from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     channels: List[BasicChannelOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from channel.channel_model import ChannelIn, ChannelOut, ChannelsOut, BasicChannelOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class ChannelService:
     """
     graph_api_service = GraphApiService()
 
-    def save_channel(self, channel: ChannelIn):
+    async def save_channel(self, channel: ChannelIn):
         """
         Send request to graph api to create new channel
 
@@ -23,34 +24,35 @@ class ChannelService:
         Returns:
             Result of request as channel object
         """
-        create_response = self.graph_api_service.create_node("Channel")
+        create_response = await self.graph_api_service.create_subgraph("Channel", channel)
 
         if create_response["errors"] is not None:
             return ChannelOut(type=channel.type, errors=create_response["errors"])
 
-        channel_id = create_response["id"]
-        properties_response = self.graph_api_service.create_properties(channel_id, channel)
-        if properties_response["errors"] is not None:
-            return ChannelOut(type=channel.type, errors=properties_response["errors"])
+        self.graph_api_service.invalidate_reference_nodes("Channel")
+        return ChannelOut(type=channel.type, id=create_response["id"])
 
-        return ChannelOut(type=channel.type,  id=channel_id)
-
-    def get_channels(self):
+    async def get_channels(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get all channels
 
+        Args:
+            limit (int): Maximal number of channels, all are returned if not given
+            after (int): Id after which returned channels start
+            where (List[str]): Filters on properties of channels
+
         Returns:
             Result of request as list of channel objects
         """
-        get_response = self.graph_api_service.get_nodes("Channel")
+        get_response = await self.graph_api_service.get_nodes("Channel", limit, after, where)
         if get_response["errors"] is not None:
             return ChannelsOut(errors=get_response["errors"])
         channels = [BasicChannelOut(id=channel["id"], type=channel["properties"][0]["value"])
                     for channel in get_response["nodes"]]
 
-        return ChannelsOut(channels=channels)
+        return ChannelsOut(channels=channels, next_after=get_response.get("next_after"))
 
-    def get_channel(self, channel_id: int):
+    async def get_channel(self, channel_id: int):
         """
         Send request to graph api to get given channel
 
@@ -60,20 +62,16 @@ class ChannelService:
         Returns:
             Result of request as channel object
         """
-        get_response = self.graph_api_service.get_node(channel_id)
+        get_response = await self.graph_api_service.get_node(channel_id, "Channel", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=channel_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Channel":
-            return NotFoundByIdModel(id=channel_id, errors="Node not found.")
 
         channel = {'id': get_response['id'], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
             channel[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(channel_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == channel_id:
                 channel['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                 name=relation["name"], relation_id=relation["id"]))
@@ -0,0 +1,133 @@
+import copy
+import time
+from collections import OrderedDict
+
+
+class EntityCache:
+    """
+    Bounded cache of nodes read from Graph API together with their relationships. Least recently used node is
+    evicted when cache is full and nodes expire after given time, so changes made by other processes are seen.
+    Cache is held by one process and only its own writes invalidate it, so with many workers others may return
+    node changed less than ttl ago. Nodes are copied when cached and when read, so callers can modify them.
+
+    Attributes:
+        size (int): Maximal number of cached nodes, cache is disabled when it is 0
+        ttl (float): Time in seconds after which cached node expires
+        version (int): Number of invalidations, node read before invalidation is not cached
+        hits (int): Number of reads served from cache
+        misses (int): Number of reads not found in cache
+        invalidations (int): Number of nodes removed from cache because they were changed
+        _entries (OrderedDict): Cached nodes with their expiry time, related nodes and relationships by key,
+            in order of use
+        _keys_by_node (dict): Keys of cached nodes by ids of nodes they contain, node itself and its neighbours
+        _keys_by_relationship (dict): Keys of cached nodes by ids of their relationships
+    """
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._keys_by_node = {}
+        self._keys_by_relationship = {}
+
+    def get(self, key: tuple):
+        """
+        Get cached node, reads are not counted when cache is disabled
+
+        Args:
+            key (tuple): Key of node, its id and label
+
+        Returns:
+            Cached node or None if it is not cached or expired
+        """
+        if self.size == 0:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] < time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[0])
+
+    def put(self, key: tuple, node: dict, version: int):
+        """
+        Cache node read from Graph API, node is not cached when any invalidation happened since read started
+
+        Args:
+            key (tuple): Key of node, its id and label
+            node (dict): Node with its relationships
+            version (int): Version of cache when read started
+        """
+        if self.size == 0 or version != self.version:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        relationships = node.get("relationships") or []
+        node_ids = {key[0]} | {relationship["start_node"] for relationship in relationships} | \
+                   {relationship["end_node"] for relationship in relationships}
+        relationship_ids = {relationship["id"] for relationship in relationships}
+        self._entries[key] = (copy.deepcopy(node), time.monotonic() + self.ttl, node_ids, relationship_ids)
+        for node_id in node_ids:
+            self._keys_by_node.setdefault(node_id, set()).add(key)
+        for relationship_id in relationship_ids:
+            self._keys_by_relationship.setdefault(relationship_id, set()).add(key)
+
+        while len(self._entries) > self.size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, node_ids=(), relationship_ids=()):
+        """
+        Remove cached nodes which are given nodes or which are related to them or have given relationships
+
+        Args:
+            node_ids (Iterable[int]): Ids of changed nodes
+            relationship_ids (Iterable[int]): Ids of changed relationships
+        """
+        self.version += 1
+        keys = set()
+        for node_id in node_ids:
+            keys.update(self._keys_by_node.get(node_id, ()))
+        for relationship_id in relationship_ids:
+            keys.update(self._keys_by_relationship.get(relationship_id, ()))
+        for key in keys:
+            self._remove(key)
+        self.invalidations += len(keys)
+
+    def clear(self):
+        """
+        Remove all cached nodes
+        """
+        self.version += 1
+        self._entries.clear()
+        self._keys_by_node.clear()
+        self._keys_by_relationship.clear()
+
+    def stats(self):
+        """
+        Return metrics of cache
+
+        Returns:
+            Number of cached nodes, limits of cache and counts of hits, misses and invalidations
+        """
+        return {"size": len(self._entries), "max_size": self.size, "ttl": self.ttl, "hits": self.hits,
+                "misses": self.misses, "invalidations": self.invalidations}
+
+    def _remove(self, key: tuple):
+        _, _, node_ids, relationship_ids = self._entries.pop(key)
+        for index, ids in ((self._keys_by_node, node_ids), (self._keys_by_relationship, relationship_ids)):
+            for id in ids:
+                keys = index[id]
+                keys.discard(key)
+                if not keys:
+                    del index[id]
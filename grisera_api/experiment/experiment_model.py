@@ -49,9 +49,11 @@ class ExperimentsOut(BaseModel):
 
     Attributes:
     experiments (List[BasicExperimentOut]): Experiments from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     experiments: List[BasicExperimentOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,8 +1,12 @@
-from fastapi import Response
+from functools import partial
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
-from typing import Union
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
+from typing import List, Optional, Union
 from experiment.experiment_model import ExperimentIn, ExperimentOut, ExperimentsOut
 from experiment.experiment_service import ExperimentService
 from models.not_found_model import NotFoundByIdModel
@@ -25,7 +29,7 @@ class ExperimentRouter:
         """
         Create experiment in database
         """
-        create_response = self.experiment_service.save_experiment(experiment)
+        create_response = await self.experiment_service.save_experiment(experiment)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -41,7 +45,7 @@ class ExperimentRouter:
         Get experiment from database
         """
 
-        get_response = self.experiment_service.get_experiment(experiment_id)
+        get_response = await self.experiment_service.get_experiment(experiment_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -51,15 +55,30 @@ class ExperimentRouter:
         return get_response
 
     @router.get("/experiments", tags=["experiments"], response_model=ExperimentsOut)
-    async def get_experiments(self, response: Response):
+    async def get_experiments(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                              after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                              where: Optional[List[str]] = Query(None)):
         """
         Get experiments from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all experiments starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.experiment_service.get_experiments, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "experiments", after), media_type="application/x-ndjson")
 
-        get_response = self.experiment_service.get_experiments()
+        get_response = await self.experiment_service.get_experiments(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/experiments", {"limit": limit, "after": get_response.next_after,
+                                                                     "where": where or []}))
 
         return get_response
 
@@ -69,7 +88,7 @@ class ExperimentRouter:
         """
         Delete experiment from database
         """
-        get_response = self.experiment_service.delete_experiment(experiment_id)
+        get_response = await self.experiment_service.delete_experiment(experiment_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -84,7 +103,7 @@ class ExperimentRouter:
         """
         Update experiment model in database
         """
-        update_response = self.experiment_service.update_experiment(experiment_id, experiment)
+        update_response = await self.experiment_service.update_experiment(experiment_id, experiment)
         if update_response.errors is not None:
             response.status_code = 404
 
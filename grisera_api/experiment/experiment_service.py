@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from experiment.experiment_model import ExperimentIn, ExperimentsOut, BasicExperimentOut,ExperimentOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class ExperimentService:
     """
     graph_api_service = GraphApiService()
     
-    def save_experiment(self, experiment: ExperimentIn):
+    async def save_experiment(self, experiment: ExperimentIn):
         """
         Send request to graph api to create new experiment
 
@@ -23,26 +24,28 @@ class ExperimentService:
         Returns:
             Result of request as experiment object
         """
-        node_response_experiment = self.graph_api_service.create_node("Experiment")
+        node_response_experiment = await self.graph_api_service.create_subgraph("Experiment", experiment)
 
         if node_response_experiment["errors"] is not None:
             return ExperimentOut(**experiment.dict(), errors=node_response_experiment["errors"])
 
-        experiment_id = node_response_experiment["id"]
-        properties_response = self.graph_api_service.create_properties(experiment_id, experiment)
-        if properties_response["errors"] is not None:
-            return ExperimentOut(**experiment.dict(), errors=properties_response["errors"])
+        return ExperimentOut(**experiment.dict(), id=node_response_experiment["id"])
 
-        return ExperimentOut(**experiment.dict(), id=experiment_id)
-
-    def get_experiments(self):
+    async def get_experiments(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get experiments
 
+        Args:
+            limit (int): Maximal number of experiments, all are returned if not given
+            after (int): Id after which returned experiments start
+            where (List[str]): Filters on properties of experiments
+
         Returns:
             Result of request as list of experiments objects
         """
-        get_response = self.graph_api_service.get_nodes("Experiment")
+        get_response = await self.graph_api_service.get_nodes("Experiment", limit, after, where)
+        if get_response["errors"] is not None:
+            return ExperimentsOut(errors=get_response["errors"])
 
         experiments = []
 
@@ -56,9 +59,9 @@ class ExperimentService:
             experiment = BasicExperimentOut(**properties)
             experiments.append(experiment)
 
-        return ExperimentsOut(experiments=experiments)
+        return ExperimentsOut(experiments=experiments, next_after=get_response.get("next_after"))
 
-    def get_experiment(self, experiment_id: int):
+    async def get_experiment(self, experiment_id: int):
         """
         Send request to graph api to get given experiment
 
@@ -68,12 +71,10 @@ class ExperimentService:
         Returns:
             Result of request as experiment object
         """
-        get_response = self.graph_api_service.get_node(experiment_id)
+        get_response = await self.graph_api_service.get_node(experiment_id, "Experiment", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=experiment_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Experiment":
-            return NotFoundByIdModel(id=experiment_id, errors="Node not found.")
 
         experiment = {'id': get_response['id'], 'additional_properties': [], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
@@ -82,9 +83,7 @@ class ExperimentService:
             else:
                 experiment['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(experiment_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == experiment_id:
                 experiment['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                    name=relation["name"], relation_id=relation["id"]))
@@ -95,7 +94,7 @@ class ExperimentService:
 
         return ExperimentOut(**experiment)
 
-    def delete_experiment(self, experiment_id: int):
+    async def delete_experiment(self, experiment_id: int):
         """
         Send request to graph api to delete given experiment
 
@@ -105,15 +104,15 @@ class ExperimentService:
         Returns:
             Result of request as experiment object
         """
-        get_response = self.get_experiment(experiment_id)
+        get_response = await self.get_experiment(experiment_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(experiment_id)
+        await self.graph_api_service.delete_node(experiment_id)
         return get_response
 
-    def update_experiment(self, experiment_id: int, experiment: ExperimentIn):
+    async def update_experiment(self, experiment_id: int, experiment: ExperimentIn):
         """
         Send request to graph api to update given experiment
 
@@ -124,13 +123,13 @@ class ExperimentService:
         Returns:
             Result of request as experiment object
         """
-        get_response = self.get_experiment(experiment_id)
+        get_response = await self.get_experiment(experiment_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(experiment_id)
-        self.graph_api_service.create_properties(experiment_id, experiment)
+        await self.graph_api_service.delete_node_properties(experiment_id)
+        await self.graph_api_service.create_properties(experiment_id, experiment)
 
         experiment_result = {'id': experiment_id, 'relations': get_response.relations,
                              'reversed_relations': get_response.reversed_relations}
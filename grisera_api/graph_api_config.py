@@ -4,3 +4,15 @@ import os
 graph_api_host = os.environ.get('GRAPH_API_HOST') or 'localhost'
 graph_api_port = os.environ.get('GRAPH_API_PORT') or '8000'
 graph_api_address = "http://{}:{}".format(graph_api_host, graph_api_port)
+stream_page_size = int(os.environ.get('STREAM_PAGE_SIZE') or '1000')
+graph_api_client = {
+    "pool_size": int(os.environ.get('GRAPH_API_POOL_SIZE') or '100'),
+    "pool_keepalive": int(os.environ.get('GRAPH_API_POOL_KEEPALIVE') or '20'),
+    "connect_timeout": float(os.environ.get('GRAPH_API_CONNECT_TIMEOUT') or '5'),
+    "timeout": float(os.environ.get('GRAPH_API_TIMEOUT') or '30'),
+    "fan_out": int(os.environ.get('GRAPH_API_FAN_OUT') or '8'),
+}
+entity_cache = {
+    "size": int(os.environ.get('ENTITY_CACHE_SIZE') or '0'),
+    "ttl": float(os.environ.get('ENTITY_CACHE_TTL') or '30'),
+}
@@ -1,6 +1,28 @@
-import requests
-from graph_api_config import graph_api_address
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import httpx
+import orjson
+from entity_cache import EntityCache
+from graph_api_config import graph_api_address, graph_api_client, entity_cache
 from pydantic import BaseModel
+from typing import List
+
+# explicit graph api transaction of current request, its id is None until first request is sent in it
+current_transaction = ContextVar("current_transaction", default=None)
+
+
+class TransactionError(Exception):
+    """
+    Error returned by Graph API in explicit transaction, raised to roll the transaction back
+
+    Attributes:
+        errors (Any): Errors returned by Graph API
+    """
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
 
 
 class GraphApiService:
@@ -9,10 +31,184 @@ class GraphApiService:
 
     Attributes:
         graph_api_url (str): Graph API URL
+        transaction_header (str): Header in which id of transaction is sent to Graph API
+        graph_api_limits (httpx.Limits): Size of the keep-alive connection pool
+        graph_api_timeout (httpx.Timeout): Timeouts of requests sent to Graph API
+        fan_out (int): Maximal number of requests sent concurrently by one gather
+        reference_labels (tuple): Labels of reference nodes, which are created once by SetupNodes and practically
+            never change, so ids of them are cached
+        cached_labels (tuple): Labels of frequently read nodes, which are cached with their relationships
+        entity_cache (EntityCache): Cache of nodes with cached labels shared by all services of process, disabled
+            by default
+        _client (httpx.AsyncClient): Pooled HTTP client shared by all services
+        _reference_nodes (dict): Cached ids of reference nodes by their label, label is missing until loaded
     """
     graph_api_url = graph_api_address
+    transaction_header = "X-Transaction-Id"
+    graph_api_limits = httpx.Limits(max_connections=graph_api_client["pool_size"],
+                                    max_keepalive_connections=graph_api_client["pool_keepalive"])
+    graph_api_timeout = httpx.Timeout(graph_api_client["timeout"], connect=graph_api_client["connect_timeout"])
+    fan_out = graph_api_client["fan_out"]
+    reference_labels = ("Activity", "Arrangement", "Channel", "Life Activity", "Measure Name", "Modality")
+    cached_labels = ("Experiment", "Participant", "Recording")
+    entity_cache = EntityCache(entity_cache["size"], entity_cache["ttl"])
+    _client = None
+    _reference_nodes = {}
+
+    def get_client(self):
+        """
+        Return pooled HTTP client shared by all services, create it on first use
+
+        Returns:
+            Client used to send requests to Graph API
+        """
+        if GraphApiService._client is None:
+            GraphApiService._client = httpx.AsyncClient(base_url=self.graph_api_url, limits=self.graph_api_limits,
+                                                        timeout=self.graph_api_timeout)
+        return GraphApiService._client
+
+    async def close(self):
+        """
+        Close pooled HTTP client and its open connections
+        """
+        if GraphApiService._client is not None:
+            await GraphApiService._client.aclose()
+            GraphApiService._client = None
+
+    async def gather(self, *coroutines):
+        """
+        Send independent requests concurrently, at most fan_out of them at once. Requests in explicit transaction
+        are sent one by one, as transaction accepts one request at a time.
+
+        Args:
+            coroutines (Coroutine): Requests to send
+
+        Returns:
+            Results of requests in order of given coroutines
+        """
+        semaphore = asyncio.Semaphore(1 if current_transaction.get() is not None else self.fan_out)
+
+        async def send(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*[send(coroutine) for coroutine in coroutines])
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Send all requests made in context in one Graph API transaction
+
+        Transaction is opened lazily with first request, committed when context exits and rolled back when
+        exception is raised in it. Request changing data which returns errors raises TransactionError, so the
+        transaction is rolled back, and TransactionError is raised also when opening or commit fails. Nested
+        contexts join the outer transaction.
+        """
+        if current_transaction.get() is not None:
+            yield
+            return
+
+        transaction = {"id": None}
+        token = current_transaction.set(transaction)
+        try:
+            yield
+        except Exception:
+            if transaction["id"] is not None:
+                await self.rollback_transaction(transaction["id"])
+            raise
+        else:
+            if transaction["id"] is not None:
+                commit_response = await self.commit_transaction(transaction["id"])
+                self.entity_cache.invalidate(transaction.get("node_ids", ()), transaction.get("relationship_ids", ()))
+                if commit_response.get("errors"):
+                    raise TransactionError(commit_response["errors"])
+        finally:
+            current_transaction.reset(token)
+
+    def invalidate_nodes(self, node_ids=(), relationship_ids=()):
+        """
+        Remove changed nodes from entity cache. Nodes changed in transaction are removed again when it is
+        committed, as other requests still read old values of nodes until then.
+
+        Args:
+            node_ids (Iterable[int]): Ids of changed nodes
+            relationship_ids (Iterable[int]): Ids of changed relationships
+        """
+        self.entity_cache.invalidate(node_ids, relationship_ids)
+        transaction = current_transaction.get()
+        if transaction is not None:
+            transaction.setdefault("node_ids", set()).update(node_ids)
+            transaction.setdefault("relationship_ids", set()).update(relationship_ids)
+
+    async def get_headers(self):
+        """
+        Prepare headers of request, open transaction of current context if it is not open yet
+
+        Returns:
+            Headers of request
+        """
+        transaction = current_transaction.get()
+        if transaction is None:
+            return {}
+        if transaction["id"] is None:
+            begin_response = await self.begin_transaction()
+            if begin_response.get("errors") or begin_response.get("id") is None:
+                raise TransactionError(begin_response.get("errors") or "Transaction was not opened")
+            transaction["id"] = begin_response["id"]
+        return {self.transaction_header: transaction["id"]}
+
+    def check_response(self, response: httpx.Response):
+        """
+        Decode response of request changing data, in explicit transaction raise TransactionError when request failed
+
+        Args:
+            response (httpx.Response): Response of Graph API
 
-    def post(self, url_part, request_body):
+        Returns:
+            Result of request
+        """
+        result = orjson.loads(response.content)
+        if current_transaction.get() is not None:
+            errors = result.get("errors") if isinstance(result, dict) else None
+            if errors or response.is_error:
+                raise TransactionError(errors or result)
+        return result
+
+    async def begin_transaction(self):
+        """
+        Send to the Graph API request to open transaction
+
+        Returns:
+            Result of request
+        """
+        response = await self.get_client().post(url="/transactions")
+        return orjson.loads(response.content)
+
+    async def commit_transaction(self, transaction_id: str):
+        """
+        Send to the Graph API request to commit transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+        Returns:
+            Result of request
+        """
+        response = await self.get_client().post(url=f"/transactions/{transaction_id}/commit")
+        return orjson.loads(response.content)
+
+    async def rollback_transaction(self, transaction_id: str):
+        """
+        Send to the Graph API request to roll back transaction
+
+        Args:
+            transaction_id (str): Id of transaction
+        Returns:
+            Result of request
+        """
+        response = await self.get_client().delete(url=f"/transactions/{transaction_id}")
+        return orjson.loads(response.content)
+
+    async def post(self, url_part, request_body):
         """
         Send request post to Graph API
 
@@ -23,12 +219,10 @@ class GraphApiService:
         Returns:
             Result of request
         """
+        response = await self.get_client().post(url=url_part, json=request_body, headers=await self.get_headers())
+        return self.check_response(response)
 
-        response = requests.post(url=self.graph_api_url + url_part,
-                                 json=request_body).json()
-        return response
-
-    def get(self, url_part, params):
+    async def get(self, url_part, params):
         """
         Send request get to Graph API
 
@@ -39,14 +233,12 @@ class GraphApiService:
         Returns:
             Result of request
         """
+        response = await self.get_client().get(url=url_part, params=params, headers=await self.get_headers())
+        return orjson.loads(response.content)
 
-        response = requests.get(url=self.graph_api_url + url_part,
-                                params=params).json()
-        return response
-
-    def delete(self, url_part, params):
+    async def delete(self, url_part, params):
         """
-        Send request get to Graph API
+        Send request delete to Graph API
 
         Args:
             url_part (str): Part to add at the end of url
@@ -55,12 +247,10 @@ class GraphApiService:
         Returns:
             Result of request
         """
+        response = await self.get_client().delete(url=url_part, params=params, headers=await self.get_headers())
+        return self.check_response(response)
 
-        response = requests.delete(url=self.graph_api_url + url_part,
-                                   params=params).json()
-        return response
-
-    def create_node(self, label: str):
+    async def create_node(self, label: str):
         """
         Send to the Graph API request to create a node
 
@@ -70,44 +260,233 @@ class GraphApiService:
             Result of request
         """
         request_body = {"labels": [label]}
-        return self.post("/nodes", request_body)
+        return await self.post("/nodes", request_body)
+
+    async def create_subgraph(self, label: str, node_model: BaseModel, relationships: List[tuple] = None):
+        """
+        Send to the Graph API request to create a node with its properties and outgoing relationships at once
+
+        Args:
+            label (str): Label for node
+            node_model (BaseModel): Model of node with properties to add
+            relationships (List[tuple]): Relationships going out of node as tuples of end node id, name of the
+                relationship and label which end node must have, relationships to nodes without that label
+                are not created
+
+        Returns:
+            Result of request with created node and its outgoing relationships
+        """
+        request_body = {"labels": [label], "properties": self.prepare_properties(node_model),
+                        "relationships": [{"end_node": end_node, "name": name, "end_node_label": end_node_label}
+                                          for end_node, name, end_node_label in relationships or []]}
+        response = await self.post("/nodes/subgraph", request_body)
+        self.invalidate_nodes([end_node for end_node, _, _ in relationships or []])
+        return response
 
-    def get_nodes(self, label: str):
+    async def create_chain(self, root: int, head: str, next: str, label: str, subgraphs: List[tuple]):
+        """
+        Send to the Graph API request to create chain of nodes with their properties and outgoing relationships
+        in one transaction, first node is linked to root by head relationship and each next node to previous one
+        by next relationship
+
+        Args:
+            root (int): Id of existing node from which chain starts
+            head (str): Name of relationship from root to first node of chain
+            next (str): Name of relationship from node of chain to the following one
+            label (str): Label for nodes of chain
+            subgraphs (List[tuple]): Nodes of chain in their order as tuples of model of node with properties
+                and relationships going out of node in form accepted by create_subgraph
+
+        Returns:
+            Result of request with root and created nodes of chain with their relationships
+        """
+        request_body = {"root": root, "head": head, "next": next, "labels": [label],
+                        "nodes": [{"properties": self.prepare_properties(node_model),
+                                   "relationships": [{"end_node": end_node, "name": name,
+                                                      "end_node_label": end_node_label}
+                                                     for end_node, name, end_node_label in relationships or []]}
+                                  for node_model, relationships in subgraphs]}
+        response = await self.post("/nodes/chain", request_body)
+        self.invalidate_nodes([root] + [end_node for _, relationships in subgraphs
+                                        for end_node, _, _ in relationships or []])
+        return response
+
+    async def create_nodes(self, label: str, node_models: List[BaseModel]):
+        """
+        Send to the Graph API request to create many nodes with their properties at once
+
+        Args:
+            label (str): Label for nodes
+            node_models (List[BaseModel]): Models of nodes with properties to add
+
+        Returns:
+            Result of request with created nodes in the same order as given models
+        """
+        request_body = [{"labels": [label], "properties": self.prepare_properties(node_model)}
+                        for node_model in node_models]
+        return await self.post("/nodes/bulk", request_body)
+
+    async def get_nodes(self, label: str, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send to the Graph API request to get nodes with given label
 
         Args:
             label (str): Label of nodes
+            limit (int): Maximal number of nodes, all nodes are returned if not given
+            after (int): Id after which returned nodes start
+            where (List[str]): Filters on properties of nodes, key:value or key:<value, key:<=value, key:>value,
+                key:>=value
         Returns:
             Result of request
         """
         request_params = {"label": label}
-        return self.get("/nodes", request_params)
-
-    def get_node(self, id: int):
+        if limit is not None:
+            request_params["limit"] = limit
+        if after is not None:
+            request_params["after"] = after
+        if where:
+            request_params["where"] = where
+        return await self.get("/nodes", request_params)
+
+    async def get_node(self, id: int, label: str = None, include_relationships: bool = False):
         """
         Send to the Graph API request to get node with given id
 
         Args:
             id (int): ID of node
+            label (str): Label which node must have, node is not found otherwise
+            include_relationships (bool): Whether relationships of node are returned together with it
         Returns:
             Result of request
         """
-        return self.get("/nodes/"+str(id), {})
+        request_params = {}
+        if label is not None:
+            request_params["label"] = label
+        if include_relationships:
+            request_params["include"] = "relationships"
+        if label not in self.cached_labels or not include_relationships or current_transaction.get() is not None:
+            return await self.get("/nodes/"+str(id), request_params)
+
+        node = self.entity_cache.get((id, label))
+        if node is None:
+            version = self.entity_cache.version
+            node = await self.get("/nodes/"+str(id), request_params)
+            if node["errors"] is None:
+                self.entity_cache.put((id, label), node, version)
+        return node
+
+    async def nodes_exist(self, nodes: List[tuple]):
+        """
+        Send to the Graph API request to check whether many nodes exist at once. Reference nodes and nodes found
+        in cache are not sent, so checking only them needs no request.
+
+        Args:
+            nodes (List[tuple]): Nodes to check as tuples of node id and label which node must have, any label
+                is accepted when it is None
+
+        Returns:
+            Result of request with results of checks in the same order as given nodes
+        """
+        unloaded = {label for _, label in nodes
+                    if label in self.reference_labels and label not in self._reference_nodes}
+        if unloaded:
+            await self.load_reference_nodes(unloaded)
+        cached = [id in self._reference_nodes.get(label, ()) or
+                  (label in self.cached_labels and self.entity_cache.get((id, label)) is not None)
+                  for id, label in nodes]
+        remote = [node for node, hit in zip(nodes, cached) if not hit]
+
+        response = {"nodes": [], "errors": None}
+        if remote:
+            request_body = [{"id": id, "label": label} for id, label in remote]
+            response = await self.post("/nodes/exists", request_body)
+            if response["errors"] is not None:
+                return response
+            for node in response["nodes"]:
+                if node["exists"] and node["label"] in self._reference_nodes:
+                    self._reference_nodes[node["label"]].add(node["id"])
+
+        answers = iter(response["nodes"])
+        response["nodes"] = [{"id": id, "label": label, "exists": True} if hit else next(answers)
+                             for (id, label), hit in zip(nodes, cached)]
+        return response
+
+    async def load_reference_nodes(self, labels: List[str] = None):
+        """
+        Send to the Graph API requests to get reference nodes and cache their ids
+
+        Args:
+            labels (List[str]): Labels of reference nodes to load, all reference labels are loaded if not given
+        """
+        labels = list(self.reference_labels if labels is None else labels)
+        responses = await self.gather(*[self.get_nodes(f"`{label}`") for label in labels])
+        for label, response in zip(labels, responses):
+            if response["errors"] is None:
+                GraphApiService._reference_nodes[label] = {node["id"] for node in response["nodes"]}
+
+    def invalidate_reference_nodes(self, label: str):
+        """
+        Forget cached ids of reference nodes with given label, they are loaded again when needed
 
-    def get_node_relationships(self, node_id: int):
+        Args:
+            label (str): Label of reference nodes
+        """
+        GraphApiService._reference_nodes.pop(label, None)
+
+    async def get_node_relationships(self, node_id: int, types: List[str] = None, direction: str = None):
         """
         Send to the Graph API request to get node's relationship
 
         Args:
             node_id (int): Id of node
+            types (List[str]): Names of relationships to get, all relationships are returned if not given
+            direction (str): "outgoing" or "incoming", relationships in both directions are returned if not given
         Returns:
             Result of request
         """
         request_params = {}
-        return self.get(f"/nodes/{node_id}/relationships", request_params)
+        if types is not None:
+            request_params["type"] = types
+        if direction is not None:
+            request_params["direction"] = direction
+        return await self.get(f"/nodes/{node_id}/relationships", request_params)
+
+    async def get_node_neighbourhood(self, node_id: int, depth: int = 1, types: List[str] = None):
+        """
+        Send to the Graph API request to get nodes reachable from node in at most given number of hops together
+        with relationships between them
 
-    def delete_node(self, node_id: int):
+        Args:
+            node_id (int): Id of node
+            depth (int): Maximal number of relationships between node and returned nodes
+            types (List[str]): Names of relationships to traverse, all relationships are traversed if not given
+        Returns:
+            Result of request
+        """
+        request_params = {"depth": depth}
+        if types is not None:
+            request_params["types"] = types
+        return await self.get(f"/nodes/{node_id}/neighbourhood", request_params)
+
+    async def get_node_chain(self, node_id: int, head: str, next: str, include_relationships: bool = False):
+        """
+        Send to the Graph API request to get chains of nodes linked by next relationships, which start at root
+        node by head relationship
+
+        Args:
+            node_id (int): Id of root, all its chains are returned, or of node of chain, only its chain is returned
+            head (str): Name of relationship from root to first node of chain
+            next (str): Name of relationship from node of chain to the following one
+            include_relationships (bool): Whether relationships of nodes are returned together with them
+        Returns:
+            Result of request
+        """
+        request_params = {"head": head, "next": next}
+        if include_relationships:
+            request_params["include"] = "relationships"
+        return await self.get(f"/nodes/{node_id}/chain", request_params)
+
+    async def delete_node(self, node_id: int):
         """
         Send to the Graph API request to delete node
 
@@ -117,9 +496,11 @@ class GraphApiService:
             Result of request
         """
         request_params = {}
-        return self.delete(f"/nodes/{node_id}", request_params)
+        response = await self.delete(f"/nodes/{node_id}", request_params)
+        self.invalidate_nodes([node_id])
+        return response
 
-    def delete_node_properties(self, node_id: int):
+    async def delete_node_properties(self, node_id: int):
         """
         Send to the Graph API request to delete node properties
 
@@ -129,9 +510,11 @@ class GraphApiService:
             Result of request
         """
         request_params = {}
-        return self.delete(f"/nodes/{node_id}/properties", request_params)
+        response = await self.delete(f"/nodes/{node_id}/properties", request_params)
+        self.invalidate_nodes([node_id])
+        return response
 
-    def create_properties(self, node_id: int, node_model: BaseModel):
+    async def create_properties(self, node_id: int, node_model: BaseModel):
         """
         Send to the Graph API request to create properties for given node
 
@@ -142,17 +525,49 @@ class GraphApiService:
         Returns:
             Result of request
         """
+        request_body = self.prepare_properties(node_model)
+        response = await self.post("/nodes/{}/properties".format(node_id), request_body)
+        self.invalidate_nodes([node_id])
+        return response
+
+    async def set_nodes_properties(self, properties: dict):
+        """
+        Send to the Graph API request to set given properties of many nodes at once, their other properties
+        are kept
+
+        Args:
+            properties (dict): Values of properties by their keys, by ids of nodes
+
+        Returns:
+            Result of request
+        """
+        request_body = [{"id": node_id, "properties": [{"key": key, "value": value}
+                                                       for key, value in node_properties.items()]}
+                        for node_id, node_properties in properties.items()]
+        response = await self.post("/nodes/properties", request_body)
+        self.invalidate_nodes(properties.keys())
+        return response
+
+    def prepare_properties(self, node_model: BaseModel):
+        """
+        Creates list of properties of node model, skipping empty values and nested models
+
+        Args:
+            node_model (BaseModel): Model of node with properties
+
+        Returns:
+            List of properties in form accepted by Graph API
+        """
         node_dict = node_model.dict()
-        request_body = []
+        properties = []
         for key, value in node_dict.items():
             if key == 'additional_properties' and value is not None:
-                request_body.extend(self.create_additional_properties(property_dict=node_dict))
+                properties.extend(self.create_additional_properties(property_dict=node_dict))
             elif value is not None and not isinstance(value, list) and not isinstance(value, dict):
-                request_body.append({"key": key, "value": value})
+                properties.append({"key": key, "value": value})
+        return properties
 
-        return self.post("/nodes/{}/properties".format(node_id), request_body)
-
-    def create_relationships(self, start_node: int, end_node: int, name: str):
+    async def create_relationships(self, start_node: int, end_node: int, name: str):
         """
         Send to the Graph API request to create a relationship
 
@@ -165,9 +580,28 @@ class GraphApiService:
             Result of request
        """
         request_body = {"start_node": start_node, "end_node": end_node, "name": name}
-        return self.post("/relationships", request_body)
+        response = await self.post("/relationships", request_body)
+        self.invalidate_nodes([start_node, end_node])
+        return response
 
-    def delete_relationship(self, relationship_id: int):
+    async def create_relationships_bulk(self, relationships: List[tuple]):
+        """
+        Send to the Graph API request to create many relationships at once
+
+        Args:
+            relationships (List[tuple]): Relationships to create as tuples of start node id, end node id and
+                name of the relationship
+
+        Returns:
+            Result of request with created relationships in the same order as given, each with its own errors
+       """
+        request_body = [{"start_node": start_node, "end_node": end_node, "name": name}
+                        for start_node, end_node, name in relationships]
+        response = await self.post("/relationships/bulk", request_body)
+        self.invalidate_nodes([node for start_node, end_node, _ in relationships for node in (start_node, end_node)])
+        return response
+
+    async def delete_relationship(self, relationship_id: int):
         """
         Send to the Graph API request to delete relationship
 
@@ -177,7 +611,9 @@ class GraphApiService:
             Result of request
         """
         request_params = {}
-        return self.delete(f"/relationships/{relationship_id}", request_params)
+        response = await self.delete(f"/relationships/{relationship_id}", request_params)
+        self.invalidate_nodes(relationship_ids=[relationship_id])
+        return response
 
     def create_additional_properties(self, property_dict: dict):
         """
@@ -70,9 +70,11 @@ class LifeActivitiesOut(BaseModel):
 
     Attributes:
     life_activities (List[BasicLifeActivityOut]): Life activities from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     life_activities: List[BasicLifeActivityOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from life_activity.life_activity_model import LifeActivityIn, LifeActivityOut, BasicLifeActivityOut, LifeActivitiesOut
 from life_activity.life_activity_service import LifeActivityService
 from models.not_found_model import NotFoundByIdModel
@@ -27,7 +31,7 @@ class LifeActivityRouter:
         """
         Get life activity from database
         """
-        get_response = self.life_activity_service.get_life_activity(life_activity_id)
+        get_response = await self.life_activity_service.get_life_activity(life_activity_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -37,14 +41,31 @@ class LifeActivityRouter:
         return get_response
 
     @router.get("/life_activities", tags=["life activities"], response_model=LifeActivitiesOut)
-    async def get_life_activities(self, response: Response):
+    async def get_life_activities(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                  after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                  where: Optional[List[str]] = Query(None)):
         """
         Get life activities from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all life activities starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.life_activity_service.get_life_activities, where=where)
+            life_activities = stream_ndjson(get_page, "life_activities", after)
+            return StreamingResponse(life_activities, media_type="application/x-ndjson")
 
-        get_response = self.life_activity_service.get_life_activities()
+        get_response = await self.life_activity_service.get_life_activities(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/life_activities", {"limit": limit,
+                                                                         "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
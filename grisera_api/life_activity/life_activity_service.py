@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from life_activity.life_activity_model import LifeActivityIn, LifeActivityOut, LifeActivitiesOut, BasicLifeActivityOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class LifeActivityService:
     """
     graph_api_service = GraphApiService()
 
-    def save_life_activity(self, life_activity: LifeActivityIn):
+    async def save_life_activity(self, life_activity: LifeActivityIn):
         """
         Send request to graph api to create new life activity
 
@@ -23,37 +24,36 @@ class LifeActivityService:
         Returns:
             Result of request as life activity object
         """
-
-        node_response = self.graph_api_service.create_node("`Life Activity`")
+        node_response = await self.graph_api_service.create_subgraph("`Life Activity`", life_activity)
 
         if node_response["errors"] is not None:
             return LifeActivityOut(life_activity=life_activity.life_activity, errors=node_response["errors"])
 
-        life_activity_id = node_response["id"]
-
-        properties_response = self.graph_api_service.create_properties(life_activity_id, life_activity)
-        if properties_response["errors"] is not None:
-            return LifeActivityOut(errors=properties_response["errors"])
-
-        return LifeActivityOut(life_activity=life_activity.life_activity, id=life_activity_id)
+        self.graph_api_service.invalidate_reference_nodes("Life Activity")
+        return LifeActivityOut(life_activity=life_activity.life_activity, id=node_response["id"])
 
-    def get_life_activities(self):
+    async def get_life_activities(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get all life activities
 
+        Args:
+            limit (int): Maximal number of life activities, all are returned if not given
+            after (int): Id after which returned life activities start
+            where (List[str]): Filters on properties of life activities
+
         Returns:
             Result of request as list of life activity objects
         """
-        get_response = self.graph_api_service.get_nodes("`Life Activity`")
+        get_response = await self.graph_api_service.get_nodes("`Life Activity`", limit, after, where)
         if get_response["errors"] is not None:
             return LifeActivitiesOut(errors=get_response["errors"])
         life_activities = [BasicLifeActivityOut(id=life_activity["id"],
                                                 life_activity=life_activity["properties"][0]["value"])
                            for life_activity in get_response["nodes"]]
 
-        return LifeActivitiesOut(life_activities=life_activities)
+        return LifeActivitiesOut(life_activities=life_activities, next_after=get_response.get("next_after"))
 
-    def get_life_activity(self, life_activity_id: int):
+    async def get_life_activity(self, life_activity_id: int):
         """
         Send request to graph api to get given life activity
 
@@ -63,20 +63,17 @@ class LifeActivityService:
         Returns:
             Result of request as life activity object
         """
-        get_response = self.graph_api_service.get_node(life_activity_id)
+        get_response = await self.graph_api_service.get_node(life_activity_id, "Life Activity",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=life_activity_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Life Activity":
-            return NotFoundByIdModel(id=life_activity_id, errors="Node not found.")
 
         life_activity = {'id': get_response['id'], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
             life_activity[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(life_activity_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == life_activity_id:
                 life_activity['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                       name=relation["name"],
@@ -1,13 +1,16 @@
+import asyncio
+import logging
 import os
-from time import sleep
 from activity.activity_router import router as activity_router
 from activity_execution.activity_execution_router import router as activity_execution_router
 from arrangement.arrangement_router import router as arrangement_router
 from appearance.appearance_router import router as appearance_router
 from channel.channel_router import router as channel_router
 from experiment.experiment_router import router as experiment_router
-from fastapi import FastAPI
-from hateoas import get_links
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from graph_api_service import GraphApiService
+from hateoas import get_links, links_enabled, links_requested
 from life_activity.life_activity_router import router as life_activity_router
 from measure.measure_router import router as measure_router
 from modality.modality_router import router as modality_router
@@ -29,6 +32,7 @@ app = FastAPI(title="GRISERA API",
                           "framework provides a persistent model for storing integrated signals and methods for its "
                           "creation.",
               version="0.1",
+              default_response_class=ORJSONResponse,
               )
 
 app.include_router(activity_router)
@@ -53,20 +57,47 @@ app.include_router(scenario_router)
 app.include_router(time_series_router)
 
 
+@app.middleware("http")
+async def links_middleware(request: Request, call_next):
+    """
+    Omit links from responses when client opts out of them with links=false query parameter or X-Links header
+    """
+    token = links_enabled.set(links_requested(request))
+    try:
+        return await call_next(request)
+    finally:
+        links_enabled.reset(token)
+
+
 @app.on_event("startup")
 async def startup_event():
+    """
+    Create reference nodes and cache their ids, when Graph API is not available yet ids are loaded when needed
+    """
     startup = SetupNodes()
-    sleep(40)
+    await asyncio.sleep(40)
     if not os.path.exists("lock"):
         open("lock", "w").write("Busy")
-        sleep(40)
-        startup.set_activities()
-        startup.set_channels()
-        startup.set_arrangements()
-        startup.set_modalities()
-        startup.set_life_activities()
-        startup.set_measure_names()
+        await asyncio.sleep(40)
+        await startup.set_activities()
+        await startup.set_channels()
+        await startup.set_arrangements()
+        await startup.set_modalities()
+        await startup.set_life_activities()
+        await startup.set_measure_names()
         os.remove("lock")
+    try:
+        await GraphApiService().load_reference_nodes()
+    except Exception as error:
+        logging.getLogger(__name__).warning("Reference nodes were not loaded: %s", error)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Close pooled connections to Graph API
+    """
+    await GraphApiService().close()
 
 
 @app.get("/", tags=["root"])
@@ -77,3 +108,13 @@ async def root():
     response = {"title": "GRISERA API"}
     response.update({'links': get_links(app)})
     return response
+
+
+@app.get("/cache", tags=["root"])
+async def cache():
+    """
+    Return metrics of cache of frequently read nodes
+    """
+    response = GraphApiService.entity_cache.stats()
+    response.update({'links': get_links(app)})
+    return response
@@ -65,9 +65,11 @@ class MeasuresOut(BaseModel):
 
     Attributes:
         measures (List[BasicMeasureOut]): measures from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     measures: List[BasicMeasureOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,10 +1,14 @@
-from fastapi import Response
+from functools import partial
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from measure.measure_model import MeasureIn, MeasuresOut, MeasureOut, MeasurePropertyIn, MeasureRelationIn
 from measure.measure_service import MeasureService
-from typing import Union
+from typing import List, Optional, Union
 from models.not_found_model import NotFoundByIdModel
 
 router = InferringRouter()
@@ -26,7 +30,7 @@ class MeasureRouter:
         Create measure in database
         """
 
-        create_response = self.measure_service.save_measure(measure)
+        create_response = await self.measure_service.save_measure(measure)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -36,15 +40,30 @@ class MeasureRouter:
         return create_response
 
     @router.get("/measures", tags=["measures"], response_model=MeasuresOut)
-    async def get_measures(self, response: Response):
+    async def get_measures(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                           after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                           where: Optional[List[str]] = Query(None)):
         """
         Get measures from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all measures starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.measure_service.get_measures, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "measures", after), media_type="application/x-ndjson")
 
-        get_response = self.measure_service.get_measures()
+        get_response = await self.measure_service.get_measures(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/measures", {"limit": limit, "after": get_response.next_after,
+                                                                  "where": where or []}))
 
         return get_response
 
@@ -55,7 +74,7 @@ class MeasureRouter:
         Get measure from database
         """
 
-        get_response = self.measure_service.get_measure(measure_id)
+        get_response = await self.measure_service.get_measure(measure_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -70,7 +89,7 @@ class MeasureRouter:
         """
         Delete measure from database
         """
-        get_response = self.measure_service.delete_measure(measure_id)
+        get_response = await self.measure_service.delete_measure(measure_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -86,8 +105,8 @@ class MeasureRouter:
         """
         Update measure model in database
         """
-        update_response = self.measure_service.update_measure(measure_id,
-                                                                                  measure)
+        update_response = await self.measure_service.update_measure(measure_id,
+                                                                                        measure)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -103,8 +122,8 @@ class MeasureRouter:
         """
         Update measure relations in database
         """
-        update_response = self.measure_service.update_measure_relationships(measure_id,
-                                                                                                measure)
+        update_response = await self.measure_service.update_measure_relationships(measure_id,
+                                                                                                      measure)
         if update_response.errors is not None:
             response.status_code = 404
 
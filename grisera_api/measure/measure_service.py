@@ -1,7 +1,7 @@
+from typing import List
 from graph_api_service import GraphApiService
 from measure.measure_model import MeasurePropertyIn, BasicMeasureOut, \
     MeasuresOut, MeasureOut, MeasureIn, MeasureRelationIn
-from measure_name.measure_name_service import MeasureNameService
 from models.not_found_model import NotFoundByIdModel
 from models.relation_information_model import RelationInformation
 
@@ -12,12 +12,10 @@ class MeasureService:
 
     Attributes:
         graph_api_service (GraphApiService): Service used to communicate with Graph API
-        measure_name_service (MeasureNameService): Service to manage measure name models
     """
     graph_api_service = GraphApiService()
-    measure_name_service = MeasureNameService()
 
-    def save_measure(self, measure: MeasureIn):
+    async def save_measure(self, measure: MeasureIn):
         """
         Send request to graph api to create new measure
 
@@ -27,32 +25,33 @@ class MeasureService:
         Returns:
             Result of request as measure object
         """
-        node_response = self.graph_api_service.create_node("`Measure`")
+        relationships = []
+        if measure.measure_name_id is not None:
+            relationships.append((measure.measure_name_id, "hasMeasureName", "Measure Name"))
+
+        properties = measure.copy(update={"measure_name_id": None})
+        node_response = await self.graph_api_service.create_subgraph("`Measure`", properties, relationships)
 
         if node_response["errors"] is not None:
             return MeasureOut(**measure.dict(), errors=node_response["errors"])
 
-        measure_id = node_response["id"]
-
-        if measure.measure_name_id is not None and \
-                type(self.measure_name_service.get_measure_name(measure.measure_name_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=measure_id,
-                                                        end_node=measure.measure_name_id,
-                                                        name="hasMeasureName")
-
-        measure.measure_name_id = None
-        self.graph_api_service.create_properties(measure_id, measure)
+        return self.prepare_measure(node_response, node_response["relationships"])
 
-        return self.get_measure(measure_id)
-
-    def get_measures(self):
+    async def get_measures(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get measures
 
+        Args:
+            limit (int): Maximal number of measures, all are returned if not given
+            after (int): Id after which returned measures start
+            where (List[str]): Filters on properties of measures
+
         Returns:
             Result of request as list of measures objects
         """
-        get_response = self.graph_api_service.get_nodes("`Measure`")
+        get_response = await self.graph_api_service.get_nodes("`Measure`", limit, after, where)
+        if get_response["errors"] is not None:
+            return MeasuresOut(errors=get_response["errors"])
 
         measures = []
 
@@ -65,9 +64,9 @@ class MeasureService:
             measure = BasicMeasureOut(**properties)
             measures.append(measure)
 
-        return MeasuresOut(measures=measures)
+        return MeasuresOut(measures=measures, next_after=get_response.get("next_after"))
 
-    def get_measure(self, measure_id: int):
+    async def get_measure(self, measure_id: int):
         """
         Send request to graph api to get given measure
 
@@ -77,22 +76,32 @@ class MeasureService:
         Returns:
             Result of request as measure object
         """
-        get_response = self.graph_api_service.get_node(measure_id)
+        get_response = await self.graph_api_service.get_node(measure_id, "Measure", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=measure_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Measure":
-            return NotFoundByIdModel(id=measure_id, errors="Node not found.")
 
-        measure = {'id': get_response['id'], 'relations': [],
+        return self.prepare_measure(get_response, get_response["relationships"])
+
+    def prepare_measure(self, node: dict, relationships: list):
+        """
+        Create measure model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of measure with its properties
+            relationships (list): Relationships of node
+
+        Returns:
+            Result as measure object
+        """
+        measure_id = node["id"]
+        measure = {'id': measure_id, 'relations': [],
                    'reversed_relations': []}
-        for property in get_response["properties"]:
+        for property in node["properties"]:
             if property["key"] in ["datatype", "range", "unit"]:
                 measure[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(measure_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == measure_id:
                 measure['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                 name=relation["name"],
@@ -104,7 +113,7 @@ class MeasureService:
 
         return MeasureOut(**measure)
 
-    def delete_measure(self, measure_id: int):
+    async def delete_measure(self, measure_id: int):
         """
         Send request to graph api to delete given measure
 
@@ -114,15 +123,15 @@ class MeasureService:
         Returns:
             Result of request as measure object
         """
-        get_response = self.get_measure(measure_id)
+        get_response = await self.get_measure(measure_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(measure_id)
+        await self.graph_api_service.delete_node(measure_id)
         return get_response
 
-    def update_measure(self, measure_id: int, measure: MeasurePropertyIn):
+    async def update_measure(self, measure_id: int, measure: MeasurePropertyIn):
         """
         Send request to graph api to update given measure
 
@@ -133,13 +142,13 @@ class MeasureService:
         Returns:
             Result of request as measure object
         """
-        get_response = self.get_measure(measure_id)
+        get_response = await self.get_measure(measure_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(measure_id)
-        self.graph_api_service.create_properties(measure_id, measure)
+        await self.graph_api_service.delete_node_properties(measure_id)
+        await self.graph_api_service.create_properties(measure_id, measure)
 
         measure_result = {"id": measure_id, "relations": get_response.relations,
                           "reversed_relations": get_response.reversed_relations}
@@ -147,8 +156,8 @@ class MeasureService:
 
         return MeasureOut(**measure_result)
 
-    def update_measure_relationships(self, measure_id: int,
-                                     measure: MeasureRelationIn):
+    async def update_measure_relationships(self, measure_id: int,
+                                           measure: MeasureRelationIn):
         """
         Send request to graph api to update given measure
 
@@ -159,15 +168,20 @@ class MeasureService:
         Returns:
             Result of request as measure object
         """
-        get_response = self.get_measure(measure_id)
+        lookups = [(measure.measure_name_id, "hasMeasureName", "Measure Name")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_measure(measure_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=measure_id, end_node=end_node, name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if measure.measure_name_id is not None and \
-                type(self.measure_name_service.get_measure_name(
-                    measure.measure_name_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=measure_id,
-                                                        end_node=measure.measure_name_id,
-                                                        name="hasMeasureName")
-        return self.get_measure(measure_id)
+        return await self.get_measure(measure_id)
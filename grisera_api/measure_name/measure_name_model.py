@@ -80,9 +80,11 @@ class MeasureNamesOut(BaseModel):
 
     Attributes:
     measure_names (List[BasicMeasureNameOut]): Measure names from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     measure_names: List[BasicMeasureNameOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
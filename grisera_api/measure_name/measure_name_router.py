@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from measure_name.measure_name_model import MeasureNameIn, MeasureNameOut, BasicMeasureNameOut, MeasureNamesOut
 from measure_name.measure_name_service import MeasureNameService
 from models.not_found_model import NotFoundByIdModel
@@ -27,7 +31,7 @@ class MeasureNameRouter:
         """
         Get measure name from database
         """
-        get_response = self.measure_name_service.get_measure_name(measure_name_id)
+        get_response = await self.measure_name_service.get_measure_name(measure_name_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -37,14 +41,30 @@ class MeasureNameRouter:
         return get_response
 
     @router.get("/measure_names", tags=["measure names"], response_model=MeasureNamesOut)
-    async def get_measure_names(self, response: Response):
+    async def get_measure_names(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                where: Optional[List[str]] = Query(None)):
         """
         Get measure names from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all measure names starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.measure_name_service.get_measure_names, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "measure_names", after), media_type="application/x-ndjson")
 
-        get_response = self.measure_name_service.get_measure_names()
+        get_response = await self.measure_name_service.get_measure_names(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/measure_names", {"limit": limit,
+                                                                       "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from measure_name.measure_name_model import MeasureNameIn, MeasureNameOut, MeasureNamesOut, BasicMeasureNameOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class MeasureNameService:
     """
     graph_api_service = GraphApiService()
 
-    def save_measure_name(self, measure_name: MeasureNameIn):
+    async def save_measure_name(self, measure_name: MeasureNameIn):
         """
         Send request to graph api to create new measure name
 
@@ -23,26 +24,27 @@ class MeasureNameService:
         Returns:
             Result of request as measure name object
         """
-        create_response = self.graph_api_service.create_node("`Measure Name`")
+        create_response = await self.graph_api_service.create_subgraph("`Measure Name`", measure_name)
 
         if create_response["errors"] is not None:
             return MeasureNameOut(name=measure_name.name, type=measure_name.type, errors=create_response["errors"])
 
-        measure_name_id = create_response["id"]
-        properties_response = self.graph_api_service.create_properties(measure_name_id, measure_name)
-        if properties_response["errors"] is not None:
-            return MeasureNameOut(name=measure_name.name, type=measure_name.type, errors=properties_response["errors"])
+        self.graph_api_service.invalidate_reference_nodes("Measure Name")
+        return MeasureNameOut(name=measure_name.name, type=measure_name.type, id=create_response["id"])
 
-        return MeasureNameOut(name=measure_name.name, type=measure_name.type, id=measure_name_id)
-
-    def get_measure_names(self):
+    async def get_measure_names(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get all measure names
 
+        Args:
+            limit (int): Maximal number of measure names, all are returned if not given
+            after (int): Id after which returned measure names start
+            where (List[str]): Filters on properties of measure names
+
         Returns:
             Result of request as list of measure name objects
         """
-        get_response = self.graph_api_service.get_nodes("`Measure Name`")
+        get_response = await self.graph_api_service.get_nodes("`Measure Name`", limit, after, where)
         if get_response["errors"] is not None:
             return MeasureNamesOut(errors=get_response["errors"])
         measure_names = [BasicMeasureNameOut(id=measure_name["id"],
@@ -52,9 +54,9 @@ class MeasureNameService:
                                                     measure_name["properties"][1]["value"]})
                          for measure_name in get_response["nodes"]]
 
-        return MeasureNamesOut(measure_names=measure_names)
+        return MeasureNamesOut(measure_names=measure_names, next_after=get_response.get("next_after"))
 
-    def get_measure_name(self, measure_name_id: int):
+    async def get_measure_name(self, measure_name_id: int):
         """
         Send request to graph api to get given measure name
 
@@ -64,20 +66,17 @@ class MeasureNameService:
         Returns:
             Result of request as measure name object
         """
-        get_response = self.graph_api_service.get_node(measure_name_id)
+        get_response = await self.graph_api_service.get_node(measure_name_id, "Measure Name",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=measure_name_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Measure Name":
-            return NotFoundByIdModel(id=measure_name_id, errors="Node not found.")
 
         measure_name = {'id': get_response['id'], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
             measure_name[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(measure_name_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == measure_name_id:
                 measure_name['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                      name=relation["name"],
@@ -85,9 +85,11 @@ class ModalitiesOut(BaseModel):
 
     Attributes:
         modalities (List[BasicModalityOut]): Modalities from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     modalities: List[BasicModalityOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from modality.modality_model import ModalityIn, ModalityOut, ModalitiesOut, BasicModalityOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class ModalityService:
     """
     graph_api_service = GraphApiService()
 
-    def save_modality(self, modality: ModalityIn):
+    async def save_modality(self, modality: ModalityIn):
         """
         Send request to graph api to create new modality
 
@@ -23,34 +24,35 @@ class ModalityService:
         Returns:
             Result of request as modality object
         """
-
-        node_response = self.graph_api_service.create_node("Modality")
+        node_response = await self.graph_api_service.create_subgraph("Modality", modality)
 
         if node_response["errors"] is not None:
             return ModalityOut(modality=modality.modality, errors=node_response["errors"])
 
-        modality_id = node_response["id"]
-
-        properties_response = self.graph_api_service.create_properties(modality_id, modality)
-        if properties_response["errors"] is not None:
-            return ModalityOut(modality=modality.modality, errors=properties_response["errors"])
+        self.graph_api_service.invalidate_reference_nodes("Modality")
+        return ModalityOut(modality=modality.modality, id=node_response["id"])
 
-        return ModalityOut(modality=modality.modality, id=modality_id)
-
-    def get_modalities(self):
+    async def get_modalities(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get all modalities
 
+        Args:
+            limit (int): Maximal number of modalities, all are returned if not given
+            after (int): Id after which returned modalities start
+            where (List[str]): Filters on properties of modalities
+
         Returns:
             Result of request as list of modality objects
         """
-        get_response = self.graph_api_service.get_nodes("Modality")
+        get_response = await self.graph_api_service.get_nodes("Modality", limit, after, where)
+        if get_response["errors"] is not None:
+            return ModalitiesOut(errors=get_response["errors"])
         modalities = [BasicModalityOut(id=modality["id"], modality=modality["properties"][0]["value"])
                       for modality in get_response["nodes"]]
 
-        return ModalitiesOut(modalities=modalities)
+        return ModalitiesOut(modalities=modalities, next_after=get_response.get("next_after"))
 
-    def get_modality(self, modality_id: int):
+    async def get_modality(self, modality_id: int):
         """
         Send request to graph api to get given modality
 
@@ -60,20 +62,16 @@ class ModalityService:
         Returns:
             Result of request as modality object
         """
-        get_response = self.graph_api_service.get_node(modality_id)
+        get_response = await self.graph_api_service.get_node(modality_id, "Modality", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=modality_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Modality":
-            return NotFoundByIdModel(id=modality_id, errors="Node not found.")
 
         modality = {'id': get_response['id'], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
             modality[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(modality_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == modality_id:
                 modality['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                  name=relation["name"], relation_id=relation["id"]))
@@ -49,9 +49,11 @@ class ObservableInformationsOut(BaseModel):
     Model of information observed during experiment to send to client as a result of request
     Attributes:
     life_activities (List[BasicLifeActivityOut]): Life activities from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     observable_informations: List[BasicObservableInformationOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from observable_information.observable_information_model import ObservableInformationIn, ObservableInformationOut, \
     BasicObservableInformationOut, ObservableInformationsOut
 from observable_information.observable_information_service import ObservableInformationService
@@ -27,7 +31,7 @@ class ObservableInformationRouter:
         """
         Create observable information in database
         """
-        create_response = self.observable_information_service.save_observable_information(observable_information)
+        create_response = await self.observable_information_service.save_observable_information(observable_information)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -37,15 +41,32 @@ class ObservableInformationRouter:
         return create_response
 
     @router.get("/observable_information", tags=["observable information"], response_model=ObservableInformationsOut)
-    async def get_observable_informations(self, response: Response):
+    async def get_observable_informations(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                          after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                          where: Optional[List[str]] = Query(None)):
         """
         Get observable information from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all observable informations starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.observable_information_service.get_observable_informations, where=where)
+            observable_informations = stream_ndjson(get_page, "observable_informations", after)
+            return StreamingResponse(observable_informations, media_type="application/x-ndjson")
 
-        get_response = self.observable_information_service.get_observable_informations()
+        get_response = await self.observable_information_service.get_observable_informations(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/observable_information", {"limit": limit,
+                                                                                "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
 
@@ -56,7 +77,7 @@ class ObservableInformationRouter:
         Get observable information from database
         """
 
-        get_response = self.observable_information_service.get_observable_information(observable_information_id)
+        get_response = await self.observable_information_service.get_observable_information(observable_information_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -71,7 +92,8 @@ class ObservableInformationRouter:
         """
         Delete observable information from database
         """
-        get_response = self.observable_information_service.delete_observable_information(observable_information_id)
+        get_response = await self.observable_information_service.delete_observable_information(
+            observable_information_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -88,7 +110,7 @@ class ObservableInformationRouter:
         """
         Update observable information relations in database
         """
-        update_response = self.observable_information_service.update_observable_information_relationships(
+        update_response = await self.observable_information_service.update_observable_information_relationships(
             observable_information_id,
             observable_information)
         if update_response.errors is not None:
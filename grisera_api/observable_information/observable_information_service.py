@@ -1,9 +1,7 @@
+from typing import List
 from graph_api_service import GraphApiService
 from observable_information.observable_information_model import ObservableInformationIn, ObservableInformationOut, \
     BasicObservableInformationOut, ObservableInformationsOut
-from modality.modality_service import ModalityService
-from life_activity.life_activity_service import LifeActivityService
-from recording.recording_service import RecordingService
 from models.not_found_model import NotFoundByIdModel
 from models.relation_information_model import RelationInformation
 
@@ -14,16 +12,10 @@ class ObservableInformationService:
 
     Attributes:
     graph_api_service (GraphApiService): Service used to communicate with Graph API
-    modality_service (ModalityService): Service used to communicate with Modality
-    life_activity_service (LifeActivityService): Service used to communicate with Life Activity
-    recording_service (RecordingService): Service used to communicate with Recording
     """
     graph_api_service = GraphApiService()
-    modality_service = ModalityService()
-    life_activity_service = LifeActivityService()
-    recording_service = RecordingService()
 
-    def save_observable_information(self, observable_information: ObservableInformationIn):
+    async def save_observable_information(self, observable_information: ObservableInformationIn):
         """
         Send request to graph api to create new observable information
 
@@ -33,41 +25,37 @@ class ObservableInformationService:
         Returns:
             Result of request as observable information object
         """
-        node_response = self.graph_api_service.create_node("`Observable Information`")
+        relationships = []
+        if observable_information.modality_id is not None:
+            relationships.append((observable_information.modality_id, "hasModality", "Modality"))
+        if observable_information.life_activity_id is not None:
+            relationships.append((observable_information.life_activity_id, "hasLifeActivity", "Life Activity"))
+        if observable_information.recording_id is not None:
+            relationships.append((observable_information.recording_id, "hasRecording", "Recording"))
+
+        properties = observable_information.copy(update={"modality_id": None, "life_activity_id": None,
+                                                         "recording_id": None})
+        node_response = await self.graph_api_service.create_subgraph("`Observable Information`", properties,
+                                                                     relationships)
 
         if node_response["errors"] is not None:
             return ObservableInformationOut(errors=node_response["errors"])
 
-        observable_information_id = node_response["id"]
+        return self.prepare_observable_information(node_response, node_response["relationships"])
 
-        if observable_information.modality_id is not None and \
-                type(self.modality_service.get_modality(observable_information.modality_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=observable_information_id,
-                                                        end_node=observable_information.modality_id, name="hasModality")
-
-        if observable_information.life_activity_id is not None and \
-                type(self.life_activity_service.get_life_activity(
-                    observable_information.life_activity_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=observable_information_id,
-                                                        end_node=observable_information.life_activity_id,
-                                                        name="hasLifeActivity")
-
-        if observable_information.recording_id is not None and \
-                type(
-                    self.recording_service.get_recording(observable_information.recording_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=observable_information_id,
-                                                        end_node=observable_information.recording_id,
-                                                        name="hasRecording")
-
-        return self.get_observable_information(observable_information_id)
-
-    def get_observable_informations(self):
+    async def get_observable_informations(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get observable information
+        Args:
+            limit (int): Maximal number of observable informations, all are returned if not given
+            after (int): Id after which returned observable informations start
+            where (List[str]): Filters on properties of observable informations
         Returns:
             Result of request as list of observable information objects
         """
-        get_response = self.graph_api_service.get_nodes("`Observable Information`")
+        get_response = await self.graph_api_service.get_nodes("`Observable Information`", limit, after, where)
+        if get_response["errors"] is not None:
+            return ObservableInformationsOut(errors=get_response["errors"])
 
         observable_informations = []
 
@@ -76,9 +64,10 @@ class ObservableInformationService:
             observable_information = BasicObservableInformationOut(**properties)
             observable_informations.append(observable_information)
 
-        return ObservableInformationsOut(observable_informations=observable_informations)
+        return ObservableInformationsOut(observable_informations=observable_informations,
+                                         next_after=get_response.get("next_after"))
 
-    def get_observable_information(self, observable_information_id: int):
+    async def get_observable_information(self, observable_information_id: int):
         """
         Send request to graph api to get given observable information
         Args:
@@ -86,19 +75,30 @@ class ObservableInformationService:
         Returns:
             Result of request as observable information object
         """
-        get_response = self.graph_api_service.get_node(observable_information_id)
+        get_response = await self.graph_api_service.get_node(observable_information_id, "Observable Information",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=observable_information_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Observable Information":
-            return NotFoundByIdModel(id=observable_information_id, errors="Node not found.")
 
-        observable_information = {'id': get_response['id'], 'relations': [],
-                                  'reversed_relations': []}
+        return self.prepare_observable_information(get_response, get_response["relationships"])
+
+    def prepare_observable_information(self, node: dict, relationships: list):
+        """
+        Create observable information model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of observable information with its properties
+            relationships (list): Relationships of node
 
-        relations_response = self.graph_api_service.get_node_relationships(observable_information_id)
+        Returns:
+            Result as observable information object
+        """
+        observable_information_id = node["id"]
+        observable_information = {'id': observable_information_id, 'relations': [],
+                                  'reversed_relations': []}
 
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == observable_information_id:
                 observable_information['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                                name=relation["name"],
@@ -111,7 +111,7 @@ class ObservableInformationService:
 
         return ObservableInformationOut(**observable_information)
 
-    def delete_observable_information(self, observable_information_id: int):
+    async def delete_observable_information(self, observable_information_id: int):
         """
         Send request to graph api to delete given observable information
         Args:
@@ -119,16 +119,16 @@ class ObservableInformationService:
         Returns:
             Result of request as observable information object
         """
-        get_response = self.get_observable_information(observable_information_id)
+        get_response = await self.get_observable_information(observable_information_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(observable_information_id)
+        await self.graph_api_service.delete_node(observable_information_id)
         return get_response
 
-    def update_observable_information_relationships(self, observable_information_id: int,
-                                                    observable_information: ObservableInformationIn):
+    async def update_observable_information_relationships(self, observable_information_id: int,
+                                                          observable_information: ObservableInformationIn):
         """
         Send request to graph api to update given observable information
         Args:
@@ -137,28 +137,23 @@ class ObservableInformationService:
         Returns:
             Result of request as observable information object
         """
-        get_response = self.get_observable_information(observable_information_id)
+        lookups = [(observable_information.modality_id, "hasModality", "Modality"),
+                   (observable_information.life_activity_id, "hasLifeActivity", "Life Activity"),
+                   (observable_information.recording_id, "hasRecording", "Recording")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_observable_information(observable_information_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=observable_information_id, end_node=end_node,
+                                                        name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if observable_information.modality_id is not None and \
-                type(self.modality_service.get_modality(observable_information.modality_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=observable_information_id,
-                                                        end_node=observable_information.modality_id, name="hasModality")
-
-        if observable_information.life_activity_id is not None and \
-                type(self.life_activity_service.get_life_activity(
-                    observable_information.life_activity_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=observable_information_id,
-                                                        end_node=observable_information.life_activity_id,
-                                                        name="hasLifeActivity")
-
-        if observable_information.recording_id is not None and \
-                type(
-                    self.recording_service.get_recording(observable_information.recording_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=observable_information_id,
-                                                        end_node=observable_information.recording_id,
-                                                        name="hasRecording")
-
-        return self.get_observable_information(observable_information_id)
+        return await self.get_observable_information(observable_information_id)
@@ -71,9 +71,11 @@ class ParticipantsOut(BaseModel):
 
     Attributes:
         participants (List[BasicParticipantOut]): Participants from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     participants: List[BasicParticipantOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,8 +1,12 @@
-from fastapi import Response
+from functools import partial
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
-from typing import Union
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
+from typing import List, Optional, Union
 from participant.participant_model import ParticipantIn, ParticipantOut, ParticipantsOut
 from participant.participant_service import ParticipantService
 from models.not_found_model import NotFoundByIdModel
@@ -29,7 +33,7 @@ class ParticipantRouter:
         if participant.date_of_birth is not None:
             participant.date_of_birth = participant.date_of_birth.__str__()
 
-        create_response = self.participant_service.save_participant(participant)
+        create_response = await self.participant_service.save_participant(participant)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -39,15 +43,31 @@ class ParticipantRouter:
         return create_response
 
     @router.get("/participants", tags=["participants"], response_model=ParticipantsOut)
-    async def get_participants(self, response: Response):
+    async def get_participants(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                               after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                               where: Optional[List[str]] = Query(None)):
         """
         Get participants from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all participants starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.participant_service.get_participants, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "participants", after), media_type="application/x-ndjson")
 
-        get_response = self.participant_service.get_participants()
+        get_response = await self.participant_service.get_participants(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/participants", {"limit": limit,
+                                                                      "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
 
@@ -58,7 +78,7 @@ class ParticipantRouter:
         Get participant from database
         """
 
-        get_response = self.participant_service.get_participant(participant_id)
+        get_response = await self.participant_service.get_participant(participant_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -73,7 +93,7 @@ class ParticipantRouter:
         """
         Delete participant from database
         """
-        get_response = self.participant_service.delete_participant(participant_id)
+        get_response = await self.participant_service.delete_participant(participant_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -88,7 +108,7 @@ class ParticipantRouter:
         """
         Update participant model in database
         """
-        update_response = self.participant_service.update_participant(participant_id, participant)
+        update_response = await self.participant_service.update_participant(participant_id, participant)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from participant.participant_model import ParticipantIn, ParticipantsOut, BasicParticipantOut, ParticipantOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,7 +14,7 @@ class ParticipantService:
     """
     graph_api_service = GraphApiService()
 
-    def save_participant(self, participant: ParticipantIn):
+    async def save_participant(self, participant: ParticipantIn):
         """
         Send request to graph api to create new participant
 
@@ -23,26 +24,28 @@ class ParticipantService:
         Returns:
             Result of request as participant object
         """
-        node_response = self.graph_api_service.create_node("Participant")
+        node_response = await self.graph_api_service.create_subgraph("Participant", participant)
 
         if node_response["errors"] is not None:
             return ParticipantOut(**participant.dict(), errors=node_response["errors"])
 
-        participant_id = node_response["id"]
-        properties_response = self.graph_api_service.create_properties(participant_id, participant)
-        if properties_response["errors"] is not None:
-            return ParticipantOut(**participant.dict(), errors=properties_response["errors"])
+        return ParticipantOut(**participant.dict(), id=node_response["id"])
 
-        return ParticipantOut(**participant.dict(), id=participant_id)
-
-    def get_participants(self):
+    async def get_participants(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get participants
 
+        Args:
+            limit (int): Maximal number of participants, all are returned if not given
+            after (int): Id after which returned participants start
+            where (List[str]): Filters on properties of participants
+
         Returns:
             Result of request as list of participants objects
         """
-        get_response = self.graph_api_service.get_nodes("Participant")
+        get_response = await self.graph_api_service.get_nodes("Participant", limit, after, where)
+        if get_response["errors"] is not None:
+            return ParticipantsOut(errors=get_response["errors"])
 
         participants = []
 
@@ -56,9 +59,9 @@ class ParticipantService:
             participant = BasicParticipantOut(**properties)
             participants.append(participant)
 
-        return ParticipantsOut(participants=participants)
+        return ParticipantsOut(participants=participants, next_after=get_response.get("next_after"))
 
-    def get_participant(self, participant_id: int):
+    async def get_participant(self, participant_id: int):
         """
         Send request to graph api to get given participant
 
@@ -68,12 +71,10 @@ class ParticipantService:
         Returns:
             Result of request as participant object
         """
-        get_response = self.graph_api_service.get_node(participant_id)
+        get_response = await self.graph_api_service.get_node(participant_id, "Participant", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=participant_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Participant":
-            return NotFoundByIdModel(id=participant_id, errors="Node not found.")
 
         participant = {'id': get_response['id'], 'additional_properties': [], 'relations': [], 'reversed_relations': []}
         for property in get_response["properties"]:
@@ -82,9 +83,7 @@ class ParticipantService:
             else:
                 participant['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(participant_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == participant_id:
                 participant['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                     name=relation["name"], relation_id=relation["id"]))
@@ -95,7 +94,7 @@ class ParticipantService:
 
         return ParticipantOut(**participant)
 
-    def delete_participant(self, participant_id: int):
+    async def delete_participant(self, participant_id: int):
         """
         Send request to graph api to delete given participant
 
@@ -105,15 +104,15 @@ class ParticipantService:
         Returns:
             Result of request as participant object
         """
-        get_response = self.get_participant(participant_id)
+        get_response = await self.get_participant(participant_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(participant_id)
+        await self.graph_api_service.delete_node(participant_id)
         return get_response
 
-    def update_participant(self, participant_id: int, participant: ParticipantIn):
+    async def update_participant(self, participant_id: int, participant: ParticipantIn):
         """
         Send request to graph api to update given participant
 
@@ -124,7 +123,7 @@ class ParticipantService:
         Returns:
             Result of request as participant object
         """
-        get_response = self.get_participant(participant_id)
+        get_response = await self.get_participant(participant_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
@@ -132,8 +131,8 @@ class ParticipantService:
         if participant.date_of_birth is not None:
             participant.date_of_birth = participant.date_of_birth.__str__()
 
-        self.graph_api_service.delete_node_properties(participant_id)
-        self.graph_api_service.create_properties(participant_id, participant)
+        await self.graph_api_service.delete_node_properties(participant_id)
+        await self.graph_api_service.create_properties(participant_id, participant)
 
         participant_result = {"id": participant_id, 'relations': get_response.relations,
                               'reversed_relations': get_response.reversed_relations}
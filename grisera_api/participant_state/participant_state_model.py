@@ -69,9 +69,11 @@ class ParticipantStatesOut(BaseModel):
 
     Attributes:
         participant_states (List[BasicParticipantStateOut]): Participant states from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     participant_states: List[BasicParticipantStateOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
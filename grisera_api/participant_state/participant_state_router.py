@@ -1,11 +1,15 @@
-from fastapi import Response
+from functools import partial
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from participant_state.participant_state_model import ParticipantStateIn, ParticipantStatesOut, ParticipantStateOut, \
     ParticipantStatePropertyIn, ParticipantStateRelationIn
 from participant_state.participant_state_service import ParticipantStateService
-from typing import Union
+from typing import List, Optional, Union
 from models.not_found_model import NotFoundByIdModel
 
 router = InferringRouter()
@@ -27,7 +31,7 @@ class ParticipantStateRouter:
         Create participant state in database
         """
 
-        create_response = self.participant_state_service.save_participant_state(participant_state)
+        create_response = await self.participant_state_service.save_participant_state(participant_state)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -37,15 +41,32 @@ class ParticipantStateRouter:
         return create_response
 
     @router.get("/participant_state", tags=["participant state"], response_model=ParticipantStatesOut)
-    async def get_participant_states(self, response: Response):
+    async def get_participant_states(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                     after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                     where: Optional[List[str]] = Query(None)):
         """
         Get participant states from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all participant states starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.participant_state_service.get_participant_states, where=where)
+            participant_states = stream_ndjson(get_page, "participant_states", after)
+            return StreamingResponse(participant_states, media_type="application/x-ndjson")
 
-        get_response = self.participant_state_service.get_participant_states()
+        get_response = await self.participant_state_service.get_participant_states(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/participant_state", {"limit": limit,
+                                                                           "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
 
@@ -56,7 +77,7 @@ class ParticipantStateRouter:
         Get participant state from database
         """
 
-        get_response = self.participant_state_service.get_participant_state(participant_id)
+        get_response = await self.participant_state_service.get_participant_state(participant_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -71,7 +92,7 @@ class ParticipantStateRouter:
         """
         Delete participant state from database
         """
-        get_response = self.participant_state_service.delete_participant_state(participant_state_id)
+        get_response = await self.participant_state_service.delete_participant_state(participant_state_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -87,8 +108,8 @@ class ParticipantStateRouter:
         """
         Update participant state model in database
         """
-        update_response = self.participant_state_service.update_participant_state(participant_state_id,
-                                                                                  participant_state)
+        update_response = await self.participant_state_service.update_participant_state(participant_state_id,
+                                                                                        participant_state)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -104,8 +125,8 @@ class ParticipantStateRouter:
         """
         Update participant state relations in database
         """
-        update_response = self.participant_state_service.update_participant_state_relationships(participant_state_id,
-                                                                                                participant_state)
+        update_response = await self.participant_state_service.update_participant_state_relationships(
+            participant_state_id, participant_state)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -1,7 +1,5 @@
+from typing import List
 from graph_api_service import GraphApiService
-from participant.participant_service import ParticipantService
-from personality.personality_service import PersonalityService
-from appearance.appearance_service import AppearanceService
 from participant_state.participant_state_model import ParticipantStatePropertyIn, BasicParticipantStateOut, \
     ParticipantStatesOut, ParticipantStateOut, ParticipantStateIn, ParticipantStateRelationIn
 from models.not_found_model import NotFoundByIdModel
@@ -14,16 +12,10 @@ class ParticipantStateService:
 
     Attributes:
         graph_api_service (GraphApiService): Service used to communicate with Graph API
-        participant_service (ParticipantService): Service to manage participant models
-        appearance_service (AppearanceService): Service to manage appearance models
-        personality_service (PersonalityService): Service to manage personality models
     """
     graph_api_service = GraphApiService()
-    participant_service = ParticipantService()
-    appearance_service = AppearanceService()
-    personality_service = PersonalityService()
 
-    def save_participant_state(self, participant_state: ParticipantStateIn):
+    async def save_participant_state(self, participant_state: ParticipantStateIn):
         """
         Send request to graph api to create new participant state
 
@@ -33,42 +25,38 @@ class ParticipantStateService:
         Returns:
             Result of request as participant state object
         """
-        node_response = self.graph_api_service.create_node("`Participant State`")
+        relationships = []
+        if participant_state.participant_id is not None:
+            relationships.append((participant_state.participant_id, "hasParticipant", "Participant"))
+        if participant_state.personality_id is not None:
+            relationships.append((participant_state.personality_id, "hasPersonality", "Personality"))
+        if participant_state.appearance_id is not None:
+            relationships.append((participant_state.appearance_id, "hasAppearance", "Appearance"))
+
+        properties = participant_state.copy(update={"participant_id": None, "personality_id": None,
+                                                    "appearance_id": None})
+        node_response = await self.graph_api_service.create_subgraph("`Participant State`", properties, relationships)
 
         if node_response["errors"] is not None:
             return ParticipantStateOut(**participant_state.dict(), errors=node_response["errors"])
 
-        participant_state_id = node_response["id"]
-
-        if participant_state.participant_id is not None and \
-                type(self.participant_service.get_participant(participant_state.participant_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=participant_state_id,
-                                                        end_node=participant_state.participant_id,
-                                                        name="hasParticipant")
-        if participant_state.personality_id is not None and \
-                type(self.personality_service.get_personality(participant_state.personality_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=participant_state_id,
-                                                        end_node=participant_state.personality_id,
-                                                        name="hasPersonality")
-        if participant_state.appearance_id is not None and \
-                type(self.appearance_service.get_appearance(participant_state.appearance_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=participant_state_id,
-                                                        end_node=participant_state.appearance_id,
-                                                        name="hasAppearance")
-
-        participant_state.participant_id = participant_state.personality_id = participant_state.appearance_id = None
-        self.graph_api_service.create_properties(participant_state_id, participant_state)
-
-        return self.get_participant_state(participant_state_id)
-
-    def get_participant_states(self):
+        return self.prepare_participant_state(node_response, node_response["relationships"])
+
+    async def get_participant_states(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get participant states
 
+        Args:
+            limit (int): Maximal number of participant states, all are returned if not given
+            after (int): Id after which returned participant states start
+            where (List[str]): Filters on properties of participant states
+
         Returns:
             Result of request as list of participant states objects
         """
-        get_response = self.graph_api_service.get_nodes("`Participant State`")
+        get_response = await self.graph_api_service.get_nodes("`Participant State`", limit, after, where)
+        if get_response["errors"] is not None:
+            return ParticipantStatesOut(errors=get_response["errors"])
 
         participant_states = []
 
@@ -82,9 +70,9 @@ class ParticipantStateService:
             participant_state = BasicParticipantStateOut(**properties)
             participant_states.append(participant_state)
 
-        return ParticipantStatesOut(participant_states=participant_states)
+        return ParticipantStatesOut(participant_states=participant_states, next_after=get_response.get("next_after"))
 
-    def get_participant_state(self, participant_state_id: int):
+    async def get_participant_state(self, participant_state_id: int):
         """
         Send request to graph api to get given participant state
 
@@ -94,24 +82,35 @@ class ParticipantStateService:
         Returns:
             Result of request as participant state object
         """
-        get_response = self.graph_api_service.get_node(participant_state_id)
+        get_response = await self.graph_api_service.get_node(participant_state_id, "Participant State",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=participant_state_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Participant State":
-            return NotFoundByIdModel(id=participant_state_id, errors="Node not found.")
 
-        participant_state = {'id': get_response['id'], 'additional_properties': [], 'relations': [],
+        return self.prepare_participant_state(get_response, get_response["relationships"])
+
+    def prepare_participant_state(self, node: dict, relationships: list):
+        """
+        Create participant state model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of participant state with its properties
+            relationships (list): Relationships of node
+
+        Returns:
+            Result as participant state object
+        """
+        participant_state_id = node["id"]
+        participant_state = {'id': participant_state_id, 'additional_properties': [], 'relations': [],
                              'reversed_relations': []}
-        for property in get_response["properties"]:
+        for property in node["properties"]:
             if property["key"] == "age":
                 participant_state[property["key"]] = property["value"]
             else:
                 participant_state['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(participant_state_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == participant_state_id:
                 participant_state['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                           name=relation["name"],
@@ -123,7 +122,7 @@ class ParticipantStateService:
 
         return ParticipantStateOut(**participant_state)
 
-    def delete_participant_state(self, participant_state_id: int):
+    async def delete_participant_state(self, participant_state_id: int):
         """
         Send request to graph api to delete given participant state
 
@@ -133,15 +132,15 @@ class ParticipantStateService:
         Returns:
             Result of request as participant state object
         """
-        get_response = self.get_participant_state(participant_state_id)
+        get_response = await self.get_participant_state(participant_state_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(participant_state_id)
+        await self.graph_api_service.delete_node(participant_state_id)
         return get_response
 
-    def update_participant_state(self, participant_state_id: int, participant_state: ParticipantStatePropertyIn):
+    async def update_participant_state(self, participant_state_id: int, participant_state: ParticipantStatePropertyIn):
         """
         Send request to graph api to update given participant state
 
@@ -152,13 +151,13 @@ class ParticipantStateService:
         Returns:
             Result of request as participant state object
         """
-        get_response = self.get_participant_state(participant_state_id)
+        get_response = await self.get_participant_state(participant_state_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(participant_state_id)
-        self.graph_api_service.create_properties(participant_state_id, participant_state)
+        await self.graph_api_service.delete_node_properties(participant_state_id)
+        await self.graph_api_service.create_properties(participant_state_id, participant_state)
 
         participant_state_result = {"id": participant_state_id, "relations": get_response.relations,
                                     "reversed_relations": get_response.reversed_relations}
@@ -166,8 +165,8 @@ class ParticipantStateService:
 
         return ParticipantStateOut(**participant_state_result)
 
-    def update_participant_state_relationships(self, participant_state_id: int,
-                                               participant_state: ParticipantStateRelationIn):
+    async def update_participant_state_relationships(self, participant_state_id: int,
+                                                     participant_state: ParticipantStateRelationIn):
         """
         Send request to graph api to update given participant state
 
@@ -178,26 +177,22 @@ class ParticipantStateService:
         Returns:
             Result of request as participant state object
         """
-        get_response = self.get_participant_state(participant_state_id)
+        lookups = [(participant_state.participant_id, "hasParticipant", "Participant"),
+                   (participant_state.personality_id, "hasPersonality", "Personality"),
+                   (participant_state.appearance_id, "hasAppearance", "Appearance")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_participant_state(participant_state_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=participant_state_id, end_node=end_node, name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if participant_state.participant_id is not None and \
-                type(self.participant_service.get_participant(
-                    participant_state.participant_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=participant_state_id,
-                                                        end_node=participant_state.participant_id,
-                                                        name="hasParticipant")
-        if participant_state.personality_id is not None and \
-                type(self.personality_service.get_personality(participant_state.personality_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=participant_state_id,
-                                                        end_node=participant_state.personality_id,
-                                                        name="hasPersonality")
-        if participant_state.appearance_id is not None and \
-                type(self.appearance_service.get_appearance(participant_state.appearance_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=participant_state_id,
-                                                        end_node=participant_state.appearance_id,
-                                                        name="hasAppearance")
-
-        return self.get_participant_state(participant_state_id)
+        return await self.get_participant_state(participant_state_id)
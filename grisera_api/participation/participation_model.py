@@ -48,9 +48,11 @@ class ParticipationsOut(BaseModel):
 
     Attributes:
     participations (List[BasicParticipationOut]): Participations from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     participations: List[BasicParticipationOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
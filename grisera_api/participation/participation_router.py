@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from models.not_found_model import NotFoundByIdModel
 from participation.participation_model import ParticipationIn, ParticipationOut, ParticipationsOut
 from participation.participation_service import ParticipationService
@@ -26,7 +30,7 @@ class ParticipationRouter:
         """
         Create participation in database
         """
-        create_response = self.participation_service.save_participation(participation)
+        create_response = await self.participation_service.save_participation(participation)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -36,15 +40,32 @@ class ParticipationRouter:
         return create_response
 
     @router.get("/participations", tags=["participations"], response_model=ParticipationsOut)
-    async def get_participations(self, response: Response):
+    async def get_participations(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                 after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                 where: Optional[List[str]] = Query(None)):
         """
         Get participations from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all participations starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.participation_service.get_participations, where=where)
+            participations = stream_ndjson(get_page, "participations", after)
+            return StreamingResponse(participations, media_type="application/x-ndjson")
 
-        get_response = self.participation_service.get_participations()
+        get_response = await self.participation_service.get_participations(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/participations", {"limit": limit,
+                                                                        "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
 
@@ -55,7 +76,7 @@ class ParticipationRouter:
         Get participations from database
         """
 
-        get_response = self.participation_service.get_participation(participation_id)
+        get_response = await self.participation_service.get_participation(participation_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -70,7 +91,7 @@ class ParticipationRouter:
         """
         Delete participations from database
         """
-        get_response = self.participation_service.delete_participation(participation_id)
+        get_response = await self.participation_service.delete_participation(participation_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -86,7 +107,8 @@ class ParticipationRouter:
         """
         Update participations relations in database
         """
-        update_response = self.participation_service.update_participation_relationships(participation_id, participation)
+        update_response = await self.participation_service.update_participation_relationships(participation_id,
+                                                                                               participation)
 
         if update_response.errors is not None:
             response.status_code = 404
@@ -1,6 +1,5 @@
+from typing import List
 from graph_api_service import GraphApiService
-from activity_execution.activity_execution_service import ActivityExecutionService
-from participant_state.participant_state_service import ParticipantStateService
 from participation.participation_model import ParticipationIn, ParticipationOut, ParticipationsOut, \
     BasicParticipationOut
 from models.not_found_model import NotFoundByIdModel
@@ -13,14 +12,10 @@ class ParticipationService:
 
     Attributes:
     graph_api_service (GraphApiService): Service used to communicate with Graph API
-    activity_execution_service (ActivityExecutionService): Service to send activity execution requests
-    participant_state_service (ParticipantStateService): Service to send participant state requests
     """
     graph_api_service = GraphApiService()
-    activity_execution_service = ActivityExecutionService()
-    participant_state_service = ParticipantStateService()
 
-    def save_participation(self, participation: ParticipationIn):
+    async def save_participation(self, participation: ParticipationIn):
         """
         Send request to graph api to create new participation
 
@@ -30,34 +25,33 @@ class ParticipationService:
         Returns:
             Result of request as participation object
         """
-        node_response = self.graph_api_service.create_node("Participation")
+        relationships = []
+        if participation.activity_execution_id is not None:
+            relationships.append((participation.activity_execution_id, "hasActivityExecution", "Activity Execution"))
+        if participation.participant_state_id is not None:
+            relationships.append((participation.participant_state_id, "hasParticipantState", "Participant State"))
+
+        properties = participation.copy(update={"activity_execution_id": None, "participant_state_id": None})
+        node_response = await self.graph_api_service.create_subgraph("Participation", properties, relationships)
 
         if node_response["errors"] is not None:
             return ParticipationOut(errors=node_response["errors"])
 
-        participation_id = node_response["id"]
-
-        if participation.activity_execution_id is not None and \
-                type(self.activity_execution_service.get_activity_execution(participation.activity_execution_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(participation_id, participation.activity_execution_id,
-                                                        "hasActivityExecution")
-
-        if participation.participant_state_id is not None and \
-                type(self.participant_state_service.get_participant_state(participation.participant_state_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(participation_id, participation.participant_state_id,
-                                                        "hasParticipantState")
-
-        return self.get_participation(participation_id)
+        return self.prepare_participation(node_response, node_response["relationships"])
 
-    def get_participations(self):
+    async def get_participations(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get participations
+        Args:
+            limit (int): Maximal number of participations, all are returned if not given
+            after (int): Id after which returned participations start
+            where (List[str]): Filters on properties of participations
         Returns:
             Result of request as list of participation objects
         """
-        get_response = self.graph_api_service.get_nodes("Participation")
+        get_response = await self.graph_api_service.get_nodes("Participation", limit, after, where)
+        if get_response["errors"] is not None:
+            return ParticipationsOut(errors=get_response["errors"])
 
         participations = []
 
@@ -66,9 +60,9 @@ class ParticipationService:
             participation = BasicParticipationOut(**properties)
             participations.append(participation)
 
-        return ParticipationsOut(participations=participations)
+        return ParticipationsOut(participations=participations, next_after=get_response.get("next_after"))
 
-    def get_participation(self, participation_id: int):
+    async def get_participation(self, participation_id: int):
         """
         Send request to graph api to get given participation
         Args:
@@ -76,19 +70,30 @@ class ParticipationService:
         Returns:
             Result of request as participation object
         """
-        get_response = self.graph_api_service.get_node(participation_id)
+        get_response = await self.graph_api_service.get_node(participation_id, "Participation",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=participation_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Participation":
-            return NotFoundByIdModel(id=participation_id, errors="Node not found.")
 
-        participation = {'id': get_response['id'], 'relations': [],
-                         'reversed_relations': []}
+        return self.prepare_participation(get_response, get_response["relationships"])
+
+    def prepare_participation(self, node: dict, relationships: list):
+        """
+        Create participation model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of participation with its properties
+            relationships (list): Relationships of node
 
-        relations_response = self.graph_api_service.get_node_relationships(participation_id)
+        Returns:
+            Result as participation object
+        """
+        participation_id = node["id"]
+        participation = {'id': participation_id, 'relations': [],
+                         'reversed_relations': []}
 
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == participation_id:
                 participation['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                       name=relation["name"],
@@ -101,7 +106,7 @@ class ParticipationService:
 
         return ParticipationOut(**participation)
 
-    def delete_participation(self, participation_id: int):
+    async def delete_participation(self, participation_id: int):
         """
         Send request to graph api to delete given participation
         Args:
@@ -109,16 +114,16 @@ class ParticipationService:
         Returns:
             Result of request as participation object
         """
-        get_response = self.get_participation(participation_id)
+        get_response = await self.get_participation(participation_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(participation_id)
+        await self.graph_api_service.delete_node(participation_id)
         return get_response
 
-    def update_participation_relationships(self, participation_id: int,
-                                           participation: ParticipationIn):
+    async def update_participation_relationships(self, participation_id: int,
+                                                 participation: ParticipationIn):
         """
         Send request to graph api to update given participation relationships
         Args:
@@ -127,21 +132,21 @@ class ParticipationService:
         Returns:
             Result of request as participation object
         """
-        get_response = self.get_participation(participation_id)
+        lookups = [(participation.activity_execution_id, "hasActivityExecution", "Activity Execution"),
+                   (participation.participant_state_id, "hasParticipantState", "Participant State")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_participation(participation_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
 
-        if participation.activity_execution_id is not None and \
-                type(self.activity_execution_service.get_activity_execution(participation.activity_execution_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(participation_id, participation.activity_execution_id,
-                                                        "hasActivityExecution")
-
-        if participation.participant_state_id is not None and \
-                type(self.participant_state_service.get_participant_state(participation.participant_state_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(participation_id, participation.participant_state_id,
-                                                        "hasParticipantState")
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(participation_id, end_node, name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        return self.get_participation(participation_id)
+        return await self.get_participation(participation_id)
@@ -99,9 +99,11 @@ class PersonalitiesOut(BaseModel):
 
     Attributes:
         personalities (List[Union[BasicPersonalityBigFiveOut, BasicPersonalityPanasOut]]): Personalities from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     personalities: List[Union[BasicPersonalityBigFiveOut, BasicPersonalityPanasOut]] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
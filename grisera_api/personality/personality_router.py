@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from personality.personality_model import PersonalityBigFiveIn, BasicPersonalityBigFiveOut, PersonalityBigFiveOut, \
     PersonalityPanasIn, BasicPersonalityPanasOut, PersonalityPanasOut, PersonalitiesOut
 from personality.personality_service import PersonalityService
@@ -28,7 +32,7 @@ class PersonalityRouter:
         Create personality big five model in database
         """
 
-        create_response = self.personality_service.save_personality_big_five(personality)
+        create_response = await self.personality_service.save_personality_big_five(personality)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -43,7 +47,7 @@ class PersonalityRouter:
         Create personality panas model in database
         """
 
-        create_response = self.personality_service.save_personality_panas(personality)
+        create_response = await self.personality_service.save_personality_panas(personality)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -59,7 +63,7 @@ class PersonalityRouter:
         Get personality from database
         """
 
-        get_response = self.personality_service.get_personality(personality_id)
+        get_response = await self.personality_service.get_personality(personality_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -69,15 +73,30 @@ class PersonalityRouter:
         return get_response
 
     @router.get("/personality", tags=["personality"], response_model=PersonalitiesOut)
-    async def get_personalities(self, response: Response):
+    async def get_personalities(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                where: Optional[List[str]] = Query(None)):
         """
         Get personalities from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all personalities starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.personality_service.get_personalities, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "personalities", after), media_type="application/x-ndjson")
 
-        get_response = self.personality_service.get_personalities()
+        get_response = await self.personality_service.get_personalities(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/personality", {"limit": limit, "after": get_response.next_after,
+                                                                     "where": where or []}))
 
         return get_response
 
@@ -87,7 +106,7 @@ class PersonalityRouter:
         """
         Delete personality from database
         """
-        get_response = self.personality_service.delete_personality(personality_id)
+        get_response = await self.personality_service.delete_personality(personality_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -103,7 +122,7 @@ class PersonalityRouter:
         """
         Update personality big five model in database
         """
-        update_response = self.personality_service.update_personality_big_five(personality_id, personality)
+        update_response = await self.personality_service.update_personality_big_five(personality_id, personality)
         if update_response.errors is not None:
             response.status_code = 404 if type(update_response) == NotFoundByIdModel else 422
 
@@ -118,7 +137,7 @@ class PersonalityRouter:
         """
         Update personality panas model in database
         """
-        update_response = self.personality_service.update_personality_panas(personality_id, personality)
+        update_response = await self.personality_service.update_personality_panas(personality_id, personality)
         if update_response.errors is not None:
             response.status_code = 404 if type(update_response) == NotFoundByIdModel else 422
 
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from personality.personality_model import PersonalityBigFiveIn, PersonalityBigFiveOut, \
     PersonalityPanasIn, PersonalityPanasOut, BasicPersonalityBigFiveOut, BasicPersonalityPanasOut, PersonalitiesOut
@@ -14,7 +15,7 @@ class PersonalityService:
     """
     graph_api_service = GraphApiService()
 
-    def save_personality_big_five(self, personality: PersonalityBigFiveIn):
+    async def save_personality_big_five(self, personality: PersonalityBigFiveIn):
         """
         Send request to graph api to create new personality big five model
 
@@ -24,18 +25,15 @@ class PersonalityService:
         Returns:
             Result of request as personality big five object
         """
-
         if not 0 <= personality.agreeableness <= 1 or not 0 <= personality.conscientiousness <= 1 or \
            not 0 <= personality.extroversion <= 1 or not 0 <= personality.neuroticism <= 1 or \
            not 0 <= personality.openess <= 1:
             return PersonalityBigFiveOut(**personality.dict(), errors="Value not between 0 and 1")
 
-        node_response = self.graph_api_service.create_node("Personality")
-        personality_id = node_response["id"]
-        self.graph_api_service.create_properties(personality_id, personality)
-        return PersonalityBigFiveOut(**personality.dict(), id=personality_id)
+        node_response = await self.graph_api_service.create_subgraph("Personality", personality)
+        return PersonalityBigFiveOut(**personality.dict(), id=node_response["id"])
 
-    def save_personality_panas(self, personality: PersonalityPanasIn):
+    async def save_personality_panas(self, personality: PersonalityPanasIn):
         """
         Send request to graph api to create new personality panas model
 
@@ -48,13 +46,11 @@ class PersonalityService:
         if not 0 <= personality.negative_affect <= 1 or not 0 <= personality.positive_affect <= 1:
             return PersonalityPanasOut(**personality.dict(), errors="Value not between 0 and 1")
 
-        node_response = self.graph_api_service.create_node("Personality")
-        personality_id = node_response["id"]
-        self.graph_api_service.create_properties(personality_id, personality)
+        node_response = await self.graph_api_service.create_subgraph("Personality", personality)
 
-        return PersonalityPanasOut(**personality.dict(), id=personality_id)
+        return PersonalityPanasOut(**personality.dict(), id=node_response["id"])
 
-    def get_personality(self, personality_id: int):
+    async def get_personality(self, personality_id: int):
         """
         Send request to graph api to get given personality
 
@@ -64,19 +60,15 @@ class PersonalityService:
         Returns:
             Result of request as personality object
         """
-        get_response = self.graph_api_service.get_node(personality_id)
+        get_response = await self.graph_api_service.get_node(personality_id, "Personality", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=personality_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Personality":
-            return NotFoundByIdModel(id=personality_id, errors="Node not found.")
 
         personality = {'id': personality_id, 'relations': [], 'reversed_relations': []}
         personality.update({property["key"]: property["value"] for property in get_response["properties"]})
 
-        relations_response = self.graph_api_service.get_node_relationships(personality_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == personality_id:
                 personality["relations"].append(RelationInformation(second_node_id=relation["end_node"],
                                                                     name=relation["name"], relation_id=relation["id"]))
@@ -88,14 +80,21 @@ class PersonalityService:
         return PersonalityPanasOut(**personality) if "negative_affect" in personality.keys() \
             else PersonalityBigFiveOut(**personality)
 
-    def get_personalities(self):
+    async def get_personalities(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get personalities
 
+        Args:
+            limit (int): Maximal number of personalities, all are returned if not given
+            after (int): Id after which returned personalities start
+            where (List[str]): Filters on properties of personalities
+
         Returns:
             Result of request as list of personalities objects
         """
-        get_response = self.graph_api_service.get_nodes("Personality")
+        get_response = await self.graph_api_service.get_nodes("Personality", limit, after, where)
+        if get_response["errors"] is not None:
+            return PersonalitiesOut(errors=get_response["errors"])
 
         personalities = []
 
@@ -106,9 +105,9 @@ class PersonalityService:
                 else BasicPersonalityBigFiveOut(**properties)
             personalities.append(personality)
 
-        return PersonalitiesOut(personalities=personalities)
+        return PersonalitiesOut(personalities=personalities, next_after=get_response.get("next_after"))
 
-    def delete_personality(self, personality_id: int):
+    async def delete_personality(self, personality_id: int):
         """
         Send request to graph api to delete given personality
 
@@ -118,14 +117,14 @@ class PersonalityService:
         Returns:
             Result of request as personality object
         """
-        get_response = self.get_personality(personality_id)
+        get_response = await self.get_personality(personality_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
-        self.graph_api_service.delete_node(personality_id)
+        await self.graph_api_service.delete_node(personality_id)
         return get_response
 
-    def update_personality_big_five(self, personality_id: int, personality: PersonalityBigFiveIn):
+    async def update_personality_big_five(self, personality_id: int, personality: PersonalityBigFiveIn):
         """
         Send request to graph api to update given personality big five model
 
@@ -141,18 +140,18 @@ class PersonalityService:
            not 0 <= personality.openess <= 1:
             return PersonalityBigFiveOut(**personality.dict(), errors="Value not between 0 and 1")
 
-        get_response = self.get_personality(personality_id)
+        get_response = await self.get_personality(personality_id)
         if type(get_response) is NotFoundByIdModel:
             return get_response
         if type(get_response) is PersonalityPanasOut:
             return NotFoundByIdModel(id=personality_id, errors="Node not found.")
 
-        self.graph_api_service.create_properties(personality_id, personality)
+        await self.graph_api_service.create_properties(personality_id, personality)
         personality_response = get_response.dict()
         personality_response.update(personality)
         return PersonalityBigFiveOut(**personality_response)
 
-    def update_personality_panas(self, personality_id: int, personality: PersonalityPanasIn):
+    async def update_personality_panas(self, personality_id: int, personality: PersonalityPanasIn):
         """
         Send request to graph api to update given personality panas model
 
@@ -166,13 +165,13 @@ class PersonalityService:
         if not 0 <= personality.negative_affect <= 1 or not 0 <= personality.positive_affect <= 1:
             return PersonalityPanasOut(**personality.dict(), errors="Value not between 0 and 1")
 
-        get_response = self.get_personality(personality_id)
+        get_response = await self.get_personality(personality_id)
         if type(get_response) is NotFoundByIdModel:
             return get_response
         if type(get_response) is PersonalityBigFiveOut:
             return NotFoundByIdModel(id=personality_id, errors="Node not found.")
 
-        self.graph_api_service.create_properties(personality_id, personality)
+        await self.graph_api_service.create_properties(personality_id, personality)
 
         personality_response = get_response.dict()
         personality_response.update(personality)
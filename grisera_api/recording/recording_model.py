@@ -67,9 +67,11 @@ class RecordingsOut(BasicRecordingOut):
 
     Attributes:
     recordings (List[BasicRecordingOut]): Recordings from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     recordings: List[BasicRecordingOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from models.not_found_model import NotFoundByIdModel
 from recording.recording_model import RecordingPropertyIn, RecordingRelationIn, RecordingIn, RecordingOut, RecordingsOut
 from recording.recording_service import RecordingService
@@ -26,7 +30,7 @@ class RecordingRouter:
         """
         Create Recording in database
         """
-        create_response = self.recording_service.save_recording(recording)
+        create_response = await self.recording_service.save_recording(recording)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -36,15 +40,30 @@ class RecordingRouter:
         return create_response
 
     @router.get("/recordings", tags=["recordings"], response_model=RecordingsOut)
-    async def get_recordings(self, response: Response):
+    async def get_recordings(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                             after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                             where: Optional[List[str]] = Query(None)):
         """
         Get recordingss from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all recordings starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.recording_service.get_recordings, where=where)
+            return StreamingResponse(stream_ndjson(get_page, "recordings", after), media_type="application/x-ndjson")
 
-        get_response = self.recording_service.get_recordings()
+        get_response = await self.recording_service.get_recordings(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/recordings", {"limit": limit, "after": get_response.next_after,
+                                                                    "where": where or []}))
 
         return get_response
 
@@ -55,7 +74,7 @@ class RecordingRouter:
         Get recordings from database
         """
 
-        get_response = self.recording_service.get_recording(recording_id)
+        get_response = await self.recording_service.get_recording(recording_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -70,7 +89,7 @@ class RecordingRouter:
         """
         Delete recordings from database
         """
-        get_response = self.recording_service.delete_recording(recording_id)
+        get_response = await self.recording_service.delete_recording(recording_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -85,7 +104,7 @@ class RecordingRouter:
         """
         Update recording model in database
         """
-        update_response = self.recording_service.update_recording(recording_id, recording)
+        update_response = await self.recording_service.update_recording(recording_id, recording)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -100,7 +119,7 @@ class RecordingRouter:
         """
         Update recordings relations in database
         """
-        update_response = self.recording_service.update_recording_relationships(recording_id, recording)
+        update_response = await self.recording_service.update_recording_relationships(recording_id, recording)
         if update_response.errors is not None:
             response.status_code = 404
 
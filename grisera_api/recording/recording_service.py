@@ -1,6 +1,5 @@
+from typing import List
 from graph_api_service import GraphApiService
-from participation.participation_service import ParticipationService
-from registered_channel.registered_channel_service import RegisteredChannelService
 from recording.recording_model import RecordingPropertyIn, RecordingRelationIn, RecordingIn, BasicRecordingOut, RecordingOut, RecordingsOut
 from models.not_found_model import NotFoundByIdModel
 from models.relation_information_model import RelationInformation
@@ -12,14 +11,10 @@ class RecordingService:
 
     Attributes:
     graph_api_service (GraphApiService): Service used to communicate with Graph API
-    participation_service (ParticipationService): Service to send participation requests
-    registered_channel_service(RegisteredChannelService): Service to send registered channel requests
     """
     graph_api_service = GraphApiService()
-    participation_service = ParticipationService()
-    registered_channel_service = RegisteredChannelService()
 
-    def save_recording(self, recording: RecordingIn):
+    async def save_recording(self, recording: RecordingIn):
         """
         Send request to graph api to create new recording node
 
@@ -29,36 +24,33 @@ class RecordingService:
         Returns:
             Result of request as recording object
         """
-        node_response = self.graph_api_service.create_node("Recording")
+        relationships = []
+        if recording.participation_id is not None:
+            relationships.append((recording.participation_id, "hasParticipation", "Participation"))
+        if recording.registered_channel_id is not None:
+            relationships.append((recording.registered_channel_id, "hasRegisteredChannel", "Registered Channel"))
+
+        properties = recording.copy(update={"participation_id": None, "registered_channel_id": None})
+        node_response = await self.graph_api_service.create_subgraph("Recording", properties, relationships)
 
         if node_response["errors"] is not None:
             return RecordingOut(**recording.dict(), errors=node_response["errors"])
 
-        recording_id = node_response["id"]
-
-        if recording.participation_id is not None and \
-                type(self.participation_service.get_participation(recording.participation_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=recording_id,
-                                                        end_node=recording.participation_id,
-                                                        name="hasParticipation")
-        if recording.registered_channel_id is not None and \
-                type(self.registered_channel_service.get_registered_channel(recording.registered_channel_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=recording_id,
-                                                        end_node=recording.registered_channel_id,
-                                                        name="hasRegisteredChannel")
-        recording.participation_id = recording.registered_channel_id = None
-        self.graph_api_service.create_properties(recording_id, recording)
-        
-        return self.get_recording(recording_id)
-
-    def get_recordings(self):
+        return self.prepare_recording(node_response, node_response["relationships"])
+
+    async def get_recordings(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get recordings
+        Args:
+            limit (int): Maximal number of recordings, all are returned if not given
+            after (int): Id after which returned recordings start
+            where (List[str]): Filters on properties of recordings
         Returns:
             Result of request as list of recordings objects
         """
-        get_response = self.graph_api_service.get_nodes("Recording")
+        get_response = await self.graph_api_service.get_nodes("Recording", limit, after, where)
+        if get_response["errors"] is not None:
+            return RecordingsOut(errors=get_response["errors"])
 
         recordings = []
 
@@ -69,9 +61,9 @@ class RecordingService:
             recording = BasicRecordingOut(**properties)
             recordings.append(recording)
 
-        return RecordingsOut(recordings=recordings)
+        return RecordingsOut(recordings=recordings, next_after=get_response.get("next_after"))
 
-    def get_recording(self, recording_id: int):
+    async def get_recording(self, recording_id: int):
         """
         Send request to graph api to get given recording
         Args:
@@ -79,22 +71,32 @@ class RecordingService:
         Returns:
             Result of request as recording object
         """
-        get_response = self.graph_api_service.get_node(recording_id)
+        get_response = await self.graph_api_service.get_node(recording_id, "Recording", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=recording_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Recording":
-            return NotFoundByIdModel(id=recording_id, errors="Node not found.")
 
-        recording = {'id': get_response['id'], 'additional_properties': [], 'relations': [],
+        return self.prepare_recording(get_response, get_response["relationships"])
+
+    def prepare_recording(self, node: dict, relationships: list):
+        """
+        Create recording model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of recording with its properties
+            relationships (list): Relationships of node
+
+        Returns:
+            Result as recording object
+        """
+        recording_id = node["id"]
+        recording = {'id': recording_id, 'additional_properties': [], 'relations': [],
                      'reversed_relations': []}
 
-        for property in get_response["properties"]:
+        for property in node["properties"]:
             recording['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(recording_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == recording_id:
                 recording['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                   name=relation["name"],
@@ -107,7 +109,7 @@ class RecordingService:
 
         return RecordingOut(**recording)
 
-    def delete_recording(self, recording_id: int):
+    async def delete_recording(self, recording_id: int):
         """
         Send request to graph api to delete given recording
         Args:
@@ -115,15 +117,15 @@ class RecordingService:
         Returns:
             Result of request as recording object
         """
-        get_response = self.get_recording(recording_id)
+        get_response = await self.get_recording(recording_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(recording_id)
+        await self.graph_api_service.delete_node(recording_id)
         return get_response
 
-    def update_recording(self, recording_id: int, recording: RecordingPropertyIn):
+    async def update_recording(self, recording_id: int, recording: RecordingPropertyIn):
         """
         Send request to graph api to update given participant state
         Args:
@@ -132,13 +134,13 @@ class RecordingService:
         Returns:
             Result of request as participant state object
         """
-        get_response = self.get_recording(recording_id)
+        get_response = await self.get_recording(recording_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(recording_id)
-        self.graph_api_service.create_properties(recording_id, recording)
+        await self.graph_api_service.delete_node_properties(recording_id)
+        await self.graph_api_service.create_properties(recording_id, recording)
 
         recording_result = {"id": recording_id, "relations": get_response.relations,
                             "reversed_relations": get_response.reversed_relations}
@@ -146,8 +148,8 @@ class RecordingService:
 
         return RecordingOut(**recording_result)
     
-    def update_recording_relationships(self, recording_id: int,
-                                       recording: RecordingIn):
+    async def update_recording_relationships(self, recording_id: int,
+                                             recording: RecordingIn):
         """
         Send request to graph api to update given recording
         Args:
@@ -156,21 +158,21 @@ class RecordingService:
         Returns:
             Result of request as recording object
         """
-        get_response = self.get_recording(recording_id)
+        lookups = [(recording.participation_id, "hasParticipation", "Participation"),
+                   (recording.registered_channel_id, "hasRegisteredChannel", "Registered Channel")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_recording(recording_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=recording_id, end_node=end_node, name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if recording.participation_id is not None and \
-                type(self.participation_service.get_participation(recording.participation_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=recording_id,
-                                                        end_node=recording.participation_id,
-                                                        name="hasParticipation")
-        if recording.registered_channel_id is not None and \
-                type(self.registered_channel_service.get_registered_channel(recording.registered_channel_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=recording_id,
-                                                        end_node=recording.registered_channel_id,
-                                                        name="hasRegisteredChannel")
-
-        return self.get_recording(recording_id)
+        return await self.get_recording(recording_id)
@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from models.not_found_model import NotFoundByIdModel
 from registered_channel.registered_channel_model import RegisteredChannelIn, RegisteredChannelsOut, \
     RegisteredChannelOut
@@ -27,7 +31,7 @@ class RegisteredChannelRouter:
         """
         Create registered channel in database
         """
-        create_response = self.registered_channel_service.save_registered_channel(registered_channel)
+        create_response = await self.registered_channel_service.save_registered_channel(registered_channel)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -37,15 +41,32 @@ class RegisteredChannelRouter:
         return create_response
 
     @router.get("/registered_channels", tags=["registered channels"], response_model=RegisteredChannelsOut)
-    async def get_registered_channels(self, response: Response):
+    async def get_registered_channels(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                      after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                      where: Optional[List[str]] = Query(None)):
         """
         Get registered channels from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all registered channels starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.registered_channel_service.get_registered_channels, where=where)
+            registered_channels = stream_ndjson(get_page, "registered_channels", after)
+            return StreamingResponse(registered_channels, media_type="application/x-ndjson")
 
-        get_response = self.registered_channel_service.get_registered_channels()
+        get_response = await self.registered_channel_service.get_registered_channels(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/registered_channels", {"limit": limit,
+                                                                             "after": get_response.next_after,
+                                                                 "where": where or []}))
 
         return get_response
 
@@ -56,7 +77,7 @@ class RegisteredChannelRouter:
         Get registered channels from database
         """
 
-        get_response = self.registered_channel_service.get_registered_channel(registered_channel_id)
+        get_response = await self.registered_channel_service.get_registered_channel(registered_channel_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -71,7 +92,7 @@ class RegisteredChannelRouter:
         """
         Delete registered channels from database
         """
-        get_response = self.registered_channel_service.delete_registered_channel(registered_channel_id)
+        get_response = await self.registered_channel_service.delete_registered_channel(registered_channel_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -88,8 +109,8 @@ class RegisteredChannelRouter:
         """
         Update registered channels relations in database
         """
-        update_response = self.registered_channel_service.update_registered_channel_relationships(registered_channel_id,
-                                                                                                  registered_channel)
+        update_response = await self.registered_channel_service.update_registered_channel_relationships(
+            registered_channel_id, registered_channel)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -1,6 +1,5 @@
+from typing import List
 from graph_api_service import GraphApiService
-from channel.channel_service import ChannelService
-from registered_data.registered_data_service import RegisteredDataService
 from registered_channel.registered_channel_model import BasicRegisteredChannelOut, RegisteredChannelsOut, \
     RegisteredChannelOut, RegisteredChannelIn
 from models.not_found_model import NotFoundByIdModel
@@ -13,14 +12,10 @@ class RegisteredChannelService:
 
     Attributes:
     graph_api_service (GraphApiService): Service used to communicate with Graph API
-    channel_service (ChannelService): Service to send channel requests
-    registered_data_service (RegisteredDataService): Service to send registered data requests
     """
     graph_api_service = GraphApiService()
-    channel_service = ChannelService()
-    registered_data_service = RegisteredDataService()
 
-    def save_registered_channel(self, registered_channel: RegisteredChannelIn):
+    async def save_registered_channel(self, registered_channel: RegisteredChannelIn):
         """
         Send request to graph api to create new registered channel
 
@@ -30,34 +25,35 @@ class RegisteredChannelService:
         Returns:
             Result of request as registered channel object
         """
-        node_response = self.graph_api_service.create_node("`Registered Channel`")
+        relationships = []
+        if registered_channel.channel_id is not None:
+            relationships.append((registered_channel.channel_id, "hasChannel", "Channel"))
+        if registered_channel.registered_data_id is not None:
+            relationships.append((registered_channel.registered_data_id, "hasRegisteredData", "Registered Data"))
+
+        properties = registered_channel.copy(update={"channel_id": None, "registered_data_id": None})
+        node_response = await self.graph_api_service.create_subgraph("`Registered Channel`", properties, relationships)
 
         if node_response["errors"] is not None:
             return RegisteredChannelOut(errors=node_response["errors"])
-        registered_channel_id = node_response["id"]
-
-        if registered_channel.channel_id is not None and \
-                type(self.channel_service.get_channel(registered_channel.channel_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=registered_channel_id,
-                                                        end_node=registered_channel.channel_id,
-                                                        name="hasChannel")
-        if registered_channel.registered_data_id is not None and \
-                type(self.registered_data_service.get_registered_data(registered_channel.registered_data_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=registered_channel_id,
-                                                        end_node=registered_channel.registered_data_id,
-                                                        name="hasRegisteredData")
-
-        return self.get_registered_channel(registered_channel_id)
-
-    def get_registered_channels(self):
+
+        return self.prepare_registered_channel(node_response, node_response["relationships"])
+
+    async def get_registered_channels(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get registered channels
 
+        Args:
+            limit (int): Maximal number of registered channels, all are returned if not given
+            after (int): Id after which returned registered channels start
+            where (List[str]): Filters on properties of registered channels
+
         Returns:
             Result of request as list of registered channels objects
         """
-        get_response = self.graph_api_service.get_nodes("`Registered Channel`")
+        get_response = await self.graph_api_service.get_nodes("`Registered Channel`", limit, after, where)
+        if get_response["errors"] is not None:
+            return RegisteredChannelsOut(errors=get_response["errors"])
 
         registered_channels = []
 
@@ -69,9 +65,9 @@ class RegisteredChannelService:
             registered_channel = BasicRegisteredChannelOut(**properties)
             registered_channels.append(registered_channel)
 
-        return RegisteredChannelsOut(registered_channels=registered_channels)
+        return RegisteredChannelsOut(registered_channels=registered_channels, next_after=get_response.get("next_after"))
 
-    def get_registered_channel(self, registered_channel_id: int):
+    async def get_registered_channel(self, registered_channel_id: int):
         """
         Send request to graph api to get given registered channel
 
@@ -81,22 +77,33 @@ class RegisteredChannelService:
         Returns:
             Result of request as registered channel object
         """
-        get_response = self.graph_api_service.get_node(registered_channel_id)
+        get_response = await self.graph_api_service.get_node(registered_channel_id, "Registered Channel",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=registered_channel_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Registered Channel":
-            return NotFoundByIdModel(id=registered_channel_id, errors="Node not found.")
 
-        registered_channel = {'id': get_response['id'], 'relations': [],
+        return self.prepare_registered_channel(get_response, get_response["relationships"])
+
+    def prepare_registered_channel(self, node: dict, relationships: list):
+        """
+        Create registered channel model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of registered channel with its properties
+            relationships (list): Relationships of node
+
+        Returns:
+            Result as registered channel object
+        """
+        registered_channel_id = node["id"]
+        registered_channel = {'id': registered_channel_id, 'relations': [],
                               'reversed_relations': []}
-        for property in get_response["properties"]:
+        for property in node["properties"]:
             if property["key"] == "age":
                 registered_channel[property["key"]] = property["value"]
 
-        relations_response = self.graph_api_service.get_node_relationships(registered_channel_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == registered_channel_id:
                 registered_channel['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                            name=relation["name"],
@@ -109,7 +116,7 @@ class RegisteredChannelService:
 
         return RegisteredChannelOut(**registered_channel)
 
-    def delete_registered_channel(self, registered_channel_id: int):
+    async def delete_registered_channel(self, registered_channel_id: int):
         """
         Send request to graph api to delete given registered channel
 
@@ -119,16 +126,16 @@ class RegisteredChannelService:
         Returns:
             Result of request as registered channel object
         """
-        get_response = self.get_registered_channel(registered_channel_id)
+        get_response = await self.get_registered_channel(registered_channel_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(registered_channel_id)
+        await self.graph_api_service.delete_node(registered_channel_id)
         return get_response
 
-    def update_registered_channel_relationships(self, registered_channel_id: int,
-                                                registered_channel: RegisteredChannelIn):
+    async def update_registered_channel_relationships(self, registered_channel_id: int,
+                                                      registered_channel: RegisteredChannelIn):
         """
         Send request to graph api to update given registered channel
 
@@ -139,21 +146,21 @@ class RegisteredChannelService:
         Returns:
             Result of request as registered channel object
         """
-        get_response = self.get_registered_channel(registered_channel_id)
+        lookups = [(registered_channel.channel_id, "hasChannel", "Channel"),
+                   (registered_channel.registered_data_id, "hasRegisteredData", "Registered Data")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_registered_channel(registered_channel_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=registered_channel_id, end_node=end_node, name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if registered_channel.channel_id is not None and \
-                type(self.channel_service.get_channel(registered_channel.channel_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=registered_channel_id,
-                                                        end_node=registered_channel.channel_id,
-                                                        name="hasChannel")
-        if registered_channel.registered_data_id is not None and \
-                type(self.registered_data_service.get_registered_data(registered_channel.registered_data_id)) \
-                is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=registered_channel_id,
-                                                        end_node=registered_channel.registered_data_id,
-                                                        name="hasRegisteredData")
-
-        return self.get_registered_channel(registered_channel_id)
+        return await self.get_registered_channel(registered_channel_id)
@@ -49,9 +49,11 @@ class RegisteredDataNodesOut(BaseModel):
 
     Attributes:
     registered_data_nodes (List[BasicRegisteredDataOut]): Registered Data nodes from database
+    next_after (Optional[int]): Id after which next page starts, None when there is no next page
     errors (Optional[Any]): Optional errors appeared during query executions
     links (Optional[list]): List of links available from api
     """
     registered_data_nodes: List[BasicRegisteredDataOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
@@ -1,9 +1,13 @@
-from typing import Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import Response
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from registered_data.registered_data_model import RegisteredDataIn, RegisteredDataOut, BasicRegisteredDataOut, \
     RegisteredDataNodesOut
 from registered_data.registered_data_service import RegisteredDataService
@@ -27,7 +31,7 @@ class RegisteredDataRouter:
         """
         Create registered data in database
         """
-        create_response = self.registered_data_service.save_registered_data(registered_data)
+        create_response = await self.registered_data_service.save_registered_data(registered_data)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -43,7 +47,7 @@ class RegisteredDataRouter:
         Get registered data from database
         """
 
-        get_response = self.registered_data_service.get_registered_data(registered_data_id)
+        get_response = await self.registered_data_service.get_registered_data(registered_data_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -53,15 +57,32 @@ class RegisteredDataRouter:
         return get_response
 
     @router.get("/registered_data", tags=["registered data"], response_model=RegisteredDataNodesOut)
-    async def get_registered_data_nodes(self, response: Response):
+    async def get_registered_data_nodes(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                        after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                        where: Optional[List[str]] = Query(None)):
         """
         Get registered data from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all registered data nodes starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.registered_data_service.get_registered_data_nodes, where=where)
+            registered_data_nodes = stream_ndjson(get_page, "registered_data_nodes", after)
+            return StreamingResponse(registered_data_nodes, media_type="application/x-ndjson")
 
-        get_response = self.registered_data_service.get_registered_data_nodes()
+        get_response = await self.registered_data_service.get_registered_data_nodes(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/registered_data", {"limit": limit,
+                                                                         "after": get_response.next_after,
+                                                                         "where": where or []}))
 
         return get_response
 
@@ -71,7 +92,7 @@ class RegisteredDataRouter:
         """
         Delete registered data from database
         """
-        get_response = self.registered_data_service.delete_registered_data(registered_data_id)
+        get_response = await self.registered_data_service.delete_registered_data(registered_data_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -87,7 +108,7 @@ class RegisteredDataRouter:
         """
         Update registered data model in database
         """
-        update_response = self.registered_data_service.update_registered_data(registered_data_id, registered_data)
+        update_response = await self.registered_data_service.update_registered_data(registered_data_id, registered_data)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -1,3 +1,4 @@
+from typing import List
 from graph_api_service import GraphApiService
 from registered_data.registered_data_model import RegisteredDataIn, RegisteredDataNodesOut, \
     BasicRegisteredDataOut, RegisteredDataOut
@@ -14,7 +15,7 @@ class RegisteredDataService:
     """
     graph_api_service = GraphApiService()
 
-    def save_registered_data(self, registered_data: RegisteredDataIn):
+    async def save_registered_data(self, registered_data: RegisteredDataIn):
         """
         Send request to graph api to create new registered data node
 
@@ -24,26 +25,28 @@ class RegisteredDataService:
         Returns:
             Result of request as registered data object
         """
-        node_response = self.graph_api_service.create_node("`Registered Data`")
+        node_response = await self.graph_api_service.create_subgraph("`Registered Data`", registered_data)
 
         if node_response["errors"] is not None:
             return RegisteredDataOut(**registered_data.dict(), errors=node_response["errors"])
 
-        registered_data_id = node_response["id"]
-        properties_response = self.graph_api_service.create_properties(registered_data_id, registered_data)
-        if properties_response["errors"] is not None:
-            return RegisteredDataOut(**registered_data.dict(), errors=properties_response["errors"])
+        return RegisteredDataOut(**registered_data.dict(), id=node_response["id"])
 
-        return RegisteredDataOut(**registered_data.dict(), id=registered_data_id)
-
-    def get_registered_data_nodes(self):
+    async def get_registered_data_nodes(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get registered_data_nodes
 
+        Args:
+            limit (int): Maximal number of registered data nodes, all are returned if not given
+            after (int): Id after which returned registered data nodes start
+            where (List[str]): Filters on properties of registered data nodes
+
         Returns:
             Result of request as list of registered_data_nodes objects
         """
-        get_response = self.graph_api_service.get_nodes("`Registered Data`")
+        get_response = await self.graph_api_service.get_nodes("`Registered Data`", limit, after, where)
+        if get_response["errors"] is not None:
+            return RegisteredDataNodesOut(errors=get_response["errors"])
 
         registered_data_nodes = []
 
@@ -57,9 +60,10 @@ class RegisteredDataService:
             registered_data = BasicRegisteredDataOut(**properties)
             registered_data_nodes.append(registered_data)
 
-        return RegisteredDataNodesOut(registered_data_nodes=registered_data_nodes)
+        return RegisteredDataNodesOut(registered_data_nodes=registered_data_nodes,
+                                      next_after=get_response.get("next_after"))
 
-    def get_registered_data(self, registered_data_id: int):
+    async def get_registered_data(self, registered_data_id: int):
         """
         Send request to graph api to get given registered data
 
@@ -69,12 +73,11 @@ class RegisteredDataService:
         Returns:
             Result of request as registered data object
         """
-        get_response = self.graph_api_service.get_node(registered_data_id)
+        get_response = await self.graph_api_service.get_node(registered_data_id, "Registered Data",
+                                                             include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=registered_data_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Registered Data":
-            return NotFoundByIdModel(id=registered_data_id, errors="Node not found.")
 
         registered_data = {'id': get_response['id'], 'additional_properties': [], 'relations': [],
                            'reversed_relations': []}
@@ -84,9 +87,7 @@ class RegisteredDataService:
             else:
                 registered_data['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(registered_data_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in get_response["relationships"]:
             if relation["start_node"] == registered_data_id:
                 registered_data['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                         name=relation["name"],
@@ -98,7 +99,7 @@ class RegisteredDataService:
 
         return RegisteredDataOut(**registered_data)
 
-    def delete_registered_data(self, registered_data_id: int):
+    async def delete_registered_data(self, registered_data_id: int):
         """
         Send request to graph api to delete given registered data
 
@@ -108,15 +109,15 @@ class RegisteredDataService:
         Returns:
             Result of request as registered data object
         """
-        get_response = self.get_registered_data(registered_data_id)
+        get_response = await self.get_registered_data(registered_data_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(registered_data_id)
+        await self.graph_api_service.delete_node(registered_data_id)
         return get_response
 
-    def update_registered_data(self, registered_data_id: int, registered_data: RegisteredDataIn):
+    async def update_registered_data(self, registered_data_id: int, registered_data: RegisteredDataIn):
         """
         Send request to graph api to update given registered data
 
@@ -127,13 +128,13 @@ class RegisteredDataService:
         Returns:
             Result of request as registered data object
         """
-        get_response = self.get_registered_data(registered_data_id)
+        get_response = await self.get_registered_data(registered_data_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(registered_data_id)
-        self.graph_api_service.create_properties(registered_data_id, registered_data)
+        await self.graph_api_service.delete_node_properties(registered_data_id)
+        await self.graph_api_service.create_properties(registered_data_id, registered_data)
 
         registered_data_result = {'id': registered_data_id, 'relations': get_response.relations,
                                   'reversed_relations': get_response.reversed_relations}
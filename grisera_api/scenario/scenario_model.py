@@ -1,5 +1,5 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, conlist
 from typing import Optional, Any
 from activity_execution.activity_execution_model import ActivityExecutionIn, ActivityExecutionOut
 
@@ -13,7 +13,7 @@ class ScenarioIn(BaseModel):
     experiment_id (int): Id of experiment
     """
     experiment_id: int
-    activity_executions: List[ActivityExecutionIn]
+    activity_executions: conlist(ActivityExecutionIn, min_items=1)
 
 
 class ScenarioOut(ScenarioIn):
@@ -26,7 +26,7 @@ class ScenarioRouter:
         """
         Create scenario in database
         """
-        create_response = self.scenario_service.save_scenario(scenario)
+        create_response = await self.scenario_service.save_scenario(scenario)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -35,13 +35,14 @@ class ScenarioRouter:
 
         return create_response
 
-    @router.post("/scenarios/{previous_id}", tags=["scenarios"], response_model=ActivityExecutionOut)
+    @router.post("/scenarios/{previous_id}", tags=["scenarios"],
+                 response_model=Union[ActivityExecutionOut, NotFoundByIdModel])
     async def add_activity_execution(self, previous_id: int, activity_execution: ActivityExecutionIn,
                                      response: Response):
         """
         Add new activity execution to scenario
         """
-        create_response = self.scenario_service.add_activity_execution(previous_id, activity_execution)
+        create_response = await self.scenario_service.add_activity_execution(previous_id, activity_execution)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -55,7 +56,7 @@ class ScenarioRouter:
         """
         Change order of one activity execution in scenario
         """
-        put_response = self.scenario_service.change_order(order_change)
+        put_response = await self.scenario_service.change_order(order_change)
         if put_response.errors is not None:
             response.status_code = 422
 
@@ -69,7 +70,7 @@ class ScenarioRouter:
         """
         Delete activity execution from scenario
         """
-        delete_response = self.scenario_service.delete_activity_execution(activity_execution_id)
+        delete_response = await self.scenario_service.delete_activity_execution(activity_execution_id)
         if delete_response.errors is not None:
             response.status_code = 404
 
@@ -83,7 +84,7 @@ class ScenarioRouter:
         """
         Get scenario from database
         """
-        get_response = self.scenario_service.get_scenario(node_id)
+        get_response = await self.scenario_service.get_scenario(node_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -1,8 +1,7 @@
-from graph_api_service import GraphApiService
+from graph_api_service import GraphApiService, TransactionError
 from scenario.scenario_model import ScenarioIn, ScenarioOut, OrderChangeIn, OrderChangeOut
 from activity_execution.activity_execution_service import ActivityExecutionService
 from activity_execution.activity_execution_model import ActivityExecutionOut, PropertyIn, ActivityExecutionIn
-from experiment.experiment_service import ExperimentService
 from models.not_found_model import NotFoundByIdModel
 from models.relation_information_model import RelationInformation
 
@@ -14,34 +13,112 @@ class ScenarioService:
     Attributes:
     graph_api_service (GraphApiService): Service used to communicate with Graph API
     activity_execution_service (ActivityExecutionService): Service used to communicate with ActivityExecution
-    experiment_service (ExperimentService): Service used to communicate with Experiment
+    position_key (str): Key of property with position of activity execution in its scenario
     """
     graph_api_service = GraphApiService()
     activity_execution_service = ActivityExecutionService()
-    experiment_service = ExperimentService()
+    position_key = "scenario_position"
 
-    def save_scenario(self, scenario: ScenarioIn):
+    async def save_scenario(self, scenario: ScenarioIn):
         """
         Send request to graph api to create new scenario
 
+        Activity executions with their relationships, hasScenario relationship from experiment and
+        nextActivityExecution relationships between them are created in one request and one transaction
+
         Args:
             scenario (ScenarioIn): Scenario to be added
 
         Returns:
             Result of request as scenario object
         """
-        activity_executions = [
-            self.activity_execution_service.save_activity_execution(activity_execution=activity_execution) for
-            activity_execution in scenario.activity_executions]
-        self.graph_api_service.create_relationships(scenario.experiment_id, activity_executions[0].id,
-                                                    'hasScenario')
-        [self.graph_api_service.create_relationships(activity_executions[index - 1].id, activity_executions[index].id,
-                                                     'nextActivityExecution')
-         for index in range(1, len(activity_executions))]
+        subgraphs = [self.activity_execution_service.prepare_subgraph(
+            self.prepare_positioned(activity_execution, float(index + 1)))
+            for index, activity_execution in enumerate(scenario.activity_executions)]
+        create_response = await self.graph_api_service.create_chain(scenario.experiment_id, "hasScenario",
+                                                                    "nextActivityExecution", "`Activity Execution`",
+                                                                    subgraphs)
+
+        if create_response["errors"] is not None:
+            return ScenarioOut(experiment_id=scenario.experiment_id, activity_executions=[],
+                               errors=create_response["errors"])
+
+        activity_executions = [self.activity_execution_service.prepare_activity_execution(node, node["relationships"])
+                               for node in create_response["nodes"]]
 
         return ScenarioOut(experiment_id=scenario.experiment_id, activity_executions=activity_executions)
 
-    def add_activity_execution(self, previous_id: int, activity_execution: ActivityExecutionIn):
+    def prepare_positioned(self, activity_execution: ActivityExecutionIn, position: float):
+        """
+        Add position in scenario to properties of activity execution, property is not validated, as PropertyIn
+        would convert position to string and it must be saved as number to be compared with other positions
+
+        Args:
+            activity_execution (ActivityExecutionIn): ActivityExecution to be added to scenario
+            position (float): Position of activity execution in scenario
+
+        Returns:
+            Activity execution with position property
+        """
+        additional_properties = [property for property in activity_execution.additional_properties or []
+                                 if property.key != self.position_key]
+        additional_properties.append(PropertyIn.construct(key=self.position_key, value=float(position)))
+        return activity_execution.copy(update={"additional_properties": additional_properties})
+
+    def get_position(self, node: dict):
+        """
+        Get position in scenario of node returned by graph api
+
+        Positions are ordinals which grow along scenario, so order of two activity executions is known by
+        comparing them. There are gaps between them, so new activity execution gets position in the middle of
+        gap and the others are not renumbered.
+
+        Args:
+            node (dict): Node of activity execution or experiment with its labels and properties
+
+        Returns:
+            Position of activity execution as number, also when it was saved as string, 0 for experiment which
+            starts scenario, None when it is not saved
+        """
+        if "Experiment" in node["labels"]:
+            return 0.0
+        position = next((property["value"] for property in node["properties"] if property["key"] == self.position_key),
+                        None)
+        return float(position) if position is not None else None
+
+    async def set_positions(self, positions: dict):
+        """
+        Send request to graph api to save positions of activity executions in scenario, all positions are saved
+        by one request
+
+        Args:
+            positions (dict): Positions by ids of activity executions
+        """
+        if positions:
+            await self.graph_api_service.set_nodes_properties({node_id: {self.position_key: position}
+                                                               for node_id, position in positions.items()})
+
+    async def renumber_scenario(self, node_id: int):
+        """
+        Send request to graph api to save positions of all activity executions of scenario in their order, used
+        when position of activity execution is missing or there is no gap left between positions. It is run in
+        transaction of the change which needs new positions, TransactionError is raised when chain is not found.
+
+        Args:
+            node_id (int): Id of experiment or activity execution which is included in scenario
+
+        Returns:
+            Positions by ids of activity executions
+        """
+        chain = await self.graph_api_service.get_node_chain(node_id, "hasScenario", "nextActivityExecution")
+        if chain["errors"] is not None:
+            raise TransactionError(chain["errors"])
+        positions = {node["id"]: float(index + 1) for index, node in enumerate(chain["nodes"])}
+        await self.set_positions(positions)
+
+        return positions
+
+    async def add_activity_execution(self, previous_id: int, activity_execution: ActivityExecutionIn):
         """
         Send request to graph api to add activity_execution to scenario
 
@@ -52,30 +129,75 @@ class ScenarioService:
         Returns:
             Result of request as activity_execution object
         """
-        relationships = self.graph_api_service.get_node_relationships(previous_id)['relationships']
-        activity_execution_result = self.activity_execution_service.save_activity_execution(activity_execution)
-
-        if previous_id in [relation['start_node'] for relation in relationships if
-                           relation['name'] == 'hasScenario']:
-            self.graph_api_service.create_relationships(previous_id, activity_execution_result.id,
-                                                        'hasScenario')
-        else:
-            self.graph_api_service.create_relationships(previous_id, activity_execution_result.id,
-                                                        'nextActivityExecution')
+        neighbourhood = await self.graph_api_service.get_node_neighbourhood(
+            previous_id, 1, ['hasScenario', 'nextActivityExecution'])
+        if neighbourhood.get('errors') is not None:
+            return NotFoundByIdModel(id=previous_id, errors=neighbourhood['errors'])
+        nodes = {node['id']: node for node in neighbourhood['nodes']}
+        if previous_id not in nodes:
+            return NotFoundByIdModel(id=previous_id, errors="Node not found")
+        relationships = [relation for relation in neighbourhood['relationships']
+                         if relation['start_node'] == previous_id]
+        next_id, relation_id = (relationships[0]['end_node'], relationships[0]['id']) if relationships \
+            else (None, None)
+
+        previous_position = self.get_position(nodes[previous_id])
+        next_position = self.get_position(nodes[next_id]) if next_id is not None else None
+        position = self.prepare_position(previous_position, next_position, next_id is not None)
 
         try:
-            next_id, relation_id = [(relation['end_node'], relation['id']) for relation in relationships
-                                    if relation['name'] in ['hasScenario', 'nextActivityExecution']
-                                    and relation['start_node'] == previous_id][0]
-        except IndexError:
-            return activity_execution_result
-
-        self.graph_api_service.create_relationships(activity_execution_result.id, next_id, 'nextActivityExecution')
-        self.graph_api_service.delete_relationship(relation_id)
+            async with self.graph_api_service.transaction():
+                if position is None:
+                    positions = await self.renumber_scenario(previous_id)
+                    position = self.prepare_position(positions.get(previous_id, 0), positions.get(next_id),
+                                                     next_id is not None)
+
+                activity_execution_result = await self.activity_execution_service.save_activity_execution(
+                    self.prepare_positioned(activity_execution, position))
+
+                if previous_id in [relation['start_node'] for relation in relationships if
+                                   relation['name'] == 'hasScenario']:
+                    await self.graph_api_service.create_relationships(previous_id, activity_execution_result.id,
+                                                                      'hasScenario')
+                else:
+                    await self.graph_api_service.create_relationships(previous_id, activity_execution_result.id,
+                                                                      'nextActivityExecution')
+
+                if next_id is None:
+                    return activity_execution_result
+
+                await self.graph_api_service.create_relationships(activity_execution_result.id, next_id,
+                                                                  'nextActivityExecution')
+                await self.graph_api_service.delete_relationship(relation_id)
+        except TransactionError as error:
+            return ActivityExecutionOut(errors=error.errors)
 
         return activity_execution_result
 
-    def change_order_middle_with_last(self, middle_id, last_id, middle_relationships, last_relationships):
+    def prepare_position(self, previous_position, next_position, has_next: bool):
+        """
+        Compute position of activity execution added after previous one, in the middle of gap when there is
+        next one
+
+        Args:
+            previous_position (float): Position of previous activity execution
+            next_position (float): Position of next activity execution
+            has_next (bool): Whether there is activity execution after the added one
+
+        Returns:
+            Position of added activity execution, None when positions are missing or there is no gap left
+        """
+        if previous_position is None:
+            return None
+        if not has_next:
+            return previous_position + 1
+        if next_position is None:
+            return None
+
+        position = (previous_position + next_position) / 2
+        return position if previous_position < position < next_position else None
+
+    async def change_order_middle_with_last(self, middle_id, last_id, middle_relationships, last_relationships):
         """
             Changes order of the middle node and the last node
 
@@ -90,7 +212,7 @@ class ScenarioService:
             middle_relationships[0]['start_node'], last_id,
             middle_relationships[0]['name']
         )
-        self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+        await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         if middle_relationships[1] == last_relationships[0]:
             # nodes are next to each other
@@ -98,7 +220,7 @@ class ScenarioService:
                 last_id, middle_relationships[1]['start_node'],
                 middle_relationships[1]['name']
             )
-            self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+            await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
             return
 
@@ -107,18 +229,18 @@ class ScenarioService:
             last_id, middle_relationships[1]['end_node'],
             middle_relationships[1]['name']
         )
-        self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+        await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         start_node, end_node, relation_name = (
             last_relationships[0]['start_node'], middle_id,
             last_relationships[0]['name']
         )
         if start_node != end_node:
-            self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+            await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         return
 
-    def change_order_middle_with_middle(self, middle_id, last_id, middle_relationships, last_relationships):
+    async def change_order_middle_with_middle(self, middle_id, last_id, middle_relationships, last_relationships):
         """
             Changes order of the two middle nodes
 
@@ -133,7 +255,7 @@ class ScenarioService:
             middle_relationships[0]['start_node'], last_id,
             middle_relationships[0]['name']
         )
-        self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+        await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         if middle_relationships[1] == last_relationships[0]:
             # nodes are next to each other
@@ -141,13 +263,13 @@ class ScenarioService:
                 last_id, middle_id,
                 middle_relationships[1]['name']
             )
-            self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+            await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
             start_node, end_node, relation_name = (
                 middle_id, last_relationships[1]['end_node'],
                 last_relationships[1]['name']
             )
-            self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+            await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
             return
 
@@ -155,57 +277,35 @@ class ScenarioService:
             last_id, middle_relationships[1]['end_node'],
             middle_relationships[1]['name']
         )
-        self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+        await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         start_node, end_node, relation_name = (
             last_relationships[0]['start_node'], middle_id,
             last_relationships[0]['name']
         )
         if start_node != end_node:
-            self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+            await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         start_node, end_node, relation_name = (
             middle_id, last_relationships[1]['end_node'],
             last_relationships[1]['name']
         )
-        self.graph_api_service.create_relationships(start_node, end_node, relation_name)
+        await self.graph_api_service.create_relationships(start_node, end_node, relation_name)
 
         return
 
-    def what_order(self, previous_relationships, activity_execution_relationships):
+    def what_order(self, previous_position, activity_execution_position):
         """
             Finds which node is in which order (starting from experiment) in the scenario
 
             Args:
-                previous_relationships: Relationships of the previous node
-                activity_execution_relationships: Relationships of the activity execution node
+                previous_position: Position of the previous node in scenario
+                activity_execution_position: Position of the activity execution node in scenario
             Returns:
                 True when is the first in order
                 False when is the second in order
         """
-        p_relationships = previous_relationships
-        p_count = False
-        a_relationships = activity_execution_relationships
-        a_count = False
-        while True:
-            if p_relationships[0]['name'] is not None and p_relationships[0]['name'] in ['hasScenario']:
-                p_count = True
-                break
-            if a_relationships[0]['name'] is not None and a_relationships[0]['name'] in ['hasScenario']:
-                a_count = True
-                break
-            p_id = p_relationships[0]['start_node']
-            p_relationships = self.graph_api_service.get_node_relationships(p_id)['relationships']
-            p_relationships = [relation for relation in p_relationships
-                               if relation['name'] in ['nextActivityExecution', 'hasScenario']
-                               and relation['end_node'] == p_id]
-            a_id = a_relationships[0]['start_node']
-            a_relationships = self.graph_api_service.get_node_relationships(a_id)['relationships']
-            a_relationships = [relation for relation in a_relationships
-                               if relation['name'] in ['nextActivityExecution', 'hasScenario']
-                               and relation['end_node'] == a_id]
-
-        return p_count, a_count
+        return previous_position < activity_execution_position, activity_execution_position < previous_position
 
     def swap_order_in_relationships_array(self, relationships, node_id):
         """
@@ -221,76 +321,101 @@ class ScenarioService:
 
         return relationships
 
-    def change_order(self, order_change: OrderChangeIn):
+    async def change_order(self, order_change: OrderChangeIn):
         """
         Send request to graph api to change order in scenario
 
+        Order of nodes is found by comparing their positions, then relationships and positions are rewritten in
+        one transaction
+
         Args:
             order_change (OrderChangeIn): Ids of activity_executions to change order by
 
         Returns:
             Result of request as changed order ids
         """
+        previous = await self.graph_api_service.get_node(order_change.previous_id, include_relationships=True)
+        activity_execution = await self.graph_api_service.get_node(order_change.activity_execution_id,
+                                                                   include_relationships=True)
+        for node in [previous, activity_execution]:
+            if node["errors"] is not None:
+                return OrderChangeOut(**order_change.dict(), errors=node["errors"])
+
         # save all relationships in lists
-        previous_relationships = self.graph_api_service.get_node_relationships(order_change.previous_id)[
-            'relationships']
-        activity_execution_relationships = \
-            self.graph_api_service.get_node_relationships(order_change.activity_execution_id)['relationships']
-
-        # check which node is before the other
-        previous_first, activity_execution_first = self.what_order(previous_relationships,
-                                                                   activity_execution_relationships)
-
-        # delete nextActivityExecution and hasScenario relationships 
-        [self.graph_api_service.delete_relationship(relation['id']) for relation in previous_relationships
-         if relation['name'] in ['nextActivityExecution', 'hasScenario']]
-        [self.graph_api_service.delete_relationship(relation['id']) for relation in activity_execution_relationships
-         if relation['name'] in ['nextActivityExecution', 'hasScenario']]
-
-        # save nextActivityExecution and hasScenario relationships 
-        previous_relationships = [relation for relation in previous_relationships
-                                  if relation['name'] in ['nextActivityExecution', 'hasScenario']]
-        activity_execution_relationships = [relation for relation in activity_execution_relationships
-                                            if relation['name'] in ['nextActivityExecution', 'hasScenario']]
-
-        # swap order of relationships if needed
-        previous_relationships = self.swap_order_in_relationships_array(previous_relationships,
-                                                                        order_change.previous_id)
-        activity_execution_relationships = self.swap_order_in_relationships_array(activity_execution_relationships,
-                                                                                  order_change.activity_execution_id)
-
-        if len(activity_execution_relationships) == 1:
-            # change order when activity execution node is last
-            self.change_order_middle_with_last(middle_id=order_change.previous_id,
-                                               last_id=order_change.activity_execution_id,
-                                               middle_relationships=previous_relationships,
-                                               last_relationships=activity_execution_relationships)
-
-        elif len(previous_relationships) == 1:
-            # change order when previous node is last
-            self.change_order_middle_with_last(middle_id=order_change.activity_execution_id,
-                                               last_id=order_change.previous_id,
-                                               middle_relationships=activity_execution_relationships,
-                                               last_relationships=previous_relationships)
-
-        elif len(previous_relationships) == 2 and len(activity_execution_relationships) == 2:
-            if previous_first is True:
-                # change order when previous node is before activity execution node
-                self.change_order_middle_with_middle(middle_id=order_change.previous_id,
-                                                     last_id=order_change.activity_execution_id,
-                                                     middle_relationships=previous_relationships,
-                                                     last_relationships=activity_execution_relationships)
-            elif activity_execution_first is True:
-                # change order when activity execution node is before previous node
-                self.change_order_middle_with_middle(middle_id=order_change.activity_execution_id,
-                                                     last_id=order_change.previous_id,
-                                                     middle_relationships=activity_execution_relationships,
-                                                     last_relationships=previous_relationships)
+        previous_relationships = previous['relationships']
+        activity_execution_relationships = activity_execution['relationships']
+
+        try:
+            async with self.graph_api_service.transaction():
+                # check which node is before the other
+                previous_position, activity_execution_position = self.get_position(previous), \
+                    self.get_position(activity_execution)
+                if previous_position is None or activity_execution_position is None:
+                    positions = await self.renumber_scenario(order_change.activity_execution_id)
+                    previous_position = positions.get(order_change.previous_id, 0)
+                    activity_execution_position = positions.get(order_change.activity_execution_id, 0)
+                previous_first, activity_execution_first = self.what_order(previous_position,
+                                                                           activity_execution_position)
+
+                # delete nextActivityExecution and hasScenario relationships 
+                [await self.graph_api_service.delete_relationship(relation['id']) for relation in previous_relationships
+                 if relation['name'] in ['nextActivityExecution', 'hasScenario']]
+                [await self.graph_api_service.delete_relationship(relation['id'])
+                 for relation in activity_execution_relationships
+                 if relation['name'] in ['nextActivityExecution', 'hasScenario']]
+
+                # save nextActivityExecution and hasScenario relationships 
+                previous_relationships = [relation for relation in previous_relationships
+                                          if relation['name'] in ['nextActivityExecution', 'hasScenario']]
+                activity_execution_relationships = [relation for relation in activity_execution_relationships
+                                                    if relation['name'] in ['nextActivityExecution', 'hasScenario']]
+
+                # swap order of relationships if needed
+                previous_relationships = self.swap_order_in_relationships_array(previous_relationships,
+                                                                                order_change.previous_id)
+                activity_execution_relationships = self.swap_order_in_relationships_array(
+                    activity_execution_relationships, order_change.activity_execution_id)
+
+                if len(activity_execution_relationships) == 1:
+                    # change order when activity execution node is last
+                    await self.change_order_middle_with_last(middle_id=order_change.previous_id,
+                                                             last_id=order_change.activity_execution_id,
+                                                             middle_relationships=previous_relationships,
+                                                             last_relationships=activity_execution_relationships)
+
+                elif len(previous_relationships) == 1:
+                    # change order when previous node is last
+                    await self.change_order_middle_with_last(middle_id=order_change.activity_execution_id,
+                                                             last_id=order_change.previous_id,
+                                                             middle_relationships=activity_execution_relationships,
+                                                             last_relationships=previous_relationships)
+
+                elif len(previous_relationships) == 2 and len(activity_execution_relationships) == 2:
+                    if previous_first is True:
+                        # change order when previous node is before activity execution node
+                        await self.change_order_middle_with_middle(middle_id=order_change.previous_id,
+                                                                   last_id=order_change.activity_execution_id,
+                                                                   middle_relationships=previous_relationships,
+                                                                   last_relationships=activity_execution_relationships)
+                    elif activity_execution_first is True:
+                        # change order when activity execution node is before previous node
+                        await self.change_order_middle_with_middle(
+                            middle_id=order_change.activity_execution_id, last_id=order_change.previous_id,
+                            middle_relationships=activity_execution_relationships,
+                            last_relationships=previous_relationships)
+
+                # positions follow nodes which changed their places
+                await self.set_positions({node['id']: position for node, position in
+                                          [(previous, activity_execution_position),
+                                           (activity_execution, previous_position)]
+                                          if "Experiment" not in node['labels']})
+        except TransactionError as error:
+            return OrderChangeOut(**order_change.dict(), errors=error.errors)
 
         return OrderChangeOut(previous_id=order_change.previous_id,
                               activity_execution_id=order_change.activity_execution_id)
 
-    def delete_activity_execution(self, activity_execution_id: int):
+    async def delete_activity_execution(self, activity_execution_id: int):
         """
         Send request to graph api to delete activity_execution from scenario
 
@@ -300,11 +425,12 @@ class ScenarioService:
         Returns:
             Result of request as activity_execution object
         """
-        relationships = self.graph_api_service.get_node_relationships(activity_execution_id)['relationships']
+        relationships = (await self.graph_api_service.get_node_relationships(
+            activity_execution_id, ['hasScenario', 'nextActivityExecution']))['relationships']
         if len(relationships) == 0:
             return ActivityExecutionOut(errors='Relationships not found')
 
-        activity_execution = self.graph_api_service.delete_node(activity_execution_id)
+        activity_execution = await self.graph_api_service.delete_node(activity_execution_id)
 
         properties = {p['key']: p['value'] for p in activity_execution['properties']}
         additional_properties = [PropertyIn(key=key, value=value) for key, value in properties.items()
@@ -322,147 +448,32 @@ class ScenarioService:
         end_node = [relationship['end_node'] for relationship in relationships
                     if relationship['start_node'] == activity_execution_id
                     and relationship['name'] == 'nextActivityExecution'][0]
-        self.graph_api_service.create_relationships(start_node, end_node, relationships[0]['name'])
+        await self.graph_api_service.create_relationships(start_node, end_node, relationships[0]['name'])
 
         return activity_execution_response
 
-    def get_scenario(self, node_id: int):
+    async def get_scenario(self, node_id: int):
         """
         Send request to graph api to get activity executions and experiment from scenario
 
+        Activity executions are acquired in their order from graph api in one request, starting at experiment
+        by hasScenario relationship and following nextActivityExecution relationships
+
         Args:
             node_id (int): Id of experiment or activity execution which is included in scenario
 
         Returns:
             Result of request as Scenario object
         """
-        get_response = self.graph_api_service.get_node(node_id)
+        get_response = await self.graph_api_service.get_node_chain(node_id, "hasScenario", "nextActivityExecution",
+                                                                   include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=node_id, errors=get_response["errors"])
-        if get_response["labels"][0] not in ["Activity Execution", "Experiment"]:
+        if "Experiment" not in get_response["root"]["labels"]:
             return NotFoundByIdModel(id=node_id, errors="Node not found.")
 
-        if get_response["labels"][0] == "Activity Execution":
-            return self.get_scenario_by_activity_execution(node_id)
-        elif get_response["labels"][0] == "Experiment":
-            return self.get_scenario_by_experiment(node_id)
-
-    def get_scenario_by_experiment(self, experiment_id: int):
-        """
-        Send request to graph api to get activity_executions from scenario which starts in experiment
-
-        Args:
-            experiment_id (int): Id of experiment where scenario starts
-
-        Returns:
-            Result of request as Scenario object
-        """
-        activity_executions = []
-
-        experiment = self.experiment_service.get_experiment(experiment_id)
-        if type(experiment) is NotFoundByIdModel:
-            return experiment
-
-        scenario = {'experiment_id': experiment_id, 'activity_executions': []}
-
-        for relation in experiment.relations:
-            if relation.name == "hasScenario":
-                self.get_scenario_after_activity_execution(relation.second_node_id, activity_executions)
-
-        [scenario['activity_executions'].append(a) for a in activity_executions if a not in scenario['activity_executions']]
-
-        return ScenarioOut(**scenario)
-
-    def get_scenario_by_activity_execution(self, activity_execution_id: int):
-        """
-        Send request to graph api to get activity_executions from scenario which has activity execution id incuded
-
-        Args:
-            activity_execution_id (int): Id of activity execution included in scenario
-
-        Returns:
-            Result of request as Scenario object
-        """
-        activity_executions = []
-        activity_executions_before = []
-
-        activity_execution = self.activity_execution_service.get_activity_execution(activity_execution_id)
-        if type(activity_execution) is NotFoundByIdModel:
-            return activity_execution
-
-        experiment_id = self.get_scenario_before_activity_execution(activity_execution_id, activity_executions_before)
-        [activity_executions.append(a) for a in activity_executions_before if a not in activity_executions]
-
-        activity_executions_after = []
-
-        self.get_scenario_after_activity_execution(activity_execution_id, activity_executions_after)
-        [activity_executions.append(a) for a in activity_executions_after if a not in activity_executions]
-
-        scenario = {'experiment_id': experiment_id,
-                    'activity_executions': []}
-
-        [scenario['activity_executions'].append(a) for a in activity_executions]
-
-        return ScenarioOut(**scenario)
-
-    def get_scenario_after_activity_execution(self, activity_execution_id: int, activity_executions: []):
-        """
-        Gets activity executions from scenario which are saved after activity_execution_id
-
-        Args:
-            activity_execution_id (int): Id of activity execution included in scenario
-            activity_executions: List of activity executions in scenario
-        """
-        activity_execution = self.activity_execution_service.get_activity_execution(activity_execution_id)
-
-        if type(activity_execution) is NotFoundByIdModel:
-            return activity_execution
-
-        activity_executions.append(activity_execution)
-
-        for relation in activity_execution.relations:
-            if relation.name == "nextActivityExecution":
-                activity_execution = self.activity_execution_service.get_activity_execution(relation.second_node_id)
-
-                if type(activity_execution) is NotFoundByIdModel:
-                    return activity_execution
-
-                activity_executions.append(activity_execution)
-                [self.get_scenario_after_activity_execution(activity_execution.id, activity_executions)
-                 for r in activity_execution.relations if r.name == "nextActivityExecution"]
-
-    def get_scenario_before_activity_execution(self, activity_execution_id: int, activity_executions: []):
-        """
-        Gets activity executions from scenario which are saved before activity_execution_id
-
-        Args:
-            activity_execution_id (int): Id of activity execution included in scenario
-            activity_executions: List of activity executions in scenario
-        """
-        activity_execution = self.activity_execution_service.get_activity_execution(activity_execution_id)
-        if type(activity_execution) is NotFoundByIdModel:
-            return activity_execution
-
-        activity_executions.append(activity_execution)
-
-        for relation in activity_execution.reversed_relations:
-
-            if relation.name == "nextActivityExecution":
-                activity_execution = self.activity_execution_service.get_activity_execution(relation.second_node_id)
-                if type(activity_execution) is NotFoundByIdModel:
-                    return activity_execution
-
-                activity_executions.append(activity_execution)
-                return self.get_scenario_before_activity_execution(activity_execution.id, activity_executions)
-
-            elif relation.name == "hasScenario":
-                experiment = self.experiment_service.get_experiment(relation.second_node_id)
-                if type(experiment) is NotFoundByIdModel:
-                    return experiment
-
-                return experiment.id
-
-
-
+        activity_executions = [self.activity_execution_service.prepare_activity_execution(node, node["relationships"])
+                               for node in get_response["nodes"]]
 
+        return ScenarioOut(experiment_id=get_response["root"]["id"], activity_executions=activity_executions)
@@ -0,0 +1,44 @@
+import orjson
+from enum import Enum
+from graph_api_config import stream_page_size
+
+
+class ResponseFormat(str, Enum):
+    """
+    Formats in which listings can be returned
+
+    Attributes:
+        json (str): Whole listing in one JSON document
+        ndjson (str): Streamed listing with one JSON document per line
+    """
+    json = "json"
+    ndjson = "ndjson"
+
+
+async def stream_ndjson(get_page, items_name, after=None, page_size=stream_page_size):
+    """
+    Serialize all items of listing to lines of NDJSON, acquiring them page by page, so only one page of items
+    is held in memory at once. When page could not be acquired, its errors are sent as last line
+
+    Args:
+        get_page (Callable): Coroutine function returning page of listing for given limit and id after which page
+            starts
+        items_name (str): Name of attribute of page with its items
+        after (int): Id after which streamed items start
+        page_size (int): Number of items acquired at once
+
+    Returns:
+        Asynchronous generator of lines
+    """
+    while True:
+        page = await get_page(page_size, after)
+        if page.errors is not None:
+            yield orjson.dumps({"errors": page.errors}).decode() + "\n"
+            return
+
+        for item in getattr(page, items_name):
+            yield item.json() + "\n"
+
+        if page.next_after is None:
+            return
+        after = page.next_after
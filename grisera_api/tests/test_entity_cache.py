@@ -0,0 +1,96 @@
+import unittest
+import unittest.mock as mock
+
+from entity_cache import EntityCache
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def setUp(self):
+        self.node = {'id': 1, 'labels': ['Participant'], 'properties': [], 'errors': None, 'links': None,
+                     'relationships': [{'start_node': 2, 'end_node': 1, 'name': 'hasParticipant', 'id': 7}]}
+
+    def test_get_after_put(self):
+        entity_cache = EntityCache(10, 30)
+
+        missing = entity_cache.get((1, 'Participant'))
+        entity_cache.put((1, 'Participant'), self.node, entity_cache.version)
+        result = entity_cache.get((1, 'Participant'))
+
+        self.assertIsNone(missing)
+        self.assertEqual(result, self.node)
+        self.assertEqual(entity_cache.stats(), {'size': 1, 'max_size': 10, 'ttl': 30, 'hits': 1, 'misses': 1,
+                                                'invalidations': 0})
+
+    def test_get_copy(self):
+        entity_cache = EntityCache(10, 30)
+        entity_cache.put((1, 'Participant'), self.node, entity_cache.version)
+        self.node['properties'].append({'key': 'age', 'value': 5})
+
+        result = entity_cache.get((1, 'Participant'))
+        result['relationships'].clear()
+
+        self.assertEqual(result['properties'], [])
+        self.assertEqual(len(entity_cache.get((1, 'Participant'))['relationships']), 1)
+
+    def test_put_evicts_least_recently_used(self):
+        entity_cache = EntityCache(2, 30)
+        for node_id in [1, 2]:
+            entity_cache.put((node_id, 'Participant'), {'id': node_id}, entity_cache.version)
+        entity_cache.get((1, 'Participant'))
+
+        entity_cache.put((3, 'Participant'), {'id': 3}, entity_cache.version)
+
+        self.assertIsNotNone(entity_cache.get((1, 'Participant')))
+        self.assertIsNone(entity_cache.get((2, 'Participant')))
+        self.assertIsNotNone(entity_cache.get((3, 'Participant')))
+
+    @mock.patch('entity_cache.time.monotonic')
+    def test_get_expired(self, monotonic_mock):
+        entity_cache = EntityCache(10, 30)
+        monotonic_mock.return_value = 100
+        entity_cache.put((1, 'Participant'), self.node, entity_cache.version)
+        monotonic_mock.return_value = 131
+
+        result = entity_cache.get((1, 'Participant'))
+
+        self.assertIsNone(result)
+        self.assertEqual(entity_cache.stats()['size'], 0)
+
+    def test_put_after_invalidation(self):
+        entity_cache = EntityCache(10, 30)
+        version = entity_cache.version
+        entity_cache.invalidate([5])
+
+        entity_cache.put((1, 'Participant'), self.node, version)
+
+        self.assertIsNone(entity_cache.get((1, 'Participant')))
+
+    def test_put_disabled(self):
+        entity_cache = EntityCache(0, 30)
+
+        entity_cache.put((1, 'Participant'), self.node, entity_cache.version)
+
+        self.assertIsNone(entity_cache.get((1, 'Participant')))
+        self.assertEqual(entity_cache.stats()['misses'], 0)
+
+    def test_invalidate_neighbour(self):
+        entity_cache = EntityCache(10, 30)
+        entity_cache.put((1, 'Participant'), self.node, entity_cache.version)
+        entity_cache.put((3, 'Participant'), {'id': 3, 'relationships': []}, entity_cache.version)
+
+        entity_cache.invalidate([2])
+
+        self.assertIsNone(entity_cache.get((1, 'Participant')))
+        self.assertIsNotNone(entity_cache.get((3, 'Participant')))
+        self.assertEqual(entity_cache.stats()['invalidations'], 1)
+
+    def test_invalidate_relationship(self):
+        entity_cache = EntityCache(10, 30)
+        entity_cache.put((1, 'Participant'), self.node, entity_cache.version)
+
+        entity_cache.invalidate(relationship_ids=[7])
+
+        self.assertIsNone(entity_cache.get((1, 'Participant')))
+        self.assertEqual(entity_cache._keys_by_node, {})
+        self.assertEqual(entity_cache._keys_by_relationship, {})
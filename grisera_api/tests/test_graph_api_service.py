@@ -1,10 +1,11 @@
-import json
+import asyncio
 import unittest
 import unittest.mock as mock
 
 from activity_execution.activity_execution_model import ActivityExecutionIn
-from graph_api_service import GraphApiService
-from requests import Response
+from entity_cache import EntityCache
+from graph_api_service import GraphApiService, TransactionError
+from httpx import Response
 
 
 class DatabaseServiceTestCase(unittest.TestCase):
@@ -12,81 +13,400 @@ class DatabaseServiceTestCase(unittest.TestCase):
     def setUp(self):
         self.graph_api_service = GraphApiService()
         self.response_content = {'id': 1, 'errors': [], 'links': {}}
-        self.response = Response()
-        self.response._content = json.dumps(self.response_content).encode('utf-8')
+        self.response = Response(200, json=self.response_content)
 
-    @mock.patch('graph_api_service.requests')
-    def test_post(self, requests_mock):
-        requests_mock.post.return_value = self.response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_post(self, get_client_mock):
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=self.response)
         url_part = '/nodes'
         node = {}
 
-        result = self.graph_api_service.post(url_part, node)
+        result = asyncio.run(self.graph_api_service.post(url_part, node))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.post.assert_called_with(url=self.graph_api_service.graph_api_url + url_part,
-                                              json=node)
+        get_client_mock.return_value.post.assert_called_with(url=url_part, json=node, headers={})
 
-    @mock.patch('graph_api_service.requests')
-    def test_get(self, requests_mock):
-        requests_mock.get.return_value = self.response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_get(self, get_client_mock):
+        get_client_mock.return_value.get = mock.AsyncMock(return_value=self.response)
         url_part = '/nodes'
         params = {'label': 'Test'}
 
-        result = self.graph_api_service.get(url_part, params)
+        result = asyncio.run(self.graph_api_service.get(url_part, params))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.get.assert_called_with(url=self.graph_api_service.graph_api_url + url_part,
-                                             params=params)
+        get_client_mock.return_value.get.assert_called_with(url=url_part, params=params, headers={})
 
-    @mock.patch('graph_api_service.requests')
-    def test_delete(self, requests_mock):
-        requests_mock.delete.return_value = self.response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_delete(self, get_client_mock):
+        get_client_mock.return_value.delete = mock.AsyncMock(return_value=self.response)
         url_part = '/nodes'
         params = {'label': 'Test'}
 
-        result = self.graph_api_service.delete(url_part, params)
+        result = asyncio.run(self.graph_api_service.delete(url_part, params))
 
         self.assertEqual(result, self.response_content)
-        requests_mock.delete.assert_called_with(url=self.graph_api_service.graph_api_url + url_part,
-                                             params=params)
+        get_client_mock.return_value.delete.assert_called_with(url=url_part, params=params, headers={})
+
+    @mock.patch('graph_api_service.httpx')
+    def test_get_client_is_shared(self, httpx_mock):
+        first = GraphApiService().get_client()
+        second = GraphApiService().get_client()
+
+        self.assertIs(first, second)
+        httpx_mock.AsyncClient.assert_called_once_with(base_url=self.graph_api_service.graph_api_url,
+                                                       limits=self.graph_api_service.graph_api_limits,
+                                                       timeout=self.graph_api_service.graph_api_timeout)
+        GraphApiService._client = None
+
+    def test_close(self):
+        client_mock = mock.MagicMock()
+        client_mock.aclose = mock.AsyncMock()
+        GraphApiService._client = client_mock
+
+        asyncio.run(self.graph_api_service.close())
+
+        client_mock.aclose.assert_awaited_once()
+        self.assertIsNone(GraphApiService._client)
+
+    def test_gather(self):
+        running = []
+        concurrent = []
+
+        async def request(result):
+            running.append(result)
+            concurrent.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(result)
+            return result
+
+        self.graph_api_service.fan_out = 2
+
+        result = asyncio.run(self.graph_api_service.gather(request(1), request(2), request(3)))
+
+        self.assertEqual(result, [1, 2, 3])
+        self.assertEqual(max(concurrent), 2)
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_gather_in_transaction(self, get_client_mock):
+        begin_response = Response(201, json={'id': 'tx', 'errors': None})
+        get_client_mock.return_value.post = mock.AsyncMock(side_effect=[begin_response, self.response,
+                                                                        self.response, self.response])
+
+        async def run():
+            async with self.graph_api_service.transaction():
+                return await self.graph_api_service.gather(self.graph_api_service.post('/nodes', {}),
+                                                           self.graph_api_service.post('/nodes', {}))
+
+        result = asyncio.run(run())
+
+        self.assertEqual(result, [self.response_content, self.response_content])
+        get_client_mock.return_value.post.assert_has_calls([
+            mock.call(url='/transactions'),
+            mock.call(url='/nodes', json={}, headers={'X-Transaction-Id': 'tx'}),
+            mock.call(url='/nodes', json={}, headers={'X-Transaction-Id': 'tx'}),
+            mock.call(url='/transactions/tx/commit')])
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_transaction_commit(self, get_client_mock):
+        begin_response = Response(201, json={'id': 'tx', 'errors': None})
+        get_client_mock.return_value.post = mock.AsyncMock(side_effect=[begin_response, self.response,
+                                                                        self.response, self.response])
+
+        async def run():
+            async with self.graph_api_service.transaction():
+                await self.graph_api_service.post('/nodes', {})
+                async with self.graph_api_service.transaction():
+                    await self.graph_api_service.post('/nodes', {})
+            return await self.graph_api_service.get_headers()
+
+        result = asyncio.run(run())
+
+        get_client_mock.return_value.post.assert_has_calls([
+            mock.call(url='/transactions'),
+            mock.call(url='/nodes', json={}, headers={'X-Transaction-Id': 'tx'}),
+            mock.call(url='/nodes', json={}, headers={'X-Transaction-Id': 'tx'}),
+            mock.call(url='/transactions/tx/commit')])
+        self.assertEqual(result, {})
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_transaction_rollback(self, get_client_mock):
+        begin_response = Response(201, json={'id': 'tx', 'errors': None})
+        get_client_mock.return_value.post = mock.AsyncMock(side_effect=[begin_response, self.response])
+        get_client_mock.return_value.delete = mock.AsyncMock(return_value=self.response)
+
+        async def run():
+            async with self.graph_api_service.transaction():
+                await self.graph_api_service.post('/nodes', {})
+                raise KeyError()
+
+        with self.assertRaises(KeyError):
+            asyncio.run(run())
+
+        get_client_mock.return_value.delete.assert_called_once_with(url='/transactions/tx')
+        self.assertEqual(get_client_mock.return_value.post.call_count, 2)
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_transaction_rollback_on_error_response(self, get_client_mock):
+        begin_response = Response(201, json={'id': 'tx', 'errors': None})
+        error_response = Response(422, json={'id': None, 'errors': 'Node not found'})
+        get_client_mock.return_value.post = mock.AsyncMock(side_effect=[begin_response, error_response])
+        get_client_mock.return_value.delete = mock.AsyncMock(return_value=self.response)
+
+        async def run():
+            async with self.graph_api_service.transaction():
+                await self.graph_api_service.post('/relationships', {})
+                await self.graph_api_service.post('/relationships', {})
+
+        with self.assertRaises(TransactionError) as context:
+            asyncio.run(run())
+
+        self.assertEqual(context.exception.errors, 'Node not found')
+        get_client_mock.return_value.delete.assert_called_once_with(url='/transactions/tx')
+        self.assertEqual(get_client_mock.return_value.post.call_count, 2)
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_transaction_commit_with_error(self, get_client_mock):
+        begin_response = Response(201, json={'id': 'tx', 'errors': None})
+        commit_response = Response(422, json={'id': 'tx', 'errors': 'Transaction expired'})
+        get_client_mock.return_value.post = mock.AsyncMock(side_effect=[begin_response, self.response,
+                                                                        commit_response])
+
+        async def run():
+            async with self.graph_api_service.transaction():
+                await self.graph_api_service.post('/nodes', {})
+
+        with self.assertRaises(TransactionError) as context:
+            asyncio.run(run())
+
+        self.assertEqual(context.exception.errors, 'Transaction expired')
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_transaction_begin_with_error(self, get_client_mock):
+        begin_response = Response(422, json={'id': None, 'errors': 'Database unavailable'})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=begin_response)
+
+        async def run():
+            async with self.graph_api_service.transaction():
+                await self.graph_api_service.post('/nodes', {})
+
+        with self.assertRaises(TransactionError) as context:
+            asyncio.run(run())
+
+        self.assertEqual(context.exception.errors, 'Database unavailable')
+        get_client_mock.return_value.post.assert_called_once_with(url='/transactions')
+
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_transaction_without_requests(self, get_client_mock):
+        async def run():
+            async with self.graph_api_service.transaction():
+                pass
+
+        asyncio.run(run())
+
+        get_client_mock.assert_not_called()
 
     @mock.patch.object(GraphApiService, 'post')
     def test_create_node(self, post_mock):
         post_mock.return_value = self.response_content
         label = 'Test'
 
-        result = self.graph_api_service.create_node(label)
+        result = asyncio.run(self.graph_api_service.create_node(label))
 
         self.assertEqual(result, self.response_content)
         post_mock.assert_called_with('/nodes', {"labels": [label]})
 
+    @mock.patch.object(GraphApiService, 'post')
+    def test_create_nodes(self, post_mock):
+        post_mock.return_value = self.response_content
+        node_models = [ActivityExecutionIn(activity_id=1),
+                       ActivityExecutionIn(arrangement_id=2, additional_properties=[{'key': 'test', 'value': 'test'}])]
+
+        result = asyncio.run(self.graph_api_service.create_nodes('Activity Execution', node_models))
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with('/nodes/bulk', [
+            {"labels": ['Activity Execution'], "properties": [{'key': 'activity_id', 'value': 1}]},
+            {"labels": ['Activity Execution'], "properties": [{'key': 'arrangement_id', 'value': 2},
+                                                              {'key': 'test', 'value': 'test'}]}])
+
+    @mock.patch.object(GraphApiService, 'post')
+    def test_create_chain(self, post_mock):
+        post_mock.return_value = self.response_content
+        node_model = ActivityExecutionIn(additional_properties=[{'key': 'test', 'value': 'test'}])
+
+        result = asyncio.run(self.graph_api_service.create_chain(1, "hasScenario", "nextActivityExecution",
+                                                                 "`Activity Execution`",
+                                                                 [(node_model, [(5, "hasActivity", "Activity")]),
+                                                                  (node_model, [])]))
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with("/nodes/chain", {
+            "root": 1, "head": "hasScenario", "next": "nextActivityExecution", "labels": ["`Activity Execution`"],
+            "nodes": [{"properties": [{'key': 'test', 'value': 'test'}],
+                       "relationships": [{"end_node": 5, "name": "hasActivity", "end_node_label": "Activity"}]},
+                      {"properties": [{'key': 'test', 'value': 'test'}], "relationships": []}]})
+
     @mock.patch.object(GraphApiService, 'get')
     def test_get_nodes(self, get_mock):
         get_mock.return_value = self.response_content
         label = 'Test'
 
-        result = self.graph_api_service.get_nodes(label)
+        result = asyncio.run(self.graph_api_service.get_nodes(label))
 
         self.assertEqual(result, self.response_content)
         get_mock.assert_called_with('/nodes', {"label": label})
 
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_nodes_page(self, get_mock):
+        get_mock.return_value = self.response_content
+        label = 'Test'
+
+        result = asyncio.run(self.graph_api_service.get_nodes(label, 10, 5))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes', {"label": label, "limit": 10, "after": 5})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_nodes_with_filters(self, get_mock):
+        get_mock.return_value = self.response_content
+        label = 'Test'
+
+        result = asyncio.run(self.graph_api_service.get_nodes(label, where=["name:test", "age:>=18"]))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes', {"label": label, "where": ["name:test", "age:>=18"]})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node(self, get_mock):
+        get_mock.return_value = self.response_content
+        node_id = 1
+
+        result = asyncio.run(self.graph_api_service.get_node(node_id))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes/1', {})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_with_label_and_relationships(self, get_mock):
+        get_mock.return_value = self.response_content
+        node_id = 1
+
+        result = asyncio.run(self.graph_api_service.get_node(node_id, "Test", include_relationships=True))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes/1', {"label": "Test", "include": "relationships"})
+
+    @mock.patch.object(GraphApiService, 'entity_cache', EntityCache(10, 30))
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_cached(self, get_mock):
+        get_mock.return_value = {'id': 1, 'errors': None, 'relationships': []}
+
+        results = [asyncio.run(self.graph_api_service.get_node(1, 'Participant', include_relationships=True))
+                   for _ in range(2)]
+
+        self.assertEqual(results, [get_mock.return_value] * 2)
+        get_mock.assert_called_once_with('/nodes/1', {'label': 'Participant', 'include': 'relationships'})
+
+    @mock.patch.object(GraphApiService, 'entity_cache', EntityCache(10, 30))
+    @mock.patch.object(GraphApiService, 'post')
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_cached_invalidated_by_relationship(self, get_mock, post_mock):
+        get_mock.return_value = {'id': 1, 'errors': None, 'relationships': []}
+        post_mock.return_value = self.response_content
+
+        async def read_write_read():
+            await self.graph_api_service.get_node(1, 'Participant', include_relationships=True)
+            await self.graph_api_service.create_relationships(2, 1, 'hasParticipant')
+            await self.graph_api_service.get_node(1, 'Participant', include_relationships=True)
+
+        asyncio.run(read_write_read())
+
+        self.assertEqual(get_mock.call_count, 2)
+
+    @mock.patch.object(GraphApiService, 'entity_cache', EntityCache(10, 30))
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_not_cached_with_error(self, get_mock):
+        get_mock.return_value = {'id': 1, 'errors': 'Node not found'}
+
+        for _ in range(2):
+            asyncio.run(self.graph_api_service.get_node(1, 'Participant', include_relationships=True))
+
+        self.assertEqual(get_mock.call_count, 2)
+
+    @mock.patch.object(GraphApiService, 'entity_cache', EntityCache(10, 30))
+    @mock.patch.object(GraphApiService, 'commit_transaction')
+    @mock.patch.object(GraphApiService, 'begin_transaction')
+    @mock.patch.object(GraphApiService, 'get_client')
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_cached_in_transaction(self, get_mock, get_client_mock, begin_transaction_mock,
+                                            commit_transaction_mock):
+        get_mock.return_value = {'id': 1, 'errors': None, 'relationships': []}
+        get_client_mock.return_value.delete = mock.AsyncMock(return_value=self.response)
+        begin_transaction_mock.return_value = {'id': 'abc'}
+        commit_transaction_mock.return_value = {'id': 'abc', 'errors': None}
+
+        async def delete_in_transaction():
+            async with self.graph_api_service.transaction():
+                await self.graph_api_service.get_node(1, 'Participant', include_relationships=True)
+                await self.graph_api_service.delete_node(1)
+                GraphApiService.entity_cache.put((1, 'Participant'), get_mock.return_value,
+                                                 GraphApiService.entity_cache.version)
+
+        asyncio.run(delete_in_transaction())
+
+        self.assertEqual(GraphApiService.entity_cache.stats()['size'], 0)
+        get_mock.assert_called_once_with('/nodes/1', {'label': 'Participant', 'include': 'relationships'})
+        commit_transaction_mock.assert_called_once_with('abc')
+
     @mock.patch.object(GraphApiService, 'get')
     def test_get_node_relationships(self, get_mock):
         get_mock.return_value = self.response_content
         node_id = 1
 
-        result = self.graph_api_service.get_node_relationships(node_id)
+        result = asyncio.run(self.graph_api_service.get_node_relationships(node_id))
 
         self.assertEqual(result, self.response_content)
         get_mock.assert_called_with('/nodes/1/relationships', {})
 
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_relationships_with_types_and_direction(self, get_mock):
+        get_mock.return_value = self.response_content
+        node_id = 1
+
+        result = asyncio.run(self.graph_api_service.get_node_relationships(node_id, ["hasScenario"], "outgoing"))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes/1/relationships', {"type": ["hasScenario"], "direction": "outgoing"})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_neighbourhood(self, get_mock):
+        get_mock.return_value = self.response_content
+        node_id = 1
+
+        result = asyncio.run(self.graph_api_service.get_node_neighbourhood(node_id, 3, ["hasParticipantState"]))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes/1/neighbourhood', {"depth": 3, "types": ["hasParticipantState"]})
+
+    @mock.patch.object(GraphApiService, 'get')
+    def test_get_node_chain(self, get_mock):
+        get_mock.return_value = self.response_content
+        node_id = 1
+
+        result = asyncio.run(self.graph_api_service.get_node_chain(node_id, "hasScenario", "nextActivityExecution",
+                                                                   True))
+
+        self.assertEqual(result, self.response_content)
+        get_mock.assert_called_with('/nodes/1/chain', {"head": "hasScenario", "next": "nextActivityExecution",
+                                                       "include": "relationships"})
+
     @mock.patch.object(GraphApiService, 'delete')
     def test_delete_node(self, delete_mock):
         delete_mock.return_value = self.response_content
         node_id = 1
 
-        result = self.graph_api_service.delete_node(node_id)
+        result = asyncio.run(self.graph_api_service.delete_node(node_id))
 
         self.assertEqual(result, self.response_content)
         delete_mock.assert_called_with('/nodes/1', {})
@@ -98,13 +418,25 @@ class DatabaseServiceTestCase(unittest.TestCase):
         node_model = ActivityExecutionIn(activity_id=1, arrangement_id=2,
                                          identifier=1, additional_properties=[{'key': 'test', 'value': 'test'}])
 
-        result = self.graph_api_service.create_properties(node_id, node_model)
+        result = asyncio.run(self.graph_api_service.create_properties(node_id, node_model))
 
         self.assertEqual(result, self.response_content)
         post_mock.assert_called_with("/nodes/1/properties", [{'key': 'activity_id', 'value': 1},
                                                              {'key':'arrangement_id', 'value': 2},
                                                              {'key': 'test', 'value': 'test'}])
 
+    @mock.patch.object(GraphApiService, 'post')
+    def test_set_nodes_properties(self, post_mock):
+        post_mock.return_value = self.response_content
+
+        result = asyncio.run(self.graph_api_service.set_nodes_properties({1: {'scenario_position': 2.5},
+                                                                          2: {'scenario_position': 3.0}}))
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with("/nodes/properties", [
+            {'id': 1, 'properties': [{'key': 'scenario_position', 'value': 2.5}]},
+            {'id': 2, 'properties': [{'key': 'scenario_position', 'value': 3.0}]}])
+
     @mock.patch.object(GraphApiService, 'post')
     def test_create_relationships(self, post_mock):
         post_mock.return_value = self.response_content
@@ -112,17 +444,90 @@ class DatabaseServiceTestCase(unittest.TestCase):
         end_node = 2
         name = 'hasNode'
 
-        result = self.graph_api_service.create_relationships(start_node, end_node, name)
+        result = asyncio.run(self.graph_api_service.create_relationships(start_node, end_node, name))
 
         self.assertEqual(result, self.response_content)
         post_mock.assert_called_with("/relationships", {"start_node": 1, "end_node": 2, "name": 'hasNode'})
 
+    @mock.patch.object(GraphApiService, 'post')
+    def test_create_relationships_bulk(self, post_mock):
+        post_mock.return_value = self.response_content
+        relationships = [(1, 2, 'hasNode'), (2, 3, 'nextNode')]
+
+        result = asyncio.run(self.graph_api_service.create_relationships_bulk(relationships))
+
+        self.assertEqual(result, self.response_content)
+        post_mock.assert_called_with('/relationships/bulk', [{"start_node": 1, "end_node": 2, "name": 'hasNode'},
+                                                             {"start_node": 2, "end_node": 3, "name": 'nextNode'}])
+
+    @mock.patch.object(GraphApiService, 'post')
+    def test_nodes_exist(self, post_mock):
+        post_mock.return_value = {'nodes': [{'id': 1, 'label': 'Recording', 'exists': True},
+                                            {'id': 2, 'label': None, 'exists': False}], 'errors': None}
+
+        result = asyncio.run(self.graph_api_service.nodes_exist([(1, 'Recording'), (2, None)]))
+
+        self.assertEqual(result, post_mock.return_value)
+        post_mock.assert_called_with('/nodes/exists', [{"id": 1, "label": 'Recording'}, {"id": 2, "label": None}])
+
+    @mock.patch.object(GraphApiService, '_reference_nodes', {})
+    @mock.patch.object(GraphApiService, 'get_nodes')
+    @mock.patch.object(GraphApiService, 'post')
+    def test_nodes_exist_with_reference_nodes(self, post_mock, get_nodes_mock):
+        get_nodes_mock.return_value = {'nodes': [{'id': 15}], 'errors': None}
+        post_mock.return_value = {'nodes': [{'id': 16, 'label': 'Modality', 'exists': True},
+                                            {'id': 3, 'label': 'Recording', 'exists': False}], 'errors': None}
+
+        result = asyncio.run(self.graph_api_service.nodes_exist([(15, 'Modality'), (16, 'Modality'),
+                                                                 (3, 'Recording')]))
+
+        self.assertEqual(result, {'nodes': [{'id': 15, 'label': 'Modality', 'exists': True},
+                                            {'id': 16, 'label': 'Modality', 'exists': True},
+                                            {'id': 3, 'label': 'Recording', 'exists': False}], 'errors': None})
+        get_nodes_mock.assert_called_once_with('`Modality`')
+        post_mock.assert_called_once_with('/nodes/exists', [{"id": 16, "label": 'Modality'},
+                                                            {"id": 3, "label": 'Recording'}])
+        self.assertEqual(GraphApiService._reference_nodes, {'Modality': {15, 16}})
+
+    @mock.patch.object(GraphApiService, '_reference_nodes', {'Modality': {15}})
+    @mock.patch.object(GraphApiService, 'post')
+    def test_nodes_exist_only_cached_nodes(self, post_mock):
+        result = asyncio.run(self.graph_api_service.nodes_exist([(15, 'Modality')]))
+
+        self.assertEqual(result, {'nodes': [{'id': 15, 'label': 'Modality', 'exists': True}], 'errors': None})
+        post_mock.assert_not_called()
+
+    @mock.patch.object(GraphApiService, 'post')
+    def test_nodes_exist_without_nodes(self, post_mock):
+        result = asyncio.run(self.graph_api_service.nodes_exist([]))
+
+        self.assertEqual(result, {"nodes": [], "errors": None})
+        post_mock.assert_not_called()
+
+    @mock.patch.object(GraphApiService, '_reference_nodes', {})
+    @mock.patch.object(GraphApiService, 'get_nodes')
+    def test_load_reference_nodes(self, get_nodes_mock):
+        get_nodes_mock.side_effect = lambda label: {'nodes': [{'id': 1}, {'id': 2}], 'errors': None} \
+            if label == '`Life Activity`' else {'errors': ['error']}
+
+        asyncio.run(self.graph_api_service.load_reference_nodes())
+
+        self.assertEqual(GraphApiService._reference_nodes, {'Life Activity': {1, 2}})
+        get_nodes_mock.assert_has_calls([mock.call(f'`{label}`') for label in GraphApiService.reference_labels],
+                                        any_order=True)
+
+    @mock.patch.object(GraphApiService, '_reference_nodes', {'Activity': {1}, 'Channel': {2}})
+    def test_invalidate_reference_nodes(self):
+        self.graph_api_service.invalidate_reference_nodes('Activity')
+
+        self.assertEqual(GraphApiService._reference_nodes, {'Channel': {2}})
+
     @mock.patch.object(GraphApiService, 'delete')
     def test_delete_relationship(self, delete_mock):
         delete_mock.return_value = self.response_content
         relationship_id = 1
 
-        result = self.graph_api_service.delete_relationship(relationship_id)
+        result = asyncio.run(self.graph_api_service.delete_relationship(relationship_id))
 
         self.assertEqual(result, self.response_content)
         delete_mock.assert_called_with('/relationships/1', {})
@@ -1,6 +1,9 @@
 import asyncio
 import unittest
+import unittest.mock as mock
 
+import hateoas
+import httpx
 import main
 
 
@@ -11,3 +14,40 @@ class TestMain(unittest.TestCase):
         expect.update({'links': main.get_links(main.app)})
 
         self.assertEqual(asyncio.run(main.root()), expect)
+
+    def test_cache(self):
+        result = asyncio.run(main.cache())
+
+        self.assertEqual(result, {**main.GraphApiService.entity_cache.stats(), 'links': main.get_links(main.app)})
+
+    @mock.patch('main.asyncio.sleep')
+    @mock.patch('main.os.path.exists', return_value=True)
+    @mock.patch.object(main.GraphApiService, 'load_reference_nodes')
+    def test_startup_without_graph_api(self, load_reference_nodes_mock, exists_mock, sleep_mock):
+        load_reference_nodes_mock.side_effect = httpx.ConnectError("Connection refused")
+
+        with self.assertLogs('main', 'WARNING') as logs:
+            asyncio.run(main.startup_event())
+
+        self.assertEqual(logs.output, ["WARNING:main:Reference nodes were not loaded: Connection refused"])
+        load_reference_nodes_mock.assert_awaited_once()
+
+    def test_links_middleware_opt_out(self):
+        request = mock.MagicMock()
+        request.query_params = {"links": "False"}
+        request.headers = {}
+
+        async def call_next(request):
+            return main.get_links(main.app)
+
+        result = asyncio.run(main.links_middleware(request, call_next))
+
+        self.assertIsNone(result)
+        self.assertTrue(main.links_enabled.get())
+
+    def test_links_computed_once(self):
+        links = main.get_links(main.app)
+        links.append({"rel": "next"})
+
+        self.assertNotEqual(main.get_links(main.app), links)
+        self.assertIs(hateoas.get_link_table(main.app), hateoas.get_link_table(main.app))
@@ -0,0 +1,41 @@
+import asyncio
+import unittest
+import unittest.mock as mock
+
+from recording.recording_model import BasicRecordingOut, RecordingsOut
+from streaming import stream_ndjson
+
+
+async def collect(lines):
+    return [line async for line in lines]
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_stream_ndjson(self):
+        get_page = mock.AsyncMock(side_effect=[
+            RecordingsOut(recordings=[BasicRecordingOut(id=1), BasicRecordingOut(id=2)], next_after=2),
+            RecordingsOut(recordings=[BasicRecordingOut(id=3)])])
+
+        result = asyncio.run(collect(stream_ndjson(get_page, "recordings", page_size=2)))
+
+        self.assertEqual(result, [BasicRecordingOut(id=1).json() + "\n", BasicRecordingOut(id=2).json() + "\n",
+                                  BasicRecordingOut(id=3).json() + "\n"])
+        get_page.assert_has_calls([mock.call(2, None), mock.call(2, 2)])
+
+    def test_stream_ndjson_empty(self):
+        get_page = mock.AsyncMock(return_value=RecordingsOut(recordings=[]))
+
+        result = asyncio.run(collect(stream_ndjson(get_page, "recordings", after=5, page_size=2)))
+
+        self.assertEqual(result, [])
+        get_page.assert_called_once_with(2, 5)
+
+    def test_stream_ndjson_with_error(self):
+        get_page = mock.AsyncMock(side_effect=[RecordingsOut(recordings=[BasicRecordingOut(id=1)], next_after=1),
+                                               RecordingsOut(errors={'errors': ['test']})])
+
+        result = asyncio.run(collect(stream_ndjson(get_page, "recordings", page_size=1)))
+
+        self.assertEqual(result, [BasicRecordingOut(id=1).json() + "\n", '{"errors":{"errors":["test"]}}\n'])
+        get_page.assert_has_calls([mock.call(1, None), mock.call(1, 1)])
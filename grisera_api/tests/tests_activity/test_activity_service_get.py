@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,20 +11,19 @@ from models.not_found_model import *
 class TestActivityServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_activity_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_activity_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Activity'],
                                       'properties': [{'key': 'activity', 'value': 'test'},
                                                      {'key': 'test', 'value': 'test'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         activity = ActivityOut(activity="test", id=id_node,
                                relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                               relation_id=0)],
@@ -31,24 +31,10 @@ class TestActivityServiceGet(unittest.TestCase):
                                                                        name="testReversedRelation", relation_id=0)])
         activity_service = ActivityService()
 
-        result = activity_service.get_activity(id_node)
+        result = asyncio.run(activity_service.get_activity(id_node))
 
         self.assertEqual(result, activity)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_activity_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        activity_service = ActivityService()
-
-        result = activity_service.get_activity(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Activity", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_activity_with_error(self, get_node_mock):
@@ -57,10 +43,10 @@ class TestActivityServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         activity_service = ActivityService()
 
-        result = activity_service.get_activity(id_node)
+        result = asyncio.run(activity_service.get_activity(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Activity", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_activities(self, get_nodes_mock):
@@ -74,10 +60,10 @@ class TestActivityServiceGet(unittest.TestCase):
         activities = ActivitiesOut(activities=[activity_one, activity_two])
         activity_service = ActivityService()
 
-        result = activity_service.get_activities()
+        result = asyncio.run(activity_service.get_activities())
 
         self.assertEqual(result, activities)
-        get_nodes_mock.assert_called_once_with("Activity")
+        get_nodes_mock.assert_called_once_with("Activity", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_activities_empty(self, get_nodes_mock):
@@ -85,7 +71,7 @@ class TestActivityServiceGet(unittest.TestCase):
         activities = ActivitiesOut(activities=[])
         activity_service = ActivityService()
 
-        result = activity_service.get_activities()
+        result = asyncio.run(activity_service.get_activities())
 
         self.assertEqual(result, activities)
-        get_nodes_mock.assert_called_once_with("Activity")
+        get_nodes_mock.assert_called_once_with("Activity", None, None, None)
@@ -1,36 +1,35 @@
-import json
+import asyncio
 import unittest
 import unittest.mock as mock
 from activity.activity_model import *
 from activity.activity_service import *
-from requests import Response
+from graph_api_service import GraphApiService
+from httpx import Response
 
 
 class TestActivityService(unittest.TestCase):
 
-    @mock.patch('graph_api_service.requests')
-    def test_activity_post_service_without_error(self, mock_requests):
-        response = Response()
-        response._content = json.dumps({'id': 1, 'properties': None, "errors": None,
-                                        'links': None}).encode('utf-8')
-        mock_requests.post.return_value = response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_activity_post_service_without_error(self, get_client_mock):
+        response = Response(200, json={'id': 1, 'properties': None, "errors": None,
+                                       'links': None})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
         activity = ActivityIn(activity="group")
         activity_service = ActivityService()
 
-        result = activity_service.save_activity(activity)
+        result = asyncio.run(activity_service.save_activity(activity))
 
         self.assertEqual(result, ActivityOut(activity="group", id=1))
 
-    @mock.patch('graph_api_service.requests')
-    def test_activity_post_service_with_node_error(self, mock_requests):
-        response = Response()
-        response._content = json.dumps({'id': None, 'properties': None, "errors": {'error': 'test'},
-                                        'links': None}).encode('utf-8')
-        mock_requests.post.return_value = response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_activity_post_service_with_node_error(self, get_client_mock):
+        response = Response(200, json={'id': None, 'properties': None, "errors": {'error': 'test'},
+                                       'links': None})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
         activity = ActivityIn(activity="group")
         activity_service = ActivityService()
 
-        result = activity_service.save_activity(activity)
+        result = asyncio.run(activity_service.save_activity(activity))
 
         self.assertEqual(result, ActivityOut(activity="group", errors={'error': 'test'}))
 
@@ -42,7 +41,7 @@ class TestActivityService(unittest.TestCase):
             create_properties_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
             activity = ActivityIn(activity="group")
             activity_service = ActivityService()
-            result = activity_service.save_activity(activity)
+            result = asyncio.run(activity_service.save_activity(activity))
             self.assertEqual(result, ActivityOut(activity="group", errors=['error']))
             create_node_mock.assert_called_once_with('Activity')
-            create_properties_mock.assert_called_once_with(id_node, activity)
\ No newline at end of file
+            create_properties_mock.assert_called_once_with(id_node, activity)
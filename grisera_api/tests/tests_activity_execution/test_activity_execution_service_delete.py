@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -12,19 +13,18 @@ class TestActivityExecutionServiceDelete(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'delete_node')
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_delete_activity_execution_without_error(self, get_node_relationships_mock, get_node_mock, delete_node_mock):
+    def test_delete_activity_execution_without_error(self, get_node_mock, delete_node_mock):
         id_node = 1
         delete_node_mock.return_value = get_node_mock.return_value = {'id': id_node, 'labels': ['Activity Execution'],
                                                                       'properties': [],
-                                                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                                                      "errors": None, 'links': None,
+                                                                      'relationships': [
+                                                                          {"start_node": id_node, "end_node": 19,
+                                                                           "name": "testRelation", "id": 0,
+                                                                           "properties": None},
+                                                                          {"start_node": 15, "end_node": id_node,
+                                                                           "name": "testReversedRelation", "id": 0,
+                                                                           "properties": None}]}
         activity_execution = ActivityExecutionOut(additional_properties=[], id=id_node,
                                                   relations=[RelationInformation(second_node_id=19,
                                                                                  name="testRelation",
@@ -34,25 +34,12 @@ class TestActivityExecutionServiceDelete(unittest.TestCase):
                                                                                           relation_id=0)])
         activity_execution_service = ActivityExecutionService()
 
-        result = activity_execution_service.delete_activity_execution(id_node)
+        result = asyncio.run(activity_execution_service.delete_activity_execution(id_node))
 
         self.assertEqual(result, activity_execution)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Activity Execution", include_relationships=True)
         delete_node_mock.assert_called_once_with(id_node)
 
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_delete_activity_execution_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        activity_execution_service = ActivityExecutionService()
-
-        result = activity_execution_service.delete_activity_execution(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
     @mock.patch.object(GraphApiService, 'get_node')
     def test_delete_activity_execution_with_error(self, get_node_mock):
         id_node = 1
@@ -60,7 +47,7 @@ class TestActivityExecutionServiceDelete(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         activity_execution_service = ActivityExecutionService()
 
-        result = activity_execution_service.delete_activity_execution(id_node)
+        result = asyncio.run(activity_execution_service.delete_activity_execution(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
\ No newline at end of file
+        get_node_mock.assert_called_once_with(id_node, "Activity Execution", include_relationships=True)
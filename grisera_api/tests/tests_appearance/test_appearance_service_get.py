@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -11,21 +12,20 @@ from graph_api_service import GraphApiService
 class TestAppearanceServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_appearance_occlusion_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_appearance_occlusion_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Appearance'],
                                       'properties': [{'key': 'glasses', 'value': True},
                                                      {'key': 'beard', 'value': "Heavy"},
                                                      {'key': 'moustache', 'value': "Heavy"}],
-                                      'errors': None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      'errors': None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         appearance = AppearanceOcclusionOut(id=id_node, glasses=True, beard="Heavy", moustache="Heavy",
                                             relations=[
                                                 RelationInformation(second_node_id=19, name="testRelation",
@@ -35,28 +35,26 @@ class TestAppearanceServiceGet(unittest.TestCase):
                                                                     relation_id=0)])
         appearance_service = AppearanceService()
 
-        result = appearance_service.get_appearance(id_node)
+        result = asyncio.run(appearance_service.get_appearance(id_node))
 
         self.assertEqual(result, appearance)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_appearance_somatotype_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_appearance_somatotype_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Appearance'],
                                       'properties': [{'key': 'ectomorph', 'value': 1.5},
                                                      {'key': 'endomorph', 'value': 1.5},
                                                      {'key': 'mesomorph', 'value': 1.5}],
-                                      'errors': None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      'errors': None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         appearance = AppearanceSomatotypeOut(id=id_node, ectomorph=1.5, endomorph=1.5,
                                              mesomorph=1.5, relations=[
                                                  RelationInformation(second_node_id=19, name="testRelation",
@@ -66,24 +64,10 @@ class TestAppearanceServiceGet(unittest.TestCase):
                                                                      relation_id=0)])
         appearance_service = AppearanceService()
 
-        result = appearance_service.get_appearance(id_node)
+        result = asyncio.run(appearance_service.get_appearance(id_node))
 
         self.assertEqual(result, appearance)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_appearance_without_appearance_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        appearance_service = AppearanceService()
-
-        result = appearance_service.get_appearance(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_appearance_with_error(self, get_node_mock):
@@ -92,10 +76,10 @@ class TestAppearanceServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         appearance_service = AppearanceService()
 
-        result = appearance_service.get_appearance(id_node)
+        result = asyncio.run(appearance_service.get_appearance(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_appearances(self, get_nodes_mock):
@@ -106,25 +90,25 @@ class TestAppearanceServiceGet(unittest.TestCase):
                                                  {'id': 2, 'labels': ['Appearance'],
                                                   'properties': [{'key': 'ectomorph', 'value': 1.5},
                                                                  {'key': 'endomorph', 'value': 1.5},
-                                                                 {'key': 'mesomorph', 'value': 1.5}]}]}
+                                                                 {'key': 'mesomorph', 'value': 1.5}]}], 'errors': None}
         appearance_occlusion = BasicAppearanceOcclusionOut(id=1, glasses=True, beard="Heavy", moustache="Heavy")
         appearance_somatotype = BasicAppearanceSomatotypeOut(id=2, ectomorph=1.5,
                                                              endomorph=1.5, mesomorph=1.5)
         appearances = AppearancesOut(appearances=[appearance_occlusion, appearance_somatotype])
         appearance_service = AppearanceService()
 
-        result = appearance_service.get_appearances()
+        result = asyncio.run(appearance_service.get_appearances())
 
         self.assertEqual(result, appearances)
-        get_nodes_mock.assert_called_once_with("Appearance")
+        get_nodes_mock.assert_called_once_with("Appearance", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_appearances_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         appearances = AppearancesOut(appearances=[])
         appearance_service = AppearanceService()
 
-        result = appearance_service.get_appearances()
+        result = asyncio.run(appearance_service.get_appearances())
 
         self.assertEqual(result, appearances)
-        get_nodes_mock.assert_called_once_with("Appearance")
+        get_nodes_mock.assert_called_once_with("Appearance", None, None, None)
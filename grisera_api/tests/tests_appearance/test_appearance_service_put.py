@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -12,8 +13,7 @@ class TestAppearanceServicePut(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_appearance_occlusion_without_error(self, get_node_relationships_mock, get_node_mock,
+    def test_update_appearance_occlusion_without_error(self, get_node_mock,
                                                        create_properties_mock):
         id_node = 1
         create_properties_mock.return_value = {}
@@ -21,14 +21,14 @@ class TestAppearanceServicePut(unittest.TestCase):
                                       'properties': [{'key': 'glasses', 'value': True},
                                                      {'key': 'beard', 'value': "Heavy"},
                                                      {'key': 'moustache', 'value': "None"}],
-                                      'errors': None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      'errors': None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         appearance_in = AppearanceOcclusionIn(glasses=True, beard="Heavy", moustache="None")
         appearance_out = AppearanceOcclusionOut(id=id_node, glasses=True, beard="Heavy", moustache="None", relations=[
                                                 RelationInformation(second_node_id=19, name="testRelation",
@@ -38,16 +38,15 @@ class TestAppearanceServicePut(unittest.TestCase):
                                                                     relation_id=0)])
         appearance_service = AppearanceService()
 
-        result = appearance_service.update_appearance_occlusion(id_node, appearance_in)
+        result = asyncio.run(appearance_service.update_appearance_occlusion(id_node, appearance_in))
 
         self.assertEqual(result, appearance_out)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
         create_properties_mock.assert_called_once_with(id_node, appearance_in)
 
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_appearance_somatotype_without_error(self, get_node_relationships_mock, get_node_mock,
+    def test_update_appearance_somatotype_without_error(self, get_node_mock,
                                                         create_properties_mock):
         id_node = 1
         create_properties_mock.return_value = {}
@@ -55,14 +54,14 @@ class TestAppearanceServicePut(unittest.TestCase):
                                       'properties': [{'key': 'ectomorph', 'value': 1.5},
                                                      {'key': 'endomorph', 'value': 1.5},
                                                      {'key': 'mesomorph', 'value': 1.5}],
-                                      'errors': None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      'errors': None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         appearance_in = AppearanceSomatotypeIn(ectomorph=1.5, endomorph=1.5, mesomorph=1.5)
         appearance_out = AppearanceSomatotypeOut(id=id_node, ectomorph=1.5, endomorph=1.5, mesomorph=1.5,
                                                  relations=[
@@ -74,97 +73,51 @@ class TestAppearanceServicePut(unittest.TestCase):
                                                  )
         appearance_service = AppearanceService()
 
-        result = appearance_service.update_appearance_somatotype(id_node, appearance_in)
+        result = asyncio.run(appearance_service.update_appearance_somatotype(id_node, appearance_in))
 
         self.assertEqual(result, appearance_out)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
         create_properties_mock.assert_called_once_with(id_node, appearance_in)
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_appearance_occlusion_without_appearance_label(self, get_node_relationships_mock, get_node_mock):
+    def test_update_appearance_occlusion_with_error(self, get_node_mock):
         id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        appearance_in = AppearanceOcclusionIn(glasses=True, beard="Heavy", moustache="None")
-        appearance_service = AppearanceService()
-
-        result = appearance_service.update_appearance_occlusion(id_node, appearance_in)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_appearance_somatotype_without_appearance_label(self, get_node_relationships_mock, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        appearance_in = AppearanceSomatotypeIn(ectomorph=1.5, endomorph=1.5, mesomorph=1.5)
-        appearance_service = AppearanceService()
-
-        result = appearance_service.update_appearance_somatotype(id_node, appearance_in)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_appearance_occlusion_with_error(self, get_node_relationships_mock, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         appearance_in = AppearanceOcclusionIn(glasses=True, beard="Heavy", moustache="None")
         appearance_service = AppearanceService()
 
-        result = appearance_service.update_appearance_occlusion(id_node, appearance_in)
+        result = asyncio.run(appearance_service.update_appearance_occlusion(id_node, appearance_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_appearance_somatotype_with_error(self, get_node_relationships_mock, get_node_mock):
+    def test_update_appearance_somatotype_with_error(self, get_node_mock):
         id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         appearance_in = AppearanceSomatotypeIn(ectomorph=1.5, endomorph=1.5, mesomorph=1.5)
         appearance_service = AppearanceService()
 
-        result = appearance_service.update_appearance_somatotype(id_node, appearance_in)
+        result = asyncio.run(appearance_service.update_appearance_somatotype(id_node, appearance_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Appearance", include_relationships=True)
 
     def test_update_appearance_somatotype_with_wrong_range(self):
         id_node = 1
@@ -173,6 +126,6 @@ class TestAppearanceServicePut(unittest.TestCase):
                                                  errors="Scale range not between 1 and 7")
         appearance_service = AppearanceService()
 
-        result = appearance_service.update_appearance_somatotype(id_node, appearance_in)
+        result = asyncio.run(appearance_service.update_appearance_somatotype(id_node, appearance_in))
 
         self.assertEqual(result, appearance_out)
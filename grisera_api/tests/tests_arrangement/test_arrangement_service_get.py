@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,21 +11,20 @@ from models.not_found_model import *
 class TestArrangementServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_arrangement_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_arrangement_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Arrangement'],
                                       'properties': [{'key': 'arrangement_type', 'value': 'test'},
                                                      {'key': 'arrangement_distance', 'value': 'test'},
                                                      {'key': 'test', 'value': 'test'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         arrangement = ArrangementOut(arrangement_type="test", arrangement_distance="test", id=id_node,
                                      relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                     relation_id=0)],
@@ -33,24 +33,10 @@ class TestArrangementServiceGet(unittest.TestCase):
                                                                              relation_id=0)])
         arrangement_service = ArrangementService()
 
-        result = arrangement_service.get_arrangement(id_node)
+        result = asyncio.run(arrangement_service.get_arrangement(id_node))
 
         self.assertEqual(result, arrangement)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_arrangement_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        arrangement_service = ArrangementService()
-
-        result = arrangement_service.get_arrangement(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Arrangement", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_arrangement_with_error(self, get_node_mock):
@@ -59,10 +45,10 @@ class TestArrangementServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         arrangement_service = ArrangementService()
 
-        result = arrangement_service.get_arrangement(id_node)
+        result = asyncio.run(arrangement_service.get_arrangement(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Arrangement", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_arrangements(self, get_nodes_mock):
@@ -76,10 +62,10 @@ class TestArrangementServiceGet(unittest.TestCase):
         arrangements = ArrangementsOut(arrangements=[arrangement_one, arrangement_two])
         arrangement_service = ArrangementService()
 
-        result = arrangement_service.get_arrangements()
+        result = asyncio.run(arrangement_service.get_arrangements())
 
         self.assertEqual(result, arrangements)
-        get_nodes_mock.assert_called_once_with("Arrangement")
+        get_nodes_mock.assert_called_once_with("Arrangement", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_arrangements_empty(self, get_nodes_mock):
@@ -87,7 +73,7 @@ class TestArrangementServiceGet(unittest.TestCase):
         arrangements = ArrangementsOut(arrangements=[])
         arrangement_service = ArrangementService()
 
-        result = arrangement_service.get_arrangements()
+        result = asyncio.run(arrangement_service.get_arrangements())
 
         self.assertEqual(result, arrangements)
-        get_nodes_mock.assert_called_once_with("Arrangement")
+        get_nodes_mock.assert_called_once_with("Arrangement", None, None, None)
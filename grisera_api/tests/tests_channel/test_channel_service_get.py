@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,20 +11,19 @@ from models.not_found_model import *
 class TestChannelServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_channel_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_channel_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Channel'],
                                       'properties': [{'key': 'type', 'value': 'test'},
                                                      {'key': 'test', 'value': 'test'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         channel = ChannelOut(type="test", id=id_node,
                              relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                             relation_id=0)],
@@ -31,24 +31,10 @@ class TestChannelServiceGet(unittest.TestCase):
                                                                      name="testReversedRelation", relation_id=0)])
         channel_service = ChannelService()
 
-        result = channel_service.get_channel(id_node)
+        result = asyncio.run(channel_service.get_channel(id_node))
 
         self.assertEqual(result, channel)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_channel_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        channel_service = ChannelService()
-
-        result = channel_service.get_channel(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Channel", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_channel_with_error(self, get_node_mock):
@@ -57,10 +43,10 @@ class TestChannelServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         channel_service = ChannelService()
 
-        result = channel_service.get_channel(id_node)
+        result = asyncio.run(channel_service.get_channel(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Channel", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_channels(self, get_nodes_mock):
@@ -74,10 +60,10 @@ class TestChannelServiceGet(unittest.TestCase):
         channels = ChannelsOut(channels=[channel_one, channel_two])
         channel_service = ChannelService()
 
-        result = channel_service.get_channels()
+        result = asyncio.run(channel_service.get_channels())
 
         self.assertEqual(result, channels)
-        get_nodes_mock.assert_called_once_with("Channel")
+        get_nodes_mock.assert_called_once_with("Channel", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_channels_empty(self, get_nodes_mock):
@@ -85,7 +71,7 @@ class TestChannelServiceGet(unittest.TestCase):
         channels = ChannelsOut(channels=[])
         channel_service = ChannelService()
 
-        result = channel_service.get_channels()
+        result = asyncio.run(channel_service.get_channels())
 
         self.assertEqual(result, channels)
-        get_nodes_mock.assert_called_once_with("Channel")
+        get_nodes_mock.assert_called_once_with("Channel", None, None, None)
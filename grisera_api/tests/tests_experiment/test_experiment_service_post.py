@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -8,52 +9,30 @@ from experiment.experiment_service import ExperimentService
 
 class TestExperimentServicePost(unittest.TestCase):
 
-    @mock.patch.object(GraphApiService, 'create_node')
-    @mock.patch.object(GraphApiService, 'create_properties')
-    def test_save_experiment_without_error(self, create_properties_mock, create_node_mock):
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    def test_save_experiment_without_error(self, create_subgraph_mock):
         id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
-        create_properties_mock.return_value = {'id': id_node, 'properties': [{'key': 'experiment_name', 'value': 'test'},
-                                                                             {'key': 'test', 'value': 'test'}],
-                                               "errors": None, 'links': None}
+        create_subgraph_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
         additional_properties = [PropertyIn(key='test', value='test')]
         experiment = ExperimentIn(experiment_name="test", additional_properties=additional_properties)
         experiment_service = ExperimentService()
 
-        result = experiment_service.save_experiment(experiment)
+        result = asyncio.run(experiment_service.save_experiment(experiment))
 
         self.assertEqual(result, ExperimentOut(experiment_name="test", additional_properties=additional_properties,
                                                id=id_node))
-        create_node_mock.assert_called_once_with('Experiment')
-        create_properties_mock.assert_called_once_with(id_node, experiment)
+        create_subgraph_mock.assert_called_once_with('Experiment', experiment)
 
-    @mock.patch.object(GraphApiService, 'create_node')
-    def test_save_experiment_with_node_error(self, create_node_mock):
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    def test_save_experiment_with_node_error(self, create_subgraph_mock):
         id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": ['error'], 'links': None}
+        create_subgraph_mock.return_value = {'id': id_node, 'properties': None, "errors": ['error'], 'links': None}
         additional_properties = [PropertyIn(key='test', value='test')]
         experiment = ExperimentIn(experiment_name="test", additional_properties=additional_properties)
         experiment_service = ExperimentService()
 
-        result = experiment_service.save_experiment(experiment)
+        result = asyncio.run(experiment_service.save_experiment(experiment))
 
         self.assertEqual(result, ExperimentOut(experiment_name="test", additional_properties=additional_properties,
                                                errors=['error']))
-        create_node_mock.assert_called_once_with('Experiment')
-
-    @mock.patch.object(GraphApiService, 'create_node')
-    @mock.patch.object(GraphApiService, 'create_properties')
-    def test_save_experiment_with_properties_error(self, create_properties_mock, create_node_mock):
-        id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
-        create_properties_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
-        additional_properties = [PropertyIn(key='test', value='test')]
-        experiment = ExperimentIn(experiment_name="test", additional_properties=additional_properties)
-        experiment_service = ExperimentService()
-
-        result = experiment_service.save_experiment(experiment)
-
-        self.assertEqual(result, ExperimentOut(experiment_name="test", additional_properties=additional_properties,
-                                               errors=['error']))
-        create_node_mock.assert_called_once_with('Experiment')
-        create_properties_mock.assert_called_once_with(id_node, experiment)
+        create_subgraph_mock.assert_called_once_with('Experiment', experiment)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -11,20 +12,19 @@ from graph_api_service import GraphApiService
 class TestLifeActivityServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_life_activity_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_life_activity_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Life Activity'],
                                       'properties': [{'key': 'life_activity', 'value': 'test'},
                                                      {'key': 'test', 'value': 'test'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         life_activity = LifeActivityOut(life_activity="test", id=id_node,
                                    relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                   relation_id=0)],
@@ -32,24 +32,10 @@ class TestLifeActivityServiceGet(unittest.TestCase):
                                                                            name="testReversedRelation", relation_id=0)])
         life_activity_service = LifeActivityService()
 
-        result = life_activity_service.get_life_activity(id_node)
+        result = asyncio.run(life_activity_service.get_life_activity(id_node))
 
         self.assertEqual(result, life_activity)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_life_activity_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        life_activity_service = LifeActivityService()
-
-        result = life_activity_service.get_life_activity(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Life Activity", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_life_activity_with_error(self, get_node_mock):
@@ -58,10 +44,10 @@ class TestLifeActivityServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         life_activity_service = LifeActivityService()
 
-        result = life_activity_service.get_life_activity(id_node)
+        result = asyncio.run(life_activity_service.get_life_activity(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Life Activity", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_life_activities(self, get_nodes_mock):
@@ -75,10 +61,10 @@ class TestLifeActivityServiceGet(unittest.TestCase):
         life_activities = LifeActivitiesOut(life_activities=[life_activity_one, life_activity_two])
         life_activity_service = LifeActivityService()
 
-        result = life_activity_service.get_life_activities()
+        result = asyncio.run(life_activity_service.get_life_activities())
 
         self.assertEqual(result, life_activities)
-        get_nodes_mock.assert_called_once_with("`Life Activity`")
+        get_nodes_mock.assert_called_once_with("`Life Activity`", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_life_activities_empty(self, get_nodes_mock):
@@ -86,7 +72,7 @@ class TestLifeActivityServiceGet(unittest.TestCase):
         life_activities = LifeActivitiesOut(life_activities=[])
         life_activity_service = LifeActivityService()
 
-        result = life_activity_service.get_life_activities()
+        result = asyncio.run(life_activity_service.get_life_activities())
 
         self.assertEqual(result, life_activities)
-        get_nodes_mock.assert_called_once_with("`Life Activity`")
+        get_nodes_mock.assert_called_once_with("`Life Activity`", None, None, None)
@@ -1,35 +1,34 @@
-import json
+import asyncio
 import unittest
 import unittest.mock as mock
 from life_activity.life_activity_model import *
 from life_activity.life_activity_service import *
-from requests import Response
+from graph_api_service import GraphApiService
+from httpx import Response
 
 
 class TestLifeActivityServicePost(unittest.TestCase):
 
-    @mock.patch('graph_api_service.requests')
-    def test_life_activity_post_service_without_error(self, mock_requests):
-        response = Response()
-        response._content = json.dumps({'id': 1, 'properties': None, "errors": None,
-                                        'links': None}).encode('utf-8')
-        mock_requests.post.return_value = response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_life_activity_post_service_without_error(self, get_client_mock):
+        response = Response(200, json={'id': 1, 'properties': None, "errors": None,
+                                       'links': None})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
         life_activity = LifeActivityIn(life_activity="movement")
         life_activity_service = LifeActivityService()
 
-        result = life_activity_service.save_life_activity(life_activity)
+        result = asyncio.run(life_activity_service.save_life_activity(life_activity))
 
         self.assertEqual(result, LifeActivityOut(life_activity="movement", id=1))
 
-    @mock.patch('graph_api_service.requests')
-    def test_life_activity_post_service_with_error(self, mock_requests):
-        response = Response()
-        response._content = json.dumps({'id': None, 'properties': None, "errors": {'error': 'test'},
-                                        'links': None}).encode('utf-8')
-        mock_requests.post.return_value = response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_life_activity_post_service_with_error(self, get_client_mock):
+        response = Response(200, json={'id': None, 'properties': None, "errors": {'error': 'test'},
+                                       'links': None})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
         life_activity = LifeActivityIn(life_activity="movement")
         life_activity_service = LifeActivityService()
 
-        result = life_activity_service.save_life_activity(life_activity)
+        result = asyncio.run(life_activity_service.save_life_activity(life_activity))
 
         self.assertEqual(result, LifeActivityOut(life_activity="movement", errors={'error': 'test'}))
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -11,21 +12,20 @@ from graph_api_service import GraphApiService
 class TestMeasureServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_measure_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_measure_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Measure'],
                                       'properties': [{'key': 'datatype', 'value': 'Test'},
                                                                           {'key': 'range', 'value': 'Unknown'},
                                                                           {'key': 'unit', 'value': 'cm'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         measure = MeasureOut(datatype="Test", range="Unknown", unit="cm", id=id_node,
                                                 relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                                relation_id=0)],
@@ -34,24 +34,10 @@ class TestMeasureServiceGet(unittest.TestCase):
                                                                                         relation_id=0)])
         measure_service = MeasureService()
 
-        result = measure_service.get_measure(id_node)
+        result = asyncio.run(measure_service.get_measure(id_node))
 
         self.assertEqual(result, measure)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_measure_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        measure_service = MeasureService()
-
-        result = measure_service.get_measure(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Measure", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_measure_with_error(self, get_node_mock):
@@ -60,10 +46,10 @@ class TestMeasureServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         measure_service = MeasureService()
 
-        result = measure_service.get_measure(id_node)
+        result = asyncio.run(measure_service.get_measure(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Measure", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_measures(self, get_nodes_mock):
@@ -74,24 +60,25 @@ class TestMeasureServiceGet(unittest.TestCase):
                                                  {'id': 2, 'labels': ['Measure'],
                                                   'properties': [{'key': 'datatype', 'value': 'Test'},
                                                                           {'key': 'range', 'value': 'Unknown'},
-                                                                          {'key': 'unit', 'value': 'cm'}]}]}
+                                                                          {'key': 'unit', 'value': 'cm'}]}],
+                                       'errors': None}
         measure_one = BasicMeasureOut(id=1, datatype="Test", range="Unknown", unit="cm")
         measure_two = BasicMeasureOut(id=2, datatype="Test", range="Unknown", unit="cm")
         measures = MeasuresOut(measures=[measure_one, measure_two])
         measures_service = MeasureService()
 
-        result = measures_service.get_measures()
+        result = asyncio.run(measures_service.get_measures())
 
         self.assertEqual(result, measures)
-        get_nodes_mock.assert_called_once_with("`Measure`")
+        get_nodes_mock.assert_called_once_with("`Measure`", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_measures_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         measures = MeasuresOut(measure=[])
         measures_service = MeasureService()
 
-        result = measures_service.get_measures()
+        result = asyncio.run(measures_service.get_measures())
 
         self.assertEqual(result, measures)
-        get_nodes_mock.assert_called_once_with("`Measure`")
+        get_nodes_mock.assert_called_once_with("`Measure`", None, None, None)
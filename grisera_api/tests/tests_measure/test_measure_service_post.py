@@ -1,48 +1,47 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
 from graph_api_service import GraphApiService
 from measure.measure_model import *
 from measure.measure_service import MeasureService
-from measure_name.measure_name_model import MeasureNameOut, BasicMeasureNameOut
-from measure_name.measure_name_service import MeasureNameService
 
 
 class TestMeasureServicePost(unittest.TestCase):
 
-    @mock.patch.object(GraphApiService, 'create_node')
-    @mock.patch.object(GraphApiService, 'create_relationships')
-    @mock.patch.object(GraphApiService, 'create_properties')
-    @mock.patch.object(MeasureNameService, 'get_measure_name')
-    @mock.patch.object(MeasureService, 'get_measure')
-    def test_save_measure_without_error(self, get_measure_mock, get_measure_name_mock, create_properties_mock,
-                                        create_relationships_mock, create_node_mock):
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    def test_save_measure_without_errors(self, create_subgraph_mock):
         id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
-        create_relationships_mock.return_value = {'id': 3, 'start_node': 2, 'end_node': 3, "errors": None,
-                                                  'links': None}
-        get_measure_name_mock.return_value = MeasureNameOut(id=6, name="Test", type="Test")
-        get_measure_mock.return_value = MeasureOut(measure_name_id=6, datatype="Test", range="Unknown", unit="cm", id=id_node)
-        calls = [mock.call(start_node=id_node, end_node=6, name="hasMeasureName")]
-        measure = MeasureIn(measure_name_id=6, datatype="Test", range="Unknown", unit="cm")
+        create_subgraph_mock.return_value = {'id': id_node, 'labels': ['Measure'],
+                                             'properties': [{'key': 'datatype', 'value': "Test"},
+                                                            {'key': 'range', 'value': "Unknown"},
+                                                            {'key': 'unit', 'value': "cm"}],
+                                             'relationships': [
+                                                 {"start_node": id_node, "end_node": 2, "name": "hasMeasureName",
+                                                  "id": 4, "properties": None}],
+                                             "errors": None, 'links': None}
+        measure_in = MeasureIn(measure_name_id=2, datatype="Test", range="Unknown", unit="cm")
+        measure_out = MeasureOut(
+            datatype="Test", range="Unknown", unit="cm",
+            relations=[RelationInformation(second_node_id=2, name="hasMeasureName", relation_id=4)],
+            reversed_relations=[], id=id_node)
         measure_service = MeasureService()
 
-        result = measure_service.save_measure(measure)
+        result = asyncio.run(measure_service.save_measure(measure_in))
 
-        self.assertEqual(result, MeasureOut(measure_name_id=6, datatype="Test", range="Unknown", unit="cm", id=id_node))
-        create_node_mock.assert_called_once_with('`Measure`')
-        get_measure_name_mock.assert_called_once()
-        create_relationships_mock.assert_has_calls(calls)
-        create_properties_mock.assert_called_once_with(id_node, measure)
+        self.assertEqual(result, measure_out)
+        create_subgraph_mock.assert_called_once_with('`Measure`', MeasureIn(datatype="Test", range="Unknown",
+                                                                             unit="cm"), [
+            (2, "hasMeasureName", "Measure Name")])
 
-    @mock.patch.object(GraphApiService, 'create_node')
-    def test_save_measure_with_node_error(self, create_node_mock):
-        create_node_mock.return_value = {'properties': None, "errors": ['error'], 'links': None}
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    def test_save_measure_with_node_error(self, create_subgraph_mock):
+        id_node = 1
+        create_subgraph_mock.return_value = {'id': id_node, 'properties': None, "errors": ['error'], 'links': None}
         measure = MeasureIn(measure_name_id=1, datatype="Test", range="Unknown", unit="cm")
         measure_service = MeasureService()
 
-        result = measure_service.save_measure(measure)
+        result = asyncio.run(measure_service.save_measure(measure))
 
-        self.assertEqual(result,
-                         MeasureOut(datatype="Test", range="Unknown", unit="cm", errors=['error']))
-        create_node_mock.assert_called_once_with('`Measure`')
+        self.assertEqual(result, MeasureOut(datatype="Test", range="Unknown", unit="cm", errors=['error']))
+        create_subgraph_mock.assert_called_once()
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -11,20 +12,19 @@ from graph_api_service import GraphApiService
 class TestMeasureNameServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_measure_name_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_measure_name_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Measure Name'],
                                       'properties': [{'key': 'name', 'value': 'Familiarity'},
                                                      {'key': 'type', 'value': 'Addional emotions measure'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         measure_name = MeasureNameOut(name="Familiarity", type="Addional emotions measure", id=id_node,
                                    relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                   relation_id=0)],
@@ -32,24 +32,10 @@ class TestMeasureNameServiceGet(unittest.TestCase):
                                                                            name="testReversedRelation", relation_id=0)])
         measure_name_service = MeasureNameService()
 
-        result = measure_name_service.get_measure_name(id_node)
+        result = asyncio.run(measure_name_service.get_measure_name(id_node))
 
         self.assertEqual(result, measure_name)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_measure_name_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        measure_name_service = MeasureNameService()
-
-        result = measure_name_service.get_measure_name(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Measure Name", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_measure_name_with_error(self, get_node_mock):
@@ -58,10 +44,10 @@ class TestMeasureNameServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         measure_name_service = MeasureNameService()
 
-        result = measure_name_service.get_measure_name(id_node)
+        result = asyncio.run(measure_name_service.get_measure_name(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Measure Name", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_measure_names(self, get_nodes_mock):
@@ -77,10 +63,10 @@ class TestMeasureNameServiceGet(unittest.TestCase):
         measure_names = MeasureNamesOut(measure_names=[measure_name_one, measure_name_two])
         measure_name_service = MeasureNameService()
 
-        result = measure_name_service.get_measure_names()
+        result = asyncio.run(measure_name_service.get_measure_names())
 
         self.assertEqual(result, measure_names)
-        get_nodes_mock.assert_called_once_with("`Measure Name`")
+        get_nodes_mock.assert_called_once_with("`Measure Name`", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_measure_names_empty(self, get_nodes_mock):
@@ -88,7 +74,7 @@ class TestMeasureNameServiceGet(unittest.TestCase):
         measure_names = MeasureNamesOut(measure_names=[])
         measure_name_service = MeasureNameService()
 
-        result = measure_name_service.get_measure_names()
+        result = asyncio.run(measure_name_service.get_measure_names())
 
         self.assertEqual(result, measure_names)
-        get_nodes_mock.assert_called_once_with("`Measure Name`")
+        get_nodes_mock.assert_called_once_with("`Measure Name`", None, None, None)
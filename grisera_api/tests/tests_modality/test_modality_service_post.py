@@ -1,35 +1,36 @@
-import json
+import asyncio
 import unittest
 import unittest.mock as mock
 from modality.modality_model import *
 from modality.modality_service import *
-from requests import Response
+from graph_api_service import GraphApiService
+from httpx import Response
 
 
 class TestModalityServicePost(unittest.TestCase):
 
-    @mock.patch('graph_api_service.requests')
-    def test_modality_post_service_without_error(self, mock_requests):
-        response = Response()
-        response._content = json.dumps({'id': 1, 'properties': None, "errors": None,
-                                        'links': None}).encode('utf-8')
-        mock_requests.post.return_value = response
+    @mock.patch.object(GraphApiService, '_reference_nodes', {'Modality': {2}})
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_modality_post_service_without_error(self, get_client_mock):
+        response = Response(200, json={'id': 1, 'properties': None, "errors": None,
+                                       'links': None})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
         modality = ModalityIn(modality="motion")
         modality_service = ModalityService()
 
-        result = modality_service.save_modality(modality)
+        result = asyncio.run(modality_service.save_modality(modality))
 
         self.assertEqual(result, ModalityOut(modality="motion", id=1))
+        self.assertNotIn("Modality", GraphApiService._reference_nodes)
 
-    @mock.patch('graph_api_service.requests')
-    def test_modality_post_service_with_error(self, mock_requests):
-        response = Response()
-        response._content = json.dumps({'id': None, 'properties': None, "errors": {'error': 'test'},
-                                        'links': None}).encode('utf-8')
-        mock_requests.post.return_value = response
+    @mock.patch.object(GraphApiService, 'get_client')
+    def test_modality_post_service_with_error(self, get_client_mock):
+        response = Response(200, json={'id': None, 'properties': None, "errors": {'error': 'test'},
+                                       'links': None})
+        get_client_mock.return_value.post = mock.AsyncMock(return_value=response)
         modality = ModalityIn(modality="motion")
         modality_service = ModalityService()
 
-        result = modality_service.save_modality(modality)
+        result = asyncio.run(modality_service.save_modality(modality))
 
         self.assertEqual(result, ModalityOut(modality="motion", errors={'error': 'test'}))
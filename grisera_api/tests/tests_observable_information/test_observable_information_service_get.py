@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,19 +11,18 @@ from observable_information.observable_information_service import ObservableInfo
 class TestObservableInformationServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_observable_information_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_observable_information_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Observable Information'],
                                       'properties': [],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         observable_information = ObservableInformationOut(id=id_node,
                                                   relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                                  relation_id=0)],
@@ -31,24 +31,10 @@ class TestObservableInformationServiceGet(unittest.TestCase):
                                                                                           relation_id=0)])
         observable_information_service = ObservableInformationService()
 
-        result = observable_information_service.get_observable_information(id_node)
+        result = asyncio.run(observable_information_service.get_observable_information(id_node))
 
         self.assertEqual(result, observable_information)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_observable_information_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        observable_information_service = ObservableInformationService()
-
-        result = observable_information_service.get_observable_information(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Observable Information", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_observable_information_with_error(self, get_node_mock):
@@ -57,10 +43,10 @@ class TestObservableInformationServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         observable_information_service = ObservableInformationService()
 
-        result = observable_information_service.get_observable_information(id_node)
+        result = asyncio.run(observable_information_service.get_observable_information(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Observable Information", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_observable_informations(self, get_nodes_mock):
@@ -68,7 +54,7 @@ class TestObservableInformationServiceGet(unittest.TestCase):
                                                   'properties': None},
                                                  {'id': 2, 'labels': ['Observable Information'],
                                                   'properties': None
-                                                  }]}
+                                                  }], 'errors': None}
 
         observable_information_one = BasicObservableInformationOut(id=1)
         observable_information_two = BasicObservableInformationOut(id=2)
@@ -76,18 +62,18 @@ class TestObservableInformationServiceGet(unittest.TestCase):
             observable_informations=[observable_information_one, observable_information_two])
         observable_informations_service = ObservableInformationService()
 
-        result = observable_informations_service.get_observable_informations()
+        result = asyncio.run(observable_informations_service.get_observable_informations())
 
         self.assertEqual(result, observable_informations)
-        get_nodes_mock.assert_called_once_with("`Observable Information`")
+        get_nodes_mock.assert_called_once_with("`Observable Information`", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_observable_informations_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         observable_informations = ObservableInformationsOut(observable_information=[])
         observable_informations_service = ObservableInformationService()
 
-        result = observable_informations_service.get_observable_informations()
+        result = asyncio.run(observable_informations_service.get_observable_informations())
 
         self.assertEqual(result, observable_informations)
-        get_nodes_mock.assert_called_once_with("`Observable Information`")
+        get_nodes_mock.assert_called_once_with("`Observable Information`", None, None, None)
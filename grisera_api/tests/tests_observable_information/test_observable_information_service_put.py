@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,63 +11,82 @@ from graph_api_service import GraphApiService
 
 class TestObservableInformationServicePut(unittest.TestCase):
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
+    @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
     @mock.patch.object(GraphApiService, 'delete_node_properties')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_observable_information_relationships_without_error(self, get_node_relationships_mock, delete_node_properties_mock,
-                                                    get_node_mock, create_properties_mock):
+    def test_update_observable_information_relationships_without_error(self, delete_node_properties_mock,
+                                                    get_node_mock, create_properties_mock, create_relationships_mock,
+                                                    nodes_exist_mock):
         id_node = 1
         create_properties_mock.return_value = {}
         delete_node_properties_mock.return_value = {}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Observable Information'],
-                                      'properties': None,
-                                      "errors": None, 'links': None}
+        node = {'id': id_node, 'labels': ['Observable Information'],
+                'properties': None,
+                "errors": None, 'links': None,
+                'relationships': [
+                    {"start_node": id_node, "end_node": 19,
+                     "name": "testRelation", "id": 0,
+                     "properties": None},
+                    {"start_node": 15, "end_node": id_node,
+                     "name": "testReversedRelation", "id": 0,
+                     "properties": None}]}
+        get_node_mock.return_value = node
+        nodes_exist_mock.return_value = {'nodes': [{'id': 15, 'label': 'Modality', 'exists': False},
+                                                   {'id': 19, 'label': 'Life Activity', 'exists': False}],
+                                         'errors': None, 'links': None}
         observable_information_in = ObservableInformationIn(modality_id=15, life_activity_id=19)
         observable_information_out = ObservableInformationOut(id=id_node, relations=
                                  [RelationInformation(second_node_id=19, name="testRelation", relation_id=0)],
                                                     reversed_relations=
                                  [RelationInformation(second_node_id=15, name="testReversedRelation", relation_id=0)])
-        calls = [mock.call(1)]
+        calls = [mock.call(1, "Observable Information", include_relationships=True)]
         observable_information_service = ObservableInformationService()
 
-        result = observable_information_service.update_observable_information_relationships(id_node, observable_information_in)
+        result = asyncio.run(observable_information_service.update_observable_information_relationships(id_node, observable_information_in))
 
         self.assertEqual(result, observable_information_out)
         get_node_mock.assert_has_calls(calls)
+        nodes_exist_mock.assert_called_once_with([(15, "Modality"), (19, "Life Activity")])
         create_properties_mock.assert_not_called()
-        get_node_relationships_mock.assert_has_calls([mock.call(1), mock.call(1)])
+        create_relationships_mock.assert_not_called()
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
+    @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_observable_information_relationships_without_label(self, get_node_mock):
+    def test_update_observable_information_relationships_to_found_nodes(self, get_node_mock,
+                                                                        create_relationships_mock, nodes_exist_mock):
         id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        observable_information_in = ObservableInformationIn(modality_id=15, life_activity_id=19)
+        get_node_mock.return_value = {'id': 1, 'labels': ['Observable Information'], 'properties': None,
+                                      'errors': None, 'links': None, 'relationships': []}
+        nodes_exist_mock.return_value = {'nodes': [{'id': 15, 'label': 'Modality', 'exists': True},
+                                                   {'id': 19, 'label': 'Life Activity', 'exists': False},
+                                                   {'id': 20, 'label': 'Recording', 'exists': False}],
+                                         'errors': None, 'links': None}
+        create_relationships_mock.return_value = {}
+        observable_information_in = ObservableInformationIn(modality_id=15, life_activity_id=19, recording_id=20)
         observable_information_service = ObservableInformationService()
 
-        result = observable_information_service.update_observable_information_relationships(id_node, observable_information_in)
+        result = asyncio.run(observable_information_service.update_observable_information_relationships(
+            id_node, observable_information_in))
 
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        self.assertEqual(result, ObservableInformationOut(id=id_node, relations=[], reversed_relations=[]))
+        get_node_mock.assert_called_with(1, "Observable Information", include_relationships=True)
+        nodes_exist_mock.assert_called_once_with([(15, "Modality"), (19, "Life Activity"), (20, "Recording")])
+        create_relationships_mock.assert_called_once_with(start_node=id_node, end_node=15, name="hasModality")
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
     @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_observable_information_relationships_with_error(self, get_node_mock):
+    def test_update_observable_information_relationships_with_error(self, get_node_mock, nodes_exist_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
+        nodes_exist_mock.return_value = {'nodes': [], 'errors': None, 'links': None}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         observable_information_in = ObservableInformationIn(modality_id=15, life_activity_id=19)
         observable_information_service = ObservableInformationService()
 
-        result = observable_information_service.update_observable_information_relationships(id_node, observable_information_in)
+        result = asyncio.run(observable_information_service.update_observable_information_relationships(id_node, observable_information_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Observable Information", include_relationships=True)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -8,48 +9,28 @@ from participant.participant_service import ParticipantService
 
 class TestParticipantServicePost(unittest.TestCase):
 
-    @mock.patch.object(GraphApiService, 'create_node')
-    @mock.patch.object(GraphApiService, 'create_properties')
-    def test_save_participant_without_error(self, create_properties_mock, create_node_mock):
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    def test_save_participant_without_error(self, create_subgraph_mock):
         id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
-        create_properties_mock.return_value = {'id': id_node, 'properties': [{'key': 'sex', 'value': 'male'},
-                                                                             {'key': 'identifier', 'value': 5}],
-                                               "errors": None, 'links': None}
+        create_subgraph_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
         additional_properties = [PropertyIn(key='testkey', value='testvalue')]
         participant = ParticipantIn(name="Test Test", sex='male', additional_properties=additional_properties)
         participant_service = ParticipantService()
 
-        result = participant_service.save_participant(participant)
+        result = asyncio.run(participant_service.save_participant(participant))
 
         self.assertEqual(result, ParticipantOut(name="Test Test", sex='male', id=id_node,
                                                 additional_properties=additional_properties))
-        create_node_mock.assert_called_once_with('Participant')
-        create_properties_mock.assert_called_once_with(id_node, participant)
+        create_subgraph_mock.assert_called_once_with('Participant', participant)
 
-    @mock.patch.object(GraphApiService, 'create_node')
-    def test_save_participant_with_node_error(self, create_node_mock):
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    def test_save_participant_with_node_error(self, create_subgraph_mock):
         id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": ['error'], 'links': None}
+        create_subgraph_mock.return_value = {'id': id_node, 'properties': None, "errors": ['error'], 'links': None}
         participant = ParticipantIn(name="Test Test", sex='male',)
         participant_service = ParticipantService()
 
-        result = participant_service.save_participant(participant)
+        result = asyncio.run(participant_service.save_participant(participant))
 
         self.assertEqual(result, ParticipantOut(sex='male', name="Test Test", errors=['error']))
-        create_node_mock.assert_called_once_with('Participant')
-
-    @mock.patch.object(GraphApiService, 'create_node')
-    @mock.patch.object(GraphApiService, 'create_properties')
-    def test_save_participant_with_properties_error(self, create_properties_mock, create_node_mock):
-        id_node = 1
-        create_node_mock.return_value = {'id': id_node, 'properties': None, "errors": None, 'links': None}
-        create_properties_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
-        participant = ParticipantIn(name="Test Test", sex='male')
-        participant_service = ParticipantService()
-
-        result = participant_service.save_participant(participant)
-
-        self.assertEqual(result, ParticipantOut(name="Test Test", sex='male', errors=['error']))
-        create_node_mock.assert_called_once_with('Participant')
-        create_properties_mock.assert_called_once_with(id_node, participant)
+        create_subgraph_mock.assert_called_once_with('Participant', participant)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -12,19 +13,18 @@ class TestParticipantStateServiceDelete(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'delete_node')
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_delete_participant_state_without_error(self, get_node_relationships_mock, get_node_mock, delete_node_mock):
+    def test_delete_participant_state_without_error(self, get_node_mock, delete_node_mock):
         id_node = 1
         delete_node_mock.return_value = get_node_mock.return_value = {'id': id_node, 'labels': ['Participant State'],
                                                                       'properties': [{'key': 'age', 'value': 5}],
-                                                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                                                      "errors": None, 'links': None,
+                                                                      'relationships': [
+                                                                          {"start_node": id_node, "end_node": 19,
+                                                                           "name": "testRelation", "id": 0,
+                                                                           "properties": None},
+                                                                          {"start_node": 15, "end_node": id_node,
+                                                                           "name": "testReversedRelation", "id": 0,
+                                                                           "properties": None}]}
         participant_state = ParticipantStateOut(age=5, id=id_node, additional_properties=[],
                                                 relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                                relation_id=0)],
@@ -33,25 +33,12 @@ class TestParticipantStateServiceDelete(unittest.TestCase):
                                                                                         relation_id=0)])
         participant_state_service = ParticipantStateService()
 
-        result = participant_state_service.delete_participant_state(id_node)
+        result = asyncio.run(participant_state_service.delete_participant_state(id_node))
 
         self.assertEqual(result, participant_state)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Participant State", include_relationships=True)
         delete_node_mock.assert_called_once_with(id_node)
 
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_delete_participant_state_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        participant_state_service = ParticipantStateService()
-
-        result = participant_state_service.delete_participant_state(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
     @mock.patch.object(GraphApiService, 'get_node')
     def test_delete_participant_state_with_error(self, get_node_mock):
         id_node = 1
@@ -59,7 +46,7 @@ class TestParticipantStateServiceDelete(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         participant_state_service = ParticipantStateService()
 
-        result = participant_state_service.delete_participant_state(id_node)
+        result = asyncio.run(participant_state_service.delete_participant_state(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Participant State", include_relationships=True)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,19 +11,18 @@ from participation.participation_service import ParticipationService
 class TestParticipationServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_participation_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_participation_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Participation'],
                                       'properties': [],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         participation = ParticipationOut(id=id_node,
                                                   relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                                  relation_id=0)],
@@ -31,24 +31,10 @@ class TestParticipationServiceGet(unittest.TestCase):
                                                                                           relation_id=0)])
         participation_service = ParticipationService()
 
-        result = participation_service.get_participation(id_node)
+        result = asyncio.run(participation_service.get_participation(id_node))
 
         self.assertEqual(result, participation)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_participation_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        participation_service = ParticipationService()
-
-        result = participation_service.get_participation(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Participation", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_participation_with_error(self, get_node_mock):
@@ -57,10 +43,10 @@ class TestParticipationServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         participation_service = ParticipationService()
 
-        result = participation_service.get_participation(id_node)
+        result = asyncio.run(participation_service.get_participation(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Participation", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_participations(self, get_nodes_mock):
@@ -68,7 +54,7 @@ class TestParticipationServiceGet(unittest.TestCase):
                                                   'properties': None},
                                                  {'id': 2, 'labels': ['Participation'],
                                                   'properties': None
-                                                  }]}
+                                                  }], 'errors': None}
 
         participation_one = BasicParticipationOut(id=1)
         participation_two = BasicParticipationOut(id=2)
@@ -76,18 +62,18 @@ class TestParticipationServiceGet(unittest.TestCase):
             participations=[participation_one, participation_two])
         participations_service = ParticipationService()
 
-        result = participations_service.get_participations()
+        result = asyncio.run(participations_service.get_participations())
 
         self.assertEqual(result, participations)
-        get_nodes_mock.assert_called_once_with("Participation")
+        get_nodes_mock.assert_called_once_with("Participation", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_participations_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         participations = ParticipationsOut(participation=[])
         participations_service = ParticipationService()
 
-        result = participations_service.get_participations()
+        result = asyncio.run(participations_service.get_participations())
 
         self.assertEqual(result, participations)
-        get_nodes_mock.assert_called_once_with("Participation")
+        get_nodes_mock.assert_called_once_with("Participation", None, None, None)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,63 +11,76 @@ from graph_api_service import GraphApiService
 
 class TestParticipationServicePut(unittest.TestCase):
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
+    @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
     @mock.patch.object(GraphApiService, 'delete_node_properties')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_participation_relationships_without_error(self, get_node_relationships_mock, delete_node_properties_mock,
-                                                    get_node_mock, create_properties_mock):
+    def test_update_participation_relationships_without_error(self, delete_node_properties_mock,
+                                                    get_node_mock, create_properties_mock, create_relationships_mock,
+                                                    nodes_exist_mock):
         id_node = 1
         create_properties_mock.return_value = {}
         delete_node_properties_mock.return_value = {}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Participation'],
-                                      'properties': None,
-                                      "errors": None, 'links': None}
+        node = {'id': id_node, 'labels': ['Participation'],
+                'properties': None,
+                "errors": None, 'links': None,
+                'relationships': [
+                    {"start_node": id_node, "end_node": 19,
+                     "name": "testRelation", "id": 0,
+                     "properties": None},
+                    {"start_node": 15, "end_node": id_node,
+                     "name": "testReversedRelation", "id": 0,
+                     "properties": None}]}
+        get_node_mock.return_value = node
+        nodes_exist_mock.return_value = {'nodes': [{'id': 15, 'label': 'Activity Execution', 'exists': False},
+                                                   {'id': 19, 'label': 'Participant State', 'exists': False}],
+                                         'errors': None, 'links': None}
         participation_in = ParticipationIn(activity_execution_id=15, participant_state_id=19)
         participation_out = ParticipationOut(id=id_node, relations=
                                  [RelationInformation(second_node_id=19, name="testRelation", relation_id=0)],
                                                     reversed_relations=
                                  [RelationInformation(second_node_id=15, name="testReversedRelation", relation_id=0)])
-        calls = [mock.call(1)]
+        calls = [mock.call(1, "Participation", include_relationships=True)]
         participation_service = ParticipationService()
 
-        result = participation_service.update_participation_relationships(id_node, participation_in)
+        result = asyncio.run(participation_service.update_participation_relationships(id_node, participation_in))
 
         self.assertEqual(result, participation_out)
         get_node_mock.assert_has_calls(calls)
+        nodes_exist_mock.assert_called_once_with([(15, "Activity Execution"), (19, "Participant State")])
         create_properties_mock.assert_not_called()
-        get_node_relationships_mock.assert_has_calls([mock.call(1), mock.call(1)])
+        create_relationships_mock.assert_not_called()
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
+    @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_participation_relationships_without_label(self, get_node_mock):
+    def test_update_participation_relationships_with_failed_existence_check(self, get_node_mock,
+                                                                           create_relationships_mock,
+                                                                           nodes_exist_mock):
         id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
+        get_node_mock.return_value = {'id': id_node, 'labels': ['Participation'], 'properties': None,
+                                      'errors': None, 'links': None, 'relationships': []}
+        nodes_exist_mock.return_value = {'nodes': None, 'errors': ['error'], 'links': None}
         participation_in = ParticipationIn(activity_execution_id=15, participant_state_id=19)
         participation_service = ParticipationService()
 
-        result = participation_service.update_participation_relationships(id_node, participation_in)
+        result = asyncio.run(participation_service.update_participation_relationships(id_node, participation_in))
 
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        self.assertEqual(result, ParticipationOut(id=id_node, relations=[], reversed_relations=[], errors=['error']))
+        create_relationships_mock.assert_not_called()
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
     @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_participation_relationships_with_error(self, get_node_mock):
+    def test_update_participation_relationships_with_error(self, get_node_mock, nodes_exist_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
+        nodes_exist_mock.return_value = {'nodes': [], 'errors': None, 'links': None}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         participation_in = ParticipationIn(activity_execution_id=15, participant_state_id=19)
         participation_service = ParticipationService()
 
-        result = participation_service.update_participation_relationships(id_node, participation_in)
+        result = asyncio.run(participation_service.update_participation_relationships(id_node, participation_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Participation", include_relationships=True)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -12,8 +13,7 @@ class TestPersonalityServicePut(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_personality_big_five_without_error(self, get_node_relationships_mock, get_node_mock,
+    def test_update_personality_big_five_without_error(self, get_node_mock,
                                                        create_properties_mock):
         id_node = 1
         create_properties_mock.return_value = {}
@@ -24,14 +24,14 @@ class TestPersonalityServicePut(unittest.TestCase):
                                                                           {'key': 'extroversion', 'value': 2.5},
                                                                           {'key': 'neuroticism', 'value': 2.5},
                                                                           {'key': 'openess', 'value': 2.5}],
-                                                                      'errors': None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                                                      'errors': None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         personality_in = PersonalityBigFiveIn(agreeableness=0.5, conscientiousness=0.5, extroversion=0.5,
                                               neuroticism=0.5, openess=0.5)
         personality_out = PersonalityBigFiveOut(agreeableness=0.5, conscientiousness=0.5, extroversion=0.5,
@@ -43,30 +43,29 @@ class TestPersonalityServicePut(unittest.TestCase):
                                                                     relation_id=0)])
         personality_service = PersonalityService()
 
-        result = personality_service.update_personality_big_five(id_node, personality_in)
+        result = asyncio.run(personality_service.update_personality_big_five(id_node, personality_in))
 
         self.assertEqual(result, personality_out)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Personality", include_relationships=True)
         create_properties_mock.assert_called_once_with(id_node, personality_in)
 
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_personality_panas_without_error(self, get_node_relationships_mock, get_node_mock,
+    def test_update_personality_panas_without_error(self, get_node_mock,
                                                     create_properties_mock):
         id_node = 1
         create_properties_mock.return_value = {}
         get_node_mock.return_value = {'id': id_node, 'labels': ['Personality'],
                                       'properties': [{'key': 'negative_affect', 'value': 0.5},
                                                      {'key': 'positive_affect', 'value': 0.5}],
-                                      'errors': None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      'errors': None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         personality_in = PersonalityPanasIn(negative_affect=0.5, positive_affect=0.5)
         personality_out = PersonalityPanasOut(negative_affect=0.5, positive_affect=0.5, id=id_node, relations=[
             RelationInformation(second_node_id=19, name="testRelation",
@@ -76,99 +75,52 @@ class TestPersonalityServicePut(unittest.TestCase):
                                                                   relation_id=0)])
         personality_service = PersonalityService()
 
-        result = personality_service.update_personality_panas(id_node, personality_in)
+        result = asyncio.run(personality_service.update_personality_panas(id_node, personality_in))
 
         self.assertEqual(result, personality_out)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Personality", include_relationships=True)
         create_properties_mock.assert_called_once_with(id_node, personality_in)
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_personality_big_five_without_appearance_label(self, get_node_relationships_mock, get_node_mock):
+    def test_update_personality_big_five_with_error(self, get_node_mock):
         id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        personality_in = PersonalityBigFiveIn(agreeableness=0.5, conscientiousness=0.5, extroversion=0.5,
-                                              neuroticism=0.5, openess=0.5)
-        personality_service = PersonalityService()
-
-        result = personality_service.update_personality_big_five(id_node, personality_in)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_personality_panas_without_appearance_label(self, get_node_relationships_mock, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        personality_in = PersonalityPanasIn(negative_affect=0.5, positive_affect=0.5)
-        personality_service = PersonalityService()
-
-        result = personality_service.update_personality_panas(id_node, personality_in)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_personality_big_five_with_error(self, get_node_relationships_mock, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         personality_in = PersonalityBigFiveIn(agreeableness=0.5, conscientiousness=0.5, extroversion=0.5,
                                               neuroticism=0.5, openess=0.5)
         personality_service = PersonalityService()
 
-        result = personality_service.update_personality_big_five(id_node, personality_in)
+        result = asyncio.run(personality_service.update_personality_big_five(id_node, personality_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Personality", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_personality_panas_with_error(self, get_node_relationships_mock, get_node_mock):
+    def test_update_personality_panas_with_error(self, get_node_mock):
         id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+        get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         personality_in = PersonalityPanasIn(negative_affect=0.5, positive_affect=0.5)
         personality_service = PersonalityService()
 
-        result = personality_service.update_personality_panas(id_node, personality_in)
+        result = asyncio.run(personality_service.update_personality_panas(id_node, personality_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Personality", include_relationships=True)
 
     def test_update_personality_big_five_with_wrong_range(self):
         id_node = 1
@@ -179,6 +131,6 @@ class TestPersonalityServicePut(unittest.TestCase):
                                                 neuroticism=2.5, openess=2.5, errors="Value not between 0 and 1")
         personality_service = PersonalityService()
 
-        result = personality_service.update_personality_big_five(id_node, personality_in)
+        result = asyncio.run(personality_service.update_personality_big_five(id_node, personality_in))
 
         self.assertEqual(result, personality_out)
@@ -50,4 +50,56 @@ class TestRecordingRouterGet(unittest.TestCase):
             BasicRecordingOut(id=2)],
             links=get_links(router)))
         get_recordings_mock.assert_called_once()
-        self.assertEqual(response.status_code, 200)
\ No newline at end of file
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(RecordingService, 'get_recordings')
+    def test_get_recordings_with_next_page(self, get_recordings_mock):
+        get_recordings_mock.return_value = RecordingsOut(recordings=[BasicRecordingOut(id=1)], next_after=1)
+        response = Response()
+        recording_router = RecordingRouter()
+
+        result = asyncio.run(recording_router.get_recordings(response, 1, None, where=None))
+
+        self.assertEqual(result, RecordingsOut(recordings=[BasicRecordingOut(id=1)], next_after=1,
+                                               links=get_links(router) + [{'rel': 'next', 'action': 'GET',
+                                                                           '$ref': '/recordings?limit=1&after=1'}]))
+        get_recordings_mock.assert_called_once_with(1, None, None)
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch('recording.recording_router.stream_ndjson')
+    def test_get_recordings_as_ndjson(self, stream_ndjson_mock):
+        stream_ndjson_mock.return_value = iter(['{"id": 1}\n'])
+        response = Response()
+        recording_router = RecordingRouter()
+
+        result = asyncio.run(recording_router.get_recordings(response, None, 3, ResponseFormat.ndjson, ["name:a"]))
+
+        self.assertEqual(result.media_type, "application/x-ndjson")
+        get_page, items_name, after = stream_ndjson_mock.call_args.args
+        self.assertEqual(get_page.func, recording_router.recording_service.get_recordings)
+        self.assertEqual(get_page.keywords, {"where": ["name:a"]})
+        self.assertEqual((items_name, after), ("recordings", 3))
+
+    @mock.patch.object(RecordingService, 'get_recordings')
+    def test_get_recordings_with_filters(self, get_recordings_mock):
+        get_recordings_mock.return_value = RecordingsOut(recordings=[BasicRecordingOut(id=1)], next_after=1)
+        response = Response()
+        recording_router = RecordingRouter()
+
+        result = asyncio.run(recording_router.get_recordings(response, 1, None, where=["source:s", "id:>2"]))
+
+        self.assertEqual(result.links[-1], {'rel': 'next', 'action': 'GET',
+                                            '$ref': '/recordings?limit=1&after=1&where=source%3As&where=id%3A%3E2'})
+        get_recordings_mock.assert_called_once_with(1, None, ["source:s", "id:>2"])
+
+    @mock.patch.object(RecordingService, 'get_recordings')
+    def test_get_recordings_with_error(self, get_recordings_mock):
+        get_recordings_mock.return_value = RecordingsOut(errors={'errors': ['unknown operator']})
+        response = Response()
+        recording_router = RecordingRouter()
+
+        result = asyncio.run(recording_router.get_recordings(response, None, None, where=["source:~camera"]))
+
+        self.assertEqual(result, RecordingsOut(errors={'errors': ['unknown operator']}, links=get_links(router)))
+        get_recordings_mock.assert_called_once_with(None, None, ["source:~camera"])
+        self.assertEqual(response.status_code, 422)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -11,19 +12,18 @@ from property.property_model import *
 class TestRecordingServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_recording_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_recording_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Recording'],
                                       'properties': [],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         recording = RecordingOut(additional_properties=[], id=id_node,
                                  relations=[RelationInformation(second_node_id=19,
                                                                 name="testRelation",
@@ -33,24 +33,10 @@ class TestRecordingServiceGet(unittest.TestCase):
                                                                          relation_id=0)])
         recording_service = RecordingService()
 
-        result = recording_service.get_recording(id_node)
+        result = asyncio.run(recording_service.get_recording(id_node))
 
         self.assertEqual(result, recording)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_recording_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        recording_service = RecordingService()
-
-        result = recording_service.get_recording(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Recording", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_recording_with_error(self, get_node_mock):
@@ -59,17 +45,17 @@ class TestRecordingServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         recording_service = RecordingService()
 
-        result = recording_service.get_recording(id_node)
+        result = asyncio.run(recording_service.get_recording(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Recording", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_recordings(self, get_nodes_mock):
         get_nodes_mock.return_value = {'nodes': [{'id': 1, 'labels': ['Recording'],
                                                   'properties': [{'key': 'test', 'value': 'test'}]},
                                                  {'id': 2, 'labels': ['Recording'],
-                                                  'properties': [{'key': 'test2', 'value': 'test3'}]}]}
+                                                  'properties': [{'key': 'test2', 'value': 'test3'}]}], 'errors': None}
         recording_one = BasicRecordingOut(additional_properties=[PropertyIn(key='test', value='test')],
                                           id=1)
         recording_two = BasicRecordingOut(additional_properties=[PropertyIn(key='test2', value='test3')],
@@ -78,18 +64,52 @@ class TestRecordingServiceGet(unittest.TestCase):
             recordings=[recording_one, recording_two])
         recordings_service = RecordingService()
 
-        result = recordings_service.get_recordings()
+        result = asyncio.run(recordings_service.get_recordings())
+
+        self.assertEqual(result, recordings)
+        get_nodes_mock.assert_called_once_with("Recording", None, None, None)
+
+    @mock.patch.object(GraphApiService, 'get_nodes')
+    def test_get_recordings_page(self, get_nodes_mock):
+        get_nodes_mock.return_value = {'nodes': [{'id': 3, 'labels': ['Recording'], 'properties': []}],
+                                       'next_after': 3, 'errors': None}
+        recordings = RecordingsOut(recordings=[BasicRecordingOut(additional_properties=[], id=3)], next_after=3)
+        recordings_service = RecordingService()
+
+        result = asyncio.run(recordings_service.get_recordings(1, 2))
 
         self.assertEqual(result, recordings)
-        get_nodes_mock.assert_called_once_with("Recording")
+        get_nodes_mock.assert_called_once_with("Recording", 1, 2, None)
+
+    @mock.patch.object(GraphApiService, 'get_nodes')
+    def test_get_recordings_with_filters(self, get_nodes_mock):
+        get_nodes_mock.return_value = {'nodes': [{'id': 3, 'labels': ['Recording'], 'properties': []}], 'errors': None}
+        recordings = RecordingsOut(recordings=[BasicRecordingOut(additional_properties=[], id=3)])
+        recordings_service = RecordingService()
+
+        result = asyncio.run(recordings_service.get_recordings(where=["source:camera"]))
+
+        self.assertEqual(result, recordings)
+        get_nodes_mock.assert_called_once_with("Recording", None, None, ["source:camera"])
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_recordings_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         recordings = RecordingsOut(recording=[])
         recordings_service = RecordingService()
 
-        result = recordings_service.get_recordings()
+        result = asyncio.run(recordings_service.get_recordings())
+
+        self.assertEqual(result, recordings)
+        get_nodes_mock.assert_called_once_with("Recording", None, None, None)
+
+    @mock.patch.object(GraphApiService, 'get_nodes')
+    def test_get_recordings_with_rejected_filter(self, get_nodes_mock):
+        get_nodes_mock.return_value = {'nodes': None, 'errors': {'errors': ['unknown operator']}}
+        recordings = RecordingsOut(errors={'errors': ['unknown operator']})
+        recordings_service = RecordingService()
+
+        result = asyncio.run(recordings_service.get_recordings(where=["source:~camera"]))
 
         self.assertEqual(result, recordings)
-        get_nodes_mock.assert_called_once_with("Recording")
+        get_nodes_mock.assert_called_once_with("Recording", None, None, ["source:~camera"])
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,19 +11,18 @@ from registered_channel.registered_channel_service import RegisteredChannelServi
 class TestRegisteredChannelServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_registered_channel_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_registered_channel_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Registered Channel'],
                                       'properties': [],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-            {"start_node": id_node, "end_node": 19,
-             "name": "testRelation", "id": 0,
-             "properties": None},
-            {"start_node": 15, "end_node": id_node,
-             "name": "testReversedRelation", "id": 0,
-             "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         registered_channel = RegisteredChannelOut(id=id_node,
                                                   relations=[RelationInformation(second_node_id=19, name="testRelation",
                                                                                  relation_id=0)],
@@ -31,24 +31,10 @@ class TestRegisteredChannelServiceGet(unittest.TestCase):
                                                                                           relation_id=0)])
         registered_channel_service = RegisteredChannelService()
 
-        result = registered_channel_service.get_registered_channel(id_node)
+        result = asyncio.run(registered_channel_service.get_registered_channel(id_node))
 
         self.assertEqual(result, registered_channel)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_registered_channel_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        registered_channel_service = RegisteredChannelService()
-
-        result = registered_channel_service.get_registered_channel(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Registered Channel", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_registered_channel_with_error(self, get_node_mock):
@@ -57,10 +43,10 @@ class TestRegisteredChannelServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         registered_channel_service = RegisteredChannelService()
 
-        result = registered_channel_service.get_registered_channel(id_node)
+        result = asyncio.run(registered_channel_service.get_registered_channel(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Registered Channel", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_registered_channels(self, get_nodes_mock):
@@ -69,25 +55,25 @@ class TestRegisteredChannelServiceGet(unittest.TestCase):
                                                                  {'key': 'test', 'value': 'test'}]},
                                                  {'id': 2, 'labels': ['Registered Channel'],
                                                   'properties': [{'key': 'age', 'value': 10},
-                                                                 {'key': 'test2', 'value': 'test3'}]}]}
+                                                                 {'key': 'test2', 'value': 'test3'}]}], 'errors': None}
         registered_channel_one = BasicRegisteredChannelOut(id=1)
         registered_channel_two = BasicRegisteredChannelOut(id=2)
         registered_channels = RegisteredChannelsOut(
             registered_channels=[registered_channel_one, registered_channel_two])
         registered_channels_service = RegisteredChannelService()
 
-        result = registered_channels_service.get_registered_channels()
+        result = asyncio.run(registered_channels_service.get_registered_channels())
 
         self.assertEqual(result, registered_channels)
-        get_nodes_mock.assert_called_once_with("`Registered Channel`")
+        get_nodes_mock.assert_called_once_with("`Registered Channel`", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_registered_channels_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         registered_channels = RegisteredChannelsOut(registered_channel=[])
         registered_channels_service = RegisteredChannelService()
 
-        result = registered_channels_service.get_registered_channels()
+        result = asyncio.run(registered_channels_service.get_registered_channels())
 
         self.assertEqual(result, registered_channels)
-        get_nodes_mock.assert_called_once_with("`Registered Channel`")
+        get_nodes_mock.assert_called_once_with("`Registered Channel`", None, None, None)
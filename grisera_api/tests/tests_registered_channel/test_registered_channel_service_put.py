@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -10,63 +11,58 @@ from graph_api_service import GraphApiService
 
 class TestRegisteredChannelServicePut(unittest.TestCase):
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
+    @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
     @mock.patch.object(GraphApiService, 'delete_node_properties')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_registered_channel_relationships_without_error(self, get_node_relationships_mock, delete_node_properties_mock,
-                                                    get_node_mock, create_properties_mock):
+    def test_update_registered_channel_relationships_without_error(self, delete_node_properties_mock,
+                                                    get_node_mock, create_properties_mock, create_relationships_mock,
+                                                    nodes_exist_mock):
         id_node = 1
         create_properties_mock.return_value = {}
         delete_node_properties_mock.return_value = {}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Registered Channel'],
-                                      'properties': [{'key': 'age', 'value': 5}, {'key': 'identifier', 'value': 5}],
-                                      "errors": None, 'links': None}
+        node = {'id': id_node, 'labels': ['Registered Channel'],
+                'properties': [{'key': 'age', 'value': 5}, {'key': 'identifier', 'value': 5}],
+                "errors": None, 'links': None,
+                'relationships': [
+                    {"start_node": id_node, "end_node": 19,
+                     "name": "testRelation", "id": 0,
+                     "properties": None},
+                    {"start_node": 15, "end_node": id_node,
+                     "name": "testReversedRelation", "id": 0,
+                     "properties": None}]}
+        get_node_mock.return_value = node
+        nodes_exist_mock.return_value = {'nodes': [{'id': 15, 'label': 'Channel', 'exists': False},
+                                                   {'id': 19, 'label': 'Registered Data', 'exists': False}],
+                                         'errors': None, 'links': None}
         registered_channel_in = RegisteredChannelIn(channel_id=15, registered_data_id=19)
         registered_channel_out = RegisteredChannelOut(id=id_node, relations=
                                  [RelationInformation(second_node_id=19, name="testRelation", relation_id=0)],
                                                     reversed_relations=
                                  [RelationInformation(second_node_id=15, name="testReversedRelation", relation_id=0)])
-        calls = [mock.call(1)]
+        calls = [mock.call(1, "Registered Channel", include_relationships=True)]
         registered_channel_service = RegisteredChannelService()
 
-        result = registered_channel_service.update_registered_channel_relationships(id_node, registered_channel_in)
+        result = asyncio.run(registered_channel_service.update_registered_channel_relationships(id_node, registered_channel_in))
 
         self.assertEqual(result, registered_channel_out)
         get_node_mock.assert_has_calls(calls)
+        nodes_exist_mock.assert_called_once_with([(15, "Channel"), (19, "Registered Data")])
         create_properties_mock.assert_not_called()
-        get_node_relationships_mock.assert_has_calls([mock.call(1), mock.call(1)])
+        create_relationships_mock.assert_not_called()
 
+    @mock.patch.object(GraphApiService, 'nodes_exist')
     @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_registered_channel_relationships_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        registered_channel_in = RegisteredChannelIn(channel_id=15, registered_data_id=19)
-        registered_channel_service = RegisteredChannelService()
-
-        result = registered_channel_service.update_registered_channel_relationships(id_node, registered_channel_in)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_registered_channel_relationships_with_error(self, get_node_mock):
+    def test_update_registered_channel_relationships_with_error(self, get_node_mock, nodes_exist_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'errors': ['error'], 'links': None}
+        nodes_exist_mock.return_value = {'nodes': [], 'errors': None, 'links': None}
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         registered_channel_in = RegisteredChannelIn(channel_id=15, registered_data_id=19)
         registered_channel_service = RegisteredChannelService()
 
-        result = registered_channel_service.update_registered_channel_relationships(id_node, registered_channel_in)
+        result = asyncio.run(registered_channel_service.update_registered_channel_relationships(id_node, registered_channel_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Registered Channel", include_relationships=True)
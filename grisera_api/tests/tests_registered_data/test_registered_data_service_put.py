@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -13,8 +14,7 @@ class TestRegisteredDataServicePut(unittest.TestCase):
     @mock.patch.object(GraphApiService, 'create_properties')
     @mock.patch.object(GraphApiService, 'get_node')
     @mock.patch.object(GraphApiService, 'delete_node_properties')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_update_registered_data_without_error(self, get_node_relationships_mock, delete_node_properties_mock,
+    def test_update_registered_data_without_error(self, delete_node_properties_mock,
                                              get_node_mock, create_properties_mock):
         id_node = 1
         create_properties_mock.return_value = {}
@@ -22,14 +22,14 @@ class TestRegisteredDataServicePut(unittest.TestCase):
         get_node_mock.return_value = {'id': id_node, 'labels': ['Registered Data'],
                                       'properties': [{'key': 'source', 'value': 'test'},
                                                      {'key': 'test', 'value': 'test'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         additional_properties = [PropertyIn(key='test', value='test')]
         registered_data_in = RegisteredDataIn(source="test", additional_properties=additional_properties)
         registered_data_out = RegisteredDataOut(source="test", additional_properties=additional_properties, id=id_node,
@@ -40,26 +40,12 @@ class TestRegisteredDataServicePut(unittest.TestCase):
                                                             relation_id=0)])
         registered_data_service = RegisteredDataService()
 
-        result = registered_data_service.update_registered_data(id_node, registered_data_in)
+        result = asyncio.run(registered_data_service.update_registered_data(id_node, registered_data_in))
 
         self.assertEqual(result, registered_data_out)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Registered Data", include_relationships=True)
         create_properties_mock.assert_called_once_with(id_node, registered_data_in)
 
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_update_registered_data_without_participant_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        registered_data_in = RegisteredDataIn(source="test")
-        registered_data_service = RegisteredDataService()
-
-        result = registered_data_service.update_registered_data(id_node, registered_data_in)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
-
     @mock.patch.object(GraphApiService, 'get_node')
     def test_update_registered_data_with_error(self, get_node_mock):
         id_node = 1
@@ -68,7 +54,7 @@ class TestRegisteredDataServicePut(unittest.TestCase):
         registered_data_in = RegisteredDataIn(source="test")
         registered_data_service = RegisteredDataService()
 
-        result = registered_data_service.update_registered_data(id_node, registered_data_in)
+        result = asyncio.run(registered_data_service.update_registered_data(id_node, registered_data_in))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Registered Data", include_relationships=True)
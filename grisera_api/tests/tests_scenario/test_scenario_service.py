@@ -1,60 +1,96 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
-from graph_api_service import GraphApiService
+from graph_api_service import GraphApiService, TransactionError
 from scenario.scenario_model import *
 from scenario.scenario_service import ScenarioService, ActivityExecutionService
+from models.not_found_model import NotFoundByIdModel
+from models.relation_information_model import RelationInformation
+from property.property_model import PropertyIn
 
 
 class TestScenarioService(unittest.TestCase):
 
-    @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
-    @mock.patch.object(GraphApiService, 'create_relationships')
-    def test_save_scenario_without_error(self, create_relationships_mock, save_activity_execution_mock):
-        id_node = 1
-        activity_execution_out = ActivityExecutionOut(activity='group', arrangement_type='personal group', id=2)
-        save_activity_execution_mock.return_value = activity_execution_out
-        create_relationships_mock.return_value = activity_execution_out
-        calls = [mock.call(2, 2, 'hasScenario')]
-        scenario = ScenarioIn(experiment_id=2, activity_executions=[ActivityExecutionIn(activity_id=1,
-                                                                                        arrangement_id=3)])
+    @mock.patch.object(GraphApiService, 'create_chain')
+    def test_save_scenario_without_error(self, create_chain_mock):
+        create_chain_mock.return_value = {'root': {'id': 2, 'labels': ['Experiment']}, 'errors': None, 'nodes': [
+            {'id': 3, 'labels': ['Activity Execution'], 'properties': [{'key': 'scenario_position', 'value': 1.0}],
+             'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'hasScenario', 'id': 7},
+                               {'start_node': 3, 'end_node': 1, 'name': 'hasActivity', 'id': 8}]},
+            {'id': 4, 'labels': ['Activity Execution'], 'properties': [{'key': 'scenario_position', 'value': 2.0}],
+             'relationships': [{'start_node': 3, 'end_node': 4, 'name': 'nextActivityExecution', 'id': 9}]}]}
+        scenario = ScenarioIn(experiment_id=2, activity_executions=[
+            ActivityExecutionIn(activity_id=1, arrangement_id=3), ActivityExecutionIn()])
         scenario_service = ScenarioService()
 
-        result = scenario_service.save_scenario(scenario)
+        result = asyncio.run(scenario_service.save_scenario(scenario))
 
-        self.assertEqual(result, ScenarioOut(experiment_id=2, activity_executions=[activity_execution_out], id=id_node))
-        create_relationships_mock.assert_has_calls(calls)
+        self.assertEqual(result, ScenarioOut(experiment_id=2, activity_executions=[
+            ActivityExecutionOut(id=3, additional_properties=[PropertyIn(key='scenario_position', value=1.0)],
+                                 relations=[RelationInformation(second_node_id=1, name='hasActivity', relation_id=8)],
+                                 reversed_relations=[RelationInformation(second_node_id=2, name='hasScenario',
+                                                                         relation_id=7)]),
+            ActivityExecutionOut(id=4, additional_properties=[PropertyIn(key='scenario_position', value=2.0)],
+                                 relations=[],
+                                 reversed_relations=[RelationInformation(second_node_id=3,
+                                                                         name='nextActivityExecution',
+                                                                         relation_id=9)])]))
+        create_chain_mock.assert_called_once_with(2, "hasScenario", "nextActivityExecution", "`Activity Execution`", [
+            (ActivityExecutionIn(additional_properties=[PropertyIn.construct(key='scenario_position', value=1.0)]),
+             [(1, "hasActivity", "Activity"), (3, "hasArrangement", "Arrangement")]),
+            (ActivityExecutionIn(additional_properties=[PropertyIn.construct(key='scenario_position', value=2.0)]),
+             [])])
+
+    @mock.patch.object(GraphApiService, 'create_chain')
+    def test_save_scenario_with_error(self, create_chain_mock):
+        create_chain_mock.return_value = {'root': None, 'nodes': [], 'errors': "Root node not found"}
+        scenario = ScenarioIn(experiment_id=2, activity_executions=[ActivityExecutionIn()])
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.save_scenario(scenario))
+
+        self.assertEqual(result, ScenarioOut(experiment_id=2, activity_executions=[], errors="Root node not found"))
 
     @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
     @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'delete_relationship')
     def test_add_activity_execution_after_experiment(self, delete_relationship_mock, create_relationships_mock,
-                                           get_node_relationships_mock, save_activity_execution_mock):
-        get_node_relationships_mock.return_value = {'relationships': [{'start_node': 1, 'end_node': 2,
-                                                                       'name': 'hasScenario', 'id': 0}]}
+                                                     get_node_neighbourhood_mock, save_activity_execution_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 1, 'labels': ['Experiment'], 'properties': []},
+                      {'id': 2, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 1.0}]}],
+            'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 0}]}
         activity_execution = ActivityExecutionIn(activity_id=1, arrangement_id=3, identifier=0, name='Test')
         save_activity_execution_mock.return_value = ActivityExecutionOut(activity_id=1, arrangement_id=3,
                                                                          identifier=0, name='Test', id=3)
         calls = [mock.call(1, 3, 'hasScenario'), mock.call(3, 2, 'nextActivityExecution')]
         scenario_service = ScenarioService()
 
-        result = scenario_service.add_activity_execution(1, activity_execution)
+        result = asyncio.run(scenario_service.add_activity_execution(1, activity_execution))
 
         self.assertEqual(result, ActivityExecutionOut(activity_id=1, arrangement_id=3, identifier=0, name='Test', id=3))
         create_relationships_mock.assert_has_calls(calls)
         delete_relationship_mock.assert_called_once_with(0)
-        save_activity_execution_mock.assert_called_with(activity_execution)
+        save_activity_execution_mock.assert_called_with(ActivityExecutionIn(
+            activity_id=1, arrangement_id=3, identifier=0, name='Test',
+            additional_properties=[PropertyIn.construct(key='scenario_position', value=0.5)]))
+        get_node_neighbourhood_mock.assert_called_once_with(1, 1, ['hasScenario', 'nextActivityExecution'])
 
     @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
     @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'delete_relationship')
     def test_add_activity_execution_at_end(self, delete_relationship_mock, create_relationships_mock,
-                                 get_node_relationships_mock, save_activity_execution_mock):
-        get_node_relationships_mock.return_value = {'relationships': [{'start_node': 0, 'end_node': 1,
-                                                                       'name': 'nextActivityExecution', 'id': 0}
-                                                                      ]}
+                                           get_node_neighbourhood_mock, save_activity_execution_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 1, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 2.0}]},
+                      {'id': 0, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 1.0}]}],
+            'relationships': [{'start_node': 0, 'end_node': 1, 'name': 'nextActivityExecution', 'id': 0}]}
         activity_execution = ActivityExecutionIn(activity_id=1, arrangement_id=3, identifier=0,
                                                  name='Test')
         save_activity_execution_mock.return_value = ActivityExecutionOut(activity='group',
@@ -63,25 +99,30 @@ class TestScenarioService(unittest.TestCase):
         calls = [mock.call(1, 3, 'nextActivityExecution')]
         scenario_service = ScenarioService()
 
-        result = scenario_service.add_activity_execution(1, activity_execution)
+        result = asyncio.run(scenario_service.add_activity_execution(1, activity_execution))
 
         self.assertEqual(result, ActivityExecutionOut(activity='group', arrangement_type='personal group',
                                                       identifier=0, name='Test', id=3))
         create_relationships_mock.assert_has_calls(calls)
         delete_relationship_mock.assert_not_called()
-        save_activity_execution_mock.assert_called_with(activity_execution)
+        self.assertEqual(save_activity_execution_mock.call_args.args[0].additional_properties,
+                         [PropertyIn.construct(key='scenario_position', value=3.0)])
 
     @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
     @mock.patch.object(GraphApiService, 'create_relationships')
     @mock.patch.object(GraphApiService, 'delete_relationship')
     def test_add_activity_execution_in_middle(self, delete_relationship_mock, create_relationships_mock,
-                                    get_node_relationships_mock, save_activity_execution_mock):
-        get_node_relationships_mock.return_value = {'relationships': [{'start_node': 1, 'end_node': 2,
-                                                                       'name': 'nextActivityExecution', 'id': 0},
-                                                                      {'start_node': 2, 'end_node': 3,
-                                                                       'name': 'nextActivityExecution', 'id': 1}
-                                                                      ]}
+                                              get_node_neighbourhood_mock, save_activity_execution_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 2, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 2.0}]},
+                      {'id': 1, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 1.0}]},
+                      {'id': 3, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 3.0}]}],
+            'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'nextActivityExecution', 'id': 0},
+                              {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 1}]}
         activity_execution = ActivityExecutionIn(activity_id=1, arrangement_id=3, identifier=0, name='Test')
         save_activity_execution_mock.return_value = ActivityExecutionOut(activity='group',
                                                                          arrangement_type='personal group',
@@ -89,11 +130,353 @@ class TestScenarioService(unittest.TestCase):
         calls = [mock.call(2, 4, 'nextActivityExecution'), mock.call(4, 3, 'nextActivityExecution')]
         scenario_service = ScenarioService()
 
-        result = scenario_service.add_activity_execution(2, activity_execution)
+        result = asyncio.run(scenario_service.add_activity_execution(2, activity_execution))
 
         self.assertEqual(result, ActivityExecutionOut(activity='group', arrangement_type='personal group',
                                                       identifier=0, name='Test', id=4))
         create_relationships_mock.assert_has_calls(calls)
         delete_relationship_mock.assert_called_once_with(1)
-        save_activity_execution_mock.assert_called_with(activity_execution)
+        self.assertEqual(save_activity_execution_mock.call_args.args[0].additional_properties,
+                         [PropertyIn.construct(key='scenario_position', value=2.5)])
+
+    @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    @mock.patch.object(GraphApiService, 'set_nodes_properties')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_add_activity_execution_without_positions(self, delete_relationship_mock, create_relationships_mock,
+                                                      set_nodes_properties_mock, get_node_chain_mock,
+                                                      get_node_neighbourhood_mock, save_activity_execution_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 2, 'labels': ['Activity Execution'], 'properties': []},
+                      {'id': 3, 'labels': ['Activity Execution'], 'properties': []}],
+            'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 1}]}
+        get_node_chain_mock.return_value = {'root': {'id': 1, 'labels': ['Experiment']}, 'errors': None,
+                                            'nodes': [{'id': 2}, {'id': 3}]}
+        save_activity_execution_mock.return_value = ActivityExecutionOut(id=4)
+        scenario_service = ScenarioService()
+
+        asyncio.run(scenario_service.add_activity_execution(2, ActivityExecutionIn()))
+
+        set_nodes_properties_mock.assert_called_once_with({2: {'scenario_position': 1.0},
+                                                           3: {'scenario_position': 2.0}})
+        self.assertEqual(save_activity_execution_mock.call_args.args[0].additional_properties,
+                         [PropertyIn.construct(key='scenario_position', value=1.5)])
+
+    @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    @mock.patch.object(GraphApiService, 'set_nodes_properties')
+    def test_add_activity_execution_with_failed_renumbering(self, set_nodes_properties_mock, get_node_chain_mock,
+                                                            get_node_neighbourhood_mock, save_activity_execution_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 2, 'labels': ['Activity Execution'], 'properties': []}],
+            'relationships': [], 'errors': None}
+        get_node_chain_mock.return_value = {'root': None, 'nodes': [], 'errors': "Node not found"}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.add_activity_execution(2, ActivityExecutionIn()))
+
+        self.assertEqual(result, ActivityExecutionOut(errors="Node not found"))
+        set_nodes_properties_mock.assert_not_called()
+        save_activity_execution_mock.assert_not_called()
+
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
+    @mock.patch.object(GraphApiService, 'create_subgraph')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_add_activity_execution_with_string_positions(self, delete_relationship_mock, create_relationships_mock,
+                                                          create_subgraph_mock, get_node_neighbourhood_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 9, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': '9.0'}]},
+                      {'id': 10, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': '10.0'}]}],
+            'relationships': [{'start_node': 9, 'end_node': 10, 'name': 'nextActivityExecution', 'id': 1}],
+            'errors': None}
+        create_subgraph_mock.return_value = {'id': 11, 'errors': None, 'relationships': [],
+                                             'properties': [{'key': 'scenario_position', 'value': 9.5}]}
+        create_relationships_mock.return_value = {'errors': None}
+        delete_relationship_mock.return_value = {'errors': None}
+        scenario_service = ScenarioService()
+
+        asyncio.run(scenario_service.add_activity_execution(9, ActivityExecutionIn()))
+
+        properties = GraphApiService().prepare_properties(create_subgraph_mock.call_args.args[1])
+        self.assertEqual(properties, [{'key': 'scenario_position', 'value': 9.5}])
+
+    def test_get_position_saved_as_string(self):
+        scenario_service = ScenarioService()
+
+        self.assertEqual(scenario_service.get_position(
+            {'labels': ['Activity Execution'], 'properties': [{'key': 'scenario_position', 'value': '9.0'}]}), 9.0)
+        self.assertEqual(scenario_service.get_position({'labels': ['Experiment'], 'properties': []}), 0.0)
+        self.assertEqual(scenario_service.what_order(scenario_service.get_position(
+            {'labels': ['Activity Execution'], 'properties': [{'key': 'scenario_position', 'value': '9.0'}]}),
+            scenario_service.get_position(
+                {'labels': ['Activity Execution'], 'properties': [{'key': 'scenario_position', 'value': '10.0'}]})),
+            (True, False))
+
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
+    def test_add_activity_execution_after_missing_node(self, get_node_neighbourhood_mock):
+        get_node_neighbourhood_mock.return_value = {'nodes': [], 'relationships': [], 'errors': "Node not found"}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.add_activity_execution(5, ActivityExecutionIn()))
+
+        self.assertEqual(result, NotFoundByIdModel(id=5, errors="Node not found"))
+
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
+    def test_add_activity_execution_after_node_outside_neighbourhood(self, get_node_neighbourhood_mock):
+        get_node_neighbourhood_mock.return_value = {'nodes': [], 'relationships': [], 'errors': None}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.add_activity_execution(5, ActivityExecutionIn()))
+
+        self.assertEqual(result, NotFoundByIdModel(id=5, errors="Node not found"))
+
+    @mock.patch.object(ActivityExecutionService, 'save_activity_execution')
+    @mock.patch.object(GraphApiService, 'get_node_neighbourhood')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_add_activity_execution_with_failed_write(self, delete_relationship_mock, create_relationships_mock,
+                                                      get_node_neighbourhood_mock, save_activity_execution_mock):
+        get_node_neighbourhood_mock.return_value = {
+            'nodes': [{'id': 1, 'labels': ['Experiment'], 'properties': []},
+                      {'id': 2, 'labels': ['Activity Execution'],
+                       'properties': [{'key': 'scenario_position', 'value': 1.0}]}],
+            'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 0}]}
+        save_activity_execution_mock.return_value = ActivityExecutionOut(id=3)
+        create_relationships_mock.side_effect = TransactionError("Node not found")
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.add_activity_execution(1, ActivityExecutionIn()))
+
+        self.assertEqual(result, ActivityExecutionOut(errors="Node not found"))
+        delete_relationship_mock.assert_not_called()
+
+    def test_prepare_position(self):
+        scenario_service = ScenarioService()
+
+        self.assertEqual(scenario_service.prepare_position(0, 1.0, True), 0.5)
+        self.assertEqual(scenario_service.prepare_position(2.0, None, False), 3.0)
+        self.assertIsNone(scenario_service.prepare_position(None, 2.0, True))
+        self.assertIsNone(scenario_service.prepare_position(1.0, None, True))
+        self.assertIsNone(scenario_service.prepare_position(1.0, 1.0 + 1e-16, True))
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'set_nodes_properties')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    @mock.patch.object(GraphApiService, 'get_node_relationships')
+    def test_change_order_of_neighbours(self, get_node_relationships_mock, delete_relationship_mock,
+                                        create_relationships_mock, set_nodes_properties_mock, get_node_mock):
+        nodes = {
+            2: {'id': 2, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 1.0}],
+                'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5},
+                                  {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]},
+            3: {'id': 3, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 2.0}],
+                'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]}}
+        get_node_mock.side_effect = lambda node_id, include_relationships: nodes[node_id]
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=2, activity_execution_id=3)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=2, activity_execution_id=3))
+        get_node_relationships_mock.assert_not_called()
+        delete_relationship_mock.assert_has_calls([mock.call(5), mock.call(6)])
+        create_relationships_mock.assert_has_calls([mock.call(1, 3, 'hasScenario'),
+                                                    mock.call(3, 2, 'nextActivityExecution')])
+        set_nodes_properties_mock.assert_called_once_with({2: {'scenario_position': 2.0},
+                                                           3: {'scenario_position': 1.0}})
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'set_nodes_properties')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_change_order_when_previous_is_last(self, delete_relationship_mock, create_relationships_mock,
+                                                set_nodes_properties_mock, get_node_mock):
+        nodes = {
+            2: {'id': 2, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 1.0}],
+                'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5},
+                                  {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]},
+            3: {'id': 3, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 2.0}],
+                'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]}}
+        get_node_mock.side_effect = lambda node_id, include_relationships: nodes[node_id]
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=3, activity_execution_id=2)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=3, activity_execution_id=2))
+        create_relationships_mock.assert_has_calls([mock.call(1, 3, 'hasScenario'),
+                                                    mock.call(3, 2, 'nextActivityExecution')])
+        set_nodes_properties_mock.assert_called_once_with({3: {'scenario_position': 1.0},
+                                                           2: {'scenario_position': 2.0}})
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'set_nodes_properties')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_change_order_with_last_separated(self, delete_relationship_mock, create_relationships_mock,
+                                              set_nodes_properties_mock, get_node_mock):
+        nodes = {
+            2: {'id': 2, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 1.0}],
+                'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5},
+                                  {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]},
+            4: {'id': 4, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 3.0}],
+                'relationships': [{'start_node': 3, 'end_node': 4, 'name': 'nextActivityExecution', 'id': 7}]}}
+        get_node_mock.side_effect = lambda node_id, include_relationships: nodes[node_id]
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=2, activity_execution_id=4)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=2, activity_execution_id=4))
+        delete_relationship_mock.assert_has_calls([mock.call(5), mock.call(6), mock.call(7)])
+        create_relationships_mock.assert_has_calls([mock.call(1, 4, 'hasScenario'),
+                                                    mock.call(4, 3, 'nextActivityExecution'),
+                                                    mock.call(3, 2, 'nextActivityExecution')])
+        set_nodes_properties_mock.assert_called_once_with({2: {'scenario_position': 3.0},
+                                                           4: {'scenario_position': 1.0}})
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    @mock.patch.object(GraphApiService, 'set_nodes_properties')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_change_order_without_positions(self, delete_relationship_mock, create_relationships_mock,
+                                            set_nodes_properties_mock, get_node_chain_mock, get_node_mock):
+        nodes = {
+            2: {'id': 2, 'labels': ['Activity Execution'], 'errors': None, 'properties': [],
+                'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5},
+                                  {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]},
+            3: {'id': 3, 'labels': ['Activity Execution'], 'errors': None, 'properties': [],
+                'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]}}
+        get_node_mock.side_effect = lambda node_id, include_relationships: nodes[node_id]
+        get_node_chain_mock.return_value = {'root': {'id': 1, 'labels': ['Experiment']}, 'errors': None,
+                                            'nodes': [{'id': 2}, {'id': 3}]}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=2, activity_execution_id=3)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=2, activity_execution_id=3))
+        set_nodes_properties_mock.assert_has_calls([
+            mock.call({2: {'scenario_position': 1.0}, 3: {'scenario_position': 2.0}}),
+            mock.call({2: {'scenario_position': 2.0}, 3: {'scenario_position': 1.0}})])
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_change_order_with_missing_activity_execution(self, delete_relationship_mock, create_relationships_mock,
+                                                          get_node_mock):
+        nodes = {
+            2: {'id': 2, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 1.0}],
+                'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5}]},
+            3: {'errors': "Node not found"}}
+        get_node_mock.side_effect = lambda node_id, include_relationships: nodes[node_id]
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=2, activity_execution_id=3)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=2, activity_execution_id=3, errors="Node not found"))
+        delete_relationship_mock.assert_not_called()
+        create_relationships_mock.assert_not_called()
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    def test_change_order_with_missing_node(self, get_node_mock):
+        get_node_mock.return_value = {'errors': "Node not found"}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=2, activity_execution_id=3)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=2, activity_execution_id=3, errors="Node not found"))
+
+    @mock.patch.object(GraphApiService, 'get_node')
+    @mock.patch.object(GraphApiService, 'create_relationships')
+    @mock.patch.object(GraphApiService, 'delete_relationship')
+    def test_change_order_with_failed_write(self, delete_relationship_mock, create_relationships_mock,
+                                            get_node_mock):
+        nodes = {
+            2: {'id': 2, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 1.0}],
+                'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5},
+                                  {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]},
+            3: {'id': 3, 'labels': ['Activity Execution'], 'errors': None,
+                'properties': [{'key': 'scenario_position', 'value': 2.0}],
+                'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]}}
+        get_node_mock.side_effect = lambda node_id, include_relationships: nodes[node_id]
+        delete_relationship_mock.side_effect = TransactionError("Relationship not found")
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.change_order(OrderChangeIn(previous_id=2, activity_execution_id=3)))
+
+        self.assertEqual(result, OrderChangeOut(previous_id=2, activity_execution_id=3,
+                                                errors="Relationship not found"))
+        create_relationships_mock.assert_not_called()
+
+    def test_what_order(self):
+        scenario_service = ScenarioService()
+
+        self.assertEqual(scenario_service.what_order(1.0, 2.5), (True, False))
+        self.assertEqual(scenario_service.what_order(3.0, 0), (False, True))
+
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    def test_get_scenario_by_activity_execution(self, get_node_chain_mock):
+        get_node_chain_mock.return_value = {'root': {'id': 1, 'labels': ['Experiment']}, 'errors': None, 'nodes': [
+            {'id': 2, 'labels': ['Activity Execution'], 'properties': [{'key': 'activity', 'value': 'test'}],
+             'relationships': [{'start_node': 1, 'end_node': 2, 'name': 'hasScenario', 'id': 5},
+                               {'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]},
+            {'id': 3, 'labels': ['Activity Execution'], 'properties': [],
+             'relationships': [{'start_node': 2, 'end_node': 3, 'name': 'nextActivityExecution', 'id': 6}]}]}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.get_scenario(3))
+
+        self.assertEqual(result, ScenarioOut(experiment_id=1, activity_executions=[
+            ActivityExecutionOut(id=2, additional_properties=[PropertyIn(key='activity', value='test')],
+                                 relations=[RelationInformation(second_node_id=3, name='nextActivityExecution',
+                                                                relation_id=6)],
+                                 reversed_relations=[RelationInformation(second_node_id=1, name='hasScenario',
+                                                                         relation_id=5)]),
+            ActivityExecutionOut(id=3, additional_properties=[], relations=[],
+                                 reversed_relations=[RelationInformation(second_node_id=2,
+                                                                         name='nextActivityExecution',
+                                                                         relation_id=6)])]))
+        get_node_chain_mock.assert_called_once_with(3, "hasScenario", "nextActivityExecution",
+                                                    include_relationships=True)
+
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    def test_get_scenario_of_experiment_without_scenario(self, get_node_chain_mock):
+        get_node_chain_mock.return_value = {'root': {'id': 1, 'labels': ['Experiment']}, 'nodes': [],
+                                            'errors': None}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.get_scenario(1))
+
+        self.assertEqual(result, ScenarioOut(experiment_id=1, activity_executions=[]))
+
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    def test_get_scenario_without_experiment(self, get_node_chain_mock):
+        get_node_chain_mock.return_value = {'root': {'id': 1, 'labels': ['Participant']}, 'nodes': [],
+                                            'errors': None}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.get_scenario(1))
+
+        self.assertEqual(result, NotFoundByIdModel(id=1, errors="Node not found."))
+
+    @mock.patch.object(GraphApiService, 'get_node_chain')
+    def test_get_scenario_with_error(self, get_node_chain_mock):
+        get_node_chain_mock.return_value = {'root': None, 'nodes': [], 'errors': "Node not found"}
+        scenario_service = ScenarioService()
+
+        result = asyncio.run(scenario_service.get_scenario(1))
 
+        self.assertEqual(result, NotFoundByIdModel(id=1, errors="Node not found"))
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -11,21 +12,20 @@ from graph_api_service import GraphApiService
 class TestTimeSeriesServiceGet(unittest.TestCase):
 
     @mock.patch.object(GraphApiService, 'get_node')
-    @mock.patch.object(GraphApiService, 'get_node_relationships')
-    def test_get_time_series_without_error(self, get_node_relationships_mock, get_node_mock):
+    def test_get_time_series_without_error(self, get_node_mock):
         id_node = 1
         get_node_mock.return_value = {'id': id_node, 'labels': ['Time Series'],
                                       'properties': [{'key': 'type', 'value': "Epoch"},
                                                      {'key': 'source', 'value': "cos"},
                                                      {'key': 'test', 'value': 'test2'}],
-                                      "errors": None, 'links': None}
-        get_node_relationships_mock.return_value = {"relationships": [
-                                                    {"start_node": id_node, "end_node": 19,
-                                                     "name": "testRelation", "id": 0,
-                                                     "properties": None},
-                                                    {"start_node": 15, "end_node": id_node,
-                                                     "name": "testReversedRelation", "id": 0,
-                                                     "properties": None}]}
+                                      "errors": None, 'links': None,
+                                      'relationships': [
+                                          {"start_node": id_node, "end_node": 19,
+                                           "name": "testRelation", "id": 0,
+                                           "properties": None},
+                                          {"start_node": 15, "end_node": id_node,
+                                           "name": "testReversedRelation", "id": 0,
+                                           "properties": None}]}
         additional_properties = [PropertyIn(key='test', value='test2')]
         time_series = TimeSeriesOut(id=1, type="Epoch", source="cos",additional_properties=additional_properties,
                                                 relations=[RelationInformation(second_node_id=19, name="testRelation",
@@ -35,24 +35,10 @@ class TestTimeSeriesServiceGet(unittest.TestCase):
                                                                                         relation_id=0)])
         time_series_service = TimeSeriesService()
 
-        result = time_series_service.get_time_series(id_node)
+        result = asyncio.run(time_series_service.get_time_series(id_node))
 
         self.assertEqual(result, time_series)
-        get_node_mock.assert_called_once_with(id_node)
-        get_node_relationships_mock.assert_called_once_with(id_node)
-
-    @mock.patch.object(GraphApiService, 'get_node')
-    def test_get_time_series_without_label(self, get_node_mock):
-        id_node = 1
-        get_node_mock.return_value = {'id': id_node, 'labels': ['Test'], 'properties': None,
-                                      "errors": None, 'links': None}
-        not_found = NotFoundByIdModel(id=id_node, errors="Node not found.")
-        time_series_service = TimeSeriesService()
-
-        result = time_series_service.get_time_series(id_node)
-
-        self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Time Series", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_node')
     def test_get_time_series_with_error(self, get_node_mock):
@@ -61,10 +47,10 @@ class TestTimeSeriesServiceGet(unittest.TestCase):
         not_found = NotFoundByIdModel(id=id_node, errors=['error'])
         time_series_service = TimeSeriesService()
 
-        result = time_series_service.get_time_series(id_node)
+        result = asyncio.run(time_series_service.get_time_series(id_node))
 
         self.assertEqual(result, not_found)
-        get_node_mock.assert_called_once_with(id_node)
+        get_node_mock.assert_called_once_with(id_node, "Time Series", include_relationships=True)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_time_series_nodes(self, get_nodes_mock):
@@ -75,7 +61,7 @@ class TestTimeSeriesServiceGet(unittest.TestCase):
                                                  {'id': 2, 'labels': ['Time Series'],
                                                   'properties': [{'key': 'type', 'value': "Epoch"},
                                                      {'key': 'source', 'value': "cos"},
-                                                                 {'key': 'test2', 'value': 'test3'}]}]}
+                                                                 {'key': 'test2', 'value': 'test3'}]}], 'errors': None}
         time_series_one = BasicTimeSeriesOut(id=1, type="Epoch", source="cos", additional_properties=[
             PropertyIn(key='test', value='test')])
         time_series_two = BasicTimeSeriesOut(id=2, type="Epoch", source="cos", additional_properties=[
@@ -83,18 +69,18 @@ class TestTimeSeriesServiceGet(unittest.TestCase):
         time_series_nodes = TimeSeriesNodesOut(time_series_nodes=[time_series_one, time_series_two])
         time_series_nodes_service = TimeSeriesService()
 
-        result = time_series_nodes_service.get_time_series_nodes()
+        result = asyncio.run(time_series_nodes_service.get_time_series_nodes())
 
         self.assertEqual(result, time_series_nodes)
-        get_nodes_mock.assert_called_once_with("`Time Series`")
+        get_nodes_mock.assert_called_once_with("`Time Series`", None, None, None)
 
     @mock.patch.object(GraphApiService, 'get_nodes')
     def test_get_time_series_nodes_empty(self, get_nodes_mock):
-        get_nodes_mock.return_value = {'nodes': []}
+        get_nodes_mock.return_value = {'nodes': [], 'errors': None}
         time_series_nodes = TimeSeriesNodesOut(time_series=[])
         time_series_nodes_service = TimeSeriesService()
 
-        result = time_series_nodes_service.get_time_series_nodes()
+        result = asyncio.run(time_series_nodes_service.get_time_series_nodes())
 
         self.assertEqual(result, time_series_nodes)
-        get_nodes_mock.assert_called_once_with("`Time Series`")
+        get_nodes_mock.assert_called_once_with("`Time Series`", None, None, None)
@@ -85,9 +85,11 @@ class TimeSeriesNodesOut(BaseModel):
 
     Attributes:
         time_series_nodes (List[BasicTimeSeriesOut]): Time series nodes from database
+        next_after (Optional[int]): Id after which next page starts, None when there is no next page
         errors (Optional[Any]): Optional errors appeared during query executions
         links (Optional[list]): List of links available from api
     """
     time_series_nodes: List[BasicTimeSeriesOut] = []
+    next_after: Optional[int] = None
     errors: Optional[Any] = None
     links: Optional[list] = None
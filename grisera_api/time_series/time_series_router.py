@@ -1,11 +1,15 @@
-from fastapi import Response
+from functools import partial
+from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi_utils.inferring_router import InferringRouter
-from hateoas import get_links
+from hateoas import get_links, get_next_link
+from pydantic import conint
+from streaming import ResponseFormat, stream_ndjson
 from time_series.time_series_model import TimeSeriesIn, TimeSeriesNodesOut, TimeSeriesOut, \
     TimeSeriesPropertyIn, TimeSeriesRelationIn
 from time_series.time_series_service import TimeSeriesService
-from typing import Union
+from typing import List, Optional, Union
 from models.not_found_model import NotFoundByIdModel
 
 router = InferringRouter()
@@ -27,7 +31,7 @@ class TimeSeriesRouter:
         Create time series in database
         """
 
-        create_response = self.time_series_service.save_time_series(time_series)
+        create_response = await self.time_series_service.save_time_series(time_series)
         if create_response.errors is not None:
             response.status_code = 422
 
@@ -37,15 +41,31 @@ class TimeSeriesRouter:
         return create_response
 
     @router.get("/time_series", tags=["time series"], response_model=TimeSeriesNodesOut)
-    async def get_time_series_nodes(self, response: Response):
+    async def get_time_series_nodes(self, response: Response, limit: Optional[conint(gt=0)] = None,
+                                    after: Optional[int] = None, format: ResponseFormat = ResponseFormat.json,
+                                    where: Optional[List[str]] = Query(None)):
         """
         Get time series nodes from database
+
+        Nodes can be filtered by their properties with where parameters, key:value requires property equal to
+        value, key:<value, key:<=value, key:>value and key:>=value compare property with value.
+
+        In ndjson format all time series nodes starting after given id are streamed, one per line.
         """
+        if format == ResponseFormat.ndjson:
+            get_page = partial(self.time_series_service.get_time_series_nodes, where=where)
+            time_series_nodes = stream_ndjson(get_page, "time_series_nodes", after)
+            return StreamingResponse(time_series_nodes, media_type="application/x-ndjson")
 
-        get_response = self.time_series_service.get_time_series_nodes()
+        get_response = await self.time_series_service.get_time_series_nodes(limit, after, where)
+        if get_response.errors is not None:
+            response.status_code = 422
 
         # add links from hateoas
         get_response.links = get_links(router)
+        if get_response.next_after is not None and get_response.links is not None:
+            get_response.links.append(get_next_link("/time_series", {"limit": limit, "after": get_response.next_after,
+                                                                     "where": where or []}))
 
         return get_response
 
@@ -56,7 +76,7 @@ class TimeSeriesRouter:
         Get time series from database
         """
 
-        get_response = self.time_series_service.get_time_series(time_series_id)
+        get_response = await self.time_series_service.get_time_series(time_series_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -71,7 +91,7 @@ class TimeSeriesRouter:
         """
         Delete time series from database
         """
-        get_response = self.time_series_service.delete_time_series(time_series_id)
+        get_response = await self.time_series_service.delete_time_series(time_series_id)
         if get_response.errors is not None:
             response.status_code = 404
 
@@ -87,8 +107,8 @@ class TimeSeriesRouter:
         """
         Update time series model in database
         """
-        update_response = self.time_series_service.update_time_series(time_series_id,
-                                                                                  time_series)
+        update_response = await self.time_series_service.update_time_series(time_series_id,
+                                                                                        time_series)
         if update_response.errors is not None:
             response.status_code = 404
 
@@ -104,8 +124,8 @@ class TimeSeriesRouter:
         """
         Update time series relations in database
         """
-        update_response = self.time_series_service.update_time_series_relationships(time_series_id,
-                                                                                                time_series)
+        update_response = await self.time_series_service.update_time_series_relationships(time_series_id,
+                                                                                                      time_series)
         if update_response.errors is not None:
             response.status_code = 404
 
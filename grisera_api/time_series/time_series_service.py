@@ -1,6 +1,5 @@
+from typing import List
 from graph_api_service import GraphApiService
-from measure.measure_service import MeasureService
-from observable_information.observable_information_service import ObservableInformationService
 from time_series.time_series_model import TimeSeriesPropertyIn, BasicTimeSeriesOut, \
     TimeSeriesNodesOut, TimeSeriesOut, TimeSeriesIn, TimeSeriesRelationIn
 from models.not_found_model import NotFoundByIdModel
@@ -13,14 +12,10 @@ class TimeSeriesService:
 
     Attributes:
         graph_api_service (GraphApiService): Service used to communicate with Graph API
-        measure_service (MeasureService): Service to manage measure models
-        observable_information_service (ObservableInformationService): Service to manage observable information models
     """
     graph_api_service = GraphApiService()
-    measure_service = MeasureService()
-    observable_information_service = ObservableInformationService()
 
-    def save_time_series(self, time_series: TimeSeriesIn):
+    async def save_time_series(self, time_series: TimeSeriesIn):
         """
         Send request to graph api to create new time series
 
@@ -30,38 +25,36 @@ class TimeSeriesService:
         Returns:
             Result of request as time series object
         """
-        node_response = self.graph_api_service.create_node("`Time Series`")
+        relationships = []
+        if time_series.observable_information_id is not None:
+            relationships.append((time_series.observable_information_id, "hasObservableInformation",
+                                  "Observable Information"))
+        if time_series.measure_id is not None:
+            relationships.append((time_series.measure_id, "hasMeasure", "Measure"))
+
+        properties = time_series.copy(update={"observable_information_id": None, "measure_id": None})
+        node_response = await self.graph_api_service.create_subgraph("`Time Series`", properties, relationships)
 
         if node_response["errors"] is not None:
             return TimeSeriesOut(**time_series.dict(), errors=node_response["errors"])
 
-        time_series_id = node_response["id"]
-
-        if time_series.observable_information_id is not None and \
-                type(self.observable_information_service.get_observable_information(
-                    time_series.observable_information_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=time_series_id,
-                                                        end_node=time_series.observable_information_id,
-                                                        name="hasObservableInformation")
-        if time_series.measure_id is not None and \
-                type(self.measure_service.get_measure(time_series.measure_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=time_series_id,
-                                                        end_node=time_series.measure_id,
-                                                        name="hasMeasure")
-
-        time_series.observable_information_id = time_series.measure_id = None
-        self.graph_api_service.create_properties(time_series_id, time_series)
+        return self.prepare_time_series(node_response, node_response["relationships"])
 
-        return self.get_time_series(time_series_id)
-
-    def get_time_series_nodes(self):
+    async def get_time_series_nodes(self, limit: int = None, after: int = None, where: List[str] = None):
         """
         Send request to graph api to get time series nodes
 
+        Args:
+            limit (int): Maximal number of time series nodes, all are returned if not given
+            after (int): Id after which returned time series nodes start
+            where (List[str]): Filters on properties of time series nodes
+
         Returns:
             Result of request as list of time series nodes objects
         """
-        get_response = self.graph_api_service.get_nodes("`Time Series`")
+        get_response = await self.graph_api_service.get_nodes("`Time Series`", limit, after, where)
+        if get_response["errors"] is not None:
+            return TimeSeriesNodesOut(errors=get_response["errors"])
 
         time_series_nodes = []
 
@@ -75,9 +68,9 @@ class TimeSeriesService:
             time_series = BasicTimeSeriesOut(**properties)
             time_series_nodes.append(time_series)
 
-        return TimeSeriesNodesOut(time_series_nodes=time_series_nodes)
+        return TimeSeriesNodesOut(time_series_nodes=time_series_nodes, next_after=get_response.get("next_after"))
 
-    def get_time_series(self, time_series_id: int):
+    async def get_time_series(self, time_series_id: int):
         """
         Send request to graph api to get given time series
 
@@ -87,24 +80,34 @@ class TimeSeriesService:
         Returns:
             Result of request as time series object
         """
-        get_response = self.graph_api_service.get_node(time_series_id)
+        get_response = await self.graph_api_service.get_node(time_series_id, "Time Series", include_relationships=True)
 
         if get_response["errors"] is not None:
             return NotFoundByIdModel(id=time_series_id, errors=get_response["errors"])
-        if get_response["labels"][0] != "Time Series":
-            return NotFoundByIdModel(id=time_series_id, errors="Node not found.")
 
-        time_series = {'id': get_response['id'], 'additional_properties': [], 'relations': [],
+        return self.prepare_time_series(get_response, get_response["relationships"])
+
+    def prepare_time_series(self, node: dict, relationships: list):
+        """
+        Create time series model from node and its relationships returned by graph api
+
+        Args:
+            node (dict): Node of time series with its properties
+            relationships (list): Relationships of node
+
+        Returns:
+            Result as time series object
+        """
+        time_series_id = node["id"]
+        time_series = {'id': time_series_id, 'additional_properties': [], 'relations': [],
                              'reversed_relations': []}
-        for property in get_response["properties"]:
+        for property in node["properties"]:
             if property["key"] in ["type", "source"]:
                 time_series[property["key"]] = property["value"]
             else:
                 time_series['additional_properties'].append({'key': property['key'], 'value': property['value']})
 
-        relations_response = self.graph_api_service.get_node_relationships(time_series_id)
-
-        for relation in relations_response["relationships"]:
+        for relation in relationships:
             if relation["start_node"] == time_series_id:
                 time_series['relations'].append(RelationInformation(second_node_id=relation["end_node"],
                                                                           name=relation["name"],
@@ -116,7 +119,7 @@ class TimeSeriesService:
 
         return TimeSeriesOut(**time_series)
 
-    def delete_time_series(self, time_series_id: int):
+    async def delete_time_series(self, time_series_id: int):
         """
         Send request to graph api to delete given time series
 
@@ -126,15 +129,15 @@ class TimeSeriesService:
         Returns:
             Result of request as time series object
         """
-        get_response = self.get_time_series(time_series_id)
+        get_response = await self.get_time_series(time_series_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node(time_series_id)
+        await self.graph_api_service.delete_node(time_series_id)
         return get_response
 
-    def update_time_series(self, time_series_id: int, time_series: TimeSeriesPropertyIn):
+    async def update_time_series(self, time_series_id: int, time_series: TimeSeriesPropertyIn):
         """
         Send request to graph api to update given time series
 
@@ -145,13 +148,13 @@ class TimeSeriesService:
         Returns:
             Result of request as time series object
         """
-        get_response = self.get_time_series(time_series_id)
+        get_response = await self.get_time_series(time_series_id)
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
 
-        self.graph_api_service.delete_node_properties(time_series_id)
-        self.graph_api_service.create_properties(time_series_id, time_series)
+        await self.graph_api_service.delete_node_properties(time_series_id)
+        await self.graph_api_service.create_properties(time_series_id, time_series)
 
         time_series_result = {"id": time_series_id, "relations": get_response.relations,
                                     "reversed_relations": get_response.reversed_relations}
@@ -159,8 +162,8 @@ class TimeSeriesService:
 
         return TimeSeriesOut(**time_series_result)
 
-    def update_time_series_relationships(self, time_series_id: int,
-                                               time_series: TimeSeriesRelationIn):
+    async def update_time_series_relationships(self, time_series_id: int,
+                                                     time_series: TimeSeriesRelationIn):
         """
         Send request to graph api to update given time series
 
@@ -171,21 +174,21 @@ class TimeSeriesService:
         Returns:
             Result of request as time series object
         """
-        get_response = self.get_time_series(time_series_id)
+        lookups = [(time_series.observable_information_id, "hasObservableInformation", "Observable Information"),
+                   (time_series.measure_id, "hasMeasure", "Measure")]
+        related = [lookup for lookup in lookups if lookup[0] is not None]
+        get_response, exist_response = await self.graph_api_service.gather(
+            self.get_time_series(time_series_id),
+            self.graph_api_service.nodes_exist([(end_node, label) for end_node, _, label in related]))
 
         if type(get_response) is NotFoundByIdModel:
             return get_response
+        if exist_response["errors"] is not None:
+            get_response.errors = exist_response["errors"]
+            return get_response
+
+        await self.graph_api_service.gather(*[
+            self.graph_api_service.create_relationships(start_node=time_series_id, end_node=end_node, name=name)
+            for (end_node, name, _), node in zip(related, exist_response["nodes"]) if node["exists"]])
 
-        if time_series.observable_information_id is not None and \
-                type(self.observable_information_service.get_observable_information(
-                    time_series.observable_information_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=time_series_id,
-                                                        end_node=time_series.observable_information_id,
-                                                        name="hasObservableInformation")
-        if time_series.measure_id is not None and \
-                type(self.measure_service.get_measure(time_series.measure_id)) is not NotFoundByIdModel:
-            self.graph_api_service.create_relationships(start_node=time_series_id,
-                                                        end_node=time_series.personality_id,
-                                                        name="hasMeasure")
-
-        return self.get_time_series(time_series_id)
+        return await self.get_time_series(time_series_id)